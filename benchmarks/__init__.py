@@ -0,0 +1,5 @@
+"""
+Performance benchmarks for the AutoSRE pipeline stages.
+
+Run with ``python -m benchmarks.run`` from the repository root.
+"""
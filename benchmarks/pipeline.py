@@ -0,0 +1,187 @@
+"""Benchmarks for each pipeline stage (registered on import)."""
+
+from __future__ import annotations
+
+import json
+import threading
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from autosre.log_storage import LogStore
+from autosre.models import (
+    Diagnosis,
+    IncidentEvent,
+    IncidentType,
+    PostMortemReport,
+    RecommendedAction,
+)
+from autosre.planner import PlannerAgent
+from autosre.reasoning_agent.agent import _parse_diagnosis_from_text
+from autosre.reasoning_agent.budget import fit_logs_to_budget
+from autosre.reasoning_agent.prompts import build_user_prompt
+from autosre.reasoning_agent.rules import RuleEngine
+from autosre.recovery_verification import RecoveryMonitor
+from autosre.slack_reporter.reporter import build_post_mortem_blocks, build_post_mortem_text
+from autosre.ui_automation.prompts import actions_to_prompts
+from benchmarks.runner import benchmark
+
+_DETECTED_AT = datetime(2025, 2, 11, 12, 0, 0)
+_MESSAGES = [
+    "level=INFO message=request handled path=/checkout status=200 latency_ms={n}",
+    "level=WARN message=slow query table=orders duration_ms={n}",
+    "level=ERROR message=memory allocation failure deployment=v1.4.2 request_id=req-{n}",
+]
+_DEPLOYMENTS = [
+    {"version": "v1.4.2", "timestamp": "2025-02-11T10:00:00Z", "status": "deployed"},
+    {"version": "v1.4.1", "timestamp": "2025-02-11T09:30:00Z", "status": "deployed"},
+]
+_DIAGNOSIS_TEXT = json.dumps(
+    {
+        "summary": "Checkout latency increased after deployment v1.4.2 (memory leak).",
+        "confidence": 0.91,
+        "recommended_action": "rollback",
+        "reasoning": "Errors begin right after v1.4.2 rollout; v1.4.1 was healthy.",
+    }
+)
+
+
+def _incident() -> IncidentEvent:
+    return IncidentEvent(
+        incident_id="inc-bench",
+        incident_type=IncidentType.LATENCY_SPIKE,
+        service_name="checkout",
+        detected_at=_DETECTED_AT,
+    )
+
+
+def _log_lines(count: int) -> list[tuple[str, datetime]]:
+    start = _DETECTED_AT - timedelta(seconds=3600)
+    step = 3600 / max(1, count)
+    return [
+        (_MESSAGES[n % len(_MESSAGES)].format(n=n), start + timedelta(seconds=n * step))
+        for n in range(count)
+    ]
+
+
+def _filled_store(count: int) -> LogStore:
+    store = LogStore()
+    for message, ts in _log_lines(count):
+        store.append_log("checkout", message, ts)
+    return store
+
+
+@benchmark("log_store.ingest", setup=_log_lines, sized=True)
+def bench_log_store_ingest(lines):
+    store = LogStore()
+    for message, ts in lines:
+        store.append_log("checkout", message, ts)
+
+
+@benchmark("log_store.query", setup=_filled_store, sized=True)
+def bench_log_store_query(store):
+    store.get_logs_for_incident(_incident())
+
+
+@benchmark("reasoning.parse_diagnosis", setup=lambda size: [_DIAGNOSIS_TEXT] * 1000)
+def bench_parse_diagnosis(texts):
+    for text in texts:
+        _parse_diagnosis_from_text(text)
+
+
+@benchmark(
+    "reasoning.build_user_prompt",
+    setup=lambda size: "\n".join(f"[{ts.isoformat()}] {m}" for m, ts in _log_lines(size)),
+    sized=True,
+)
+def bench_build_user_prompt(logs):
+    build_user_prompt("latency_spike", "checkout", logs, _DEPLOYMENTS)
+
+
+@benchmark(
+    "reasoning.fit_logs_to_budget",
+    setup=lambda size: "\n".join(f"[{ts.isoformat()}] {m}" for m, ts in _log_lines(size)),
+    sized=True,
+)
+def bench_fit_logs_to_budget(logs):
+    fit_logs_to_budget(logs, 6000, detected_at=_DETECTED_AT, deployment_history=_DEPLOYMENTS)
+
+
+_RULE_ENGINE = RuleEngine()
+
+
+@benchmark(
+    "reasoning.rule_engine_match",
+    setup=lambda size: "\n".join(f"[{ts.isoformat()}] {m}" for m, ts in _log_lines(size)),
+    sized=True,
+)
+def bench_rule_engine_match(logs):
+    _RULE_ENGINE.match(_incident(), logs, _DEPLOYMENTS)
+
+
+def _diagnoses(size: int | None) -> list[Diagnosis]:
+    return [
+        Diagnosis(summary="bench", confidence=0.9, recommended_action=action)
+        for action in RecommendedAction
+    ] * 200
+
+
+@benchmark("planner.plan", setup=_diagnoses)
+def bench_planner_plan(diagnoses):
+    planner = PlannerAgent()
+    for diagnosis in diagnoses:
+        planner.plan(diagnosis)
+
+
+def _plans(size: int | None) -> list[list]:
+    planner = PlannerAgent()
+    return [planner.plan(diagnosis) for diagnosis in _diagnoses(size)]
+
+
+@benchmark("ui.actions_to_prompts", setup=_plans)
+def bench_actions_to_prompts(plans):
+    for actions in plans:
+        actions_to_prompts(actions, service_name="checkout", include_login=True)
+
+
+def _report(size: int | None) -> PostMortemReport:
+    return PostMortemReport(
+        incident_id="inc-bench",
+        root_cause="Memory leak in v1.4.2",
+        action_taken="rollback",
+        recovery_time_seconds=92.0,
+        prevention_suggestion="Add memory profiling to CI pipeline",
+        timeline=[f"Step {n}" for n in range(10)],
+    )
+
+
+@benchmark("slack.build_post_mortem", setup=_report)
+def bench_slack_blocks(report):
+    for _ in range(1000):
+        build_post_mortem_text(report)
+        build_post_mortem_blocks(report)
+
+
+class _HealthyHandler(BaseHTTPRequestHandler):
+    """Stub dashboard: GET /api/health always reports healthy."""
+
+    def do_GET(self) -> None:
+        body = b'{"status": "healthy"}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+
+def _stub_dashboard(size: int | None) -> RecoveryMonitor:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _HealthyHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return RecoveryMonitor(metrics_url=f"http://127.0.0.1:{server.server_port}/api/health")
+
+
+@benchmark("recovery.verify", setup=_stub_dashboard)
+def bench_recovery_verify(monitor):
+    monitor.verify("inc-bench", "checkout", timeout_seconds=10)
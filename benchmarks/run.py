@@ -0,0 +1,56 @@
+"""
+Run the pipeline benchmark suite.
+
+  python -m benchmarks.run                      # quick run (10k-line sizes)
+  python -m benchmarks.run --sizes 10k,1m,10m   # full LogStore scaling run
+  python -m benchmarks.run --json out.json      # machine-readable results
+  python -m benchmarks.run --baseline out.json  # exit 1 on regressions vs. a saved run
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+from benchmarks import pipeline, startup  # noqa: F401  (register benchmarks)
+from benchmarks.runner import BenchmarkRun, compare, format_run, parse_size, run_benchmarks
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="AutoSRE pipeline benchmarks")
+    parser.add_argument("--sizes", default="10k", help="Comma-separated sizes (10k,1m,10m)")
+    parser.add_argument("--rounds", type=int, default=5, help="Timed rounds per case")
+    parser.add_argument("--filter", default="", help="Only run benchmarks containing this text")
+    parser.add_argument("--json", dest="json_path", help="Write results to this JSON file")
+    parser.add_argument("--baseline", help="Compare against a previous --json results file")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.25,
+        help="Allowed slowdown vs. baseline median before failing (default: 0.25 = 25%%)",
+    )
+    args = parser.parse_args(argv)
+
+    sizes = [parse_size(s) for s in args.sizes.split(",") if s.strip()]
+    run = run_benchmarks(sizes, rounds=args.rounds, name_filter=args.filter)
+    print(format_run(run))
+    if args.json_path:
+        Path(args.json_path).write_text(run.model_dump_json(indent=2), encoding="utf-8")
+
+    if args.baseline:
+        baseline = BenchmarkRun.model_validate_json(Path(args.baseline).read_text(encoding="utf-8"))
+        regressions = compare(run, baseline, tolerance=args.tolerance)
+        for r in regressions:
+            print(
+                f"REGRESSION {r.case}: {r.baseline_seconds * 1000:.3f}ms -> "
+                f"{r.current_seconds * 1000:.3f}ms ({r.ratio:.2f}x)"
+            )
+        if regressions:
+            return 1
+        print(f"No regressions vs. {args.baseline} (tolerance {args.tolerance:.0%})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
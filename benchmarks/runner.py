@@ -0,0 +1,146 @@
+"""Benchmark registry, timing loop, JSON results and baseline comparison."""
+
+from __future__ import annotations
+
+import platform
+import statistics
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+# name -> (setup(size) -> state, run(state) -> None, sized)
+_REGISTRY: dict[str, tuple[Callable[[int | None], Any], Callable[[Any], Any], bool]] = {}
+
+SIZE_ALIASES = {"10k": 10_000, "100k": 100_000, "1m": 1_000_000, "10m": 10_000_000}
+
+
+class BenchmarkResult(BaseModel):
+    """Timing of one benchmark case (seconds per round)."""
+
+    name: str
+    size: int | None = None
+    rounds: int
+    min_seconds: float
+    median_seconds: float
+    mean_seconds: float
+    max_seconds: float
+    items_per_second: float | None = None
+
+
+class BenchmarkRun(BaseModel):
+    """Machine-readable results of one suite run."""
+
+    created_at: str = Field(default_factory=lambda: datetime.now(UTC).isoformat())
+    python: str = Field(default_factory=platform.python_version)
+    results: list[BenchmarkResult] = Field(default_factory=list)
+
+    def key(self, result: BenchmarkResult) -> str:
+        return f"{result.name}[{result.size}]" if result.size is not None else result.name
+
+
+class Regression(BaseModel):
+    """A case whose median slowed down beyond the tolerance vs. the baseline."""
+
+    case: str
+    baseline_seconds: float
+    current_seconds: float
+    ratio: float
+
+
+def benchmark(name: str, setup: Callable[[int | None], Any] | None = None, sized: bool = False):
+    """Register run(state) as benchmark `name`; setup(size) builds state outside the timed loop."""
+
+    def register(run: Callable[[Any], Any]) -> Callable[[Any], Any]:
+        _REGISTRY[name] = (setup or (lambda size: None), run, sized)
+        return run
+
+    return register
+
+
+def parse_size(value: str) -> int:
+    """Parse a size such as 10k, 1m, 10m or a plain integer."""
+    value = value.strip().lower()
+    if value in SIZE_ALIASES:
+        return SIZE_ALIASES[value]
+    return int(value)
+
+
+def run_benchmarks(
+    sizes: list[int],
+    rounds: int = 5,
+    name_filter: str = "",
+    max_round_seconds: float = 2.0,
+) -> BenchmarkRun:
+    """
+    Run every registered benchmark whose name contains name_filter.
+
+    Sized benchmarks run once per size. After a single round, a case that took
+    longer than max_round_seconds is not repeated (large LogStore sizes).
+    """
+    run = BenchmarkRun()
+    for name in sorted(_REGISTRY):
+        if name_filter and name_filter not in name:
+            continue
+        setup, fn, sized = _REGISTRY[name]
+        for size in sizes if sized else [None]:
+            state = setup(size)
+            timings: list[float] = []
+            for _ in range(max(1, rounds)):
+                start = time.perf_counter()
+                fn(state)
+                timings.append(time.perf_counter() - start)
+                if timings[-1] > max_round_seconds:
+                    break
+            median = statistics.median(timings)
+            run.results.append(
+                BenchmarkResult(
+                    name=name,
+                    size=size,
+                    rounds=len(timings),
+                    min_seconds=min(timings),
+                    median_seconds=median,
+                    mean_seconds=statistics.fmean(timings),
+                    max_seconds=max(timings),
+                    items_per_second=size / median if size and median > 0 else None,
+                )
+            )
+    return run
+
+
+def compare(
+    current: BenchmarkRun, baseline: BenchmarkRun, tolerance: float = 0.25
+) -> list[Regression]:
+    """Cases present in both runs whose median exceeds baseline * (1 + tolerance)."""
+    base = {baseline.key(r): r for r in baseline.results}
+    regressions = []
+    for result in current.results:
+        key = current.key(result)
+        previous = base.get(key)
+        if previous is None or previous.median_seconds <= 0:
+            continue
+        ratio = result.median_seconds / previous.median_seconds
+        if ratio > 1 + tolerance:
+            regressions.append(
+                Regression(
+                    case=key,
+                    baseline_seconds=previous.median_seconds,
+                    current_seconds=result.median_seconds,
+                    ratio=ratio,
+                )
+            )
+    return regressions
+
+
+def format_run(run: BenchmarkRun) -> str:
+    """Human-readable results table."""
+    lines = [f"{'case':<42}{'rounds':>7}{'median ms':>14}{'min ms':>12}{'items/s':>14}"]
+    for r in run.results:
+        rate = f"{r.items_per_second:,.0f}" if r.items_per_second else "-"
+        lines.append(
+            f"{run.key(r):<42}{r.rounds:>7}{r.median_seconds * 1000:>14.3f}"
+            f"{r.min_seconds * 1000:>12.3f}{rate:>14}"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,117 @@
+"""
+CLI cold-start benchmark based on ``python -X importtime``.
+
+  python -m benchmarks.startup                  # exit 1 if over target
+  python -m benchmarks.startup --target-ms 20   # tighter budget
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+from benchmarks.runner import benchmark
+
+CLI_MODULE = "autosre.cli"
+# Dependencies that must not be imported just to parse arguments / print --help
+HEAVY_MODULES = (
+    "boto3",
+    "botocore",
+    "httpx",
+    "nova_act",
+    "numpy",
+    "pydantic",
+    "pydantic_settings",
+    "slack_sdk",
+)
+DEFAULT_TARGET_MS = 30.0
+
+
+def import_profile(module: str = CLI_MODULE) -> list[tuple[str, int, int]]:
+    """Run ``python -X importtime -c 'import module'``; return (name, self_us, cumulative_us)."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|", 2)
+        rows.append((name.strip(), int(self_us), int(cumulative_us)))
+    return rows
+
+
+def module_import_ms(rows: list[tuple[str, int, int]], module: str = CLI_MODULE) -> float:
+    """Cumulative import time of `module` in milliseconds."""
+    for name, _, cumulative in rows:
+        if name == module:
+            return cumulative / 1000
+    return 0.0
+
+
+def heavy_imports(rows: list[tuple[str, int, int]]) -> list[str]:
+    """Top-level heavy dependencies that were imported."""
+    imported = {name for name, _, _ in rows}
+    return [m for m in HEAVY_MODULES if m in imported]
+
+
+def help_wall_seconds(runs: int = 5) -> list[float]:
+    """Wall time of ``python -m autosre.cli --help`` (interpreter start included)."""
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, "-m", CLI_MODULE, "--help"],
+            capture_output=True,
+            check=True,
+        )
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+@benchmark("cli.help_startup")
+def bench_cli_help_startup(state):
+    help_wall_seconds(runs=1)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="AutoSRE CLI startup benchmark")
+    parser.add_argument(
+        "--target-ms",
+        type=float,
+        default=DEFAULT_TARGET_MS,
+        help=f"Max cumulative import time of {CLI_MODULE} (default: {DEFAULT_TARGET_MS:.0f})",
+    )
+    parser.add_argument("--runs", type=int, default=5, help="Timed `--help` invocations")
+    parser.add_argument("--top", type=int, default=10, help="Show the N slowest imports")
+    args = parser.parse_args(argv)
+
+    rows = import_profile()
+    import_ms = module_import_ms(rows)
+    heavy = heavy_imports(rows)
+    wall = statistics.median(help_wall_seconds(args.runs))
+
+    print(f"{CLI_MODULE} import: {import_ms:.1f}ms (target {args.target_ms:.0f}ms)")
+    print(f"autosre --help wall time (median of {args.runs}): {wall * 1000:.1f}ms")
+    print("Slowest imports (cumulative):")
+    for name, _, cumulative in sorted(rows, key=lambda r: r[2], reverse=True)[: args.top]:
+        print(f"  {cumulative / 1000:>8.1f}ms  {name}")
+
+    ok = True
+    if heavy:
+        print(f"FAIL: heavy dependencies imported at startup: {', '.join(heavy)}")
+        ok = False
+    if import_ms > args.target_ms:
+        print(f"FAIL: {CLI_MODULE} import {import_ms:.1f}ms exceeds {args.target_ms:.0f}ms")
+        ok = False
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
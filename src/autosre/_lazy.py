@@ -0,0 +1,32 @@
+"""Lazy package exports: names are imported on first attribute access."""
+
+from __future__ import annotations
+
+import importlib
+import sys
+from collections.abc import Callable
+from typing import Any
+
+
+def lazy_exports(
+    package: str, exports: dict[str, str]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """
+    Module-level (__getattr__, __dir__) for package, resolving exports (name -> module).
+
+    Importing the package then stays cheap: each exported module is imported the first
+    time one of its names is accessed, and the value is cached in the package globals.
+    """
+
+    def __getattr__(name: str) -> Any:
+        module = exports.get(name)
+        if module is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module), name)
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(set(vars(sys.modules[package])) | exports.keys())
+
+    return __getattr__, __dir__
@@ -0,0 +1,67 @@
+"""Shared boto3 client factory (attaches the active record/playback cassette, if any)."""
+
+from __future__ import annotations
+
+import threading
+from typing import Any
+
+from autosre.config import get_settings
+
+
+def get_client(
+    service_name: str,
+    region_name: str | None = None,
+    sdk_retries: bool = True,
+    **kwargs: Any,
+) -> Any:
+    """
+    Create a boto3 client for service_name in region_name (default: configured region).
+
+    Every AWS call site goes through here so calls can be recorded to or played back
+    from a cassette (see autosre.cassette). Pass sdk_retries=False when the calls are
+    wrapped in an autosre.retry.RetryPolicy, so botocore does not retry underneath it.
+    """
+    import boto3
+
+    from autosre.cassette import active_cassette
+
+    if not sdk_retries:
+        from botocore.config import Config
+
+        from autosre.retry import BOTO_NO_RETRIES
+
+        no_retries = Config(retries=BOTO_NO_RETRIES)
+        config = kwargs.get("config")
+        kwargs["config"] = config.merge(no_retries) if config is not None else no_retries
+
+    client = boto3.client(
+        service_name, region_name=region_name or get_settings().aws_region, **kwargs
+    )
+    cassette = active_cassette()
+    if cassette is not None:
+        cassette.attach(client)
+    return client
+
+
+class ClientCache:
+    """
+    One boto3 client per (service, region), created on first use and then shared.
+
+    boto3 clients are thread-safe, so concurrent fan-out and wait-for-stable polling
+    threads reuse a region's client (and its connection pool) instead of building one
+    per call.
+    """
+
+    def __init__(self, sdk_retries: bool = True) -> None:
+        self._sdk_retries = sdk_retries
+        self._lock = threading.Lock()
+        self._clients: dict[tuple[str, str | None], Any] = {}
+
+    def get(self, service_name: str, region_name: str | None = None) -> Any:
+        key = (service_name, region_name or None)
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None:
+                client = get_client(service_name, region_name, sdk_retries=self._sdk_retries)
+                self._clients[key] = client
+            return client
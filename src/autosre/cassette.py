@@ -0,0 +1,304 @@
+"""
+Record/playback of AWS API calls (CloudWatch, Logs, Lambda, Bedrock) for offline runs.
+
+A cassette attaches to boto3 clients through botocore's event hooks, so every call
+path (direct calls, paginators, waiters, modeled exceptions, Converse streams) is
+captured. Interactions are stored as gzip-compressed JSON lines. In playback mode
+requests never reach the network: the recorded response (or error) is returned
+after the recorded latency multiplied by latency_scale.
+"""
+
+from __future__ import annotations
+
+import atexit
+import base64
+import gzip
+import io
+import json
+import logging
+import threading
+import time
+from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+CASSETTE_VERSION = 1
+RECORD = "record"
+PLAYBACK = "playback"
+
+_CONTEXT_KEY = "autosre_cassette"
+
+
+class CassetteMissError(LookupError):
+    """Raised in playback mode when no recorded interaction matches a call."""
+
+
+def _encode(value: Any) -> Any:
+    """Convert a boto3 request/response value into JSON-safe form."""
+    if isinstance(value, dict):
+        return {k: _encode(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_encode(v) for v in value]
+    if isinstance(value, datetime):
+        return {"__datetime__": value.isoformat()}
+    if isinstance(value, (bytes, bytearray)):
+        return {"__bytes__": base64.b64encode(bytes(value)).decode("ascii")}
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    return str(value)
+
+
+def _decode(value: Any) -> Any:
+    """Inverse of _encode."""
+    if isinstance(value, dict):
+        if "__datetime__" in value and len(value) == 1:
+            return datetime.fromisoformat(value["__datetime__"])
+        if "__bytes__" in value and len(value) == 1:
+            return base64.b64decode(value["__bytes__"])
+        return {k: _decode(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_decode(v) for v in value]
+    return value
+
+
+def _params_key(params: dict) -> str:
+    return json.dumps(_encode(params), sort_keys=True, separators=(",", ":"))
+
+
+class _PlaybackHTTPResponse:
+    """Minimal stand-in for botocore's AWSResponse when short-circuiting a call."""
+
+    def __init__(self, status_code: int) -> None:
+        self.status_code = status_code
+        self.headers: dict[str, str] = {}
+        self.content = b""
+
+
+class Cassette:
+    """
+    Recorded AWS interactions for one scenario.
+
+    Record mode captures every call made by attached clients and writes them on
+    save(). Playback mode answers calls from the recording: interactions are matched
+    by service, operation and request parameters (falling back to the next unplayed
+    interaction of the same operation), and the last match is repeated once a
+    sequence is exhausted so polling loops keep working.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        mode: str = PLAYBACK,
+        latency_scale: float = 1.0,
+    ) -> None:
+        if mode not in (RECORD, PLAYBACK):
+            raise ValueError(f"Unknown cassette mode: {mode!r}")
+        self.path = Path(path)
+        self.mode = mode
+        self.latency_scale = max(0.0, latency_scale)
+        self._lock = threading.Lock()
+        self._interactions: list[dict] = []
+        self._by_params: dict[tuple[str, str, str], deque[dict]] = {}
+        self._by_operation: dict[tuple[str, str], deque[dict]] = {}
+        self._last: dict[tuple[str, str], dict] = {}
+        if mode == PLAYBACK:
+            self._load()
+
+    @property
+    def interactions(self) -> list[dict]:
+        """Recorded interactions (in call order)."""
+        return list(self._interactions)
+
+    def _load(self) -> None:
+        with gzip.open(self.path, "rt", encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                if "operation" not in entry:
+                    continue  # header
+                self._interactions.append(entry)
+        for entry in self._interactions:
+            op_key = (entry["service"], entry["operation"])
+            self._by_params.setdefault((*op_key, entry["params_key"]), deque()).append(entry)
+            self._by_operation.setdefault(op_key, deque()).append(entry)
+
+    def save(self) -> None:
+        """Write recorded interactions to the cassette file (record mode only)."""
+        if self.mode != RECORD:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            entries = list(self._interactions)
+        with gzip.open(self.path, "wt", encoding="utf-8") as f:
+            f.write(json.dumps({"version": CASSETTE_VERSION}) + "\n")
+            for entry in entries:
+                f.write(json.dumps(entry, separators=(",", ":")) + "\n")
+        logger.info("Cassette saved: %s (%s interactions)", self.path, len(entries))
+
+    def attach(self, client: Any) -> Any:
+        """Register record/playback hooks on a boto3 client; returns the client."""
+        service = client.meta.service_model.service_name
+        events = client.meta.events
+        events.register("before-parameter-build", self._make_capture_handler(service))
+        if self.mode == PLAYBACK:
+            events.register_first("before-call", self._before_call)
+        else:
+            events.register_last("after-call", self._after_call)
+        return client
+
+    def _make_capture_handler(self, service: str):
+        def capture(params: dict, model: Any, context: dict, **kwargs: Any) -> None:
+            context[_CONTEXT_KEY] = {
+                "service": service,
+                "operation": model.name,
+                "params": _encode(params),
+                "params_key": _params_key(params),
+                "start": time.perf_counter(),
+            }
+
+        return capture
+
+    @staticmethod
+    def _pop_unplayed(queue: deque[dict] | None) -> dict | None:
+        while queue:
+            entry = queue.popleft()
+            if not entry.get("_played"):
+                return entry
+        return None
+
+    def _match(self, service: str, operation: str, params_key: str) -> dict:
+        op_key = (service, operation)
+        with self._lock:
+            entry = self._pop_unplayed(self._by_params.get((*op_key, params_key)))
+            if entry is None:
+                entry = self._pop_unplayed(self._by_operation.get(op_key))
+            if entry is None:
+                entry = self._last.get(op_key)
+            if entry is None:
+                raise CassetteMissError(f"No recorded interaction for {service}.{operation}")
+            entry["_played"] = True
+            self._last[op_key] = entry
+            return entry
+
+    def _before_call(self, context: dict, **kwargs: Any):
+        call = context.get(_CONTEXT_KEY)
+        if call is None:
+            return None
+        entry = self._match(call["service"], call["operation"], call["params_key"])
+        delay = entry.get("duration", 0.0) * self.latency_scale
+        if delay > 0:
+            time.sleep(delay)
+        response = _decode(entry["response"])
+        if "stream" in entry:
+            response["stream"] = self._play_stream(entry["stream"])
+        if "body" in entry:
+            from botocore.response import StreamingBody
+
+            data = base64.b64decode(entry["body"]["data"])
+            response[entry["body"]["key"]] = StreamingBody(io.BytesIO(data), len(data))
+        return _PlaybackHTTPResponse(entry.get("status", 200)), response
+
+    def _play_stream(self, events: list) -> Iterator[dict]:
+        previous = 0.0
+        for offset, event in events:
+            delay = (offset - previous) * self.latency_scale
+            if delay > 0:
+                time.sleep(delay)
+            previous = offset
+            yield _decode(event)
+
+    def _after_call(self, http_response: Any, parsed: dict, context: dict, **kwargs: Any) -> None:
+        call = context.get(_CONTEXT_KEY)
+        if call is None:
+            return
+        start = call.pop("start")
+        entry = dict(call)
+        entry["status"] = getattr(http_response, "status_code", 200)
+        entry["duration"] = time.perf_counter() - start
+        response = dict(parsed)
+        stream_key = self._streaming_key(response)
+        if stream_key == "stream":
+            entry["stream"] = []
+            response.pop("stream")
+            parsed["stream"] = self._record_stream(
+                parsed["stream"], entry["stream"], time.perf_counter()
+            )
+        elif stream_key is not None:
+            data = parsed[stream_key].read()
+            from botocore.response import StreamingBody
+
+            parsed[stream_key] = StreamingBody(io.BytesIO(data), len(data))
+            response.pop(stream_key)
+            entry["body"] = {"key": stream_key, "data": base64.b64encode(data).decode("ascii")}
+        entry["response"] = _encode(response)
+        with self._lock:
+            self._interactions.append(entry)
+
+    @staticmethod
+    def _streaming_key(response: dict) -> str | None:
+        for key, value in response.items():
+            if key == "stream" and hasattr(value, "__iter__") and not isinstance(value, dict):
+                return key
+            if hasattr(value, "read") and callable(value.read):
+                return key
+        return None
+
+    def _record_stream(self, stream: Any, sink: list, base: float) -> Iterator[dict]:
+        for event in stream:
+            sink.append([time.perf_counter() - base, _encode(event)])
+            yield event
+
+
+_active: Cassette | None = None
+_active_lock = threading.Lock()
+_settings_cassette_loaded = False
+
+
+def active_cassette() -> Cassette | None:
+    """
+    Return the cassette new AWS clients should attach to.
+
+    An explicit use_cassette() context wins; otherwise the cassette configured via
+    cassette_mode / cassette_path settings is opened once per process.
+    """
+    global _active, _settings_cassette_loaded
+    if _active is not None or _settings_cassette_loaded:
+        return _active
+    with _active_lock:
+        if _active is None and not _settings_cassette_loaded:
+            _settings_cassette_loaded = True
+            from autosre.config import get_settings
+
+            settings = get_settings()
+            mode = (settings.cassette_mode or "").strip().lower()
+            if mode and settings.cassette_path:
+                _active = Cassette(
+                    settings.cassette_path,
+                    mode=mode,
+                    latency_scale=settings.cassette_latency_scale,
+                )
+                if _active.mode == RECORD:
+                    atexit.register(_active.save)
+    return _active
+
+
+@contextmanager
+def use_cassette(path: str | Path, mode: str = PLAYBACK, latency_scale: float = 1.0):
+    """Attach a cassette to all AWS clients created inside the block (saved on exit when recording)."""
+    global _active
+    cassette = Cassette(path, mode=mode, latency_scale=latency_scale)
+    with _active_lock:
+        previous = _active
+        _active = cassette
+    try:
+        yield cassette
+    finally:
+        with _active_lock:
+            _active = previous
+        cassette.save()
@@ -1,23 +1,121 @@
-"""CLI entry point for AutoSRE."""
+"""
+CLI entry point for AutoSRE.
+
+Only argparse and the standard library are imported at module load; pydantic,
+httpx, boto3 and the workflow stages are imported once a command actually runs,
+so ``autosre --help`` / ``--version`` start fast (e.g. from Lambda or cron).
+"""
 
 import argparse
 import sys
 
-from autosre.models import IncidentType
-from autosre.workflow import run_demo, run_once
+from autosre import __version__
+
+# Mirrors autosre.models.IncidentType values (kept literal to avoid importing pydantic here)
+INCIDENT_TYPES = ("latency_spike", "crash_loop", "memory_leak", "deployment_failure")
+
+
+def _run_replay(args: argparse.Namespace) -> int:
+    """Replay recorded incidents offline and print the latency report."""
+    from autosre.replay import replay_incidents
+
+    report = replay_incidents(
+        args.source,
+        speedup=args.speedup,
+        limit=args.limit,
+        cassette=args.cassette,
+        latency_scale=args.latency_scale,
+    )
+    if args.json:
+        print(report.model_dump_json(indent=2))
+    else:
+        print(report.format_text())
+    return 0 if report.incidents else 1
+
 
+def _run_serve(args: argparse.Namespace) -> int:
+    """Run the long-lived poller + worker pool until SIGTERM/SIGINT."""
+    from autosre.config import get_settings
+    from autosre.daemon import AutoSREDaemon
 
-def main() -> int:
+    overrides = {
+        "serve_host": args.host,
+        "serve_port": args.port,
+        "serve_workers": args.workers,
+        "serve_poll_interval_seconds": args.poll_interval,
+    }
+    settings = get_settings().model_copy(
+        update={k: v for k, v in overrides.items() if v is not None}
+    )
+    return AutoSREDaemon(settings=settings).run()
+
+
+def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="AutoSRE — Self-Healing Cloud Operations Agent")
     parser.add_argument("--demo", action="store_true", help="Run deterministic demo scenario")
     parser.add_argument(
         "--incident-type",
-        choices=[t.value for t in IncidentType],
-        default=IncidentType.LATENCY_SPIKE.value,
+        choices=INCIDENT_TYPES,
+        default="latency_spike",
         help="Incident type for single run (default: latency_spike)",
     )
-    parser.add_argument("--version", action="version", version="%(prog)s 0.1.0")
-    args = parser.parse_args()
+    parser.add_argument("--version", action="version", version=f"%(prog)s {__version__}")
+    subparsers = parser.add_subparsers(dest="command")
+
+    replay = subparsers.add_parser(
+        "replay", help="Replay recorded incidents offline and report per-stage latency"
+    )
+    replay.add_argument(
+        "source", help="LogStore data dir, its incidents.json, or a JSONL file of incidents"
+    )
+    replay.add_argument(
+        "--speedup",
+        type=float,
+        default=None,
+        help="Replay recorded gaps and recovery waits compressed by this factor "
+        "(default: no waiting)",
+    )
+    replay.add_argument("--limit", type=int, default=None, help="Replay at most N incidents")
+    replay.add_argument(
+        "--cassette", default=None, help="Answer Bedrock/AWS calls from this recorded cassette"
+    )
+    replay.add_argument(
+        "--latency-scale",
+        type=float,
+        default=1.0,
+        help="Multiplier for recorded call latency during cassette playback (default: 1.0)",
+    )
+    replay.add_argument("--json", action="store_true", help="Print the report as JSON")
+
+    serve = subparsers.add_parser(
+        "serve", help="Run continuously: poll for incidents, handle them in a worker pool"
+    )
+    serve.add_argument("--host", default=None, help="Health/metrics bind host (SERVE_HOST)")
+    serve.add_argument(
+        "--port", type=int, default=None, help="Health/metrics port (SERVE_PORT, default: 8085)"
+    )
+    serve.add_argument(
+        "--workers", type=int, default=None, help="Concurrent incidents (SERVE_WORKERS, default: 2)"
+    )
+    serve.add_argument(
+        "--poll-interval",
+        type=float,
+        default=None,
+        help="Seconds between incident polls (SERVE_POLL_INTERVAL_SECONDS, default: 30)",
+    )
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _build_parser().parse_args(argv)
+
+    if args.command == "replay":
+        return _run_replay(args)
+    if args.command == "serve":
+        return _run_serve(args)
+
+    from autosre.models import IncidentType
+    from autosre.workflow import run_demo, run_once
 
     if args.demo:
         ok = run_demo()
@@ -23,6 +23,61 @@ class Settings(BaseSettings):
     bedrock_read_timeout_seconds: int = 300
     # Set true to call Bedrock Nova for reasoning; false uses stub (demo/CI without AWS)
     reasoning_use_bedrock: bool = False
+    # Model cascade: the fast model (nova_model_id) answers first; below the confidence
+    # threshold the escalation model (e.g. Nova Pro) is asked. Empty = single model.
+    reasoning_escalation_model_id: str = ""
+    reasoning_cascade_confidence_threshold: float = 0.7
+    # Also start the escalation model if the fast one takes longer than this (0 = never)
+    reasoning_cascade_hedge_seconds: float = 0.0
+    # USD per 1K (input, output) tokens by model id substring, JSON; extends built-in Nova prices
+    reasoning_model_prices: dict[str, tuple[float, float]] = {}
+    # Max estimated tokens of log lines sent to the model (0 = no limit); over budget, lines
+    # are deduplicated and ranked (errors, stack traces, near detection/deploys first)
+    reasoning_log_token_budget: int = 6000
+    # Stream the Converse response so recommended_action/confidence are known before it finishes
+    reasoning_streaming: bool = False
+    # Circuit breaker: after failure_threshold failures among the last `window` model calls
+    # (or a p95 latency above slow_call_seconds) Bedrock is skipped for open_seconds and
+    # incidents get rules / stale cached / similar-incident diagnoses, or escalation
+    reasoning_breaker_enabled: bool = True
+    reasoning_breaker_failure_threshold: int = 5
+    reasoning_breaker_window: int = 20
+    reasoning_breaker_slow_call_seconds: float = 60.0
+    reasoning_breaker_open_seconds: float = 60.0
+    # How long past its TTL a cached diagnosis may still be used while the circuit is open
+    reasoning_breaker_stale_cache_seconds: float = 86400.0
+    # Client-side Bedrock quota per model (0 = unlimited): requests and tokens per minute,
+    # overridable per model id substring, e.g. {"nova-pro": [50, 100000]}. A call waits
+    # at most max_wait_seconds for quota. max_concurrency bounds analyze_many fan-out.
+    reasoning_rpm: int = 0
+    reasoning_tpm: int = 0
+    reasoning_rate_limits: dict[str, tuple[int, int]] = {}
+    reasoning_rate_limit_max_wait_seconds: float = 60.0
+    reasoning_max_concurrency: int = 4
+    # Put a Bedrock prompt-cache checkpoint after the static system prompt and examples
+    # (turned off per model automatically if the model rejects it)
+    reasoning_prompt_cache: bool = True
+    # Deterministic rules checked before the model (e.g. "too many connections" → restart_db_pool);
+    # optional JSON file of extra rules is checked before the built-in ones
+    reasoning_rules_enabled: bool = True
+    reasoning_rules_path: str = ""
+    # Reuse a diagnosis for a recurring incident (same type, service, log templates and
+    # latest deployment) for this long; optional JSON file keeps entries across restarts
+    diagnosis_cache_enabled: bool = True
+    diagnosis_cache_ttl_seconds: float = 900.0
+    diagnosis_cache_max_entries: int = 256
+    diagnosis_cache_path: str = ""
+    # Retrieval over past incident outcomes (log store): the top_k most similar incidents
+    # scoring >= min_score go into the prompt; a recovered near-duplicate skips the model
+    similarity_enabled: bool = True
+    similarity_top_k: int = 3
+    similarity_min_score: float = 0.3
+    similarity_near_duplicate_threshold: float = 0.95
+
+    # Remediation plan catalog: optional JSON with {"plans": {action: [steps]}, "services":
+    # {service: {action: [steps]}}} overriding the built-in plans; replicas for scale_up
+    planner_catalog_path: str = ""
+    planner_scale_replicas: int = 4
 
     # Slack
     slack_bot_token: str = ""
@@ -42,20 +97,88 @@ class Settings(BaseSettings):
     lambda_function_name: str = ""
     # Lambda alias to roll back (e.g. live, prod); default "live"
     lambda_alias_name: str = "live"
+    # Published versions are indexed per function (all pages) for rollback; the index is
+    # refreshed incrementally once older than this
+    lambda_version_index_ttl_seconds: float = 300.0
+    # Rollback: "direct" flips the alias at once; "gradual" pre-warms the target version
+    # with concurrent invocations, then shifts traffic through the weights (checking the
+    # target's CloudWatch Errors/Throttles after each step) before finalizing. Warm-up
+    # invocations send {"autosre_warmup": true}; handlers must return early on it
+    lambda_rollback_mode: str = "direct"
+    lambda_rollback_weights: list[float] = [0.1, 0.5]
+    lambda_rollback_step_seconds: float = 60.0
+    lambda_rollback_warm_invocations: int = 3
+    # Resources (ARNs: ECS services, Lambda functions, RDS DB instances) that restart,
+    # scale_up and restart_db_pool act on, per service, e.g. {"checkout": ["arn:aws:ecs:..."]};
+    # without an entry the Lambda function above is used. Each resource is polled until stable
+    aws_remediation_resources: dict[str, list[str]] = {}
+    # restart_db_pool may reboot RDS instances among those resources (the database is down
+    # while it reboots); off: RDS resources are skipped by pool resets
+    aws_allow_db_reboot: bool = False
+    aws_wait_timeout_seconds: float = 240.0
+    aws_wait_poll_seconds: float = 10.0
     # CloudWatch Logs group for RCA (e.g. /aws/lambda/<name>); default derived from lambda_function_name if empty
     lambda_log_group_name: str = ""
 
     # UI automation (Nova Act): True = stub only; False = use real browser
     ui_stub: bool = True
     nova_act_api_key: str = ""
+    # Warm, logged-in Nova Act browsers reused across incidents (0 = new browser per run);
+    # sessions older than the max age are recycled
+    ui_session_pool_size: int = 2
+    ui_session_max_age_seconds: float = 1800.0
+    ui_session_acquire_timeout_seconds: float = 60.0
+    # Run browsers in this many worker subprocesses (each keeps one warm session), so UI
+    # remediations of concurrent incidents run in parallel (suits `autosre serve`);
+    # 0 = in-process, using the session pool above
+    ui_worker_processes: int = 0
+    ui_worker_task_timeout_seconds: float = 600.0
+    # Merge navigation steps with the action that follows them into one Nova Act call
+    ui_coalesce_prompts: bool = True
+    # With real UI automation, run plans whose steps all map to dashboard API calls
+    # (e.g. rollback) over HTTP instead of the browser; Nova Act handles the rest
+    dashboard_api_enabled: bool = True
+    dashboard_api_timeout_seconds: float = 5.0
+
+    # Remediation: steps of a plan run as a DAG (depends_on); independent steps run in
+    # parallel up to remediation_max_parallel, each bounded by the step timeout (0 = none)
+    remediation_max_parallel: int = 4
+    remediation_step_timeout_seconds: float = 300.0
+    # Journal of applied remediation steps per incident (append-only JSON lines when a path
+    # is set): a retried or re-triggered incident skips the steps that already succeeded
+    remediation_journal_enabled: bool = True
+    remediation_journal_path: str = ""
+    remediation_journal_retention_seconds: float = 86400.0
 
     # Phase 6: incident / log storage (optional file persistence)
     log_storage_data_dir: str = ""
 
+    # AWS call cassette: "record" captures boto3 calls to cassette_path, "playback" replays
+    # them offline; recorded latency is multiplied by cassette_latency_scale on playback
+    cassette_mode: str = ""
+    cassette_path: str = ""
+    cassette_latency_scale: float = 1.0
+
     # Phase 7: workflow hardening
     reasoning_max_retries: int = 2
+    # Backoff for Bedrock/AWS/Slack calls: throttling, timeouts and 5xx are retried with
+    # exponential backoff + full jitter, capped per sleep and in total per call
+    retry_max_attempts: int = 3
+    retry_base_delay_seconds: float = 0.5
+    retry_max_delay_seconds: float = 8.0
+    retry_max_total_seconds: float = 30.0
     recovery_verify_timeout_seconds: float = 120.0
 
+    # `autosre serve` daemon: poller + worker pool + health/metrics HTTP port
+    serve_host: str = "0.0.0.0"
+    serve_port: int = 8085
+    serve_workers: int = 2
+    serve_poll_interval_seconds: float = 30.0
+    # Max wait for in-flight incidents on SIGTERM before exiting
+    serve_drain_timeout_seconds: float = 150.0
+    # Ignore the same alarm for this long after it was handled (it may still read ALARM)
+    serve_dedupe_cooldown_seconds: float = 300.0
+
 
 def get_settings() -> Settings:
     """Return loaded settings from environment (and .env if present)."""
@@ -0,0 +1,377 @@
+"""
+Long-running AutoSRE service (``autosre serve``).
+
+Keeps one warm process: a poller reads the incident source every poll interval and
+hands new incidents to a worker pool that runs the workflow. A small HTTP server
+exposes /healthz and Prometheus-style /metrics. SIGTERM/SIGINT stop polling and
+drain in-flight incidents (up to the drain timeout) before exiting.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import json
+import logging
+import queue
+import signal
+import threading
+import time
+from collections.abc import Callable, Iterable
+from concurrent.futures import Future, wait
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+from autosre.config import Settings, get_settings
+from autosre.incident_detection import get_incident_stream
+from autosre.models import IncidentEvent
+from autosre.reasoning_agent.breaker import BreakerState, get_circuit_breaker
+from autosre.reasoning_agent.cache import get_diagnosis_cache
+from autosre.remediation.journal import get_action_journal
+from autosre.ui_automation.session_pool import close_session_pool, get_session_pool
+from autosre.ui_automation.workers import close_ui_worker_pool, get_ui_worker_pool
+from autosre.workflow import WorkflowComponents, build_components, build_monitor, run_incident
+
+logger = logging.getLogger(__name__)
+
+
+def _dedupe_key(incident: IncidentEvent) -> str:
+    """Same alarm → same key, so a still-firing alarm is not handled twice."""
+    alarm = (incident.raw_payload or {}).get("AlarmName")
+    return f"alarm:{alarm}" if alarm else f"incident:{incident.incident_id}"
+
+
+class _DaemonWorkerPool:
+    """
+    Minimal executor on daemon threads.
+
+    ThreadPoolExecutor workers are joined at interpreter exit, so an incident still
+    running after the drain timeout would keep the process alive. These are not.
+    """
+
+    def __init__(self, workers: int, thread_name_prefix: str) -> None:
+        self._tasks: queue.SimpleQueue = queue.SimpleQueue()
+        self._threads = [
+            threading.Thread(target=self._work, name=f"{thread_name_prefix}_{i}", daemon=True)
+            for i in range(workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def submit(self, fn: Callable[..., Any], *args: Any) -> Future:
+        future: Future = Future()
+        self._tasks.put((future, fn, args))
+        return future
+
+    def _work(self) -> None:
+        while True:
+            task = self._tasks.get()
+            if task is None:
+                return
+            future, fn, args = task
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(fn(*args))
+            except BaseException as e:  # noqa: BLE001
+                future.set_exception(e)
+
+    def shutdown(self) -> None:
+        """Let the workers exit once idle (does not wait for running tasks)."""
+        for _ in self._threads:
+            self._tasks.put(None)
+
+
+class DaemonMetrics:
+    """Thread-safe counters exported on /metrics."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.started_at = time.monotonic()
+        self.polls = 0
+        self.poll_errors = 0
+        self.received = 0
+        self.skipped_duplicate = 0
+        self.deferred = 0
+        self.in_flight = 0
+        self.outcomes: dict[str, int] = {"recovered": 0, "not_recovered": 0, "error": 0}
+        self.stage_seconds: dict[str, float] = {}
+        self.stage_count: dict[str, int] = {}
+
+    def incr(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            setattr(self, name, getattr(self, name) + amount)
+
+    def record_run(self, outcome: str, stage_timings: dict[str, float]) -> None:
+        with self._lock:
+            self.outcomes[outcome] = self.outcomes.get(outcome, 0) + 1
+            for stage, seconds in stage_timings.items():
+                self.stage_seconds[stage] = self.stage_seconds.get(stage, 0.0) + seconds
+                self.stage_count[stage] = self.stage_count.get(stage, 0) + 1
+
+    def render(self) -> str:
+        """Prometheus text exposition format."""
+        with self._lock:
+            lines = [
+                "# TYPE autosre_uptime_seconds gauge",
+                f"autosre_uptime_seconds {time.monotonic() - self.started_at:.3f}",
+                "# TYPE autosre_polls_total counter",
+                f"autosre_polls_total {self.polls}",
+                f"autosre_poll_errors_total {self.poll_errors}",
+                "# TYPE autosre_incidents_received_total counter",
+                f"autosre_incidents_received_total {self.received}",
+                f"autosre_incidents_skipped_duplicate_total {self.skipped_duplicate}",
+                f"autosre_incidents_deferred_total {self.deferred}",
+                "# TYPE autosre_incidents_in_flight gauge",
+                f"autosre_incidents_in_flight {self.in_flight}",
+                "# TYPE autosre_incidents_total counter",
+            ]
+            lines += [
+                f'autosre_incidents_total{{outcome="{outcome}"}} {count}'
+                for outcome, count in sorted(self.outcomes.items())
+            ]
+            lines.append("# TYPE autosre_stage_seconds summary")
+            for stage in sorted(self.stage_seconds):
+                lines.append(
+                    f'autosre_stage_seconds_sum{{stage="{stage}"}} {self.stage_seconds[stage]:.6f}'
+                )
+                lines.append(
+                    f'autosre_stage_seconds_count{{stage="{stage}"}} {self.stage_count[stage]}'
+                )
+        return "\n".join(lines) + "\n"
+
+
+class AutoSREDaemon:
+    """
+    Warm incident-processing service.
+
+    Components are built once; each worker thread gets its own RecoveryMonitor
+    (it keeps per-run state) and shares the rest. Incidents whose alarm is already
+    being handled, or was handled within the dedupe cooldown, are skipped; when all
+    workers are busy, further incidents are left for the next poll.
+
+    Without an incident_source, get_incident_stream is polled: CloudWatch alarms with
+    use_aws_integration, otherwise the simulator (whose incidents carry a stable
+    simulated AlarmName, so they dedupe the same way).
+    """
+
+    def __init__(
+        self,
+        settings: Settings | None = None,
+        incident_source: Callable[[], Iterable[IncidentEvent]] | None = None,
+        components: WorkflowComponents | None = None,
+    ) -> None:
+        self._settings = settings or get_settings()
+        self._incident_source = incident_source or get_incident_stream
+        self._components = components or build_components(self._settings)
+        self._workers = max(1, self._settings.serve_workers)
+        self._executor = _DaemonWorkerPool(self._workers, thread_name_prefix="autosre-worker")
+        self._local = threading.local()
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        self._active: dict[str, Future] = {}
+        self._cooldown_until: dict[str, float] = {}
+        self._http: ThreadingHTTPServer | None = None
+        self.metrics = DaemonMetrics()
+
+    @property
+    def draining(self) -> bool:
+        return self._stop.is_set()
+
+    @property
+    def http_port(self) -> int | None:
+        return self._http.server_port if self._http else None
+
+    def cache_metrics(self) -> str:
+        """Diagnosis cache counters in Prometheus text format ("" when the cache is off)."""
+        if not self._settings.diagnosis_cache_enabled:
+            return ""
+        stats = get_diagnosis_cache(self._settings).stats()
+        return (
+            "# TYPE autosre_diagnosis_cache_hits_total counter\n"
+            f"autosre_diagnosis_cache_hits_total {stats['hits']}\n"
+            f"autosre_diagnosis_cache_misses_total {stats['misses']}\n"
+            f"autosre_diagnosis_cache_evictions_total {stats['evictions']}\n"
+            "# TYPE autosre_diagnosis_cache_entries gauge\n"
+            f"autosre_diagnosis_cache_entries {stats['size']}\n"
+        )
+
+    def breaker_metrics(self) -> str:
+        """Bedrock circuit breaker state in Prometheus text format ("" when it is off)."""
+        if not self._settings.reasoning_breaker_enabled:
+            return ""
+        stats = get_circuit_breaker(self._settings).stats()
+        states = "".join(
+            f'autosre_bedrock_circuit_state{{state="{state.value}"}} '
+            f"{int(stats['state'] == state.value)}\n"
+            for state in BreakerState
+        )
+        return (
+            "# TYPE autosre_bedrock_circuit_state gauge\n"
+            f"{states}"
+            "# TYPE autosre_bedrock_circuit_opened_total counter\n"
+            f"autosre_bedrock_circuit_opened_total {stats['times_opened']}\n"
+            f"autosre_bedrock_circuit_rejected_total {stats['rejected']}\n"
+            "# TYPE autosre_bedrock_latency_seconds gauge\n"
+            f'autosre_bedrock_latency_seconds{{quantile="0.5"}} {stats["p50_seconds"]}\n'
+            f'autosre_bedrock_latency_seconds{{quantile="0.95"}} {stats["p95_seconds"]}\n'
+        )
+
+    def journal_metrics(self) -> str:
+        """Remediation journal counters in Prometheus text format ("" when it is off)."""
+        if not self._settings.remediation_journal_enabled:
+            return ""
+        stats = get_action_journal(self._settings).stats()
+        return (
+            "# TYPE autosre_remediation_journal_hits_total counter\n"
+            f"autosre_remediation_journal_hits_total {stats['hits']}\n"
+            "# TYPE autosre_remediation_journal_entries gauge\n"
+            f"autosre_remediation_journal_entries {stats['entries']}\n"
+        )
+
+    def _worker_components(self) -> WorkflowComponents:
+        components = getattr(self._local, "components", None)
+        if components is None:
+            components = dataclasses.replace(
+                self._components, monitor=build_monitor(self._settings)
+            )
+            self._local.components = components
+        return components
+
+    def _handle(self, key: str, incident: IncidentEvent) -> None:
+        timings: dict[str, float] = {}
+        outcome = "error"
+        try:
+            recovered = run_incident(
+                incident, self._worker_components(), settings=self._settings, stage_timings=timings
+            )
+            outcome = "recovered" if recovered else "not_recovered"
+        except Exception as e:
+            logger.warning("Workflow failed for %s: %s", incident.incident_id, e, exc_info=True)
+        finally:
+            self.metrics.record_run(outcome, timings)
+            with self._lock:
+                self._active.pop(key, None)
+                self._cooldown_until[key] = (
+                    time.monotonic() + self._settings.serve_dedupe_cooldown_seconds
+                )
+            self.metrics.incr("in_flight", -1)
+
+    def poll_once(self) -> int:
+        """Read the incident source once and submit new incidents; returns how many were queued."""
+        self.metrics.incr("polls")
+        try:
+            incidents = list(self._incident_source())
+        except Exception as e:
+            self.metrics.incr("poll_errors")
+            logger.warning("Incident poll failed: %s", e, exc_info=True)
+            return 0
+        queued = 0
+        now = time.monotonic()
+        for incident in incidents:
+            self.metrics.incr("received")
+            key = _dedupe_key(incident)
+            with self._lock:
+                if key in self._active or self._cooldown_until.get(key, 0.0) > now:
+                    self.metrics.incr("skipped_duplicate")
+                    continue
+                if len(self._active) >= self._workers or self._stop.is_set():
+                    self.metrics.incr("deferred")
+                    continue
+                self.metrics.incr("in_flight")
+                self._active[key] = self._executor.submit(self._handle, key, incident)
+            queued += 1
+            logger.info("Queued incident %s (%s)", incident.incident_id, key)
+        return queued
+
+    def start_http(self) -> None:
+        """Serve /healthz and /metrics on the configured host/port (background thread)."""
+        daemon = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                if self.path.startswith("/healthz"):
+                    status = "draining" if daemon.draining else "ok"
+                    body = json.dumps(
+                        {"status": status, "in_flight": daemon.metrics.in_flight}
+                    ).encode()
+                    self._reply(503 if daemon.draining else 200, "application/json", body)
+                elif self.path.startswith("/metrics"):
+                    body = (
+                        daemon.metrics.render()
+                        + daemon.cache_metrics()
+                        + daemon.breaker_metrics()
+                        + daemon.journal_metrics()
+                    ).encode()
+                    self._reply(200, "text/plain; version=0.0.4", body)
+                else:
+                    self._reply(404, "text/plain", b"not found\n")
+
+            def _reply(self, code: int, content_type: str, body: bytes) -> None:
+                self.send_response(code)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args) -> None:
+                logger.debug("http: " + format, *args)
+
+        self._http = ThreadingHTTPServer(
+            (self._settings.serve_host, self._settings.serve_port), Handler
+        )
+        threading.Thread(target=self._http.serve_forever, name="autosre-http", daemon=True).start()
+        logger.info("Health/metrics listening on %s:%s", self._settings.serve_host, self.http_port)
+
+    def stop(self, *_: object) -> None:
+        """Stop polling and begin draining (safe to call from a signal handler)."""
+        if not self._stop.is_set():
+            logger.info("Shutdown requested; draining in-flight incidents")
+        self._stop.set()
+
+    def drain(self) -> bool:
+        """
+        Wait for in-flight incidents up to the drain timeout; returns True if all finished.
+
+        Incidents still running after the timeout do not hold up process exit.
+        """
+        with self._lock:
+            pending = list(self._active.values())
+        _, not_done = wait(pending, timeout=self._settings.serve_drain_timeout_seconds)
+        self._executor.shutdown()
+        if not_done:
+            logger.warning("Drain timeout; abandoning %s incident(s) still running", len(not_done))
+        return not not_done
+
+    def run(self, install_signal_handlers: bool = True) -> int:
+        """Poll until stop() (or SIGTERM/SIGINT), then drain. Returns a process exit code."""
+        if install_signal_handlers and threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGTERM, self.stop)
+            signal.signal(signal.SIGINT, self.stop)
+        if self._http is None:
+            self.start_http()
+        if self._components.ui_agent is not None and not self._settings.ui_stub:
+            # Browsers start and log in while the first poll runs, and stay warm (shared
+            # by every incident) until the service exits
+            if self._settings.ui_worker_processes > 0:
+                get_ui_worker_pool(self._settings).start()
+            elif self._settings.ui_session_pool_size > 0:
+                threading.Thread(
+                    target=get_session_pool(self._settings).warm,
+                    name="autosre-ui-warm",
+                    daemon=True,
+                ).start()
+        logger.info(
+            "AutoSRE serving: %s worker(s), polling every %ss",
+            self._workers,
+            self._settings.serve_poll_interval_seconds,
+        )
+        while not self._stop.is_set():
+            self.poll_once()
+            self._stop.wait(self._settings.serve_poll_interval_seconds)
+        drained = self.drain()
+        close_session_pool()
+        close_ui_worker_pool()
+        if self._http is not None:
+            self._http.shutdown()
+            self._http.server_close()
+        return 0 if drained else 1
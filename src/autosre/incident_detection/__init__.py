@@ -5,8 +5,14 @@ Receives alerts from monitoring source (simulated CloudWatch or real CloudWatch
 Outputs structured IncidentEvent.
 """
 
-from autosre.incident_detection.simulator import DEMO_INCIDENT_ID
-from autosre.models import IncidentType
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from autosre._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from autosre.models import IncidentType
 
 
 def get_incident_stream(
@@ -36,3 +42,7 @@ def get_incident_stream(
 
 
 __all__ = ["DEMO_INCIDENT_ID", "get_incident_stream"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__, {"DEMO_INCIDENT_ID": "autosre.incident_detection.simulator"}
+)
@@ -6,6 +6,7 @@ import logging
 from datetime import datetime, timezone
 from uuid import uuid4
 
+from autosre.aws_clients import get_client
 from autosre.config import get_settings
 from autosre.models import IncidentEvent, IncidentType
 
@@ -86,9 +87,7 @@ def get_incident_stream(
         names = [n.strip() for n in settings.cloudwatch_alarm_names.split(",") if n.strip()]
 
     try:
-        import boto3
-
-        client = boto3.client("cloudwatch", region_name=settings.aws_region)
+        client = get_client("cloudwatch", region_name=settings.aws_region)
         kwargs = {"StateValue": "ALARM"}
         if names:
             kwargs["AlarmNames"] = names
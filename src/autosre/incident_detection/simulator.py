@@ -18,14 +18,19 @@ def get_incident_stream(
 
     For demo: use incident_type=IncidentType.LATENCY_SPIKE and
     incident_id=DEMO_INCIDENT_ID (or "inc-demo0001") for deterministic flow.
+    Each event names a stable simulated alarm (per service and incident type), so
+    repeated polls of a still-firing simulated incident dedupe like a CloudWatch alarm.
     """
+    incident_type = incident_type or IncidentType.LATENCY_SPIKE
+    service_name = "checkout"
     event = IncidentEvent(
         incident_id=incident_id or f"inc-{uuid4().hex[:8]}",
-        incident_type=incident_type or IncidentType.LATENCY_SPIKE,
-        service_name="checkout",
+        incident_type=incident_type,
+        service_name=service_name,
         detected_at=datetime.utcnow(),
         raw_payload={
             "source": "simulated",
+            "AlarmName": f"simulated-{service_name}-{incident_type.value}",
             "metric": "latency_p99",
             "value": 2500,
             "threshold": 500,
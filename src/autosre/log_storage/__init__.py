@@ -4,6 +4,17 @@ Log storage abstraction.
 Provides logs and deployment history for root cause analysis.
 """
 
-from autosre.log_storage.store import LogStore
+from typing import TYPE_CHECKING
+
+from autosre._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from autosre.log_storage.store import LogStore
+
+_EXPORTS = {
+    "LogStore": "autosre.log_storage.store",
+}
 
 __all__ = ["LogStore"]
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -5,8 +5,10 @@ from __future__ import annotations
 import logging
 from datetime import timezone
 
+from autosre.aws_clients import get_client
 from autosre.config import get_settings
 from autosre.models import IncidentEvent
+from autosre.retry import RetryPolicy
 
 logger = logging.getLogger(__name__)
 
@@ -51,9 +53,8 @@ def get_logs_for_incident_cloudwatch(
     start_ts_ms = end_ts_ms - (window_seconds * 1000)
 
     try:
-        import boto3
-
-        client = boto3.client("logs", region_name=settings.aws_region)
+        client = get_client("logs", region_name=settings.aws_region, sdk_retries=False)
+        retry = RetryPolicy.from_settings(settings)
         lines: list[str] = []
         next_token = None
         while True:
@@ -64,7 +65,9 @@ def get_logs_for_incident_cloudwatch(
             }
             if next_token:
                 kwargs["nextToken"] = next_token
-            response = client.filter_log_events(**kwargs)
+            response = retry.call(
+                client.filter_log_events, description="filter_log_events", **kwargs
+            )
             for event in response.get("events") or []:
                 ts = event.get("timestamp")
                 msg = event.get("message", "")
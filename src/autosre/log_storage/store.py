@@ -3,10 +3,11 @@
 from __future__ import annotations
 
 import json
+import threading
 from datetime import datetime
 from pathlib import Path
 
-from autosre.models import IncidentEvent, IncidentType
+from autosre.models import Diagnosis, IncidentEvent, IncidentType
 
 # Stub fallbacks when store has no data (backward compatible)
 STUB_LOG_SNIPPET = (
@@ -20,26 +21,49 @@ STUB_DEPLOYMENTS = [
 _INCIDENTS_FILE = "incidents.json"
 _LOG_ENTRIES_FILE = "log_entries.json"
 _DEPLOYMENTS_FILE = "deployments.json"
+_OUTCOMES_FILE = "outcomes.json"
 
 
 def _iso(dt: datetime) -> str:
     return dt.isoformat() if hasattr(dt, "isoformat") else str(dt)
 
 
+def incident_from_payload(payload: dict) -> IncidentEvent | None:
+    """Build an IncidentEvent from a stored incident dict, or None if the payload is invalid."""
+    try:
+        detected_at_str = payload.get("detected_at") or ""
+        detected_at = datetime.fromisoformat(str(detected_at_str).replace("Z", "+00:00"))
+        incident_type = IncidentType(payload["incident_type"])
+        return IncidentEvent(
+            incident_id=payload["incident_id"],
+            incident_type=incident_type,
+            service_name=payload["service_name"],
+            detected_at=detected_at,
+            raw_payload=payload.get("raw_payload") or {},
+        )
+    except (ValueError, KeyError, TypeError, AttributeError):
+        return None
+
+
 class LogStore:
     """
     Provides incident recording, logs, and deployment history for RCA.
 
     In-memory by default. If config log_storage_data_dir is set, data is
-    loaded on init and saved after each mutation (record_incident, append_log,
-    append_deployment).
+    loaded on init and saved after each mutation (record_incident, record_outcome,
+    append_log, append_deployment). With read_only=True data is loaded but never written
+    back (e.g. when replaying recorded incidents). Mutations are serialized with a lock so
+    one store can be shared by concurrent workflow runs.
     """
 
-    def __init__(self, data_dir: str | None = None) -> None:
+    def __init__(self, data_dir: str | None = None, read_only: bool = False) -> None:
         self._data_dir = Path(data_dir) if data_dir else None
+        self._read_only = read_only
+        self._lock = threading.Lock()
         self._incidents: list[dict] = []
         self._log_entries: list[dict] = []  # service_name, timestamp, message
         self._deployments: list[dict] = []  # service_name, version, timestamp, status
+        self._outcomes: list[dict] = []  # incident + diagnosis + whether remediation worked
         if self._data_dir and self._data_dir.is_dir():
             self._load()
 
@@ -48,6 +72,7 @@ class LogStore:
             (_INCIDENTS_FILE, "_incidents"),
             (_LOG_ENTRIES_FILE, "_log_entries"),
             (_DEPLOYMENTS_FILE, "_deployments"),
+            (_OUTCOMES_FILE, "_outcomes"),
         ]:
             path = self._data_dir / name
             if path.is_file():
@@ -59,7 +84,7 @@ class LogStore:
                     pass
 
     def _save(self, filename: str, data: list) -> None:
-        if not self._data_dir:
+        if not self._data_dir or self._read_only:
             return
         self._data_dir.mkdir(parents=True, exist_ok=True)
         path = self._data_dir / filename
@@ -77,44 +102,70 @@ class LogStore:
             "detected_at": _iso(incident.detected_at),
             "raw_payload": incident.raw_payload,
         }
-        self._incidents.append(payload)
-        self._save(_INCIDENTS_FILE, self._incidents)
+        with self._lock:
+            self._incidents.append(payload)
+            self._save(_INCIDENTS_FILE, self._incidents)
 
     def get_incident(self, incident_id: str) -> IncidentEvent | None:
         """Return a stored incident by id, or None (also None if payload is invalid)."""
         for p in self._incidents:
-            if p.get("incident_id") != incident_id:
-                continue
-            try:
-                detected_at_str = p.get("detected_at") or ""
-                detected_at = datetime.fromisoformat(
-                    str(detected_at_str).replace("Z", "+00:00")
-                )
-                incident_type = IncidentType(p["incident_type"])
-            except (ValueError, KeyError, TypeError):
-                return None
-            return IncidentEvent(
-                incident_id=p["incident_id"],
-                incident_type=incident_type,
-                service_name=p["service_name"],
-                detected_at=detected_at,
-                raw_payload=p.get("raw_payload") or {},
-            )
+            if p.get("incident_id") == incident_id:
+                return incident_from_payload(p)
         return None
 
+    def list_incidents(self) -> list[IncidentEvent]:
+        """Return all stored incidents in recorded order (invalid payloads are skipped)."""
+        incidents = []
+        for p in self._incidents:
+            incident = incident_from_payload(p)
+            if incident is not None:
+                incidents.append(incident)
+        return incidents
+
+    def record_outcome(
+        self,
+        incident: IncidentEvent,
+        diagnosis: Diagnosis,
+        recovered: bool,
+        recovery_seconds: float = 0.0,
+        log_templates: list[str] | None = None,
+    ) -> dict:
+        """Record how an incident was diagnosed and whether remediation worked; returns it."""
+        outcome = {
+            "incident_id": incident.incident_id,
+            "incident_type": incident.incident_type.value,
+            "service_name": incident.service_name,
+            "detected_at": _iso(incident.detected_at),
+            "summary": diagnosis.summary,
+            "recommended_action": diagnosis.recommended_action.value,
+            "confidence": diagnosis.confidence,
+            "recovered": recovered,
+            "recovery_seconds": recovery_seconds,
+            "log_templates": list(log_templates or []),
+        }
+        with self._lock:
+            self._outcomes.append(outcome)
+            self._save(_OUTCOMES_FILE, self._outcomes)
+        return outcome
+
+    def list_outcomes(self) -> list[dict]:
+        """Return recorded incident outcomes (oldest first)."""
+        return list(self._outcomes)
+
     def append_log(
         self, service_name: str, message: str, timestamp: datetime | None = None
     ) -> None:
         """Append a log line for the given service (for RCA)."""
         ts = timestamp or datetime.utcnow()
-        self._log_entries.append(
-            {
-                "service_name": service_name,
-                "timestamp": _iso(ts),
-                "message": message,
-            }
-        )
-        self._save(_LOG_ENTRIES_FILE, self._log_entries)
+        with self._lock:
+            self._log_entries.append(
+                {
+                    "service_name": service_name,
+                    "timestamp": _iso(ts),
+                    "message": message,
+                }
+            )
+            self._save(_LOG_ENTRIES_FILE, self._log_entries)
 
     def get_logs_for_incident(self, incident: IncidentEvent, window_seconds: int = 3600) -> str:
         """Return log snippet relevant to the incident (service + time window). Fallback to stub if empty."""
@@ -146,15 +197,16 @@ class LogStore:
     ) -> None:
         """Record a deployment event for a service."""
         ts = _iso(timestamp) if isinstance(timestamp, datetime) else str(timestamp)
-        self._deployments.append(
-            {
-                "service_name": service_name,
-                "version": version,
-                "timestamp": ts,
-                "status": status,
-            }
-        )
-        self._save(_DEPLOYMENTS_FILE, self._deployments)
+        with self._lock:
+            self._deployments.append(
+                {
+                    "service_name": service_name,
+                    "version": version,
+                    "timestamp": ts,
+                    "status": status,
+                }
+            )
+            self._save(_DEPLOYMENTS_FILE, self._deployments)
 
     def get_deployment_history(self, service_name: str, limit: int = 5) -> list[dict]:
         """Return recent deployments for the service. Fallback to stub list if empty."""
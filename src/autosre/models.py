@@ -43,14 +43,24 @@ class Diagnosis(BaseModel):
     confidence: float = Field(ge=0.0, le=1.0)
     recommended_action: RecommendedAction
     reasoning: str = ""
+    # How the diagnosis was produced (e.g. context budget stats); not shown to the model
+    metadata: dict[str, Any] = Field(default_factory=dict)
 
 
 class PlannedAction(BaseModel):
-    """Planner output: concrete step for UI automation."""
+    """
+    Planner output: concrete step for UI automation.
+
+    A plan where no step declares depends_on runs in list order. Otherwise it is a
+    DAG: steps run once the steps named in depends_on (by step_id) have succeeded,
+    and steps without dependencies may start right away.
+    """
 
     action_type: str  # e.g. "click_rollback", "restart_instance"
     target: str  # e.g. "deployment_panel", "service_checkout"
     parameters: dict[str, Any] = Field(default_factory=dict)
+    step_id: str = ""  # defaults to "step<index>" within the plan
+    depends_on: list[str] = Field(default_factory=list)
 
 
 class RecoveryStatus(str, Enum):
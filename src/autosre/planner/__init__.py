@@ -4,6 +4,19 @@ Decision planning agent.
 Converts Diagnosis into concrete operational steps for UI automation.
 """
 
-from autosre.planner.agent import PlannerAgent
+from typing import TYPE_CHECKING
 
-__all__ = ["PlannerAgent"]
+from autosre._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from autosre.planner.agent import PlannerAgent
+    from autosre.planner.catalog import PlanCatalog
+
+_EXPORTS = {
+    "PlannerAgent": "autosre.planner.agent",
+    "PlanCatalog": "autosre.planner.catalog",
+}
+
+__all__ = ["PlanCatalog", "PlannerAgent"]
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -1,40 +1,26 @@
 """Planner: diagnosis → concrete UI actions."""
 
-from autosre.models import Diagnosis, PlannedAction, RecommendedAction
+from autosre.models import Diagnosis, IncidentEvent, PlannedAction
+from autosre.planner.catalog import PlanCatalog, get_plan_catalog
 
 
 class PlannerAgent:
-    """Maps diagnosis to a sequence of UI automation steps."""
+    """Maps diagnosis to a sequence of UI automation steps from the plan catalog."""
 
-    def plan(self, diagnosis: Diagnosis) -> list[PlannedAction]:
-        """Convert diagnosis into ordered list of UI actions."""
-        action_map = {
-            RecommendedAction.ROLLBACK: [
-                PlannedAction(action_type="navigate", target="deployment_panel", parameters={}),
-                PlannedAction(
-                    action_type="click_rollback",
-                    target="deployment_panel",
-                    parameters={"to_version": "v1.4.1"},
-                ),
-            ],
-            RecommendedAction.RESTART: [
-                PlannedAction(action_type="navigate", target="service_instances", parameters={}),
-                PlannedAction(
-                    action_type="restart_instance", target="service_instances", parameters={}
-                ),
-            ],
-            RecommendedAction.SCALE_UP: [
-                PlannedAction(action_type="navigate", target="service_scaling", parameters={}),
-                PlannedAction(
-                    action_type="scale_replicas",
-                    target="service_scaling",
-                    parameters={"replicas": 4},
-                ),
-            ],
-            RecommendedAction.RESTART_DB_POOL: [
-                PlannedAction(action_type="navigate", target="db_pool", parameters={}),
-                PlannedAction(action_type="restart_pool", target="db_pool", parameters={}),
-            ],
-            RecommendedAction.ESCALATE: [],
-        }
-        return action_map.get(diagnosis.recommended_action, [])
+    def __init__(self, catalog: PlanCatalog | None = None) -> None:
+        """catalog: compiled plan templates (default: built-in plus config overrides)."""
+        self._catalog = catalog or get_plan_catalog()
+
+    def plan(
+        self,
+        diagnosis: Diagnosis,
+        incident: IncidentEvent | None = None,
+        deployment_history: list | None = None,
+    ) -> list[PlannedAction]:
+        """
+        Convert diagnosis into ordered list of UI actions.
+
+        With the incident, per-service templates apply and parameters are filled from
+        its context; the rollback target is the last good version in deployment_history.
+        """
+        return self._catalog.render(diagnosis.recommended_action, incident, deployment_history)
@@ -0,0 +1,244 @@
+"""
+Remediation plan catalog: per-action (and per-service) step templates.
+
+The catalog is loaded once (built-in defaults, optionally overridden from a JSON
+file), validated, and compiled into immutable templates. Planning only fills in
+the dynamic parameters from the incident context, e.g. the version to roll back
+to from the service's deployment history.
+
+A parameter value "{name}" is replaced by the context value (keeping its type);
+other strings containing "{name}" are formatted. Context names:
+
+  service_name, incident_type, current_version, previous_version, replicas
+"""
+
+from __future__ import annotations
+
+import string
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+from autosre.config import Settings, get_settings
+from autosre.models import IncidentEvent, PlannedAction, RecommendedAction
+from autosre.remediation.dag import build_dag
+
+CONTEXT_KEYS = frozenset(
+    {"service_name", "incident_type", "current_version", "previous_version", "replicas"}
+)
+# Deployments with these statuses are never rollback targets
+_BAD_DEPLOYMENT_STATUSES = frozenset({"failed", "rolled_back", "rollback", "error"})
+
+
+class StepSpec(BaseModel):
+    """One step of a plan as written in the catalog."""
+
+    action_type: str
+    target: str
+    parameters: dict[str, Any] = Field(default_factory=dict)
+    step_id: str = ""
+    depends_on: list[str] = Field(default_factory=list)
+
+
+class CatalogSpec(BaseModel):
+    """Catalog file: plan overrides per action, and per service and action."""
+
+    plans: dict[RecommendedAction, list[StepSpec]] = Field(default_factory=dict)
+    services: dict[str, dict[RecommendedAction, list[StepSpec]]] = Field(default_factory=dict)
+    default_replicas: int | None = None
+
+
+DEFAULT_CATALOG: dict[str, list[dict[str, Any]]] = {
+    RecommendedAction.ROLLBACK.value: [
+        {"action_type": "navigate", "target": "deployment_panel"},
+        {
+            "action_type": "click_rollback",
+            "target": "deployment_panel",
+            "parameters": {"to_version": "{previous_version}"},
+        },
+    ],
+    RecommendedAction.RESTART.value: [
+        {"action_type": "navigate", "target": "service_instances"},
+        {"action_type": "restart_instance", "target": "service_instances"},
+    ],
+    RecommendedAction.SCALE_UP.value: [
+        {"action_type": "navigate", "target": "service_scaling"},
+        {
+            "action_type": "scale_replicas",
+            "target": "service_scaling",
+            "parameters": {"replicas": "{replicas}"},
+        },
+    ],
+    RecommendedAction.RESTART_DB_POOL.value: [
+        {"action_type": "navigate", "target": "db_pool"},
+        {"action_type": "restart_pool", "target": "db_pool"},
+    ],
+    RecommendedAction.ESCALATE.value: [],
+}
+
+
+_DEFAULT_SPEC = CatalogSpec.model_validate({"plans": DEFAULT_CATALOG})
+
+
+def _placeholders(value: Any) -> set[str]:
+    if not isinstance(value, str):
+        return set()
+    return {name for _, name, _, _ in string.Formatter().parse(value) if name}
+
+
+@dataclass(frozen=True)
+class _CompiledStep:
+    action_type: str
+    target: str
+    # (key, value) pairs; dynamic ones are resolved per plan
+    static: tuple[tuple[str, Any], ...]
+    exact: tuple[tuple[str, str], ...]  # value is exactly "{name}": substitute, keep type
+    formatted: tuple[tuple[str, str], ...]  # value embeds placeholders: str.format
+    step_id: str = ""
+    depends_on: tuple[str, ...] = ()
+
+    def render(self, context: dict[str, Any]) -> PlannedAction:
+        parameters = dict(self.static)
+        for key, name in self.exact:
+            parameters[key] = context[name]
+        for key, template in self.formatted:
+            parameters[key] = template.format_map(context)
+        # Templates were validated at compile time; skip re-validating every plan
+        return PlannedAction.model_construct(
+            action_type=self.action_type,
+            target=self.target,
+            parameters=parameters,
+            step_id=self.step_id,
+            depends_on=list(self.depends_on),
+        )
+
+
+def _compile_step(spec: StepSpec, where: str) -> _CompiledStep:
+    static, exact, formatted = [], [], []
+    for key, value in spec.parameters.items():
+        names = _placeholders(value)
+        unknown = names - CONTEXT_KEYS
+        if unknown:
+            raise ValueError(f"{where}: unknown placeholder(s) {sorted(unknown)} in {key!r}")
+        if not names:
+            static.append((key, value))
+        elif len(names) == 1 and value == "{" + next(iter(names)) + "}":
+            exact.append((key, next(iter(names))))
+        else:
+            formatted.append((key, value))
+    return _CompiledStep(
+        spec.action_type,
+        spec.target,
+        tuple(static),
+        tuple(exact),
+        tuple(formatted),
+        spec.step_id,
+        tuple(spec.depends_on),
+    )
+
+
+def _compile_plans(
+    plans: dict[RecommendedAction, list[StepSpec]], where: str
+) -> dict[RecommendedAction, tuple[_CompiledStep, ...]]:
+    compiled = {}
+    for action, steps in plans.items():
+        compiled[action] = tuple(
+            _compile_step(step, f"{where}.{action.value}[{i}]") for i, step in enumerate(steps)
+        )
+        # Reject duplicate ids, unknown depends_on and cycles at load time, not mid-incident
+        try:
+            build_dag([step.render(dict.fromkeys(CONTEXT_KEYS, "")) for step in compiled[action]])
+        except ValueError as e:
+            raise ValueError(f"{where}.{action.value}: {e}") from e
+    return compiled
+
+
+def current_and_previous_version(deployment_history: list | None) -> tuple[str | None, str | None]:
+    """(current, previous good) versions from deployment history, newest first by timestamp."""
+    entries = [d for d in deployment_history or [] if isinstance(d, dict) and d.get("version")]
+    entries.sort(key=lambda d: str(d.get("timestamp") or ""), reverse=True)
+    if not entries:
+        return None, None
+    current = str(entries[0]["version"])
+    for entry in entries[1:]:
+        status = str(entry.get("status") or "").lower()
+        if entry["version"] != current and status not in _BAD_DEPLOYMENT_STATUSES:
+            return current, str(entry["version"])
+    return current, None
+
+
+class PlanCatalog:
+    """Compiled, immutable plan templates with optional per-service overrides."""
+
+    def __init__(self, spec: CatalogSpec | None = None, default_replicas: int = 4) -> None:
+        """Validate and compile spec over the built-in plans; raises ValueError if invalid."""
+        spec = spec or CatalogSpec()
+        self._plans = _compile_plans(_DEFAULT_SPEC.plans, "default")
+        self._plans.update(_compile_plans(spec.plans, "plans"))
+        self._services = {
+            service: _compile_plans(plans, f"services.{service}")
+            for service, plans in spec.services.items()
+        }
+        self._default_replicas = (
+            spec.default_replicas if spec.default_replicas is not None else default_replicas
+        )
+
+    @classmethod
+    def from_file(cls, path: str, default_replicas: int = 4) -> PlanCatalog:
+        """Load a JSON CatalogSpec: {"plans": {...}, "services": {name: {...}}}."""
+        spec = CatalogSpec.model_validate_json(Path(path).read_text(encoding="utf-8"))
+        return cls(spec, default_replicas=default_replicas)
+
+    def context(
+        self,
+        incident: IncidentEvent | None = None,
+        deployment_history: list | None = None,
+    ) -> dict[str, Any]:
+        current, previous = current_and_previous_version(deployment_history)
+        return {
+            "service_name": incident.service_name if incident else "",
+            "incident_type": incident.incident_type.value if incident else "",
+            "current_version": current or "current",
+            # The UI agent and dashboard treat "previous" as "the version before current"
+            "previous_version": previous or "previous",
+            "replicas": self._default_replicas,
+        }
+
+    def render(
+        self,
+        action: RecommendedAction,
+        incident: IncidentEvent | None = None,
+        deployment_history: list | None = None,
+    ) -> list[PlannedAction]:
+        """Planned steps for action, parameterized for the incident's service."""
+        service = incident.service_name if incident else ""
+        steps = self._services.get(service, {}).get(action)
+        if steps is None:
+            steps = self._plans.get(action, ())
+        if not steps:
+            return []
+        context = self.context(incident, deployment_history)
+        return [step.render(context) for step in steps]
+
+
+_shared_catalog: PlanCatalog | None = None
+_shared_lock = threading.Lock()
+
+
+def get_plan_catalog(settings: Settings | None = None) -> PlanCatalog:
+    """Process-wide catalog: built-in plans plus config planner_catalog_path overrides."""
+    global _shared_catalog
+    with _shared_lock:
+        if _shared_catalog is None:
+            settings = settings or get_settings()
+            if settings.planner_catalog_path:
+                _shared_catalog = PlanCatalog.from_file(
+                    settings.planner_catalog_path,
+                    default_replicas=settings.planner_scale_replicas,
+                )
+            else:
+                _shared_catalog = PlanCatalog(default_replicas=settings.planner_scale_replicas)
+        return _shared_catalog
@@ -5,6 +5,33 @@ Analyzes logs, deployment history, and metrics to produce Diagnosis
 with recommended action.
 """
 
-from autosre.reasoning_agent.agent import ReasoningAgent
+from typing import TYPE_CHECKING
 
-__all__ = ["ReasoningAgent"]
+from autosre._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from autosre.reasoning_agent.agent import ReasoningAgent
+    from autosre.reasoning_agent.breaker import CircuitBreaker
+    from autosre.reasoning_agent.cache import DiagnosisCache
+    from autosre.reasoning_agent.rules import Rule, RuleEngine
+    from autosre.reasoning_agent.similarity import SimilarityIndex
+
+_EXPORTS = {
+    "ReasoningAgent": "autosre.reasoning_agent.agent",
+    "CircuitBreaker": "autosre.reasoning_agent.breaker",
+    "DiagnosisCache": "autosre.reasoning_agent.cache",
+    "Rule": "autosre.reasoning_agent.rules",
+    "RuleEngine": "autosre.reasoning_agent.rules",
+    "SimilarityIndex": "autosre.reasoning_agent.similarity",
+}
+
+__all__ = [
+    "CircuitBreaker",
+    "DiagnosisCache",
+    "ReasoningAgent",
+    "Rule",
+    "RuleEngine",
+    "SimilarityIndex",
+]
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -3,14 +3,45 @@
 import json
 import re
 import logging
+import threading
+import time
+from collections.abc import Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, as_completed, wait
 from typing import Any
 
+from autosre.aws_clients import get_client
 from autosre.config import get_settings
 from autosre.models import Diagnosis, IncidentEvent, RecommendedAction
-from autosre.reasoning_agent.prompts import SYSTEM_PROMPT, build_user_prompt
+from autosre.reasoning_agent.breaker import CircuitBreaker
+from autosre.reasoning_agent.budget import estimate_tokens, fit_logs_to_budget
+from autosre.reasoning_agent.cache import DiagnosisCache, incident_fingerprint
+from autosre.reasoning_agent.cascade import TierResult, estimate_cost
+from autosre.reasoning_agent.prompts import (
+    FEW_SHOT_EXAMPLES,
+    SYSTEM_PROMPT,
+    build_system_blocks,
+    build_user_prompt,
+)
+from autosre.reasoning_agent.ratelimit import ModelRateLimiter
+from autosre.reasoning_agent.rules import RuleEngine
+from autosre.reasoning_agent.similarity import SimilarityIndex, diagnosis_from_similar
+from autosre.reasoning_agent.streaming import (
+    IncrementalDiagnosisParser,
+    PartialCallback,
+    iter_converse_stream_text,
+)
+from autosre.reasoning_agent.templates import log_templates
+from autosre.retry import ErrorKind, RetryPolicy, classify_error
 
 logger = logging.getLogger(__name__)
 
+# Errors that count against Bedrock in the circuit breaker; anything else is local
+_PROVIDER_ERROR_KINDS = frozenset({ErrorKind.THROTTLING, ErrorKind.TIMEOUT, ErrorKind.TRANSIENT})
+
+_MAX_OUTPUT_TOKENS = 1024
+# Reserved against the TPM quota for every call, next to the user message
+_STATIC_PROMPT_TOKENS = estimate_tokens(SYSTEM_PROMPT + FEW_SHOT_EXAMPLES)
+
 # Fallback diagnosis when Bedrock fails or response is invalid
 FALLBACK_DIAGNOSIS = Diagnosis(
     summary="Root cause could not be determined; escalation recommended.",
@@ -64,16 +95,16 @@ def _parse_diagnosis_from_text(text: str) -> Diagnosis | None:
 
 def _get_bedrock_client():
     """Create Bedrock Runtime client with configured timeout and region."""
-    import boto3
     from botocore.config import Config
 
     settings = get_settings()
     config = Config(read_timeout=settings.bedrock_read_timeout_seconds)
-    kwargs = {"region_name": settings.aws_region, "config": config}
+    # Retries are done by the agent's RetryPolicy, not by botocore underneath it
+    kwargs = {"region_name": settings.aws_region, "config": config, "sdk_retries": False}
     if settings.aws_access_key_id and settings.aws_secret_access_key:
         kwargs["aws_access_key_id"] = settings.aws_access_key_id
         kwargs["aws_secret_access_key"] = settings.aws_secret_access_key
-    return boto3.client("bedrock-runtime", **kwargs)
+    return get_client("bedrock-runtime", **kwargs)
 
 
 class ReasoningAgent:
@@ -82,72 +113,500 @@ class ReasoningAgent:
 
     Produces a structured Diagnosis. On API or parse failure, returns
     a safe fallback (ESCALATE) so the pipeline does not break.
+
+    With an escalation model configured the agent cascades: the fast model answers
+    first and its diagnosis is accepted at or above the confidence threshold;
+    otherwise (or if it fails) the escalation model is asked. With a hedge timeout
+    the escalation model is also started when the fast model is slower than that,
+    and the first acceptable answer wins.
     """
 
     def __init__(
         self,
         model_id: str | None = None,
         use_bedrock: bool = True,
+        cache: DiagnosisCache | None = None,
+        streaming: bool | None = None,
+        log_token_budget: int | None = None,
+        escalation_model_id: str | None = None,
+        confidence_threshold: float | None = None,
+        hedge_seconds: float | None = None,
+        rules: RuleEngine | None = None,
+        similarity_index: SimilarityIndex | None = None,
+        prompt_cache: bool | None = None,
+        retry_policy: RetryPolicy | None = None,
+        breaker: CircuitBreaker | None = None,
+        rate_limiter: ModelRateLimiter | None = None,
+        max_concurrency: int | None = None,
     ) -> None:
         """
         Args:
             model_id: Bedrock model ID (default from config).
             use_bedrock: If False, use stub behavior for tests/demo without AWS.
+            cache: Optional diagnosis cache consulted before calling Bedrock.
+            streaming: Use converse_stream and report fields as they arrive
+                (default from config reasoning_streaming).
+            log_token_budget: Max estimated tokens of logs in the prompt
+                (default from config reasoning_log_token_budget; 0 = no limit).
+            escalation_model_id: Larger model for low-confidence diagnoses
+                (default from config reasoning_escalation_model_id; empty = no cascade).
+            confidence_threshold: Minimum confidence to accept the fast model's answer.
+            hedge_seconds: Start the escalation model in parallel when the fast model
+                takes longer than this (0 = never hedge).
+            rules: Optional deterministic rules checked before the model (and the stub).
+            similarity_index: Optional index of past incident outcomes; the most similar
+                ones are added to the prompt, and a recovered near-duplicate is reused.
+            prompt_cache: Mark the static system prompt as a Bedrock prompt-cache prefix
+                (default from config reasoning_prompt_cache).
+            retry_policy: Backoff for throttled/timed-out model calls (default from
+                config: 1 + reasoning_max_retries attempts, retry_* delays).
+            breaker: Optional circuit breaker; while open, Bedrock is skipped and the
+                diagnosis comes from a stale cache entry or the most similar incident.
+            rate_limiter: Optional per-model RPM/TPM limiter every model call waits on.
+            max_concurrency: Parallel analyses in analyze_many
+                (default from config reasoning_max_concurrency).
         """
-        self._model_id = model_id or get_settings().nova_model_id
+        settings = get_settings()
+        self._model_id = model_id or settings.nova_model_id
         self._use_bedrock = use_bedrock
+        self._cache = cache
+        self._streaming = settings.reasoning_streaming if streaming is None else streaming
+        self._log_token_budget = (
+            settings.reasoning_log_token_budget if log_token_budget is None else log_token_budget
+        )
+        escalation = (
+            settings.reasoning_escalation_model_id
+            if escalation_model_id is None
+            else escalation_model_id
+        )
+        self._escalation_model_id = escalation if escalation != self._model_id else ""
+        self._confidence_threshold = (
+            settings.reasoning_cascade_confidence_threshold
+            if confidence_threshold is None
+            else confidence_threshold
+        )
+        self._hedge_seconds = (
+            settings.reasoning_cascade_hedge_seconds if hedge_seconds is None else hedge_seconds
+        )
+        self._model_prices = settings.reasoning_model_prices
+        self._rules = rules
+        self._similarity_index = similarity_index
+        self._similarity_top_k = settings.similarity_top_k
+        self._similarity_min_score = settings.similarity_min_score
+        self._near_duplicate_threshold = settings.similarity_near_duplicate_threshold
+        self._prompt_cache = (
+            settings.reasoning_prompt_cache if prompt_cache is None else prompt_cache
+        )
+        self._retry = retry_policy or RetryPolicy.from_settings(
+            settings, max_attempts=1 + max(0, settings.reasoning_max_retries)
+        )
+        self._breaker = breaker
+        self._rate_limiter = rate_limiter
+        self._max_concurrency = max(
+            1,
+            settings.reasoning_max_concurrency if max_concurrency is None else max_concurrency,
+        )
+        self._stale_cache_seconds = settings.reasoning_breaker_stale_cache_seconds
+        # Models that rejected a cachePoint; they are called without one from then on
+        self._no_prompt_cache: set[str] = set()
 
     def analyze(
         self,
         incident: IncidentEvent,
         logs: str,
         deployment_history: list,
+        on_partial: PartialCallback | None = None,
     ) -> Diagnosis:
-        """Produce diagnosis and recommended action from incident context."""
+        """
+        Produce diagnosis and recommended action from incident context.
+
+        In streaming mode on_partial(field, value) is called for each top-level field
+        of the model's JSON (e.g. recommended_action, confidence) as soon as it is
+        complete, before the rest of the response has arrived. Only the fast model's
+        fields are reported.
+        """
+        if self._rules is not None:
+            matched = self._rules.match(incident, logs, deployment_history)
+            if matched is not None:
+                logger.info(
+                    "Rule %s matched; skipping model",
+                    matched.metadata.get("rule"),
+                    extra={
+                        "incident_id": incident.incident_id,
+                        "recommended_action": matched.recommended_action.value,
+                    },
+                )
+                return matched
         if not self._use_bedrock:
             return self._stub_analyze(incident)
+        templates = (
+            log_templates(logs)
+            if self._cache is not None or self._similarity_index is not None
+            else []
+        )
+        fingerprint = None
+        if self._cache is not None:
+            fingerprint = incident_fingerprint(incident, logs, deployment_history, templates)
+            cached = self._cache.get(fingerprint)
+            if cached is not None:
+                logger.info(
+                    "Reasoning agent reused cached diagnosis",
+                    extra={"incident_id": incident.incident_id, "fingerprint": fingerprint},
+                )
+                return cached
+        similar = []
+        if self._similarity_index is not None:
+            similar = self._similarity_index.query(
+                incident,
+                templates,
+                k=self._similarity_top_k,
+                min_similarity=self._similarity_min_score,
+            )
+            if similar and similar[0].similarity >= self._near_duplicate_threshold:
+                reused = diagnosis_from_similar(similar[0])
+                if reused is not None:
+                    logger.info(
+                        "Reasoning agent reused diagnosis of similar incident %s",
+                        similar[0].incident_id,
+                        extra={
+                            "incident_id": incident.incident_id,
+                            "similarity": similar[0].similarity,
+                        },
+                    )
+                    return reused
+        permit = self._breaker.allow() if self._breaker is not None else None
+        if self._breaker is not None and permit is None:
+            return self._degraded_analyze(incident, fingerprint, similar)
+        start = time.perf_counter()
+        provider_ok: bool | None = None  # None: no provider outcome to record
         try:
             client = _get_bedrock_client()
+            budgeted_logs, context_stats = fit_logs_to_budget(
+                logs,
+                self._log_token_budget,
+                detected_at=incident.detected_at,
+                deployment_history=deployment_history,
+            )
             user_content = build_user_prompt(
                 incident_type=incident.incident_type.value,
                 service_name=incident.service_name,
-                logs=logs,
+                logs=budgeted_logs,
                 deployment_history=deployment_history,
+                similar_incidents=[s.model_dump() for s in similar],
             )
-            response = client.converse(
-                modelId=self._model_id,
-                messages=[
-                    {
-                        "role": "user",
-                        "content": [{"text": user_content}],
-                    }
-                ],
-                system=[{"text": SYSTEM_PROMPT}],
-                inferenceConfig={
-                    "maxTokens": 1024,
-                    "temperature": 0.2,
-                },
-            )
-            text = _extract_text_from_converse_response(response)
-            diagnosis = _parse_diagnosis_from_text(text)
+            diagnosis, tiers = self._run_cascade(client, user_content, on_partial)
+            if any(not t.error for t in tiers):
+                provider_ok = True
+            elif any(t.provider_error for t in tiers):
+                provider_ok = False
             if diagnosis is not None:
+                diagnosis = diagnosis.model_copy(
+                    update={
+                        "metadata": {
+                            "context": context_stats.model_dump(),
+                            "tiers": [t.model_dump() for t in tiers],
+                            "similar_incidents": [s.incident_id for s in similar],
+                        }
+                    }
+                )
                 logger.info(
                     "Reasoning agent produced diagnosis",
                     extra={
                         "incident_id": incident.incident_id,
                         "recommended_action": diagnosis.recommended_action.value,
                         "confidence": diagnosis.confidence,
+                        "model_id": next((t.model_id for t in tiers if t.accepted), ""),
+                        "cache_read_tokens": sum(t.cache_read_tokens for t in tiers),
+                        "cache_write_tokens": sum(t.cache_write_tokens for t in tiers),
                     },
                 )
+                if fingerprint is not None:
+                    self._cache.put(fingerprint, diagnosis)
                 return diagnosis
-        except Exception as e:  # noqa: BLE001
+        except Exception as e:
+            if classify_error(e) in _PROVIDER_ERROR_KINDS:
+                provider_ok = False
             logger.warning(
                 "Bedrock reasoning failed; using fallback",
                 extra={"incident_id": incident.incident_id, "error": str(e)},
                 exc_info=True,
             )
+        finally:
+            if self._breaker is not None and permit is not None:
+                if provider_ok is None:
+                    self._breaker.release(permit)
+                else:
+                    self._breaker.record(permit, provider_ok, time.perf_counter() - start)
         return FALLBACK_DIAGNOSIS
 
+    def analyze_many(
+        self,
+        requests: Iterable[tuple[IncidentEvent, str, list]],
+        max_concurrency: int | None = None,
+    ) -> Iterator[tuple[IncidentEvent, Diagnosis]]:
+        """
+        Analyze several (incident, logs, deployment_history) concurrently.
+
+        Yields (incident, diagnosis) in completion order, so the first finished RCA
+        can be acted on while the others are still running. Model calls share the
+        rate limiter, so a burst of incidents is paced to the Bedrock quota.
+        """
+        requests = list(requests)
+        if not requests:
+            return
+        workers = min(len(requests), max(1, max_concurrency or self._max_concurrency))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="autosre-rca") as pool:
+            futures = {
+                pool.submit(self.analyze, incident, logs, history): incident
+                for incident, logs, history in requests
+            }
+            for future in as_completed(futures):
+                incident = futures[future]
+                try:
+                    diagnosis = future.result()
+                except Exception as e:
+                    logger.warning(
+                        "Analysis of %s failed: %s", incident.incident_id, e, exc_info=True
+                    )
+                    diagnosis = FALLBACK_DIAGNOSIS
+                yield incident, diagnosis
+
+    def _degraded_analyze(
+        self, incident: IncidentEvent, fingerprint: str | None, similar: list
+    ) -> Diagnosis:
+        """Answer without Bedrock (circuit open): stale cache, then similar incident, then escalate."""
+        diagnosis = None
+        source = "fallback"
+        if fingerprint is not None:
+            diagnosis = self._cache.get_stale(fingerprint, self._stale_cache_seconds)
+            source = "stale_cache"
+        if diagnosis is None and similar:
+            diagnosis = diagnosis_from_similar(similar[0])
+            source = "similar_incident"
+        if diagnosis is None:
+            diagnosis, source = FALLBACK_DIAGNOSIS, "fallback"
+        logger.warning(
+            "Bedrock circuit open; degraded diagnosis from %s",
+            source,
+            extra={
+                "incident_id": incident.incident_id,
+                "recommended_action": diagnosis.recommended_action.value,
+            },
+        )
+        metadata = {**diagnosis.metadata, "degraded": source}
+        return diagnosis.model_copy(update={"metadata": metadata})
+
+    def _acceptable(self, diagnosis: Diagnosis | None) -> bool:
+        return diagnosis is not None and diagnosis.confidence >= self._confidence_threshold
+
+    def _run_cascade(
+        self, client: Any, user_content: str, on_partial: PartialCallback | None
+    ) -> tuple[Diagnosis | None, list[TierResult]]:
+        """Run the fast model and, when needed, the escalation model; return (diagnosis, tiers)."""
+        if not self._escalation_model_id:
+            # Single model: errors propagate (→ fallback) as without a cascade
+            diagnosis, tier = self._call_model(client, self._model_id, user_content, on_partial)
+            tier.accepted = diagnosis is not None
+            return diagnosis, [tier]
+        if self._hedge_seconds > 0:
+            return self._run_hedged(client, user_content, on_partial)
+
+        fast_diagnosis, fast = self._try_model(client, self._model_id, user_content, on_partial)
+        if self._acceptable(fast_diagnosis):
+            fast.accepted = True
+            return fast_diagnosis, [fast]
+        logger.info(
+            "Escalating diagnosis to %s (fast model confidence %s)",
+            self._escalation_model_id,
+            fast.confidence,
+        )
+        slow_diagnosis, slow = self._try_model(
+            client, self._escalation_model_id, user_content, None
+        )
+        return self._pick({0: (fast_diagnosis, fast), 1: (slow_diagnosis, slow)})
+
+    def _run_hedged(
+        self, client: Any, user_content: str, on_partial: PartialCallback | None
+    ) -> tuple[Diagnosis | None, list[TierResult]]:
+        """Cascade where the escalation model also starts if the fast one exceeds the hedge."""
+        closed = threading.Event()
+
+        def fast_partial(field: str, value: Any) -> None:
+            # A fast model that loses the race must not report fields after we return
+            if on_partial is not None and not closed.is_set():
+                on_partial(field, value)
+
+        executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="autosre-cascade")
+        try:
+            futures: list[Future] = [
+                executor.submit(self._try_model, client, self._model_id, user_content, fast_partial)
+            ]
+            done, _ = wait(futures, timeout=self._hedge_seconds)
+            if not done:
+                logger.info(
+                    "Fast model slower than %ss; hedging with %s",
+                    self._hedge_seconds,
+                    self._escalation_model_id,
+                )
+                futures.append(
+                    executor.submit(
+                        self._try_model, client, self._escalation_model_id, user_content, None
+                    )
+                )
+            results: dict[int, tuple[Diagnosis | None, TierResult]] = {}
+            while True:
+                pending = [f for i, f in enumerate(futures) if i not in results]
+                if not pending:
+                    break
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    results[futures.index(future)] = future.result()
+                if 1 in results and results[1][0] is not None:
+                    break
+                if 0 in results and self._acceptable(results[0][0]):
+                    break
+                if 0 in results and len(futures) == 1:
+                    futures.append(
+                        executor.submit(
+                            self._try_model, client, self._escalation_model_id, user_content, None
+                        )
+                    )
+            return self._pick(results)
+        finally:
+            closed.set()
+            executor.shutdown(wait=False)
+
+    def _pick(
+        self, results: dict[int, tuple[Diagnosis | None, TierResult]]
+    ) -> tuple[Diagnosis | None, list[TierResult]]:
+        """Accepted fast answer, else the escalation answer, else a low-confidence fast answer."""
+        fast_diagnosis, fast = results.get(0, (None, None))
+        slow_diagnosis, slow = results.get(1, (None, None))
+        tiers = [t for t in (fast, slow) if t is not None]
+        if self._acceptable(fast_diagnosis):
+            chosen, tier = fast_diagnosis, fast
+        elif slow_diagnosis is not None:
+            chosen, tier = slow_diagnosis, slow
+        else:
+            chosen, tier = fast_diagnosis, fast
+        if chosen is not None:
+            tier.accepted = True
+        return chosen, tiers
+
+    def _try_model(
+        self,
+        client: Any,
+        model_id: str,
+        user_content: str,
+        on_partial: PartialCallback | None,
+    ) -> tuple[Diagnosis | None, TierResult]:
+        """_call_model that records a failure on the tier instead of raising."""
+        start = time.perf_counter()
+        try:
+            return self._call_model(client, model_id, user_content, on_partial)
+        except Exception as e:
+            logger.warning("Model %s failed: %s", model_id, e, exc_info=True)
+            tier = TierResult(
+                model_id=model_id,
+                latency_seconds=time.perf_counter() - start,
+                error=str(e),
+                provider_error=classify_error(e) in _PROVIDER_ERROR_KINDS,
+            )
+            return None, tier
+
+    def _call_model(
+        self,
+        client: Any,
+        model_id: str,
+        user_content: str,
+        on_partial: PartialCallback | None,
+    ) -> tuple[Diagnosis | None, TierResult]:
+        """One Converse call (streaming or not); returns the parsed diagnosis and its tier stats."""
+        prompt_cache = self._prompt_cache and model_id not in self._no_prompt_cache
+        reserved = _STATIC_PROMPT_TOKENS + estimate_tokens(user_content) + _MAX_OUTPUT_TOKENS
+        reserved_total = 0
+        queued = 0.0
+
+        def attempt(cache: bool) -> tuple[str, dict[str, Any]]:
+            # Every attempt is a request against the quota, retries included
+            nonlocal queued, reserved_total
+            if self._rate_limiter is not None:
+                queued += self._rate_limiter.acquire(model_id, reserved)
+                reserved_total += reserved
+            return self._converse(client, model_id, user_content, cache, on_partial)
+
+        start = time.perf_counter()
+        description = f"Converse {model_id}"
+        used = 0
+        try:
+            try:
+                text, usage = self._retry.call(attempt, prompt_cache, description=description)
+            except Exception as e:
+                if not prompt_cache or not _is_prompt_cache_rejection(e):
+                    raise
+                logger.warning("Model %s rejected prompt caching; disabling it: %s", model_id, e)
+                self._no_prompt_cache.add(model_id)
+                text, usage = self._retry.call(attempt, False, description=description)
+            latency = time.perf_counter() - start
+            input_tokens = int(usage.get("inputTokens") or 0)
+            output_tokens = int(usage.get("outputTokens") or 0)
+            cache_read = int(usage.get("cacheReadInputTokens") or 0)
+            cache_write = int(usage.get("cacheWriteInputTokens") or 0)
+            # Without reported usage, the successful attempt keeps its reservation
+            used = input_tokens + output_tokens + cache_read + cache_write or reserved
+        finally:
+            if self._rate_limiter is not None and reserved_total:
+                # Failed attempts used nothing: every reservation but the answered one returns
+                self._rate_limiter.settle(model_id, reserved_total, used)
+        diagnosis = _parse_diagnosis_from_text(text)
+        tier = TierResult(
+            model_id=model_id,
+            latency_seconds=latency,
+            queued_seconds=queued,
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            cache_read_tokens=cache_read,
+            cache_write_tokens=cache_write,
+            cost_usd=estimate_cost(
+                model_id,
+                input_tokens,
+                output_tokens,
+                self._model_prices,
+                cache_read_tokens=cache_read,
+                cache_write_tokens=cache_write,
+            ),
+            confidence=diagnosis.confidence if diagnosis else None,
+        )
+        return diagnosis, tier
+
+    def _converse(
+        self,
+        client: Any,
+        model_id: str,
+        user_content: str,
+        prompt_cache: bool,
+        on_partial: PartialCallback | None,
+    ) -> tuple[str, dict[str, Any]]:
+        """Send one Converse request; returns (response text, token usage)."""
+        request = {
+            "modelId": model_id,
+            "messages": [
+                {
+                    "role": "user",
+                    "content": [{"text": user_content}],
+                }
+            ],
+            "system": build_system_blocks(prompt_cache),
+            "inferenceConfig": {
+                "maxTokens": _MAX_OUTPUT_TOKENS,
+                "temperature": 0.2,
+            },
+        }
+        if self._streaming:
+            return _converse_stream_text(client, request, on_partial)
+        response = client.converse(**request)
+        return _extract_text_from_converse_response(response), response.get("usage") or {}
+
     def _stub_analyze(self, incident: IncidentEvent) -> Diagnosis:
         """Deterministic stub for demo or when use_bedrock=False."""
         return Diagnosis(
@@ -161,6 +620,39 @@ class ReasoningAgent:
         )
 
 
+def _is_prompt_cache_rejection(error: Exception) -> bool:
+    """True for a ValidationException about cachePoint (model without prompt caching)."""
+    code = ""
+    response = getattr(error, "response", None)
+    if isinstance(response, dict):
+        code = str((response.get("Error") or {}).get("Code") or "")
+    message = str(error).lower()
+    return (code == "ValidationException" or "validation" in message) and "cach" in message
+
+
+def _converse_stream_text(
+    client: Any, request: dict[str, Any], on_partial: PartialCallback | None
+) -> tuple[str, dict[str, Any]]:
+    """
+    Run converse_stream, feeding text deltas to an incremental parser.
+
+    Returns the full text and the token usage from the stream's metadata event.
+    """
+
+    def on_field(field: str, value: Any) -> None:
+        try:
+            on_partial(field, value)
+        except Exception as e:
+            logger.warning("on_partial callback failed for %s: %s", field, e, exc_info=True)
+
+    response = client.converse_stream(**request)
+    parser = IncrementalDiagnosisParser(on_field=on_field if on_partial else None)
+    usage: dict[str, Any] = {}
+    for chunk in iter_converse_stream_text(response.get("stream") or [], usage=usage):
+        parser.feed(chunk)
+    return parser.text, usage
+
+
 def _extract_text_from_converse_response(response: dict[str, Any]) -> str:
     """Extract concatenated text from Bedrock Converse response (output.message.content)."""
     parts = []
@@ -0,0 +1,174 @@
+"""
+Circuit breaker around the Bedrock model calls.
+
+The breaker keeps the outcomes of the last `window` calls. It opens when
+`failure_threshold` of them failed, or when the window's p95 latency exceeds
+`slow_call_seconds` (a degraded provider often times out before it errors). While
+open, the reasoning agent answers from its local fallbacks instead of waiting on
+Bedrock. After `open_seconds` one probe call is let through (half-open): success
+closes the breaker, failure opens it again. Only provider errors (throttling,
+timeouts, 5xx) count as failures; a call that fails locally is released unrecorded.
+
+allow() hands out numbered permits, and record()/release() take the permit back.
+In half-open state only the probe's permit decides the circuit. Calls admitted
+before the circuit last opened may finish much later (the Bedrock read timeout is
+longer than open_seconds); their outcomes are ignored.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from enum import Enum
+
+from autosre.config import Settings, get_settings
+
+logger = logging.getLogger(__name__)
+
+
+class BreakerState(str, Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    """Nearest-rank percentile (values need not be sorted); 0.0 when empty."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = math.ceil(pct / 100 * len(ordered)) - 1
+    return ordered[max(0, min(len(ordered) - 1, rank))]
+
+
+class CircuitBreaker:
+    """Thread-safe failure/latency circuit breaker (shared by concurrent workflow runs)."""
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        window: int = 20,
+        slow_call_seconds: float = 60.0,
+        min_calls: int = 5,
+        open_seconds: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._failure_threshold = max(1, failure_threshold)
+        self._slow_call_seconds = slow_call_seconds
+        self._min_calls = max(1, min_calls)
+        self._open_seconds = open_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._calls: deque[tuple[bool, float]] = deque(maxlen=max(1, window))  # (ok, latency)
+        self._state = BreakerState.CLOSED
+        self._opened_at = 0.0
+        self._next_permit = 1
+        self._closed_from = 1  # first permit issued since the circuit last closed
+        self._probe: int | None = None  # the half-open probe's permit
+        self.times_opened = 0
+        self.rejected = 0
+
+    @property
+    def state(self) -> BreakerState:
+        with self._lock:
+            return self._state
+
+    def _issue(self) -> int:
+        permit = self._next_permit
+        self._next_permit += 1
+        return permit
+
+    def allow(self) -> int | None:
+        """
+        A permit (a positive int) if a model call may be made now, else None.
+
+        In half-open state the single permit handed out is the probe.
+        """
+        with self._lock:
+            if self._state == BreakerState.CLOSED:
+                return self._issue()
+            if self._state == BreakerState.OPEN:
+                if self._clock() - self._opened_at < self._open_seconds:
+                    self.rejected += 1
+                    return None
+                self._state = BreakerState.HALF_OPEN
+                logger.info("Bedrock circuit half-open; sending a probe request")
+            if self._probe is not None:
+                self.rejected += 1
+                return None
+            self._probe = self._issue()
+            return self._probe
+
+    def record(self, permit: int, ok: bool, latency_seconds: float) -> None:
+        """Record the outcome of the call allow() issued permit for."""
+        with self._lock:
+            if permit == self._probe:
+                self._probe = None
+                if ok and latency_seconds < self._slow_call_seconds:
+                    logger.info("Bedrock probe succeeded; circuit closed")
+                    self._state = BreakerState.CLOSED
+                    self._closed_from = self._next_permit
+                    self._calls.clear()
+                else:
+                    self._open("probe failed")
+                return
+            if self._state != BreakerState.CLOSED or permit < self._closed_from:
+                return  # admitted before the circuit last opened
+            self._calls.append((ok, latency_seconds))
+            failures = sum(1 for call_ok, _ in self._calls if not call_ok)
+            if failures >= self._failure_threshold:
+                self._open(f"{failures} failures in the last {len(self._calls)} calls")
+                return
+            p95 = _percentile([latency for _, latency in self._calls], 95)
+            if len(self._calls) >= self._min_calls and p95 > self._slow_call_seconds:
+                self._open(f"p95 latency {p95:.1f}s over {self._slow_call_seconds:.1f}s")
+
+    def release(self, permit: int) -> None:
+        """Forget a call that allow() let through but that never got a provider outcome."""
+        with self._lock:
+            if permit == self._probe:
+                self._probe = None
+
+    def _open(self, reason: str) -> None:
+        logger.warning("Bedrock circuit opened: %s", reason)
+        self._state = BreakerState.OPEN
+        self._opened_at = self._clock()
+        self._probe = None
+        self.times_opened += 1
+
+    def stats(self) -> dict[str, float | str]:
+        """State, recent failure count and latency percentiles (for logs and /metrics)."""
+        with self._lock:
+            latencies = [latency for _, latency in self._calls]
+            return {
+                "state": self._state.value,
+                "calls": len(self._calls),
+                "failures": sum(1 for ok, _ in self._calls if not ok),
+                "p50_seconds": _percentile(latencies, 50),
+                "p95_seconds": _percentile(latencies, 95),
+                "times_opened": self.times_opened,
+                "rejected": self.rejected,
+            }
+
+
+_shared_breaker: CircuitBreaker | None = None
+_shared_lock = threading.Lock()
+
+
+def get_circuit_breaker(settings: Settings | None = None) -> CircuitBreaker:
+    """Process-wide breaker built from settings (all workers see the same provider health)."""
+    global _shared_breaker
+    with _shared_lock:
+        if _shared_breaker is None:
+            settings = settings or get_settings()
+            _shared_breaker = CircuitBreaker(
+                failure_threshold=settings.reasoning_breaker_failure_threshold,
+                window=settings.reasoning_breaker_window,
+                slow_call_seconds=settings.reasoning_breaker_slow_call_seconds,
+                open_seconds=settings.reasoning_breaker_open_seconds,
+            )
+        return _shared_breaker
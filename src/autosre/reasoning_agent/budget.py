@@ -0,0 +1,151 @@
+"""
+Fit a log window into a token budget before it is sent to the model.
+
+When the logs are over budget, lines are deduplicated by template (repeats are
+folded into the first occurrence with a count) and ranked: errors and stack traces
+first, then lines close to the incident's detected_at or to a deployment. The
+highest ranked lines are kept until the budget is full and emitted in their
+original order. Logs that already fit are passed through unchanged.
+"""
+
+from __future__ import annotations
+
+import math
+import re
+from datetime import UTC, datetime
+
+from pydantic import BaseModel
+
+from autosre.reasoning_agent.templates import normalize_line
+
+# Rough chars-per-token for English/log text (Nova and Claude tokenizers average ~4)
+CHARS_PER_TOKEN = 4
+
+_TIMESTAMP = re.compile(r"^\s*\[([^\]]+)\]")
+_ERROR = re.compile(
+    r"\b(error|fatal|critical|exception|panic|oom|out of memory|timed? ?out|refused|failed|failure)\b",
+    re.IGNORECASE,
+)
+_WARNING = re.compile(r"\b(warn|warning|retry|retrying|degraded|slow)\b", re.IGNORECASE)
+_STACK = re.compile(r"^\s+(at |File \")|^Traceback \(most recent call last\)|^\s*Caused by:")
+# Lines within this many seconds of detected_at / a deployment get a proximity boost
+_PROXIMITY_SECONDS = 300.0
+
+
+class ContextBudgetStats(BaseModel):
+    """What the budgeter kept and dropped (recorded on Diagnosis.metadata["context"])."""
+
+    budget_tokens: int
+    input_lines: int
+    input_tokens: int
+    kept_lines: int
+    kept_tokens: int
+    duplicate_lines: int = 0
+    dropped_lines: int = 0
+    truncated: bool = False
+
+
+def estimate_tokens(text: str) -> int:
+    """Cheap token estimate (no tokenizer dependency)."""
+    return math.ceil(len(text) / CHARS_PER_TOKEN) if text else 0
+
+
+def to_epoch(value: str | datetime | None) -> float | None:
+    """Epoch seconds of an ISO timestamp or datetime (naive = UTC); None if unparseable."""
+    if value is None:
+        return None
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value.strip())
+        except ValueError:
+            return None
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=UTC)
+    return value.timestamp()
+
+
+def _score(line: str, ts: float | None, anchors: list[float]) -> float:
+    score = 0.0
+    if _ERROR.search(line):
+        score += 4.0
+    elif _WARNING.search(line):
+        score += 1.5
+    if _STACK.search(line):
+        score += 3.0
+    if ts is not None and anchors:
+        distance = min(abs(ts - anchor) for anchor in anchors)
+        score += 2.0 * math.exp(-distance / _PROXIMITY_SECONDS)
+    return score
+
+
+def fit_logs_to_budget(
+    logs: str,
+    budget_tokens: int,
+    detected_at: datetime | None = None,
+    deployment_history: list | None = None,
+) -> tuple[str, ContextBudgetStats]:
+    """Return (logs within budget_tokens, stats). budget_tokens <= 0 disables the budget."""
+    lines = [line for line in logs.splitlines() if line.strip()]
+    input_tokens = estimate_tokens(logs)
+    if budget_tokens <= 0 or input_tokens <= budget_tokens:
+        stats = ContextBudgetStats(
+            budget_tokens=budget_tokens,
+            input_lines=len(lines),
+            input_tokens=input_tokens,
+            kept_lines=len(lines),
+            kept_tokens=input_tokens,
+        )
+        return logs, stats
+
+    # Fold repeats of the same template into their first occurrence
+    first_index: dict[str, int] = {}
+    repeats: dict[int, int] = {}
+    unique: list[int] = []
+    for index, line in enumerate(lines):
+        template = normalize_line(line)
+        if template in first_index:
+            repeats[first_index[template]] = repeats.get(first_index[template], 0) + 1
+            continue
+        first_index[template] = index
+        unique.append(index)
+
+    anchors = [a for a in [to_epoch(detected_at)] if a is not None]
+    for deployment in deployment_history or []:
+        if isinstance(deployment, dict):
+            ts = to_epoch(deployment.get("timestamp"))
+            if ts is not None:
+                anchors.append(ts)
+
+    rendered: dict[int, str] = {}
+    scores: dict[int, float] = {}
+    for index in unique:
+        line = lines[index]
+        if index in repeats:
+            line = f"{line}  [repeated {repeats[index]}x]"
+        rendered[index] = line
+        match = _TIMESTAMP.match(line)
+        scores[index] = _score(line, to_epoch(match.group(1)) if match else None, anchors)
+
+    kept: list[int] = []
+    used = 0
+    # Highest score first; among equals prefer later lines (closer to the incident)
+    for index in sorted(unique, key=lambda i: (scores[i], i), reverse=True):
+        cost = estimate_tokens(rendered[index]) + 1  # newline
+        if used + cost > budget_tokens:
+            continue
+        kept.append(index)
+        used += cost
+    kept.sort()
+
+    text = "\n".join(rendered[i] for i in kept)
+    stats = ContextBudgetStats(
+        budget_tokens=budget_tokens,
+        input_lines=len(lines),
+        input_tokens=input_tokens,
+        kept_lines=len(kept),
+        kept_tokens=estimate_tokens(text),
+        duplicate_lines=len(lines) - len(unique),
+        dropped_lines=len(unique) - len(kept),
+        truncated=True,
+    )
+    return text, stats
@@ -0,0 +1,194 @@
+"""
+TTL + LRU cache of diagnoses keyed by incident fingerprint.
+
+A recurring incident (same type, service, log signature and latest deployment)
+is answered from the cache instead of another Bedrock round trip. Entries expire
+after ttl_seconds; beyond max_entries the least recently used entry is evicted.
+With a path, entries are persisted as JSON and reloaded on start.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+from autosre.config import Settings, get_settings
+from autosre.models import Diagnosis, IncidentEvent
+from autosre.reasoning_agent.templates import log_templates
+
+logger = logging.getLogger(__name__)
+
+
+def deployment_head(deployment_history: list) -> str:
+    """`version:status` of the most recent deployment, or "" if there is none."""
+    entries = [d for d in deployment_history or [] if isinstance(d, dict)]
+    if not entries:
+        return ""
+    latest = max(entries, key=lambda d: str(d.get("timestamp") or ""))
+    return f"{latest.get('version', '')}:{latest.get('status', '')}"
+
+
+def incident_fingerprint(
+    incident: IncidentEvent,
+    logs: str,
+    deployment_history: list,
+    templates: list[str] | None = None,
+) -> str:
+    """
+    Stable key for "the same incident": type, service, log templates, deployment head.
+
+    Pass templates when log_templates(logs) was already computed by the caller.
+    """
+    parts = [
+        incident.incident_type.value,
+        incident.service_name,
+        deployment_head(deployment_history),
+        *(log_templates(logs) if templates is None else templates),
+    ]
+    return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()
+
+
+class DiagnosisCache:
+    """Thread-safe TTL + LRU cache of Diagnosis by fingerprint, with hit/miss counters."""
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        ttl_seconds: float = 900.0,
+        path: str | None = None,
+    ) -> None:
+        self._max_entries = max(1, max_entries)
+        self._ttl_seconds = ttl_seconds
+        self._path = Path(path) if path else None
+        self._lock = threading.Lock()
+        # fingerprint -> (expires_at epoch seconds, diagnosis); most recently used last
+        self._entries: OrderedDict[str, tuple[float, Diagnosis]] = OrderedDict()
+        # Entries dropped on expiry, kept (bounded) for get_stale in degraded mode
+        self._expired: OrderedDict[str, tuple[float, Diagnosis]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._load()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, fingerprint: str) -> Diagnosis | None:
+        """Cached diagnosis for fingerprint, or None if absent or expired."""
+        with self._lock:
+            entry = self._entries.get(fingerprint)
+            if entry is not None and entry[0] <= time.time():
+                del self._entries[fingerprint]
+                self._expired[fingerprint] = entry
+                while len(self._expired) > self._max_entries:
+                    self._expired.popitem(last=False)
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(fingerprint)
+            self.hits += 1
+            return entry[1]
+
+    def get_stale(self, fingerprint: str, max_stale_seconds: float) -> Diagnosis | None:
+        """
+        Diagnosis for fingerprint even if it expired up to max_stale_seconds ago.
+
+        Used when the model is unavailable: an outdated answer for the same incident
+        beats escalating blind. Does not count as a hit or miss.
+        """
+        with self._lock:
+            entry = self._entries.get(fingerprint) or self._expired.get(fingerprint)
+            if entry is None or entry[0] + max_stale_seconds <= time.time():
+                return None
+            return entry[1]
+
+    def put(self, fingerprint: str, diagnosis: Diagnosis) -> None:
+        """Store diagnosis, evicting the least recently used entries beyond max_entries."""
+        with self._lock:
+            self._entries[fingerprint] = (time.time() + self._ttl_seconds, diagnosis)
+            self._entries.move_to_end(fingerprint)
+            self._expired.pop(fingerprint, None)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+            self._save()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._expired.clear()
+            self._save()
+
+    def stats(self) -> dict[str, float]:
+        """Hit/miss counters and current size (for logs and /metrics)."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self._entries),
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+    def _load(self) -> None:
+        if self._path is None or not self._path.exists():
+            return
+        try:
+            raw = json.loads(self._path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning("Ignoring unreadable diagnosis cache %s: %s", self._path, e)
+            return
+        now = time.time()
+        for item in raw if isinstance(raw, list) else []:
+            try:
+                if item["expires_at"] > now:
+                    diagnosis = Diagnosis.model_validate(item["diagnosis"])
+                    self._entries[item["fingerprint"]] = (item["expires_at"], diagnosis)
+            except (KeyError, TypeError, ValueError):
+                continue
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def _save(self) -> None:
+        if self._path is None:
+            return
+        payload = [
+            {
+                "fingerprint": fingerprint,
+                "expires_at": expires_at,
+                "diagnosis": diagnosis.model_dump(mode="json"),
+            }
+            for fingerprint, (expires_at, diagnosis) in self._entries.items()
+        ]
+        try:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self._path.with_suffix(self._path.suffix + ".tmp")
+            tmp.write_text(json.dumps(payload), encoding="utf-8")
+            tmp.replace(self._path)
+        except OSError as e:
+            logger.warning("Could not persist diagnosis cache to %s: %s", self._path, e)
+
+
+_shared_cache: DiagnosisCache | None = None
+_shared_lock = threading.Lock()
+
+
+def get_diagnosis_cache(settings: Settings | None = None) -> DiagnosisCache:
+    """Process-wide cache built from settings (shared by every ReasoningAgent in build_components)."""
+    global _shared_cache
+    with _shared_lock:
+        if _shared_cache is None:
+            settings = settings or get_settings()
+            _shared_cache = DiagnosisCache(
+                max_entries=settings.diagnosis_cache_max_entries,
+                ttl_seconds=settings.diagnosis_cache_ttl_seconds,
+                path=settings.diagnosis_cache_path or None,
+            )
+        return _shared_cache
@@ -0,0 +1,73 @@
+"""
+Per-tier accounting for the reasoning model cascade.
+
+The cascade runs the fast model first and escalates to a larger model only when
+the fast diagnosis is missing or below the confidence threshold. Each model call
+is recorded as a TierResult (latency, tokens, prompt-cache tokens, estimated cost)
+on Diagnosis.metadata["tiers"].
+"""
+
+from __future__ import annotations
+
+from pydantic import BaseModel
+
+# On-demand USD per 1K (input, output) tokens, matched by substring of the model id.
+# Override or extend with config reasoning_model_prices.
+DEFAULT_MODEL_PRICES: dict[str, tuple[float, float]] = {
+    "nova-micro": (0.000035, 0.00014),
+    "nova-lite": (0.00006, 0.00024),
+    "nova-2-lite": (0.0003, 0.0025),
+    "nova-pro": (0.0008, 0.0032),
+    "nova-premier": (0.0025, 0.0125),
+}
+# Prompt-cache tokens relative to the input price: reads are discounted, writes are
+# billed like regular input (Nova; Claude models charge a premium for writes)
+CACHE_READ_PRICE_FACTOR = 0.25
+CACHE_WRITE_PRICE_FACTOR = 1.0
+
+
+class TierResult(BaseModel):
+    """One model call of the cascade."""
+
+    model_id: str
+    latency_seconds: float
+    # Time spent waiting on the RPM/TPM rate limiter before the call was sent
+    queued_seconds: float = 0.0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    # Prompt-cache usage: prefix tokens served from / written to the Bedrock cache
+    cache_read_tokens: int = 0
+    cache_write_tokens: int = 0
+    cost_usd: float | None = None
+    confidence: float | None = None
+    accepted: bool = False
+    error: str = ""
+    # The error came from the provider (throttling, timeout, 5xx), not from local code
+    provider_error: bool = False
+
+
+def estimate_cost(
+    model_id: str,
+    input_tokens: int,
+    output_tokens: int,
+    prices: dict[str, tuple[float, float]] | None = None,
+    cache_read_tokens: int = 0,
+    cache_write_tokens: int = 0,
+) -> float | None:
+    """
+    Estimated USD cost of a call, or None for a model without a known price.
+
+    input_tokens excludes prompt-cache tokens (as reported by Converse usage); those
+    are priced separately with CACHE_READ_PRICE_FACTOR / CACHE_WRITE_PRICE_FACTOR.
+    """
+    table = {**DEFAULT_MODEL_PRICES, **(prices or {})}
+    # Longest match wins ("nova-2-lite" over "nova-lite")
+    for key in sorted(table, key=len, reverse=True):
+        if key in model_id:
+            input_price, output_price = table[key]
+            cached = (
+                cache_read_tokens * CACHE_READ_PRICE_FACTOR
+                + cache_write_tokens * CACHE_WRITE_PRICE_FACTOR
+            )
+            return ((input_tokens + cached) * input_price + output_tokens * output_price) / 1000
+    return None
@@ -1,4 +1,11 @@
-"""Prompt templates for the reasoning agent (Nova) root cause analysis."""
+"""
+Prompt templates for the reasoning agent (Nova) root cause analysis.
+
+Everything that does not change between incidents (instructions, action mapping,
+worked examples) lives in the system prompt, ahead of a Bedrock prompt-cache
+checkpoint; the user message carries only the incident itself. Keep per-incident
+data out of SYSTEM_PROMPT and FEW_SHOT_EXAMPLES or the cached prefix is invalidated.
+"""
 
 SYSTEM_PROMPT = """You are an expert Site Reliability Engineer performing root cause analysis on a cloud service incident.
 Your task is to analyze the provided incident details, logs, and deployment history and output a structured diagnosis.
@@ -15,29 +22,111 @@ Recommended action mapping:
 - Overload, capacity issue → scale_up
 - DB connection exhaustion, pool issues → restart_db_pool
 - Unknown cause, low confidence, or unsafe to act → escalate
+
+Similar past incidents, when listed, show what was done before and whether it worked;
+use them as hints, but the current logs and deployment history take precedence.
+"""
+
+FEW_SHOT_EXAMPLES = """Examples of incidents and the expected response:
+
+Incident type: latency_spike
+Service: checkout
+Logs:
+[2025-01-07T09:14:02Z] WARN p99 latency 2400ms (threshold 800ms)
+[2025-01-07T09:14:05Z] ERROR java.lang.OutOfMemoryError: Java heap space
+Deployment history:
+  - v2.3.0 at 2025-01-07T09:05:00Z (success)
+Response:
+{"summary": "Latency and heap exhaustion started minutes after v2.3.0 was deployed; likely a memory regression in that release.", "confidence": 0.88, "recommended_action": "rollback", "reasoning": "Errors begin right after the deployment and match a regression; rollback is the lowest-risk fix."}
+
+Incident type: latency_spike
+Service: orders
+Logs:
+[2025-01-09T17:40:11Z] ERROR FATAL: sorry, too many clients already
+[2025-01-09T17:40:12Z] ERROR could not acquire connection from pool within 30000ms
+Deployment history:
+  - v5.1.2 at 2025-01-02T10:00:00Z (success)
+Response:
+{"summary": "The database connection pool is exhausted; requests wait for connections.", "confidence": 0.9, "recommended_action": "restart_db_pool", "reasoning": "Connection limit errors with no recent deployment point to leaked or exhausted DB connections."}
+
+Incident type: crash_loop
+Service: payments
+Logs:
+[2025-01-11T03:02:44Z] INFO worker heartbeat missed (3 consecutive)
+[2025-01-11T03:02:45Z] WARN health check /healthz timed out after 5s
+Deployment history:
+  - v1.9.0 at 2024-12-20T12:00:00Z (success)
+Response:
+{"summary": "Workers stopped responding to health checks without a recent change; the process appears hung.", "confidence": 0.75, "recommended_action": "restart", "reasoning": "Missed heartbeats and health check timeouts on a stable release suggest a stuck process."}
+
+Incident type: latency_spike
+Service: search
+Logs:
+[2025-01-14T12:00:03Z] WARN CPU utilization 97% on all tasks
+[2025-01-14T12:00:04Z] WARN request queue depth 1800 (normal < 100)
+Deployment history:
+  - v3.0.4 at 2025-01-01T08:00:00Z (success)
+Response:
+{"summary": "Traffic exceeds current capacity: CPU is saturated and the request queue is growing.", "confidence": 0.82, "recommended_action": "scale_up", "reasoning": "Saturation without errors or a recent deployment indicates load, not a defect."}
+
+Incident type: deployment_failure
+Service: inventory
+Logs:
+[2025-01-15T22:10:00Z] WARN intermittent 502 from upstream gateway
+Deployment history:
+  (none)
+Response:
+{"summary": "Intermittent gateway errors with no clear cause in the service logs.", "confidence": 0.3, "recommended_action": "escalate", "reasoning": "Not enough evidence to choose a safe automated action."}
 """
 
 
+def build_system_blocks(prompt_cache: bool = True) -> list[dict]:
+    """
+    System content blocks for the Converse API.
+
+    With prompt_cache a cachePoint follows the static instructions and examples, so
+    Bedrock can reuse that prefix across calls instead of processing it every time.
+    """
+    blocks: list[dict] = [{"text": SYSTEM_PROMPT}, {"text": FEW_SHOT_EXAMPLES}]
+    if prompt_cache:
+        blocks.append({"cachePoint": {"type": "default"}})
+    return blocks
+
+
 def build_user_prompt(
     incident_type: str,
     service_name: str,
     logs: str,
     deployment_history: list,
+    similar_incidents: list[dict] | None = None,
 ) -> str:
-    """Build the user message for the Converse API."""
+    """
+    Build the user message for the Converse API.
+
+    similar_incidents (dicts as from SimilarIncident.model_dump) are added as compact
+    few-shot context: what was done for comparable past incidents and whether it worked.
+    """
     deployments = "\n".join(
         f"  - {d.get('version', '?')} at {d.get('timestamp', '?')} ({d.get('status', '?')})"
         for d in (deployment_history or [])
     )
-    return f"""Analyze this incident and respond with only the JSON object.
-
-Incident type: {incident_type}
+    similar = ""
+    if similar_incidents:
+        rows = "\n".join(
+            f"  - {s.get('incident_type', '?')} on {s.get('service_name', '?')} "
+            f"(similarity {float(s.get('similarity') or 0):.2f}): "
+            f"{s.get('recommended_action', '?')} -> "
+            f"{'recovered' if s.get('recovered') else 'not recovered'}; {s.get('summary', '')}"
+            for s in similar_incidents
+        )
+        similar = f"\n\nSimilar past incidents (for reference; verify against the logs):\n{rows}"
+    return f"""Incident type: {incident_type}
 Service: {service_name}
 
 Logs:
 {logs}
 
 Deployment history:
-{deployments or "  (none)"}
+{deployments or "  (none)"}{similar}
 
-Respond with a single JSON object with keys: summary, confidence, recommended_action, reasoning."""
+Respond with the JSON object only."""
@@ -0,0 +1,167 @@
+"""
+Client-side Bedrock quota limiter (requests and tokens per minute, per model).
+
+Each model gets two token buckets, one for requests (RPM) and one for tokens
+(TPM). A call reserves one request and its estimated tokens before it is sent,
+waiting for the buckets to refill if needed. Once the response reports actual
+usage, the difference is settled. Concurrent RCAs (analyze_many, daemon workers)
+are then paced to the account quota instead of bursting into ThrottlingException.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable
+
+from autosre.config import Settings, get_settings
+
+
+class RateLimitWaitExceeded(Exception):
+    """The quota did not free up within the limiter's max wait."""
+
+
+class TokenBucket:
+    """Thread-safe token bucket refilled continuously at rate_per_minute, up to capacity."""
+
+    def __init__(
+        self,
+        rate_per_minute: float,
+        capacity: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self._rate = rate_per_minute / 60.0
+        self._capacity = capacity if capacity is not None else rate_per_minute
+        self._tokens = self._capacity
+        self._clock = clock
+        self._sleep = sleep
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    @property
+    def available(self) -> float:
+        with self._lock:
+            self._refill()
+            return self._tokens
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+
+    def acquire(self, amount: float, timeout: float | None = None) -> bool:
+        """Take amount (capped at capacity), waiting up to timeout; False if it timed out."""
+        amount = min(amount, self._capacity)
+        deadline = None if timeout is None else self._clock() + timeout
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= amount:
+                    self._tokens -= amount
+                    return True
+                wait = (amount - self._tokens) / self._rate
+            if deadline is not None:
+                remaining = deadline - self._clock()
+                if remaining <= 0:
+                    return False
+                wait = min(wait, remaining)
+            self._sleep(wait)
+
+    def refund(self, amount: float) -> None:
+        """Return amount (or take more when negative), e.g. when actual usage differs."""
+        with self._lock:
+            self._refill()
+            self._tokens = min(self._capacity, self._tokens + amount)
+
+
+class ModelRateLimiter:
+    """
+    Per-model RPM/TPM buckets.
+
+    limits maps a model id substring to (rpm, tpm); the longest match wins, and
+    models without a match use (default_rpm, default_tpm). 0 means unlimited.
+    """
+
+    def __init__(
+        self,
+        default_rpm: int = 0,
+        default_tpm: int = 0,
+        limits: dict[str, tuple[int, int]] | None = None,
+        max_wait_seconds: float | None = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self._default = (default_rpm, default_tpm)
+        self._limits = dict(limits or {})
+        self._max_wait_seconds = max_wait_seconds
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._buckets: dict[str, tuple[TokenBucket | None, TokenBucket | None]] = {}
+
+    def _limits_for(self, model_id: str) -> tuple[int, int]:
+        for key in sorted(self._limits, key=len, reverse=True):
+            if key in model_id:
+                return self._limits[key]
+        return self._default
+
+    def _model_buckets(self, model_id: str) -> tuple[TokenBucket | None, TokenBucket | None]:
+        with self._lock:
+            buckets = self._buckets.get(model_id)
+            if buckets is None:
+                rpm, tpm = self._limits_for(model_id)
+                buckets = tuple(
+                    TokenBucket(limit, clock=self._clock, sleep=self._sleep) if limit > 0 else None
+                    for limit in (rpm, tpm)
+                )
+                self._buckets[model_id] = buckets
+            return buckets
+
+    def acquire(self, model_id: str, tokens: int) -> float:
+        """Reserve one request and tokens for model_id; returns seconds waited."""
+        start = self._clock()
+        requests, token_bucket = self._model_buckets(model_id)
+        if requests is not None and not requests.acquire(1, self._max_wait_seconds):
+            raise RateLimitWaitExceeded(f"{model_id}: RPM quota busy for {self._max_wait_seconds}s")
+        if token_bucket is not None:
+            remaining = None
+            if self._max_wait_seconds is not None:
+                remaining = max(0.0, self._max_wait_seconds - (self._clock() - start))
+            if not token_bucket.acquire(tokens, remaining):
+                if requests is not None:
+                    requests.refund(1)
+                raise RateLimitWaitExceeded(
+                    f"{model_id}: TPM quota busy for {self._max_wait_seconds}s"
+                )
+        return self._clock() - start
+
+    def settle(self, model_id: str, reserved_tokens: int, used_tokens: int) -> None:
+        """
+        Correct the TPM bucket once the actual usage of a call is known.
+
+        reserved_tokens is everything acquired for the call (all its attempts);
+        used_tokens is 0 for a call that failed.
+        """
+        _, token_bucket = self._model_buckets(model_id)
+        if token_bucket is not None:
+            token_bucket.refund(reserved_tokens - used_tokens)
+
+
+_shared_limiter: ModelRateLimiter | None = None
+_shared_lock = threading.Lock()
+
+
+def get_rate_limiter(settings: Settings | None = None) -> ModelRateLimiter:
+    """Process-wide limiter built from settings (the quota is per account, not per agent)."""
+    global _shared_limiter
+    with _shared_lock:
+        if _shared_limiter is None:
+            settings = settings or get_settings()
+            _shared_limiter = ModelRateLimiter(
+                default_rpm=settings.reasoning_rpm,
+                default_tpm=settings.reasoning_tpm,
+                limits=settings.reasoning_rate_limits,
+                max_wait_seconds=settings.reasoning_rate_limit_max_wait_seconds,
+            )
+        return _shared_limiter
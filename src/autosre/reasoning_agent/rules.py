@@ -0,0 +1,170 @@
+"""
+Rule-based fast path ahead of the model.
+
+Some incidents map deterministically to an action, e.g. an error alarm shortly
+after a deploy → rollback, or "too many connections" in the logs → restart the
+DB pool. A RuleEngine checks its rules in order against the incident type, the
+raw alarm payload, the log text and the deployment history. The first rule that
+fires produces the Diagnosis directly; otherwise the caller asks the model.
+
+Patterns are compiled once, when the engine is built, and are case-insensitive.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import re
+import threading
+from pathlib import Path
+
+from pydantic import BaseModel, Field
+
+from autosre.config import Settings, get_settings
+from autosre.models import Diagnosis, IncidentEvent, IncidentType, RecommendedAction
+from autosre.reasoning_agent.budget import to_epoch
+
+logger = logging.getLogger(__name__)
+
+
+class Rule(BaseModel):
+    """
+    One deterministic diagnosis rule; every condition that is set must hold.
+
+    payload_pattern is searched in the raw payload flattened to "key=value" pairs
+    (e.g. "MetricName=Errors source=cloudwatch"); log_patterns fire if any of them
+    is found in the logs. summary may use {service} and {version} (latest deployment).
+    """
+
+    name: str
+    action: RecommendedAction
+    confidence: float = Field(default=0.9, ge=0.0, le=1.0)
+    summary: str
+    incident_types: list[IncidentType] = Field(default_factory=list)
+    payload_pattern: str | None = None
+    log_patterns: list[str] = Field(default_factory=list)
+    # Latest deployment happened at most this many minutes before detection
+    deploy_within_minutes: float | None = None
+
+
+DEFAULT_RULES: tuple[Rule, ...] = (
+    Rule(
+        name="db_connection_exhaustion",
+        action=RecommendedAction.RESTART_DB_POOL,
+        summary="{service} database connections are exhausted (pool errors in logs).",
+        log_patterns=[
+            r"too many connections",
+            r"remaining connection slots are reserved",
+            r"connection pool (?:is )?(?:exhausted|timed? ?out)",
+        ],
+    ),
+    Rule(
+        name="error_alarm_after_recent_deploy",
+        action=RecommendedAction.ROLLBACK,
+        summary="{service} started failing right after deployment {version}.",
+        payload_pattern=r"\b(?:metric|metricname|alarmname)=[^ ]*(?:error|5xx|fault)",
+        deploy_within_minutes=15,
+    ),
+)
+
+
+def _flatten_payload(payload: dict) -> str:
+    return " ".join(f"{key}={value}" for key, value in sorted(payload.items()))
+
+
+def _latest_deployment(deployment_history: list) -> dict | None:
+    entries = [d for d in deployment_history or [] if isinstance(d, dict)]
+    if not entries:
+        return None
+    return max(entries, key=lambda d: str(d.get("timestamp") or ""))
+
+
+class _CompiledRule:
+    __slots__ = ("deploy_within_seconds", "incident_types", "log_res", "payload_re", "rule")
+
+    def __init__(self, rule: Rule) -> None:
+        self.rule = rule
+        self.incident_types = frozenset(rule.incident_types)
+        self.payload_re = (
+            re.compile(rule.payload_pattern, re.IGNORECASE) if rule.payload_pattern else None
+        )
+        # Kept separate: an alternation would lose re's literal-prefix fast scan
+        self.log_res = tuple(re.compile(p, re.IGNORECASE) for p in rule.log_patterns)
+        self.deploy_within_seconds = (
+            rule.deploy_within_minutes * 60 if rule.deploy_within_minutes is not None else None
+        )
+
+
+class RuleEngine:
+    """Ordered deterministic rules; match() returns the first rule's Diagnosis or None."""
+
+    def __init__(self, rules: list[Rule] | tuple[Rule, ...] = DEFAULT_RULES) -> None:
+        self._rules = tuple(_CompiledRule(rule) for rule in rules)
+
+    @property
+    def rules(self) -> list[Rule]:
+        return [compiled.rule for compiled in self._rules]
+
+    @classmethod
+    def from_file(cls, path: str, include_defaults: bool = True) -> RuleEngine:
+        """Rules from a JSON list of Rule objects, checked before the default rules."""
+        raw = json.loads(Path(path).read_text(encoding="utf-8"))
+        rules = [Rule.model_validate(item) for item in raw]
+        return cls(rules + list(DEFAULT_RULES) if include_defaults else rules)
+
+    def match(
+        self,
+        incident: IncidentEvent,
+        logs: str,
+        deployment_history: list,
+    ) -> Diagnosis | None:
+        """Diagnosis from the first rule that fires, or None."""
+        payload: str | None = None
+        latest = _latest_deployment(deployment_history)
+        for compiled in self._rules:
+            if compiled.incident_types and incident.incident_type not in compiled.incident_types:
+                continue
+            if compiled.deploy_within_seconds is not None:
+                deployed_at = to_epoch(latest.get("timestamp")) if latest else None
+                detected_at = to_epoch(incident.detected_at)
+                if deployed_at is None or detected_at is None:
+                    continue
+                if not 0 <= detected_at - deployed_at <= compiled.deploy_within_seconds:
+                    continue
+            if compiled.payload_re is not None:
+                if payload is None:
+                    payload = _flatten_payload(incident.raw_payload or {})
+                if not compiled.payload_re.search(payload):
+                    continue
+            if compiled.log_res and not any(p.search(logs) for p in compiled.log_res):
+                continue
+            return self._diagnosis(compiled.rule, incident, latest)
+        return None
+
+    @staticmethod
+    def _diagnosis(rule: Rule, incident: IncidentEvent, latest: dict | None) -> Diagnosis:
+        version = str((latest or {}).get("version") or "unknown")
+        return Diagnosis(
+            summary=rule.summary.format(service=incident.service_name, version=version),
+            confidence=rule.confidence,
+            recommended_action=rule.action,
+            reasoning=f"Matched deterministic rule '{rule.name}'.",
+            metadata={"rule": rule.name},
+        )
+
+
+_shared_engine: RuleEngine | None = None
+_shared_lock = threading.Lock()
+
+
+def get_rule_engine(settings: Settings | None = None) -> RuleEngine:
+    """Process-wide engine: rules from reasoning_rules_path (if set) plus the defaults."""
+    global _shared_engine
+    with _shared_lock:
+        if _shared_engine is None:
+            settings = settings or get_settings()
+            if settings.reasoning_rules_path:
+                _shared_engine = RuleEngine.from_file(settings.reasoning_rules_path)
+            else:
+                _shared_engine = RuleEngine()
+        return _shared_engine
@@ -0,0 +1,214 @@
+"""
+Local similarity index over past incident outcomes (retrieval-augmented RCA).
+
+Each recorded outcome (LogStore.record_outcome) becomes a hashed TF-IDF vector over
+its incident type, service and log templates. For a new incident the k most
+similar past incidents are found by cosine similarity (matrix-vector products in
+NumPy, no external service). They are given to the model as few-shot context,
+and a near-duplicate that was remediated successfully can answer directly.
+"""
+
+from __future__ import annotations
+
+import math
+import re
+import threading
+import zlib
+from typing import TYPE_CHECKING, Any
+
+from pydantic import BaseModel
+
+from autosre.models import Diagnosis, IncidentEvent, RecommendedAction
+
+if TYPE_CHECKING:
+    from autosre.log_storage import LogStore
+
+_WORD = re.compile(r"[a-z][a-z0-9_]+|<[a-z]+>")
+# Incident type / service are strong signals next to individual log words
+_FIELD_WEIGHT = 3
+
+
+class SimilarIncident(BaseModel):
+    """A past incident close to the current one, with how it was resolved."""
+
+    incident_id: str
+    similarity: float
+    incident_type: str
+    service_name: str
+    summary: str
+    recommended_action: str
+    confidence: float
+    recovered: bool
+    recovery_seconds: float = 0.0
+
+
+def _features(incident_type: str, service_name: str, templates: list[str]) -> dict[str, int]:
+    counts: dict[str, int] = {
+        f"type:{incident_type}": _FIELD_WEIGHT,
+        f"service:{service_name}": _FIELD_WEIGHT,
+    }
+    for template in templates:
+        counts[f"t:{template}"] = counts.get(f"t:{template}", 0) + 1
+        for word in _WORD.findall(template.lower()):
+            counts[word] = counts.get(word, 0) + 1
+    return counts
+
+
+class SimilarityIndex:
+    """
+    Thread-safe hashed TF-IDF index of incident outcomes.
+
+    Features are hashed into `dimensions` buckets (crc32, stable across processes).
+    Each outcome is appended as one row of sublinear term frequencies (the matrix
+    grows by doubling), so adding is O(features). IDF weights change with every
+    document, so they are applied at query time: scores and row norms are two
+    matrix-vector products, with no per-document rebuild.
+    """
+
+    def __init__(self, dimensions: int = 2048) -> None:
+        self._dimensions = dimensions
+        self._lock = threading.Lock()
+        self._outcomes: list[dict] = []
+        self._document_frequency: dict[int, int] = {}
+        self._tf: Any = None  # numpy (capacity, dimensions); the first len(self) rows are used
+
+    def __len__(self) -> int:
+        return len(self._outcomes)
+
+    @classmethod
+    def from_log_store(cls, log_store: LogStore, dimensions: int = 2048) -> SimilarityIndex:
+        index = cls(dimensions=dimensions)
+        for outcome in log_store.list_outcomes():
+            index.add(outcome)
+        return index
+
+    def _hashed(self, counts: dict[str, int]) -> dict[int, int]:
+        buckets: dict[int, int] = {}
+        for feature, count in counts.items():
+            bucket = zlib.crc32(feature.encode("utf-8")) % self._dimensions
+            buckets[bucket] = buckets.get(bucket, 0) + count
+        return buckets
+
+    def _tf_row(self, doc: dict[int, int]) -> Any:
+        import numpy as np
+
+        row = np.zeros(self._dimensions, dtype=np.float32)
+        for bucket, count in doc.items():
+            row[bucket] = 1.0 + math.log(count)
+        return row
+
+    def add(self, outcome: dict) -> None:
+        """Index one outcome dict as returned by LogStore.record_outcome."""
+        import numpy as np
+
+        counts = _features(
+            str(outcome.get("incident_type", "")),
+            str(outcome.get("service_name", "")),
+            list(outcome.get("log_templates") or []),
+        )
+        doc = self._hashed(counts)
+        row = self._tf_row(doc)
+        with self._lock:
+            n_docs = len(self._outcomes)
+            if self._tf is None or n_docs == len(self._tf):
+                grown = np.zeros((max(16, 2 * n_docs), self._dimensions), dtype=np.float32)
+                if self._tf is not None:
+                    grown[:n_docs] = self._tf
+                self._tf = grown
+            self._tf[n_docs] = row
+            self._outcomes.append(outcome)
+            for bucket in doc:
+                self._document_frequency[bucket] = self._document_frequency.get(bucket, 0) + 1
+
+    def _idf(self) -> Any:
+        import numpy as np
+
+        df = np.zeros(self._dimensions, dtype=np.float32)
+        for bucket, count in self._document_frequency.items():
+            df[bucket] = count
+        return np.log((1.0 + len(self._outcomes)) / (1.0 + df)) + 1.0
+
+    def _scores(self, doc: dict[int, int]) -> Any:
+        """Cosine similarity of doc to every indexed outcome, under the current IDF."""
+        import numpy as np
+
+        idf = self._idf()
+        query = self._tf_row(doc) * idf
+        norm = float(np.linalg.norm(query))
+        if norm:
+            query /= norm
+        tf = self._tf[: len(self._outcomes)]
+        # Row i is tf_i * idf / ||tf_i * idf||
+        row_norms = np.sqrt(np.einsum("ij,ij,j->i", tf, tf, idf * idf))
+        dots = tf @ (query * idf)
+        return np.divide(dots, row_norms, out=np.zeros_like(dots), where=row_norms > 0)
+
+    def query(
+        self,
+        incident: IncidentEvent,
+        templates: list[str],
+        k: int = 3,
+        min_similarity: float = 0.0,
+        recovered_only: bool = True,
+    ) -> list[SimilarIncident]:
+        """The k most similar past incidents (highest similarity first)."""
+        import numpy as np
+
+        with self._lock:
+            if not self._outcomes or k <= 0:
+                return []
+            scores = self._scores(
+                self._hashed(
+                    _features(incident.incident_type.value, incident.service_name, templates)
+                )
+            )
+            if recovered_only:
+                mask = np.array([bool(o.get("recovered")) for o in self._outcomes])
+                scores = np.where(mask, scores, -1.0)
+            top = min(k + 1, len(scores))  # +1: the incident itself may be indexed
+            candidates = np.argpartition(-scores, top - 1)[:top]
+            ranked = sorted(candidates, key=lambda i: float(scores[i]), reverse=True)
+            results: list[SimilarIncident] = []
+            for i in ranked:
+                if len(results) == k:
+                    break
+                score = float(scores[i])
+                outcome = self._outcomes[i]
+                if score < max(min_similarity, 0.0) or outcome.get("incident_id") == (
+                    incident.incident_id
+                ):
+                    continue
+                results.append(
+                    SimilarIncident(
+                        incident_id=str(outcome.get("incident_id", "")),
+                        similarity=round(score, 4),
+                        incident_type=str(outcome.get("incident_type", "")),
+                        service_name=str(outcome.get("service_name", "")),
+                        summary=str(outcome.get("summary", "")),
+                        recommended_action=str(outcome.get("recommended_action", "")),
+                        confidence=float(outcome.get("confidence") or 0.0),
+                        recovered=bool(outcome.get("recovered")),
+                        recovery_seconds=float(outcome.get("recovery_seconds") or 0.0),
+                    )
+                )
+            return results
+
+
+def diagnosis_from_similar(similar: SimilarIncident) -> Diagnosis | None:
+    """Reuse a successfully remediated near-duplicate's diagnosis (None if not applicable)."""
+    try:
+        action = RecommendedAction(similar.recommended_action)
+    except ValueError:
+        return None
+    if not similar.recovered or action == RecommendedAction.ESCALATE:
+        return None
+    return Diagnosis(
+        summary=similar.summary,
+        confidence=min(similar.confidence, similar.similarity),
+        recommended_action=action,
+        reasoning=(
+            f"Near-duplicate of {similar.incident_id} (similarity {similar.similarity:.2f}), "
+            f"which recovered after {action.value}."
+        ),
+        metadata={"similar_incident": similar.incident_id, "similarity": similar.similarity},
+    )
@@ -0,0 +1,130 @@
+"""
+Incremental parsing of a streamed diagnosis JSON object.
+
+The model emits one flat JSON object (see prompts.SYSTEM_PROMPT). While text
+deltas arrive from ``converse_stream``, IncrementalDiagnosisParser reports each
+top-level field as soon as its value is complete, so recommended_action and
+confidence are known before the (long) reasoning text has finished streaming.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from collections.abc import Callable, Iterable, Iterator
+from typing import Any
+
+# Called with (field name, decoded value) as each top-level field completes
+PartialCallback = Callable[[str, Any], None]
+
+_WHITESPACE = " \t\r\n"
+# A bare scalar (number / true / false / null) is complete once a delimiter follows
+_SCALAR_END = re.compile(r"[\s,}\]]")
+_INCOMPLETE = object()
+
+
+class IncrementalDiagnosisParser:
+    """Feed text chunks; fields of the top-level JSON object are decoded as they complete."""
+
+    def __init__(self, on_field: PartialCallback | None = None) -> None:
+        self._on_field = on_field
+        self._decoder = json.JSONDecoder()
+        self._buf = ""
+        self._pos = 0
+        self._started = False
+        self._done = False
+        self._key: str | None = None
+        self.fields: dict[str, Any] = {}
+
+    @property
+    def text(self) -> str:
+        """All text fed so far."""
+        return self._buf
+
+    def feed(self, chunk: str) -> dict[str, Any]:
+        """Append chunk; return the fields completed by it (also passed to on_field)."""
+        if not chunk:
+            return {}
+        self._buf += chunk
+        completed: dict[str, Any] = {}
+        while not self._done and self._step(completed):
+            pass
+        return completed
+
+    def _skip_whitespace(self) -> None:
+        while self._pos < len(self._buf) and self._buf[self._pos] in _WHITESPACE:
+            self._pos += 1
+
+    def _step(self, completed: dict[str, Any]) -> bool:
+        """Consume one token if it is complete; False means wait for more text."""
+        if not self._started:
+            # Tolerate a leading ```json fence or prose before the object
+            start = self._buf.find("{", self._pos)
+            if start < 0:
+                return False
+            self._pos = start + 1
+            self._started = True
+            return True
+        self._skip_whitespace()
+        if self._pos >= len(self._buf):
+            return False
+        char = self._buf[self._pos]
+        if self._key is None:
+            if char == ",":
+                self._pos += 1
+                return True
+            if char == "}":
+                self._done = True
+                return False
+            key = self._decode_complete()
+            if key is _INCOMPLETE:
+                return False
+            self._key = str(key)
+            return True
+        if char == ":":
+            self._pos += 1
+            return True
+        value = self._decode_complete()
+        if value is _INCOMPLETE:
+            return False
+        key, self._key = self._key, None
+        self.fields[key] = value
+        completed[key] = value
+        if self._on_field is not None:
+            self._on_field(key, value)
+        return True
+
+    def _decode_complete(self) -> Any:
+        """Decode the value at _pos and advance past it, or return _INCOMPLETE."""
+        char = self._buf[self._pos]
+        if char not in '"{[':
+            match = _SCALAR_END.search(self._buf, self._pos)
+            if match is None:
+                return _INCOMPLETE
+            end = match.start()
+            try:
+                value = json.loads(self._buf[self._pos : end])
+            except json.JSONDecodeError:
+                self._done = True
+                return _INCOMPLETE
+            self._pos = end
+            return value
+        try:
+            value, end = self._decoder.raw_decode(self._buf, self._pos)
+        except json.JSONDecodeError:
+            return _INCOMPLETE  # string / nested value not finished yet
+        self._pos = end
+        return value
+
+
+def iter_converse_stream_text(
+    events: Iterable[dict], usage: dict[str, Any] | None = None
+) -> Iterator[str]:
+    """Text deltas from a Bedrock converse_stream event stream (token usage copied into usage)."""
+    for event in events:
+        if usage is not None and "metadata" in event:
+            usage.update(event["metadata"].get("usage") or {})
+        delta = (event.get("contentBlockDelta") or {}).get("delta") or {}
+        text = delta.get("text")
+        if text:
+            yield text
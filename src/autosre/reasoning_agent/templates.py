@@ -0,0 +1,44 @@
+"""
+Log line → template normalization.
+
+Replaces the variable parts of a log line (timestamps, ids, numbers, addresses,
+quoted values) with placeholders so that lines emitted by the same log statement
+collapse to one template, e.g.
+
+    [2025-02-11T12:00:01] ERROR timeout after 5012ms request_id=req-8812
+    → ERROR timeout after <num>ms request_id=<id>
+"""
+
+from __future__ import annotations
+
+import re
+
+_LEADING_TIMESTAMP = re.compile(r"^\s*\[[^\]]*\]\s*")  # "[<ts>] " added by LogStore / CloudWatch
+# One alternation, so each line is scanned once; earlier alternatives win at a position
+_VARIABLE_PARTS = (
+    ("ts", r"\b\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2}(?:\.\d+)?(?:Z|[+-]\d{2}:?\d{2})?", "<ts>"),
+    ("uuid", r"\b[0-9a-fA-F]{8}-(?:[0-9a-fA-F]{4}-){3}[0-9a-fA-F]{12}\b", "<uuid>"),
+    ("ip", r"\b\d{1,3}(?:\.\d{1,3}){3}(?::\d+)?\b", "<ip>"),
+    # values of request_id=, trace_id=, pid= ...
+    ("id", r"(?<=id=)[^\s,;]+", "<id>"),
+    ("hex", r"\b0x[0-9a-fA-F]+\b|\b[0-9a-fA-F]{12,}\b", "<hex>"),
+    ("str", r'"[^"]*"', '"<str>"'),
+    ("num", r"\d+(?:\.\d+)?", "<num>"),
+)
+_VARIABLE = re.compile("|".join(f"(?P<{name}>{pattern})" for name, pattern, _ in _VARIABLE_PARTS))
+_PLACEHOLDERS = {name: placeholder for name, _, placeholder in _VARIABLE_PARTS}
+
+
+def _placeholder(match: re.Match[str]) -> str:
+    return _PLACEHOLDERS[match.lastgroup]
+
+
+def normalize_line(line: str) -> str:
+    """Template of one log line (variable parts replaced by <placeholders>)."""
+    line = _VARIABLE.sub(_placeholder, _LEADING_TIMESTAMP.sub("", line, count=1))
+    return " ".join(line.split())
+
+
+def log_templates(logs: str) -> list[str]:
+    """Distinct templates of the non-empty lines in `logs`, sorted."""
+    return sorted({t for t in (normalize_line(line) for line in logs.splitlines()) if t})
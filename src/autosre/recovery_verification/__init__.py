@@ -4,6 +4,17 @@ Recovery verification.
 Monitors metrics after remediation; determines recovered / not recovered.
 """
 
-from autosre.recovery_verification.monitor import RecoveryMonitor
+from typing import TYPE_CHECKING
+
+from autosre._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from autosre.recovery_verification.monitor import RecoveryMonitor
+
+_EXPORTS = {
+    "RecoveryMonitor": "autosre.recovery_verification.monitor",
+}
 
 __all__ = ["RecoveryMonitor"]
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -5,6 +5,7 @@ import time
 
 import httpx
 
+from autosre.aws_clients import get_client
 from autosre.models import RecoveryStatus
 
 logger = logging.getLogger(__name__)
@@ -111,9 +112,7 @@ class RecoveryMonitor:
     def _check_cloudwatch_alarms_ok(self, alarm_names: list[str]) -> bool:
         """Return True if all given CloudWatch alarms are in OK state."""
         try:
-            import boto3
-
-            client = boto3.client("cloudwatch", region_name=self._aws_region)
+            client = get_client("cloudwatch", region_name=self._aws_region)
             response = client.describe_alarms(AlarmNames=alarm_names)
             for alarm in response.get("MetricAlarms") or []:
                 if alarm.get("StateValue") != "OK":
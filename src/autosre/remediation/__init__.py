@@ -2,8 +2,36 @@
 Remediation layer: execute planned actions via real AWS APIs.
 
 When use_aws_integration is True, workflow uses AWSExecutor instead of UIActionAgent.
+Otherwise plans run through the dashboard API (DashboardAPIExecutor) when possible.
 """
 
-from autosre.remediation.aws_executor import AWSExecutor
+from typing import TYPE_CHECKING
 
-__all__ = ["AWSExecutor"]
+from autosre._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from autosre.remediation.aws_executor import AWSExecutor
+    from autosre.remediation.dag import DagExecutor, DagResult
+    from autosre.remediation.dashboard_api import DashboardAPIExecutor
+    from autosre.remediation.journal import ActionJournal
+    from autosre.remediation.lambda_versions import LambdaVersionIndex
+
+_EXPORTS = {
+    "AWSExecutor": "autosre.remediation.aws_executor",
+    "ActionJournal": "autosre.remediation.journal",
+    "DagExecutor": "autosre.remediation.dag",
+    "DagResult": "autosre.remediation.dag",
+    "DashboardAPIExecutor": "autosre.remediation.dashboard_api",
+    "LambdaVersionIndex": "autosre.remediation.lambda_versions",
+}
+
+__all__ = [
+    "AWSExecutor",
+    "ActionJournal",
+    "DagExecutor",
+    "DagResult",
+    "DashboardAPIExecutor",
+    "LambdaVersionIndex",
+]
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -0,0 +1,195 @@
+"""
+Gradual Lambda alias shift for rollback.
+
+Flipping an alias in one update_alias call sends all traffic to execution
+environments that do not exist yet. The cold starts cause a latency spike that
+recovery verification can mistake for a failed rollback. This module instead:
+
+1. pre-warms the target version with concurrent warm-up invocations,
+2. shifts traffic to it in weighted RoutingConfig steps, checking the target's
+   health after each step, and
+3. finalizes by pointing the alias at the target with no routing.
+
+Health is read from CloudWatch, not from synthetic invokes: the target is healthy
+at a step when the AWS/Lambda Errors and Throttles metrics for the requests it
+served through the alias (the ExecutedVersion dimension) are zero over the step
+window. Lambda publishes these metrics per minute, so steps should last at least
+a minute. If the target turns out unhealthy, the shift is abandoned: the alias
+goes back to its original version with no routing, and the rollback reports
+failure.
+
+Warm-up contract: warm-up invocations send DEFAULT_WARMUP_PAYLOAD
+({"autosre_warmup": true}) to the target version. Handlers must return early on
+it, without side effects; for functions that do not, set warm_invocations to 0.
+Warm-up results are never used as a health signal.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import time
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime
+from typing import Any
+
+from autosre.retry import RetryPolicy
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WARMUP_PAYLOAD = {"autosre_warmup": True}
+
+_HEALTH_METRICS = ("Errors", "Throttles")
+
+
+class GradualAliasShift:
+    """Pre-warm, then weighted alias shift, then finalize (one rollback per run())."""
+
+    def __init__(
+        self,
+        client: Any,
+        cloudwatch: Any | None = None,
+        retry_policy: RetryPolicy | None = None,
+        weights: Sequence[float] = (0.1, 0.5),
+        step_seconds: float = 10.0,
+        warm_invocations: int = 3,
+        warmup_payload: dict[str, Any] | None = None,
+        health_check: Callable[[str, str, str, datetime], bool] | None = None,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        """
+        health_check(function_name, alias_name, version, since) -> bool replaces the
+        default check of the target's CloudWatch metrics (which needs cloudwatch).
+        """
+        if health_check is None and cloudwatch is None:
+            raise ValueError("GradualAliasShift needs a CloudWatch client or a health_check")
+        self._client = client
+        self._cloudwatch = cloudwatch
+        self._retry = retry_policy or RetryPolicy()
+        self._weights = sorted(w for w in weights if 0.0 < w < 1.0)
+        self._step_seconds = step_seconds
+        self._warm_invocations = max(0, warm_invocations)
+        self._payload = json.dumps(
+            DEFAULT_WARMUP_PAYLOAD if warmup_payload is None else warmup_payload
+        ).encode()
+        self._health_check = health_check or self._metrics_ok
+        self._sleep = sleep
+
+    def _metrics_ok(
+        self, function_name: str, alias_name: str, version: str, since: datetime
+    ) -> bool:
+        """True if version had no Errors or Throttles serving alias_name since `since`."""
+        dimensions = [
+            {"Name": "FunctionName", "Value": function_name},
+            {"Name": "Resource", "Value": f"{function_name}:{alias_name}"},
+            {"Name": "ExecutedVersion", "Value": version},
+        ]
+        response = self._retry.call(
+            self._cloudwatch.get_metric_data,
+            MetricDataQueries=[
+                {
+                    "Id": metric.lower(),
+                    "MetricStat": {
+                        "Metric": {
+                            "Namespace": "AWS/Lambda",
+                            "MetricName": metric,
+                            "Dimensions": dimensions,
+                        },
+                        "Period": 60,
+                        "Stat": "Sum",
+                    },
+                }
+                for metric in _HEALTH_METRICS
+            ],
+            StartTime=since.replace(second=0, microsecond=0),
+            EndTime=datetime.now(UTC),
+        )
+        counts = {
+            result["Id"]: sum(result.get("Values", []))
+            for result in response.get("MetricDataResults", [])
+        }
+        if any(counts.values()):
+            logger.warning("Version %s of %s: %s", version, function_name, counts)
+            return False
+        return True
+
+    def _invoke_ok(self, function_name: str, version: str) -> bool:
+        response = self._retry.call(
+            self._client.invoke,
+            FunctionName=function_name,
+            Qualifier=version,
+            InvocationType="RequestResponse",
+            Payload=self._payload,
+        )
+        return not response.get("FunctionError")
+
+    def prewarm(self, function_name: str, version: str) -> int:
+        """Concurrent warm-up invocations (one execution environment each); returns successes."""
+        if not self._warm_invocations:
+            return 0
+        with ThreadPoolExecutor(max_workers=self._warm_invocations) as pool:
+            futures = [
+                pool.submit(self._invoke_ok, function_name, version)
+                for _ in range(self._warm_invocations)
+            ]
+        ok = 0
+        for future in futures:
+            try:
+                ok += bool(future.result())
+            except Exception as e:  # noqa: BLE001
+                logger.debug("Warm-up invocation of %s:%s failed: %s", function_name, version, e)
+        logger.info(
+            "Pre-warmed %s:%s (%s/%s invocations ok)",
+            function_name,
+            version,
+            ok,
+            self._warm_invocations,
+        )
+        return ok
+
+    def _route(
+        self, function_name: str, alias_name: str, primary: str, target: str | None, weight: float
+    ) -> None:
+        weights = {target: round(weight, 4)} if target else {}
+        self._retry.call(
+            self._client.update_alias,
+            FunctionName=function_name,
+            Name=alias_name,
+            FunctionVersion=primary,
+            RoutingConfig={"AdditionalVersionWeights": weights},
+        )
+
+    def run(self, function_name: str, alias_name: str, current: str, target: str) -> bool:
+        """Move alias_name from current to target gradually; True once finalized."""
+        self.prewarm(function_name, target)
+        # Weighted routing needs a published primary version; $LATEST is switched directly
+        weights = self._weights if current != "$LATEST" else []
+        for weight in weights:
+            since = datetime.now(UTC)
+            self._route(function_name, alias_name, current, target, weight)
+            logger.info(
+                "Lambda rollback: %s alias %s sends %.0f%% to version %s",
+                function_name,
+                alias_name,
+                weight * 100,
+                target,
+            )
+            self._sleep(self._step_seconds)
+            try:
+                healthy = self._health_check(function_name, alias_name, target, since)
+            except Exception as e:  # noqa: BLE001
+                logger.warning("Health check of %s:%s failed: %s", function_name, target, e)
+                healthy = False
+            if not healthy:
+                logger.warning(
+                    "Version %s unhealthy at %.0f%%; restoring %s to version %s",
+                    target,
+                    weight * 100,
+                    alias_name,
+                    current,
+                )
+                self._route(function_name, alias_name, current, None, 0.0)
+                return False
+        self._route(function_name, alias_name, target, None, 0.0)
+        return True
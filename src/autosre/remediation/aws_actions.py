@@ -0,0 +1,309 @@
+"""
+Restart, scale and connection-pool actions on AWS resources.
+
+A plan step (restart_instance, scale_replicas, restart_pool) applies to every
+resource of the service. Resources are given as ARNs, which carry both the region
+and the resource type. The step fans out over the resources concurrently, and each
+resource is polled until it is stable. Clients come from one shared ClientCache,
+so all operations and polls in a region reuse a single client.
+
+  restart_instance  ECS service: force a new deployment; Lambda function: new execution
+                    environments for the alias (configuration bump, published as a new
+                    version the alias moves to); RDS instance: reboot
+  scale_replicas    ECS service: desired count; Lambda function: provisioned concurrency
+                    on the alias
+  restart_pool      the connection pool lives in the clients: restart the ECS service or
+                    Lambda environments. RDS instance: reboot (drops all connections, and
+                    the database is down meanwhile), only with allow_db_reboot; otherwise
+                    RDS resources are skipped
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Literal
+
+from autosre.aws_clients import ClientCache
+from autosre.remediation.lambda_versions import RESTART_DESCRIPTION_PREFIX
+from autosre.retry import RetryPolicy
+
+logger = logging.getLogger(__name__)
+
+WaitState = Literal["ok", "pending", "failed"]
+
+SUPPORTED: dict[str, frozenset[str]] = {
+    "restart_instance": frozenset({"ecs", "lambda", "rds"}),
+    "scale_replicas": frozenset({"ecs", "lambda"}),
+    "restart_pool": frozenset({"ecs", "lambda", "rds"}),
+}
+
+
+@dataclass(frozen=True)
+class AwsResource:
+    service: str  # "ecs", "lambda" or "rds"
+    region: str
+    name: str
+    cluster: str = ""  # ECS only
+
+    @classmethod
+    def from_arn(cls, arn: str) -> AwsResource:
+        """Parse an ECS service, Lambda function or RDS DB instance ARN; ValueError otherwise."""
+        parts = arn.split(":", 5)
+        if len(parts) != 6 or parts[0] != "arn":
+            raise ValueError(f"Not an ARN: {arn!r}")
+        service, region, resource = parts[2], parts[3], parts[5]
+        if service == "ecs" and resource.startswith("service/"):
+            path = resource.split("/")
+            cluster, name = (path[1], path[2]) if len(path) == 3 else ("default", path[1])
+            return cls("ecs", region, name, cluster)
+        if service == "lambda" and resource.startswith("function:"):
+            return cls("lambda", region, resource.split(":")[1])
+        if service == "rds" and resource.startswith("db:"):
+            return cls("rds", region, resource.split(":", 1)[1])
+        raise ValueError(f"Unsupported resource for remediation: {arn!r}")
+
+    def __str__(self) -> str:
+        where = f"{self.cluster}/" if self.cluster else ""
+        return f"{self.service}:{self.region}:{where}{self.name}"
+
+
+class AwsResourceActions:
+    """Runs one action across resources in parallel and waits for each to stabilize."""
+
+    def __init__(
+        self,
+        clients: ClientCache,
+        retry_policy: RetryPolicy | None = None,
+        lambda_alias_name: str = "live",
+        allow_db_reboot: bool = False,
+        max_parallel: int = 8,
+        wait_timeout_seconds: float = 240.0,
+        poll_seconds: float = 10.0,
+        sleep: Callable[[float], None] = time.sleep,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._clients = clients
+        self._retry = retry_policy or RetryPolicy()
+        self._lambda_alias_name = lambda_alias_name
+        self._allow_db_reboot = allow_db_reboot
+        self._max_parallel = max_parallel
+        self._wait_timeout_seconds = wait_timeout_seconds
+        self._poll_seconds = poll_seconds
+        self._sleep = sleep
+        self._clock = clock
+
+    def run(
+        self, action_type: str, resources: list[AwsResource], parameters: dict[str, Any]
+    ) -> bool:
+        """Apply action_type to every resource that supports it; True if all succeeded."""
+        supported = SUPPORTED.get(action_type, frozenset())
+        if action_type == "restart_pool" and not self._allow_db_reboot:
+            if any(r.service == "rds" for r in resources):
+                logger.warning(
+                    "restart_pool would reboot RDS instances; set AWS_ALLOW_DB_REBOOT=true to allow"
+                )
+            supported -= {"rds"}
+        targets = [r for r in resources if r.service in supported]
+        skipped = [str(r) for r in resources if r.service not in supported]
+        if skipped:
+            logger.info("%s does not apply to %s", action_type, skipped)
+        if not targets:
+            logger.warning("No resource to %s (resources: %s)", action_type, skipped)
+            return False
+        workers = max(1, min(self._max_parallel, len(targets)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="autosre-aws") as pool:
+            results = list(pool.map(lambda r: self._run_one(action_type, r, parameters), targets))
+        return all(results)
+
+    def _run_one(self, action_type: str, resource: AwsResource, parameters: dict[str, Any]) -> bool:
+        handler = getattr(self, f"_{action_type}_{resource.service}")
+        start = self._clock()
+        try:
+            ok = handler(resource, parameters)
+        except Exception as e:
+            logger.warning("%s on %s failed: %s", action_type, resource, e, exc_info=True)
+            return False
+        logger.info(
+            "%s on %s %s in %.1fs",
+            action_type,
+            resource,
+            "succeeded" if ok else "failed",
+            self._clock() - start,
+            extra={"action_type": action_type, "resource": str(resource)},
+        )
+        return ok
+
+    def _wait(self, resource: AwsResource, check: Callable[[], WaitState]) -> bool:
+        """Poll check until "ok" (True), "failed" or the wait timeout (False)."""
+        deadline = self._clock() + self._wait_timeout_seconds
+        while True:
+            state = check()
+            if state != "pending":
+                return state == "ok"
+            if self._clock() >= deadline:
+                logger.warning("%s not stable after %ss", resource, self._wait_timeout_seconds)
+                return False
+            self._sleep(self._poll_seconds)
+
+    # ECS
+
+    def _update_ecs(self, resource: AwsResource, **changes: Any) -> bool:
+        client = self._clients.get("ecs", resource.region)
+        self._retry.call(
+            client.update_service, cluster=resource.cluster, service=resource.name, **changes
+        )
+
+        def check() -> WaitState:
+            response = self._retry.call(
+                client.describe_services, cluster=resource.cluster, services=[resource.name]
+            )
+            service = (response.get("services") or [{}])[0]
+            deployments = service.get("deployments") or []
+            if any(d.get("rolloutState") == "FAILED" for d in deployments):
+                return "failed"
+            steady = len(deployments) == 1 and service.get("runningCount") == service.get(
+                "desiredCount"
+            )
+            return "ok" if steady else "pending"
+
+        return self._wait(resource, check)
+
+    def _restart_instance_ecs(self, resource: AwsResource, parameters: dict[str, Any]) -> bool:
+        return self._update_ecs(resource, forceNewDeployment=True)
+
+    def _scale_replicas_ecs(self, resource: AwsResource, parameters: dict[str, Any]) -> bool:
+        return self._update_ecs(resource, desiredCount=int(parameters["replicas"]))
+
+    _restart_pool_ecs = _restart_instance_ecs
+
+    # Lambda
+
+    def _alias_version(self, client: Any, resource: AwsResource) -> str | None:
+        """Version the alias points at; None if the function has no such alias."""
+        try:
+            alias = self._retry.call(
+                client.get_alias, FunctionName=resource.name, Name=self._lambda_alias_name
+            )
+        except client.exceptions.ResourceNotFoundException:
+            return None
+        return alias.get("FunctionVersion")
+
+    def _restart_instance_lambda(self, resource: AwsResource, parameters: dict[str, Any]) -> bool:
+        """
+        New execution environments for the version the alias serves.
+
+        A configuration change makes Lambda replace environments, but only $LATEST can
+        be changed. So the bump goes to $LATEST, which is then published and the alias
+        moved to the new version. That keeps the alias's code only when its version has
+        $LATEST's code; otherwise (e.g. after a rollback) the restart is refused rather
+        than deploying $LATEST.
+        """
+        client = self._clients.get("lambda", resource.region)
+        config = self._retry.call(client.get_function_configuration, FunctionName=resource.name)
+        served = self._alias_version(client, resource)
+        publish = served not in (None, "$LATEST")
+        if publish:
+            served_config = self._retry.call(
+                client.get_function_configuration, FunctionName=resource.name, Qualifier=served
+            )
+            if served_config.get("CodeSha256") != config.get("CodeSha256"):
+                logger.warning(
+                    "%s alias %s serves version %s, whose code differs from $LATEST; "
+                    "not restarting (it would deploy $LATEST)",
+                    resource,
+                    self._lambda_alias_name,
+                    served,
+                )
+                return False
+        variables = dict((config.get("Environment") or {}).get("Variables") or {})
+        variables["AUTOSRE_RESTARTED_AT"] = str(int(time.time()))
+        self._retry.call(
+            client.update_function_configuration,
+            FunctionName=resource.name,
+            Environment={"Variables": variables},
+        )
+
+        def updated() -> WaitState:
+            status = self._retry.call(
+                client.get_function_configuration, FunctionName=resource.name
+            ).get("LastUpdateStatus")
+            return {"Successful": "ok", "Failed": "failed"}.get(status, "pending")
+
+        if not self._wait(resource, updated):
+            return False
+        if not publish:
+            return True  # callers of $LATEST get the new environments directly
+        version = self._retry.call(
+            client.publish_version,
+            FunctionName=resource.name,
+            CodeSha256=config.get("CodeSha256"),
+            Description=f"{RESTART_DESCRIPTION_PREFIX}{served}",
+        )["Version"]
+
+        def active() -> WaitState:
+            state = self._retry.call(
+                client.get_function_configuration, FunctionName=resource.name, Qualifier=version
+            ).get("State")
+            return {"Active": "ok", "Failed": "failed"}.get(state, "pending")
+
+        if not self._wait(resource, active):
+            return False
+        self._retry.call(
+            client.update_alias,
+            FunctionName=resource.name,
+            Name=self._lambda_alias_name,
+            FunctionVersion=version,
+        )
+        logger.info(
+            "%s alias %s moved from version %s to restarted version %s",
+            resource,
+            self._lambda_alias_name,
+            served,
+            version,
+        )
+        return True
+
+    def _scale_replicas_lambda(self, resource: AwsResource, parameters: dict[str, Any]) -> bool:
+        """One provisioned (pre-initialized) execution environment per replica, on the alias."""
+        client = self._clients.get("lambda", resource.region)
+        self._retry.call(
+            client.put_provisioned_concurrency_config,
+            FunctionName=resource.name,
+            Qualifier=self._lambda_alias_name,
+            ProvisionedConcurrentExecutions=int(parameters["replicas"]),
+        )
+
+        def check() -> WaitState:
+            status = self._retry.call(
+                client.get_provisioned_concurrency_config,
+                FunctionName=resource.name,
+                Qualifier=self._lambda_alias_name,
+            ).get("Status")
+            return {"READY": "ok", "FAILED": "failed"}.get(status, "pending")
+
+        return self._wait(resource, check)
+
+    _restart_pool_lambda = _restart_instance_lambda
+
+    # RDS
+
+    def _restart_instance_rds(self, resource: AwsResource, parameters: dict[str, Any]) -> bool:
+        client = self._clients.get("rds", resource.region)
+        self._retry.call(client.reboot_db_instance, DBInstanceIdentifier=resource.name)
+
+        def check() -> WaitState:
+            response = self._retry.call(
+                client.describe_db_instances, DBInstanceIdentifier=resource.name
+            )
+            status = (response.get("DBInstances") or [{}])[0].get("DBInstanceStatus")
+            return "ok" if status == "available" else "pending"
+
+        # The instance reports "available" until the reboot is picked up
+        self._sleep(self._poll_seconds)
+        return self._wait(resource, check)
+
+    _restart_pool_rds = _restart_instance_rds
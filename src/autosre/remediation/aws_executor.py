@@ -1,46 +1,127 @@
-"""AWS action executor: Lambda rollback (and optionally other actions) via boto3."""
+"""AWS action executor: Lambda rollback, restart, scale and pool reset via boto3."""
 
 from __future__ import annotations
 
 import logging
+import threading
 
+from autosre.aws_clients import ClientCache
 from autosre.config import get_settings
 from autosre.models import PlannedAction
+from autosre.remediation.alias_shift import GradualAliasShift
+from autosre.remediation.aws_actions import SUPPORTED, AwsResource, AwsResourceActions
+from autosre.remediation.dag import DagExecutor, DagResult
+from autosre.remediation.journal import ActionJournal
+from autosre.remediation.lambda_versions import LambdaVersionIndex, get_lambda_version_index
+from autosre.retry import RetryPolicy
 
 logger = logging.getLogger(__name__)
 
 
 class AWSExecutor:
     """
-    Executes planned actions via boto3 (Lambda version/alias).
+    Executes planned actions via boto3.
 
     Implements the same contract as UIActionAgent.execute(actions, service_name) -> bool.
-    For ROLLBACK (click_rollback): Lambda publish_version + update_alias to previous version.
-    Other action types are no-op in this minimal slice (can be extended later).
+    For ROLLBACK (click_rollback): update the Lambda alias to the previous version.
+    restart_instance, scale_replicas and restart_pool fan out over the service's
+    resources (see aws_actions); navigate steps need no API call.
+    Steps run through a DagExecutor, so independent steps of a plan run in parallel.
+    With a journal, steps already applied for the incident are not run again.
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        dag: DagExecutor | None = None,
+        versions: LambdaVersionIndex | None = None,
+        journal: ActionJournal | None = None,
+    ) -> None:
         self._settings = get_settings()
+        self._retry = RetryPolicy.from_settings(self._settings)
+        self._versions = versions or get_lambda_version_index(self._settings)
+        self._journal = journal
+        self._clients = ClientCache(sdk_retries=False)
+        self._actions = AwsResourceActions(
+            self._clients,
+            retry_policy=self._retry,
+            lambda_alias_name=(self._settings.lambda_alias_name or "live").strip(),
+            allow_db_reboot=self._settings.aws_allow_db_reboot,
+            max_parallel=self._settings.remediation_max_parallel,
+            wait_timeout_seconds=self._settings.aws_wait_timeout_seconds,
+            poll_seconds=self._settings.aws_wait_poll_seconds,
+        )
+        self._dag = dag or DagExecutor(
+            max_parallel=self._settings.remediation_max_parallel,
+            step_timeout_seconds=self._settings.remediation_step_timeout_seconds,
+        )
+
+    def function_name(self, service_name: str | None) -> str:
+        """Lambda function acted on for service_name ("" when unknown)."""
+        return (self._settings.lambda_function_name or (service_name or "")).strip()
+
+    def prefetch(self, service_name: str | None) -> threading.Thread | None:
+        """Warm the rollback version index while the incident is being analyzed."""
+        function_name = self.function_name(service_name)
+        return self._versions.prefetch(function_name) if function_name else None
 
     def execute(
         self,
         actions: list[PlannedAction],
         service_name: str | None = None,
+        incident_id: str | None = None,
     ) -> bool:
         """Execute the list of planned actions via AWS APIs. Returns True if all succeeded."""
-        if not actions:
-            return True
+        return self.execute_dag(actions, service_name, incident_id=incident_id).ok
 
-        has_rollback = any(
-            a.action_type == "click_rollback" for a in actions
+    def execute_dag(
+        self,
+        actions: list[PlannedAction],
+        service_name: str | None = None,
+        incident_id: str | None = None,
+    ) -> DagResult:
+        """Execute the plan's steps and return the outcome of each one."""
+
+        def run_step(action: PlannedAction) -> bool:
+            if self._journal is None:
+                return self._run_step(action, service_name)
+            return self._journal.run(
+                incident_id, action, service_name, lambda: self._run_step(action, service_name)
+            )
+
+        result = self._dag.run(actions, run_step)
+        if not result.ok:
+            logger.warning("Remediation plan partially failed: %s", result.summary())
+        return result
+
+    def resources(self, action: PlannedAction, service_name: str | None) -> list[AwsResource]:
+        """
+        Resources a step acts on: the step's "resources" parameter (ARNs), else the
+        service's entry in aws_remediation_resources, else the configured Lambda function.
+        """
+        arns = action.parameters.get("resources") or self._settings.aws_remediation_resources.get(
+            (service_name or "").strip(), []
         )
-        if not has_rollback:
-            logger.info("No rollback action in plan; other AWS actions not yet implemented")
+        if arns:
+            return [AwsResource.from_arn(arn) for arn in arns]
+        function_name = self.function_name(service_name)
+        if not function_name:
+            return []
+        return [AwsResource("lambda", self._settings.aws_region, function_name)]
+
+    def _run_step(self, action: PlannedAction, service_name: str | None) -> bool:
+        if action.action_type == "navigate":
+            return True
+        if action.action_type in SUPPORTED:
+            resources = self.resources(action, service_name)
+            if not resources:
+                logger.warning("No AWS resources configured for %s", service_name)
+                return False
+            return self._actions.run(action.action_type, resources, action.parameters)
+        if action.action_type != "click_rollback":
+            logger.info("AWS action %s not yet implemented; skipping", action.action_type)
             return True
 
-        function_name = (
-            self._settings.lambda_function_name or (service_name or "").strip()
-        ).strip()
+        function_name = self.function_name(service_name)
         if not function_name:
             logger.warning("Lambda function name not configured; skipping rollback")
             return False
@@ -52,16 +133,17 @@ class AWSExecutor:
         """
         Point the Lambda alias to the previous version (rollback).
 
-        Gets current alias version, lists versions, updates alias to the previous version.
+        Gets current alias version, looks up the version before it in the version index,
+        and updates the alias to it: directly, or (lambda_rollback_mode "gradual")
+        pre-warmed and shifted in weighted steps.
         """
         try:
-            import boto3
-
-            client = boto3.client("lambda", region_name=self._settings.aws_region)
+            client = self._clients.get("lambda", self._settings.aws_region)
+            retry = self._retry.call
 
             # Resolve alias to current version
             try:
-                alias = client.get_alias(FunctionName=function_name, Name=alias_name)
+                alias = retry(client.get_alias, FunctionName=function_name, Name=alias_name)
             except client.exceptions.ResourceNotFoundException:
                 logger.warning("Alias %s not found for %s", alias_name, function_name)
                 return False
@@ -69,45 +151,35 @@ class AWSExecutor:
             if not current_version:
                 logger.warning("Alias has no FunctionVersion")
                 return False
-            if current_version == "$LATEST":
-                # Alias points to $LATEST; we could publish current and then point to previous published
-                # For simplicity: list versions and point to latest published (other than $LATEST)
-                versions = client.list_versions_by_function(FunctionName=function_name)
-                published = [
-                    v for v in (versions.get("Versions") or [])
-                    if v.get("Version") != "$LATEST"
-                ]
-                published.sort(key=lambda v: int(v.get("Version", "0")), reverse=True)
-                if len(published) < 2:
-                    logger.warning("No previous published version to roll back to")
+            # For $LATEST: the newest published version is assumed to match it, so the
+            # target is the one before that
+            previous_version = self._versions.previous_version(function_name, current_version)
+            if not previous_version:
+                logger.warning(
+                    "No previous version of %s before %s to roll back to",
+                    function_name,
+                    current_version,
+                )
+                return False
+
+            if self._settings.lambda_rollback_mode == "gradual":
+                shift = GradualAliasShift(
+                    client,
+                    cloudwatch=self._clients.get("cloudwatch", self._settings.aws_region),
+                    retry_policy=self._retry,
+                    weights=self._settings.lambda_rollback_weights,
+                    step_seconds=self._settings.lambda_rollback_step_seconds,
+                    warm_invocations=self._settings.lambda_rollback_warm_invocations,
+                )
+                if not shift.run(function_name, alias_name, current_version, previous_version):
                     return False
-                previous_version = published[1].get("Version")
             else:
-                try:
-                    current_num = int(current_version)
-                except (ValueError, TypeError):
-                    logger.warning("Cannot parse version %s", current_version)
-                    return False
-                versions = client.list_versions_by_function(FunctionName=function_name)
-                all_versions = [
-                    v for v in (versions.get("Versions") or [])
-                    if v.get("Version") != "$LATEST"
-                ]
-                all_versions.sort(key=lambda v: int(v.get("Version", "0")), reverse=True)
-                previous_version = None
-                for v in all_versions:
-                    if int(v.get("Version", 0)) < current_num:
-                        previous_version = v.get("Version")
-                        break
-                if not previous_version:
-                    logger.warning("No previous version to roll back to")
-                    return False
-
-            client.update_alias(
-                FunctionName=function_name,
-                Name=alias_name,
-                FunctionVersion=previous_version,
-            )
+                retry(
+                    client.update_alias,
+                    FunctionName=function_name,
+                    Name=alias_name,
+                    FunctionVersion=previous_version,
+                )
             logger.info(
                 "Lambda rollback: %s alias %s -> version %s",
                 function_name,
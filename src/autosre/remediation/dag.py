@@ -0,0 +1,189 @@
+"""
+Parallel DAG execution of planned actions.
+
+Steps whose dependencies have succeeded run concurrently (up to max_parallel),
+each with a timeout. When a step fails or times out, the steps that depend on it
+are skipped, but independent branches keep going. The DagResult records every
+step's outcome so a partial failure can be reported precisely.
+
+A plan without any depends_on keeps the old sequential semantics: each step
+depends on the one before it.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Literal
+
+from pydantic import BaseModel, Field
+
+from autosre.models import PlannedAction
+
+logger = logging.getLogger(__name__)
+
+StepRunner = Callable[[PlannedAction], bool]
+StepStatus = Literal["succeeded", "failed", "timed_out", "skipped"]
+
+
+class StepResult(BaseModel):
+    step_id: str
+    action_type: str
+    target: str
+    status: StepStatus
+    error: str = ""
+    duration_seconds: float = 0.0
+
+
+class DagResult(BaseModel):
+    """Outcome of every step of a plan, in plan order."""
+
+    steps: list[StepResult] = Field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return all(step.status == "succeeded" for step in self.steps)
+
+    def summary(self) -> str:
+        """One line per step that did not succeed (empty when all succeeded)."""
+        return "; ".join(
+            f"{s.step_id} ({s.action_type} on {s.target}) {s.status}"
+            + (f": {s.error}" if s.error else "")
+            for s in self.steps
+            if s.status != "succeeded"
+        )
+
+
+def step_ids(actions: list[PlannedAction]) -> list[str]:
+    return [action.step_id or f"step{i}" for i, action in enumerate(actions)]
+
+
+def build_dag(actions: list[PlannedAction]) -> dict[str, list[str]]:
+    """step_id -> dependencies; raises ValueError on duplicate ids, unknown deps or cycles."""
+    ids = step_ids(actions)
+    if len(set(ids)) != len(ids):
+        raise ValueError(f"Duplicate step ids in plan: {ids}")
+    if not any(action.depends_on for action in actions):
+        return {step: ids[i - 1 : i] for i, step in enumerate(ids)}
+    deps = {step: list(action.depends_on) for step, action in zip(ids, actions)}
+    for step, needs in deps.items():
+        unknown = [d for d in needs if d not in deps]
+        if unknown:
+            raise ValueError(f"Step {step} depends on unknown step(s) {unknown}")
+    # Kahn's algorithm: every step must become ready eventually
+    remaining = {step: set(needs) for step, needs in deps.items()}
+    while remaining:
+        ready = [step for step, needs in remaining.items() if not needs]
+        if not ready:
+            raise ValueError(f"Dependency cycle among steps {sorted(remaining)}")
+        for step in ready:
+            del remaining[step]
+        for needs in remaining.values():
+            needs.difference_update(ready)
+    return deps
+
+
+def topological_order(actions: list[PlannedAction]) -> list[PlannedAction]:
+    """Actions in an order that respects depends_on (stable for independent steps)."""
+    deps = build_dag(actions)
+    by_id = dict(zip(step_ids(actions), actions))
+    done: set[str] = set()
+    ordered: list[PlannedAction] = []
+    while len(ordered) < len(actions):
+        for step, action in by_id.items():
+            if step not in done and all(d in done for d in deps[step]):
+                done.add(step)
+                ordered.append(action)
+    return ordered
+
+
+class DagExecutor:
+    """Runs a plan's DAG with bounded parallelism and per-step timeouts."""
+
+    def __init__(self, max_parallel: int = 4, step_timeout_seconds: float | None = None) -> None:
+        self._max_parallel = max(1, max_parallel)
+        self._step_timeout_seconds = step_timeout_seconds or None
+
+    def run(self, actions: list[PlannedAction], run_step: StepRunner) -> DagResult:
+        """
+        Execute actions with run_step(action) -> bool (exceptions count as failure).
+
+        A timed-out step is reported as timed_out and its dependents are skipped; its
+        thread cannot be interrupted and finishes in the background.
+        """
+        if not actions:
+            return DagResult()
+        deps = build_dag(actions)
+        ids = step_ids(actions)
+        by_id = dict(zip(ids, actions))
+        results: dict[str, StepResult] = {}
+        running: dict[Future, tuple[str, float]] = {}  # future -> (step_id, started)
+
+        def finish(step: str, status: StepStatus, error: str = "", duration: float = 0.0):
+            action = by_id[step]
+            results[step] = StepResult(
+                step_id=step,
+                action_type=action.action_type,
+                target=action.target,
+                status=status,
+                error=error,
+                duration_seconds=duration,
+            )
+            if status != "succeeded":
+                logger.warning("Step %s (%s) %s %s", step, action.action_type, status, error)
+
+        def call(action: PlannedAction) -> bool:
+            return bool(run_step(action))
+
+        pool = ThreadPoolExecutor(max_workers=self._max_parallel, thread_name_prefix="autosre-dag")
+        try:
+            while len(results) < len(ids):
+                active = {step for step, _ in running.values()}
+                for step in ids:
+                    if step in results or step in active:
+                        continue
+                    needs = [results.get(d) for d in deps[step]]
+                    if any(r is not None and r.status != "succeeded" for r in needs):
+                        finish(step, "skipped", "dependency did not succeed")
+                    elif all(r is not None for r in needs) and len(running) < self._max_parallel:
+                        running[pool.submit(call, by_id[step])] = (step, time.monotonic())
+                        active.add(step)
+                if len(results) == len(ids):
+                    break
+                if not running:
+                    continue  # skips above may have unblocked more decisions
+                timeout = None
+                if self._step_timeout_seconds is not None:
+                    now = time.monotonic()
+                    timeout = max(
+                        0.0,
+                        min(
+                            started + self._step_timeout_seconds - now
+                            for _, started in running.values()
+                        ),
+                    )
+                done, _ = wait(list(running), timeout=timeout, return_when=FIRST_COMPLETED)
+                now = time.monotonic()
+                for future in done:
+                    step, started = running.pop(future)
+                    try:
+                        ok = future.result()
+                        error = "" if ok else "step reported failure"
+                    except Exception as e:  # noqa: BLE001
+                        ok, error = False, str(e)
+                    finish(step, "succeeded" if ok else "failed", error, now - started)
+                if self._step_timeout_seconds is not None:
+                    for future, (step, started) in list(running.items()):
+                        if now - started >= self._step_timeout_seconds:
+                            del running[future]
+                            finish(
+                                step,
+                                "timed_out",
+                                f"no result after {self._step_timeout_seconds:.0f}s",
+                                now - started,
+                            )
+        finally:
+            pool.shutdown(wait=False)
+        return DagResult(steps=[results[step] for step in ids])
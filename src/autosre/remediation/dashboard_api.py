@@ -0,0 +1,187 @@
+"""
+Dashboard API executor: run planned actions as direct HTTP calls to the dashboard.
+
+The operations dashboard exposes the same operations as its UI over a JSON API
+(e.g. POST /api/services/{id}/rollback). When every step of a plan maps to an API
+call, the plan runs over a pooled httpx client in milliseconds. Otherwise the
+whole plan goes to the fallback executor (the Nova Act UIActionAgent), because UI
+steps depend on the page state left by the steps before them.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from typing import TYPE_CHECKING, Any, Protocol
+
+from autosre.models import PlannedAction
+from autosre.planner.catalog import current_and_previous_version
+from autosre.remediation.dag import DagExecutor, DagResult
+from autosre.remediation.journal import ActionJournal
+from autosre.retry import RetryPolicy
+
+if TYPE_CHECKING:
+    import httpx
+
+logger = logging.getLogger(__name__)
+
+# Steps that only move the browser around; the API needs no equivalent
+_NAVIGATION_ONLY = frozenset({"navigate"})
+# action_type -> (method, path template); {service} is the dashboard service id
+API_ROUTES: dict[str, tuple[str, str]] = {
+    "click_rollback": ("POST", "/api/services/{service}/rollback"),
+}
+
+
+class ActionExecutor(Protocol):
+    def execute(
+        self,
+        actions: list[PlannedAction],
+        service_name: str | None = None,
+        incident_id: str | None = None,
+    ) -> bool: ...
+
+
+class DashboardAPIExecutor:
+    """
+    Executes planned actions via the dashboard's HTTP API, falling back to the UI.
+
+    Implements the same contract as UIActionAgent.execute(actions, service_name) -> bool.
+    With a journal, steps already applied for the incident are not run again.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        fallback: ActionExecutor | None = None,
+        timeout_seconds: float = 5.0,
+        retry_policy: RetryPolicy | None = None,
+        dag: DagExecutor | None = None,
+        client: httpx.Client | None = None,
+        journal: ActionJournal | None = None,
+    ) -> None:
+        self._base_url = base_url.rstrip("/")
+        self._fallback = fallback
+        self._timeout_seconds = timeout_seconds
+        self._retry = retry_policy or RetryPolicy()
+        self._dag = dag or DagExecutor()
+        self._client = client
+        self._journal = journal
+        self._client_lock = threading.Lock()
+        self.api_plans = 0
+        self.fallback_plans = 0
+
+    def _http(self) -> httpx.Client:
+        """Shared client, created on first use (keeps connections to the dashboard alive)."""
+        with self._client_lock:
+            if self._client is None:
+                import httpx
+
+                self._client = httpx.Client(base_url=self._base_url, timeout=self._timeout_seconds)
+            return self._client
+
+    def close(self) -> None:
+        with self._client_lock:
+            if self._client is not None:
+                self._client.close()
+                self._client = None
+
+    @staticmethod
+    def supports(actions: list[PlannedAction], service_name: str | None) -> bool:
+        """True if every step of the plan can run through the API."""
+        if not service_name:
+            return False
+        return all(
+            a.action_type in _NAVIGATION_ONLY or a.action_type in API_ROUTES for a in actions
+        )
+
+    def execute(
+        self,
+        actions: list[PlannedAction],
+        service_name: str | None = None,
+        incident_id: str | None = None,
+    ) -> bool:
+        """Execute the plan via the API when fully mapped, else via the fallback."""
+        if not actions:
+            return True
+        if not self.supports(actions, service_name):
+            if self._fallback is None:
+                logger.warning(
+                    "No dashboard API mapping for %s and no UI fallback",
+                    [a.action_type for a in actions],
+                )
+                return False
+            self.fallback_plans += 1
+            logger.info("Plan has steps without a dashboard API; using UI automation")
+            return self._fallback.execute(
+                actions, service_name=service_name, incident_id=incident_id
+            )
+        self.api_plans += 1
+        return self.execute_dag(actions, service_name, incident_id=incident_id).ok
+
+    def execute_dag(
+        self,
+        actions: list[PlannedAction],
+        service_name: str | None,
+        incident_id: str | None = None,
+    ) -> DagResult:
+        def run_step(action: PlannedAction) -> bool:
+            if self._journal is None:
+                return self._run_step(action, service_name or "")
+            return self._journal.run(
+                incident_id,
+                action,
+                service_name,
+                lambda: self._run_step(action, service_name or ""),
+            )
+
+        result = self._dag.run(actions, run_step)
+        if not result.ok:
+            logger.warning("Dashboard API plan partially failed: %s", result.summary())
+        return result
+
+    def _run_step(self, action: PlannedAction, service_name: str) -> bool:
+        if action.action_type in _NAVIGATION_ONLY:
+            return True
+        method, path = API_ROUTES[action.action_type]
+        service = service_name.strip().lower()
+        body = self._body(action, service)
+        if body is None:
+            return False
+        response = self._request(method, path.format(service=service), json=body)
+        logger.info(
+            "Dashboard API %s %s -> %s",
+            method,
+            path.format(service=service),
+            response.status_code,
+            extra={"service_name": service, "action_type": action.action_type},
+        )
+        return response.is_success
+
+    def _body(self, action: PlannedAction, service: str) -> dict[str, Any] | None:
+        if action.action_type != "click_rollback":
+            return dict(action.parameters)
+        to_version = str(action.parameters.get("to_version") or "previous")
+        if to_version == "previous":
+            # The planner had no deployment history; ask the dashboard for it
+            response = self._request("GET", f"/api/services/{service}/deployments")
+            if not response.is_success:
+                logger.warning("Cannot list deployments for %s: %s", service, response.status_code)
+                return None
+            _, previous = current_and_previous_version(response.json().get("deployments"))
+            if previous is None:
+                logger.warning("No previous version of %s to roll back to", service)
+                return None
+            to_version = previous
+        return {"to_version": to_version}
+
+    def _request(self, method: str, path: str, **kwargs: Any) -> httpx.Response:
+        client = self._http()
+
+        def send() -> httpx.Response:
+            response = client.request(method, path, **kwargs)
+            if response.status_code == 429 or response.status_code >= 500:
+                response.raise_for_status()  # classified as throttling/transient: retried
+            return response
+
+        return self._retry.call(send, description=f"dashboard {method} {path}")
@@ -0,0 +1,258 @@
+"""
+Journal of applied remediation steps, keyed by incident and action fingerprint.
+
+Executors consult the journal before running a state-changing step of an
+incident's plan. A step that already succeeded for that incident (an earlier
+attempt, a retry after a partial failure, a worker that restarted mid-plan) is
+answered from the journal instead of being applied again, so a rollback is never
+re-executed. Navigation steps change nothing and are not journaled.
+
+With a path, every outcome is appended as one JSON line and the file is replayed
+on start; the last line for a key wins, so a failed step that later succeeds is
+recorded as applied. Entries older than retention_seconds are ignored, and pruned
+from memory (at most once a minute, on record) so a long-running service does not
+accumulate them. A step's lock exists only while a run of that step is in flight.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from autosre.config import Settings, get_settings
+from autosre.models import PlannedAction
+from autosre.remediation.dag import step_ids
+
+logger = logging.getLogger(__name__)
+
+# Steps that only move the browser around; nothing to deduplicate
+_NOT_JOURNALED = frozenset({"navigate"})
+
+_PRUNE_INTERVAL_SECONDS = 60.0
+
+
+def action_fingerprint(action: PlannedAction, service_name: str | None) -> str:
+    """Stable key for "the same step": service, action type, target and parameters."""
+    payload = json.dumps(
+        [
+            (service_name or "").strip().lower(),
+            action.action_type,
+            action.target,
+            action.parameters,
+        ],
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+@dataclass(frozen=True)
+class JournalEntry:
+    incident_id: str
+    fingerprint: str
+    action_type: str
+    target: str
+    ok: bool
+    recorded_at: float  # epoch seconds
+
+
+class _KeyLock:
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.users = 0  # runs holding or waiting for the lock
+
+
+class ActionJournal:
+    """Thread-safe journal of step outcomes; steps of one key never run concurrently."""
+
+    def __init__(self, path: str | None = None, retention_seconds: float = 86400.0) -> None:
+        self._path = Path(path) if path else None
+        self._retention_seconds = retention_seconds
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._entries: dict[tuple[str, str], JournalEntry] = {}
+        self._key_locks: dict[tuple[str, str], _KeyLock] = {}
+        self._pruned_at = time.time()
+        self.hits = 0
+        self._load()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def journaled(action: PlannedAction) -> bool:
+        return action.action_type not in _NOT_JOURNALED
+
+    def get(self, incident_id: str, fingerprint: str) -> JournalEntry | None:
+        """Latest entry for the key, or None if absent or past retention."""
+        with self._lock:
+            entry = self._entries.get((incident_id, fingerprint))
+        if entry is None or entry.recorded_at + self._retention_seconds <= time.time():
+            return None
+        return entry
+
+    def applied(self, incident_id: str, action: PlannedAction, service_name: str | None) -> bool:
+        entry = self.get(incident_id, action_fingerprint(action, service_name))
+        return entry is not None and entry.ok
+
+    def record(
+        self, incident_id: str, action: PlannedAction, service_name: str | None, ok: bool
+    ) -> JournalEntry:
+        entry = JournalEntry(
+            incident_id=incident_id,
+            fingerprint=action_fingerprint(action, service_name),
+            action_type=action.action_type,
+            target=action.target,
+            ok=ok,
+            recorded_at=time.time(),
+        )
+        with self._lock:
+            self._entries[(incident_id, entry.fingerprint)] = entry
+            if entry.recorded_at - self._pruned_at >= _PRUNE_INTERVAL_SECONDS:
+                self._prune(entry.recorded_at)
+        self._append(entry)
+        return entry
+
+    def _prune(self, now: float) -> None:
+        """Drop entries past retention (caller holds self._lock)."""
+        cutoff = now - self._retention_seconds
+        expired = [key for key, entry in self._entries.items() if entry.recorded_at <= cutoff]
+        for key in expired:
+            del self._entries[key]
+        self._pruned_at = now
+
+    def run(
+        self,
+        incident_id: str | None,
+        action: PlannedAction,
+        service_name: str | None,
+        execute: Callable[[], bool],
+    ) -> bool:
+        """
+        Run execute() for the step unless it already succeeded for incident_id.
+
+        Without an incident_id, or for a navigation step, execute() just runs.
+        """
+        if not incident_id or not self.journaled(action):
+            return execute()
+        key = (incident_id, action_fingerprint(action, service_name))
+        with self._lock:
+            key_lock = self._key_locks.get(key)
+            if key_lock is None:
+                key_lock = self._key_locks[key] = _KeyLock()
+            key_lock.users += 1
+        try:
+            with key_lock.lock:
+                if self.applied(incident_id, action, service_name):
+                    with self._lock:
+                        self.hits += 1
+                    logger.info(
+                        "Skipping %s on %s for %s: already applied",
+                        action.action_type,
+                        action.target,
+                        incident_id,
+                        extra={"incident_id": incident_id, "action_type": action.action_type},
+                    )
+                    return True
+                ok = False
+                try:
+                    ok = execute()
+                finally:
+                    self.record(incident_id, action, service_name, ok)
+                return ok
+        finally:
+            with self._lock:
+                key_lock.users -= 1
+                if not key_lock.users:
+                    del self._key_locks[key]
+
+    def pending(
+        self, incident_id: str | None, actions: list[PlannedAction], service_name: str | None
+    ) -> list[PlannedAction]:
+        """
+        The plan without its already-applied steps (for executors that run a plan as one batch).
+
+        Dependencies on dropped steps are removed; step ids are made explicit so the
+        remaining depends_on still resolve.
+        """
+        if not incident_id:
+            return list(actions)
+        dropped = {
+            step
+            for step, action in zip(step_ids(actions), actions)
+            if self.journaled(action) and self.applied(incident_id, action, service_name)
+        }
+        if not dropped:
+            return list(actions)
+        with self._lock:
+            self.hits += len(dropped)
+        logger.info("Skipping %s already applied step(s) for %s", len(dropped), incident_id)
+        explicit = any(action.depends_on for action in actions)
+        return [
+            action.model_copy(
+                update={
+                    "step_id": step,
+                    "depends_on": [d for d in action.depends_on if d not in dropped],
+                }
+            )
+            if explicit
+            else action
+            for step, action in zip(step_ids(actions), actions)
+            if step not in dropped
+        ]
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {"hits": self.hits, "entries": len(self._entries)}
+
+    def _append(self, entry: JournalEntry) -> None:
+        if self._path is None:
+            return
+        line = json.dumps(asdict(entry)) + "\n"
+        try:
+            with self._write_lock:
+                self._path.parent.mkdir(parents=True, exist_ok=True)
+                with self._path.open("a", encoding="utf-8") as f:
+                    f.write(line)
+        except OSError as e:
+            logger.warning("Could not append to remediation journal %s: %s", self._path, e)
+
+    def _load(self) -> None:
+        if self._path is None or not self._path.exists():
+            return
+        try:
+            lines = self._path.read_text(encoding="utf-8").splitlines()
+        except OSError as e:
+            logger.warning("Ignoring unreadable remediation journal %s: %s", self._path, e)
+            return
+        cutoff = time.time() - self._retention_seconds
+        for line in lines:
+            try:
+                entry = JournalEntry(**json.loads(line))
+            except (TypeError, ValueError):
+                continue  # e.g. a line torn by a crash mid-write
+            if entry.recorded_at > cutoff:
+                self._entries[(entry.incident_id, entry.fingerprint)] = entry
+
+
+_shared_journal: ActionJournal | None = None
+_shared_lock = threading.Lock()
+
+
+def get_action_journal(settings: Settings | None = None) -> ActionJournal:
+    """Process-wide journal (shared by every executor in build_components)."""
+    global _shared_journal
+    with _shared_lock:
+        if _shared_journal is None:
+            settings = settings or get_settings()
+            _shared_journal = ActionJournal(
+                path=settings.remediation_journal_path or None,
+                retention_seconds=settings.remediation_journal_retention_seconds,
+            )
+        return _shared_journal
@@ -0,0 +1,207 @@
+"""
+Per-function index of published Lambda versions (rollback target resolution).
+
+ListVersionsByFunction returns at most 50 versions per page, in ascending order.
+The index pages through all of them once, keeps each version's predecessor in a
+dict, and afterwards refreshes incrementally: it re-reads from the marker of the
+last page, which picks up versions published since. Resolving "the version
+before the alias's current one" is then a dict lookup. Incidents prefetch their
+function's index in the background, so it is usually warm when the rollback runs.
+
+A Lambda restart publishes $LATEST again as a new version with the code of the
+version it replaces (its description names that version). The index resolves such
+a version to the one it restarted, so a rollback never lands on the same code.
+"""
+
+from __future__ import annotations
+
+import bisect
+import logging
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from autosre.aws_clients import get_client
+from autosre.config import Settings, get_settings
+from autosre.retry import RetryPolicy
+
+logger = logging.getLogger(__name__)
+
+# Description of versions published by a Lambda restart, followed by the restarted version
+RESTART_DESCRIPTION_PREFIX = "autosre restart of version "
+
+
+@dataclass
+class _FunctionVersions:
+    versions: list[int] = field(default_factory=list)  # ascending
+    previous: dict[int, int | None] = field(default_factory=dict)
+    restart_of: dict[int, int] = field(default_factory=dict)  # restart version -> restarted
+    last_page_marker: str | None = None  # marker that fetched the last page
+    refreshed_at: float | None = None
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def extend(self, numbers: list[int]) -> None:
+        for number in sorted(set(numbers) - self.previous.keys()):
+            if self.versions and number < self.versions[-1]:
+                bisect.insort(self.versions, number)
+                i = self.versions.index(number)
+                self.previous[number] = self.versions[i - 1] if i else None
+                self.previous[self.versions[i + 1]] = number
+            else:
+                self.previous[number] = self.versions[-1] if self.versions else None
+                self.versions.append(number)
+
+
+class LambdaVersionIndex:
+    """Thread-safe, lazily built index of each function's published versions."""
+
+    def __init__(
+        self,
+        region_name: str | None = None,
+        ttl_seconds: float = 300.0,
+        retry_policy: RetryPolicy | None = None,
+        client_factory: Callable[[], Any] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._region_name = region_name
+        self._ttl_seconds = ttl_seconds
+        self._retry = retry_policy or RetryPolicy()
+        self._client_factory = client_factory or (
+            lambda: get_client("lambda", region_name=self._region_name, sdk_retries=False)
+        )
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._functions: dict[str, _FunctionVersions] = {}
+
+    def _entry(self, function_name: str) -> _FunctionVersions:
+        with self._lock:
+            entry = self._functions.get(function_name)
+            if entry is None:
+                entry = self._functions[function_name] = _FunctionVersions()
+            return entry
+
+    def _list_from(
+        self, client: Any, function_name: str, marker: str | None
+    ) -> tuple[list[int], dict[int, int], str | None]:
+        """
+        All version numbers from marker on, the restart versions among them (mapped to
+        the version each restarted), and the marker of the last page read.
+        """
+        numbers: list[int] = []
+        restart_of: dict[int, int] = {}
+        page_marker = marker
+        while True:
+            kwargs: dict[str, Any] = {"FunctionName": function_name, "MaxItems": 50}
+            if page_marker:
+                kwargs["Marker"] = page_marker
+            page = self._retry.call(client.list_versions_by_function, **kwargs)
+            for version in page.get("Versions") or []:
+                number = str(version.get("Version", ""))
+                if number.isdigit():  # skips $LATEST
+                    numbers.append(int(number))
+                    description = str(version.get("Description") or "")
+                    restarted = description[len(RESTART_DESCRIPTION_PREFIX) :]
+                    if description.startswith(RESTART_DESCRIPTION_PREFIX) and restarted.isdigit():
+                        restart_of[int(number)] = int(restarted)
+            next_marker = page.get("NextMarker")
+            if not next_marker:
+                return numbers, restart_of, page_marker
+            page_marker = next_marker
+
+    def refresh(self, function_name: str, full: bool = False) -> None:
+        """Fetch versions published since the last refresh (or all of them)."""
+        entry = self._entry(function_name)
+        with entry.lock:
+            client = self._client_factory()
+            marker = None if full else entry.last_page_marker
+            try:
+                numbers, restart_of, last_marker = self._list_from(client, function_name, marker)
+            except Exception:
+                if marker is None:
+                    raise
+                # The stored marker may no longer be accepted; start over
+                numbers, restart_of, last_marker = self._list_from(client, function_name, None)
+            if full:
+                entry.versions, entry.previous, entry.restart_of = [], {}, {}
+            entry.extend(numbers)
+            entry.restart_of.update(restart_of)
+            entry.last_page_marker = last_marker
+            entry.refreshed_at = self._clock()
+            logger.debug(
+                "Lambda version index for %s: %s versions", function_name, len(entry.versions)
+            )
+
+    def _fresh(self, function_name: str) -> _FunctionVersions:
+        entry = self._entry(function_name)
+        if entry.refreshed_at is None or self._clock() - entry.refreshed_at >= self._ttl_seconds:
+            self.refresh(function_name)
+        return entry
+
+    def prefetch(self, function_name: str) -> threading.Thread:
+        """Warm the index for function_name in the background (errors are only logged)."""
+
+        def run() -> None:
+            try:
+                self._fresh(function_name)
+            except Exception as e:  # noqa: BLE001
+                logger.warning("Lambda version prefetch failed for %s: %s", function_name, e)
+
+        thread = threading.Thread(target=run, name="autosre-lambda-versions", daemon=True)
+        thread.start()
+        return thread
+
+    def versions(self, function_name: str) -> list[int]:
+        entry = self._fresh(function_name)
+        with entry.lock:
+            return list(entry.versions)
+
+    def previous_version(self, function_name: str, current: str) -> str | None:
+        """
+        The published version to roll back to from current, or None.
+
+        For "$LATEST" this is the version before the newest published one (the newest
+        is assumed to match $LATEST's code). A restart version counts as the version it
+        restarted.
+        """
+        entry = self._fresh(function_name)
+        if current == "$LATEST":
+            with entry.lock:
+                if not entry.versions:
+                    return None
+                current = str(entry.versions[-1])
+        try:
+            number = int(current)
+        except (TypeError, ValueError):
+            return None
+        if number not in entry.previous:
+            # Published since the last refresh
+            self.refresh(function_name)
+        with entry.lock:
+            while number in entry.restart_of:
+                number = entry.restart_of[number]
+            if number in entry.previous:
+                previous = entry.previous[number]
+            else:
+                i = bisect.bisect_left(entry.versions, number)
+                previous = entry.versions[i - 1] if i else None
+        return str(previous) if previous is not None else None
+
+
+_shared_index: LambdaVersionIndex | None = None
+_shared_lock = threading.Lock()
+
+
+def get_lambda_version_index(settings: Settings | None = None) -> LambdaVersionIndex:
+    """Process-wide index (shared by the daemon's workers)."""
+    global _shared_index
+    with _shared_lock:
+        if _shared_index is None:
+            settings = settings or get_settings()
+            _shared_index = LambdaVersionIndex(
+                region_name=settings.aws_region,
+                ttl_seconds=settings.lambda_version_index_ttl_seconds,
+                retry_policy=RetryPolicy.from_settings(settings),
+            )
+        return _shared_index
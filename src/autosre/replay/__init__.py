@@ -0,0 +1,29 @@
+"""
+Offline incident replay.
+
+Re-runs recorded incidents through the full workflow against stubbed AWS, Bedrock
+and Slack and reports per-stage latency and throughput.
+"""
+
+from typing import TYPE_CHECKING
+
+from autosre._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from autosre.replay.harness import (
+        ReplayReport,
+        build_replay_components,
+        load_incidents,
+        replay_incidents,
+    )
+
+_EXPORTS = {
+    "ReplayReport": "autosre.replay.harness",
+    "build_replay_components": "autosre.replay.harness",
+    "load_incidents": "autosre.replay.harness",
+    "replay_incidents": "autosre.replay.harness",
+}
+
+__all__ = ["ReplayReport", "build_replay_components", "load_incidents", "replay_incidents"]
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
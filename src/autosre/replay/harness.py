@@ -0,0 +1,267 @@
+"""Replay recorded incidents through the workflow and measure per-stage latency."""
+
+from __future__ import annotations
+
+import json
+import logging
+import time
+from pathlib import Path
+
+from pydantic import BaseModel, Field
+
+from autosre.cassette import PLAYBACK, active_cassette, use_cassette
+from autosre.config import Settings, get_settings
+from autosre.log_storage import LogStore
+from autosre.log_storage.store import incident_from_payload
+from autosre.models import IncidentEvent, PostMortemReport, RecoveryStatus
+from autosre.planner import PlannerAgent
+from autosre.reasoning_agent import ReasoningAgent
+from autosre.recovery_verification import RecoveryMonitor
+from autosre.recovery_verification.monitor import STUB_RECOVERY_SECONDS
+from autosre.slack_reporter import SlackReporter
+from autosre.slack_reporter.reporter import build_post_mortem_blocks, build_post_mortem_text
+from autosre.ui_automation import UIActionAgent
+from autosre.workflow import WorkflowComponents, run_incident
+
+logger = logging.getLogger(__name__)
+
+STAGES = ("store", "analyze", "plan", "execute", "verify", "report")
+
+_INCIDENTS_FILE = "incidents.json"
+
+
+class StageStats(BaseModel):
+    """Latency summary for one pipeline stage across replayed incidents."""
+
+    count: int = 0
+    total_seconds: float = 0.0
+    mean_seconds: float = 0.0
+    p50_seconds: float = 0.0
+    p95_seconds: float = 0.0
+    max_seconds: float = 0.0
+
+
+class IncidentResult(BaseModel):
+    """Outcome and stage timings of one replayed incident."""
+
+    incident_id: str
+    recovered: bool
+    total_seconds: float
+    stage_seconds: dict[str, float] = Field(default_factory=dict)
+
+
+class ReplayReport(BaseModel):
+    """Per-stage latency and throughput of a replay run."""
+
+    incidents: int = 0
+    recovered: int = 0
+    wall_seconds: float = 0.0
+    throughput_per_second: float = 0.0
+    stages: dict[str, StageStats] = Field(default_factory=dict)
+    results: list[IncidentResult] = Field(default_factory=list)
+
+    def format_text(self) -> str:
+        """Human-readable summary table."""
+        lines = [
+            (
+                f"Replayed {self.incidents} incident(s), {self.recovered} recovered, "
+                f"in {self.wall_seconds:.3f}s ({self.throughput_per_second:.2f} incidents/s)"
+            ),
+            f"{'stage':<10}{'count':>7}{'mean ms':>12}{'p50 ms':>12}{'p95 ms':>12}{'max ms':>12}",
+        ]
+        for name, st in self.stages.items():
+            lines.append(
+                f"{name:<10}{st.count:>7}{st.mean_seconds * 1000:>12.3f}"
+                f"{st.p50_seconds * 1000:>12.3f}{st.p95_seconds * 1000:>12.3f}"
+                f"{st.max_seconds * 1000:>12.3f}"
+            )
+        return "\n".join(lines)
+
+
+class _ReplayMonitor(RecoveryMonitor):
+    """Recovery monitor that reports the stub recovery time, waiting it out scaled by speedup."""
+
+    def __init__(self, speedup: float | None = None) -> None:
+        super().__init__(metrics_url="")
+        self._speedup = speedup
+
+    def verify(
+        self,
+        incident_id: str,
+        service_name: str,
+        timeout_seconds: float = 120,
+        action_start_time: float | None = None,
+    ) -> RecoveryStatus:
+        if self._speedup:
+            time.sleep(min(STUB_RECOVERY_SECONDS, timeout_seconds) / self._speedup)
+        self._last_recovery_seconds = STUB_RECOVERY_SECONDS
+        return RecoveryStatus.RECOVERED
+
+
+class _ReplaySlackReporter(SlackReporter):
+    """Builds the post-mortem text and blocks like the real reporter but never sends them."""
+
+    def publish(self, report: PostMortemReport) -> bool:
+        build_post_mortem_text(report)
+        build_post_mortem_blocks(report)
+        return True
+
+
+def _percentile(sorted_values: list[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, round(pct / 100 * len(sorted_values)) - 1))
+    return sorted_values[rank]
+
+
+def _stage_stats(values: list[float]) -> StageStats:
+    ordered = sorted(values)
+    total = sum(ordered)
+    return StageStats(
+        count=len(ordered),
+        total_seconds=total,
+        mean_seconds=total / len(ordered) if ordered else 0.0,
+        p50_seconds=_percentile(ordered, 50),
+        p95_seconds=_percentile(ordered, 95),
+        max_seconds=ordered[-1] if ordered else 0.0,
+    )
+
+
+def _store_dir_for(source: Path) -> Path | None:
+    """LogStore data dir for a source (the dir itself, or the dir holding incidents.json)."""
+    if source.is_dir():
+        return source
+    if source.name == _INCIDENTS_FILE:
+        return source.parent
+    return None
+
+
+def load_incidents(source: str | Path) -> list[IncidentEvent]:
+    """
+    Load recorded incidents ordered by detected_at.
+
+    source may be a LogStore data dir, its incidents.json, or a JSONL file with one
+    incident payload per line. Invalid entries are skipped.
+    """
+    path = Path(source)
+    store_dir = _store_dir_for(path)
+    if store_dir is not None:
+        incidents = LogStore(data_dir=str(store_dir), read_only=True).list_incidents()
+    else:
+        incidents = []
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    payload = json.loads(line)
+                except json.JSONDecodeError:
+                    logger.warning("Skip invalid JSONL line in %s", path)
+                    continue
+                incident = incident_from_payload(payload) if isinstance(payload, dict) else None
+                if incident is not None:
+                    incidents.append(incident)
+    return sorted(incidents, key=lambda i: i.detected_at.timestamp())
+
+
+def build_replay_components(
+    log_store: LogStore | None = None,
+    speedup: float | None = None,
+    use_bedrock: bool = False,
+) -> WorkflowComponents:
+    """
+    Stage components with stubbed UI automation, recovery polling and Slack.
+
+    Reasoning uses the stub unless use_bedrock is set (answered from a cassette).
+    """
+    return WorkflowComponents(
+        log_store=log_store or LogStore(),
+        reasoning=ReasoningAgent(use_bedrock=use_bedrock),
+        planner=PlannerAgent(),
+        monitor=_ReplayMonitor(speedup=speedup),
+        slack=_ReplaySlackReporter(),
+        ui_agent=UIActionAgent(use_nova_act=False),
+    )
+
+
+def replay_incidents(
+    source: str | Path,
+    speedup: float | None = None,
+    limit: int | None = None,
+    settings: Settings | None = None,
+    components: WorkflowComponents | None = None,
+    cassette: str | Path | None = None,
+    latency_scale: float = 1.0,
+) -> ReplayReport:
+    """
+    Replay recorded incidents through run_incident and report stage latency and throughput.
+
+    With speedup=None incidents run back to back with no simulated waiting. With a
+    positive speedup, recorded inter-arrival gaps and recovery waits are replayed
+    compressed by that factor (e.g. 60 replays an hour of incidents in a minute).
+    When cassette is given, reasoning calls Bedrock and AWS calls are answered from
+    that recording with its latency multiplied by latency_scale.
+    """
+    if cassette is not None:
+        with use_cassette(cassette, mode=PLAYBACK, latency_scale=latency_scale):
+            return replay_incidents(
+                source,
+                speedup=speedup,
+                limit=limit,
+                settings=settings,
+                components=components,
+            )
+    settings = settings or get_settings()
+    path = Path(source)
+    incidents = load_incidents(path)
+    if limit is not None:
+        incidents = incidents[:limit]
+    if components is None:
+        store_dir = _store_dir_for(path)
+        log_store = LogStore(data_dir=str(store_dir), read_only=True) if store_dir else None
+        components = build_replay_components(
+            log_store=log_store,
+            speedup=speedup,
+            use_bedrock=active_cassette() is not None,
+        )
+
+    results: list[IncidentResult] = []
+    run_start = time.perf_counter()
+    previous: IncidentEvent | None = None
+    previous_start = run_start
+    for incident in incidents:
+        if speedup and previous is not None:
+            try:
+                gap = (incident.detected_at - previous.detected_at).total_seconds() / speedup
+            except TypeError:  # naive vs aware timestamps
+                gap = 0.0
+            remaining = gap - (time.perf_counter() - previous_start)
+            if remaining > 0:
+                time.sleep(remaining)
+        previous, previous_start = incident, time.perf_counter()
+        timings: dict[str, float] = {}
+        recovered = run_incident(incident, components, settings=settings, stage_timings=timings)
+        results.append(
+            IncidentResult(
+                incident_id=incident.incident_id,
+                recovered=recovered,
+                total_seconds=time.perf_counter() - previous_start,
+                stage_seconds=timings,
+            )
+        )
+    wall = time.perf_counter() - run_start
+
+    stages = {
+        stage: _stage_stats([r.stage_seconds[stage] for r in results if stage in r.stage_seconds])
+        for stage in STAGES
+    }
+    return ReplayReport(
+        incidents=len(results),
+        recovered=sum(1 for r in results if r.recovered),
+        wall_seconds=wall,
+        throughput_per_second=len(results) / wall if wall > 0 else 0.0,
+        stages=stages,
+        results=results,
+    )
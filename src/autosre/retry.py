@@ -0,0 +1,234 @@
+"""
+Retry policy shared by the Bedrock, AWS and Slack call sites.
+
+Errors are classified before retrying: throttling and timeouts/transient server
+errors are retried with exponential backoff and full jitter (throttling backs off
+harder so a throttling storm is not amplified), validation/permission errors and
+unrecognized exceptions are raised immediately. A total-time cap bounds the whole
+call including sleeps, and a server-provided Retry-After is honoured.
+
+Clients wrapped by a RetryPolicy should disable their SDK's own retries
+(see BOTO_NO_RETRIES) so attempts do not multiply.
+"""
+
+from __future__ import annotations
+
+import logging
+import random
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from enum import Enum
+from typing import TYPE_CHECKING, Any, TypeVar
+
+if TYPE_CHECKING:
+    from autosre.config import Settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# botocore Config(retries=...) for clients whose calls go through a RetryPolicy
+BOTO_NO_RETRIES = {"mode": "standard", "max_attempts": 1}
+
+
+class ErrorKind(str, Enum):
+    """How a failed call should be treated by a RetryPolicy."""
+
+    THROTTLING = "throttling"
+    TIMEOUT = "timeout"
+    TRANSIENT = "transient"
+    VALIDATION = "validation"
+    UNKNOWN = "unknown"
+
+
+_THROTTLING_CODES = frozenset(
+    {
+        "ThrottlingException",
+        "Throttling",
+        "ThrottledException",
+        "TooManyRequestsException",
+        "RequestLimitExceeded",
+        "ProvisionedThroughputExceededException",
+        "SlowDown",
+        "ratelimited",
+    }
+)
+_TIMEOUT_CODES = frozenset({"ModelTimeoutException", "RequestTimeout", "RequestTimeoutException"})
+_TRANSIENT_CODES = frozenset(
+    {
+        "InternalServerException",
+        "InternalFailure",
+        "ServiceUnavailableException",
+        "ServiceUnavailable",
+        "ModelNotReadyException",
+        "InternalError",
+        "service_unavailable",
+        "fatal_error",
+    }
+)
+_VALIDATION_CODES = frozenset(
+    {
+        "ValidationException",
+        "AccessDeniedException",
+        "UnrecognizedClientException",
+        "ResourceNotFoundException",
+        "InvalidParameterValueException",
+        "InvalidParameterException",
+        "ModelErrorException",
+        "invalid_auth",
+        "channel_not_found",
+        "not_in_channel",
+        "invalid_blocks",
+    }
+)
+# botocore/urllib3/httpx exception class names (matched by name: no SDK import needed)
+_TIMEOUT_NAMES = frozenset(
+    {"ReadTimeoutError", "ConnectTimeoutError", "ReadTimeout", "ConnectTimeout", "TimeoutException"}
+)
+_TRANSIENT_NAMES = frozenset(
+    {"EndpointConnectionError", "ConnectionClosedError", "ConnectError", "RemoteProtocolError"}
+)
+
+
+def _error_code(error: BaseException) -> str:
+    """Service error code of a botocore ClientError or slack_sdk SlackApiError, else ""."""
+    response = getattr(error, "response", None)
+    if isinstance(response, dict):
+        return str((response.get("Error") or {}).get("Code") or "")
+    get = getattr(response, "get", None)  # SlackResponse supports .get
+    if callable(get):
+        try:
+            return str(get("error") or "")
+        except Exception:  # noqa: BLE001
+            return ""
+    return ""
+
+
+def _status_code(error: BaseException) -> int | None:
+    response = getattr(error, "response", None)
+    if isinstance(response, dict):
+        status = (response.get("ResponseMetadata") or {}).get("HTTPStatusCode")
+    else:
+        status = getattr(response, "status_code", None)
+    return status if isinstance(status, int) else None
+
+
+def classify_error(error: BaseException) -> ErrorKind:
+    """Classify an exception from boto3, slack_sdk, httpx or the standard library."""
+    code = _error_code(error)
+    if code in _THROTTLING_CODES:
+        return ErrorKind.THROTTLING
+    if code in _TIMEOUT_CODES:
+        return ErrorKind.TIMEOUT
+    if code in _TRANSIENT_CODES:
+        return ErrorKind.TRANSIENT
+    if code in _VALIDATION_CODES:
+        return ErrorKind.VALIDATION
+    for cls in type(error).__mro__:
+        if cls.__name__ in _TIMEOUT_NAMES:
+            return ErrorKind.TIMEOUT
+        if cls.__name__ in _TRANSIENT_NAMES:
+            return ErrorKind.TRANSIENT
+    if isinstance(error, TimeoutError):
+        return ErrorKind.TIMEOUT
+    if isinstance(error, ConnectionError):
+        return ErrorKind.TRANSIENT
+    status = _status_code(error)
+    if status == 429:
+        return ErrorKind.THROTTLING
+    if status is not None and status >= 500:
+        return ErrorKind.TRANSIENT
+    if status is not None and status >= 400:
+        return ErrorKind.VALIDATION
+    return ErrorKind.UNKNOWN
+
+
+def _retry_after(error: BaseException) -> float | None:
+    """Seconds from a Retry-After header on the error's response (Slack rate limits)."""
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None)
+    if headers is None and isinstance(response, dict):
+        headers = (response.get("ResponseMetadata") or {}).get("HTTPHeaders")
+    if not headers:
+        return None
+    for key in ("Retry-After", "retry-after"):
+        value = headers.get(key) if hasattr(headers, "get") else None
+        if value is not None:
+            try:
+                return max(0.0, float(value))
+            except (TypeError, ValueError):
+                return None
+    return None
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    Exponential backoff with full jitter over classified errors.
+
+    Attempt n (0-based) sleeps uniform(0, min(max_delay, base_delay * 2**n)) before the
+    next try, with throttling_multiplier applied to the cap for throttling errors.
+    A retry is skipped when its sleep would exceed max_total_seconds.
+    """
+
+    max_attempts: int = 3
+    base_delay: float = 0.5
+    max_delay: float = 8.0
+    max_total_seconds: float = 30.0
+    throttling_multiplier: float = 2.0
+    retry_on: frozenset[ErrorKind] = frozenset(
+        {ErrorKind.THROTTLING, ErrorKind.TIMEOUT, ErrorKind.TRANSIENT}
+    )
+
+    @classmethod
+    def from_settings(cls, settings: Settings, max_attempts: int | None = None) -> RetryPolicy:
+        return cls(
+            max_attempts=max_attempts or settings.retry_max_attempts,
+            base_delay=settings.retry_base_delay_seconds,
+            max_delay=settings.retry_max_delay_seconds,
+            max_total_seconds=settings.retry_max_total_seconds,
+        )
+
+    def backoff(self, attempt: int, kind: ErrorKind, rng: random.Random | None = None) -> float:
+        """Jittered sleep before retry number attempt + 1."""
+        cap = self.base_delay * (2**attempt)
+        if kind == ErrorKind.THROTTLING:
+            cap *= self.throttling_multiplier
+        return (rng or random).uniform(0.0, min(self.max_delay, cap))
+
+    def call(
+        self,
+        fn: Callable[..., T],
+        *args: Any,
+        description: str = "",
+        sleep: Callable[[float], None] = time.sleep,
+        **kwargs: Any,
+    ) -> T:
+        """Call fn(*args, **kwargs), retrying retryable errors; the last error is raised."""
+        start = time.monotonic()
+        attempt = 0
+        while True:
+            try:
+                return fn(*args, **kwargs)
+            except Exception as e:
+                kind = classify_error(e)
+                attempt += 1
+                if kind not in self.retry_on or attempt >= self.max_attempts:
+                    raise
+                delay = self.backoff(attempt - 1, kind)
+                retry_after = _retry_after(e)
+                if retry_after is not None:
+                    delay = max(delay, retry_after)
+                if time.monotonic() - start + delay > self.max_total_seconds:
+                    raise
+                logger.info(
+                    "%s failed (%s, attempt %s/%s); retrying in %.2fs: %s",
+                    description or getattr(fn, "__name__", "call"),
+                    kind.value,
+                    attempt,
+                    self.max_attempts,
+                    delay,
+                    e,
+                )
+                sleep(delay)
@@ -4,6 +4,17 @@ Slack post-mortem reporter.
 Publishes incident timeline, root cause, remediation, and prevention suggestion.
 """
 
-from autosre.slack_reporter.reporter import SlackReporter
+from typing import TYPE_CHECKING
+
+from autosre._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from autosre.slack_reporter.reporter import SlackReporter
+
+_EXPORTS = {
+    "SlackReporter": "autosre.slack_reporter.reporter",
+}
 
 __all__ = ["SlackReporter"]
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -3,11 +3,12 @@
 import logging
 
 from autosre.models import PostMortemReport
+from autosre.retry import RetryPolicy
 
 logger = logging.getLogger(__name__)
 
 
-def _build_post_mortem_text(report: PostMortemReport) -> str:
+def build_post_mortem_text(report: PostMortemReport) -> str:
     """Plain-text fallback for notifications and accessibility."""
     lines = [
         f"*AutoSRE Post-Mortem* — Incident `{report.incident_id}`",
@@ -24,7 +25,7 @@ def _build_post_mortem_text(report: PostMortemReport) -> str:
     return "\n".join(lines)
 
 
-def _build_post_mortem_blocks(report: PostMortemReport) -> list[dict]:
+def build_post_mortem_blocks(report: PostMortemReport) -> list[dict]:
     """Block Kit layout for post-mortem in Slack."""
     blocks: list[dict] = [
         {
@@ -54,9 +55,16 @@ def _build_post_mortem_blocks(report: PostMortemReport) -> list[dict]:
 class SlackReporter:
     """Publishes post-mortem to Slack via slack_sdk WebClient and Block Kit; fallback text when token not configured."""
 
-    def __init__(self, bot_token: str = "", channel_id: str = "") -> None:
+    def __init__(
+        self,
+        bot_token: str = "",
+        channel_id: str = "",
+        retry_policy: RetryPolicy | None = None,
+    ) -> None:
         self.bot_token = bot_token
         self.channel_id = channel_id
+        # Rate limits (429, Retry-After honoured) and 5xx are retried; auth errors are not
+        self.retry_policy = retry_policy or RetryPolicy()
 
     def publish(self, report: PostMortemReport) -> bool:
         """Send post-mortem to configured Slack channel. Returns False if token/channel missing or API fails."""
@@ -70,9 +78,11 @@ class SlackReporter:
             from slack_sdk import WebClient
 
             client = WebClient(token=self.bot_token)
-            text = _build_post_mortem_text(report)
-            blocks = _build_post_mortem_blocks(report)
-            client.chat_postMessage(
+            text = build_post_mortem_text(report)
+            blocks = build_post_mortem_blocks(report)
+            self.retry_policy.call(
+                client.chat_postMessage,
+                description="Slack chat_postMessage",
                 channel=self.channel_id,
                 text=text,
                 blocks=blocks,
@@ -5,6 +5,21 @@ Executes planned actions against the operations dashboard:
 login, navigate, click rollback, restart instance, scale replicas.
 """
 
-from autosre.ui_automation.agent import UIActionAgent
+from typing import TYPE_CHECKING
 
-__all__ = ["UIActionAgent"]
+from autosre._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from autosre.ui_automation.agent import UIActionAgent
+    from autosre.ui_automation.session_pool import NovaActSessionPool
+    from autosre.ui_automation.workers import UIWorkerPool
+
+_EXPORTS = {
+    "UIActionAgent": "autosre.ui_automation.agent",
+    "NovaActSessionPool": "autosre.ui_automation.session_pool",
+    "UIWorkerPool": "autosre.ui_automation.workers",
+}
+
+__all__ = ["NovaActSessionPool", "UIActionAgent", "UIWorkerPool"]
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
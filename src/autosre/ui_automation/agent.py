@@ -1,27 +1,34 @@
 """UI action agent (Nova Act) — executes planned steps on the operations dashboard."""
 
 import logging
-import os
+import time
 
 from autosre.models import PlannedAction
-from autosre.ui_automation.prompts import actions_to_prompts
+from autosre.remediation.dag import DagExecutor, topological_order
+from autosre.remediation.journal import ActionJournal
+from autosre.ui_automation.prompts import actions_to_prompts, compile_prompts
+from autosre.ui_automation.session_pool import NovaActSessionPool, run_prompts
+from autosre.ui_automation.workers import UIWorkerPool
 
 logger = logging.getLogger(__name__)
 
 
-def _run_nova_act(dashboard_url: str, prompts: list[str], api_key: str | None) -> bool:
+def _run_nova_act(
+    dashboard_url: str,
+    prompts: list[str],
+    api_key: str | None,
+    timings: list[tuple[str, float]] | None = None,
+) -> bool:
     """Run Nova Act with the given prompts. Returns True if all steps succeeded."""
     try:
         from nova_act import NovaAct
     except ImportError as e:
         logger.warning("Nova Act SDK not available; cannot run UI automation: %s", e)
         return False
-    if api_key:
-        os.environ["NOVA_ACT_API_KEY"] = api_key
+    kwargs = {"nova_act_api_key": api_key} if api_key else {}
     try:
-        with NovaAct(starting_page=dashboard_url) as nova:
-            for prompt in prompts:
-                nova.act(prompt)
+        with NovaAct(starting_page=dashboard_url, **kwargs) as nova:
+            run_prompts(nova, prompts, timings)
         return True
     except Exception as e:
         logger.warning("Nova Act execution failed: %s", e, exc_info=True)
@@ -34,6 +41,14 @@ class UIActionAgent:
 
     In stub mode (default): logs actions and returns True (no browser).
     With use_nova_act=True: uses Nova Act SDK to run natural-language prompts.
+    One browser session drives one page, so Nova Act runs the steps one at a time in
+    dependency order; stub mode runs the plan through the DAG executor.
+    With a session_pool, Nova Act reuses a warm, logged-in browser instead of
+    starting one (and logging in) for every execute. With a worker_pool, the browser
+    runs in a worker subprocess instead, so several plans can run in parallel. With coalesce_prompts, safe
+    consecutive steps are merged so a plan needs fewer act() round trips. With a journal,
+    steps already applied for the incident are left out; Nova Act journals a plan's
+    steps only once the whole batch has succeeded.
     """
 
     def __init__(
@@ -41,35 +56,89 @@ class UIActionAgent:
         dashboard_url: str = "http://localhost:3000",
         use_nova_act: bool = False,
         api_key: str | None = None,
+        dag: DagExecutor | None = None,
+        session_pool: NovaActSessionPool | None = None,
+        coalesce_prompts: bool = False,
+        worker_pool: UIWorkerPool | None = None,
+        journal: ActionJournal | None = None,
     ) -> None:
         self.dashboard_url = dashboard_url.rstrip("/")
         self._use_nova_act = use_nova_act
         self._api_key = api_key or ""
+        self._dag = dag or DagExecutor()
+        self.session_pool = session_pool
+        self._coalesce_prompts = coalesce_prompts
+        self.worker_pool = worker_pool
+        self._journal = journal
 
     def execute(
         self,
         actions: list[PlannedAction],
         service_name: str | None = None,
+        incident_id: str | None = None,
     ) -> bool:
         """Execute the list of planned actions. Returns True if all succeeded."""
         if not actions:
             return True
-        prompts = actions_to_prompts(
-            actions,
-            service_name=service_name,
-            include_login=True,
-        )
+        journal = self._journal
         if self._use_nova_act:
-            return _run_nova_act(
-                self.dashboard_url,
-                prompts,
-                self._api_key or None,
+            if journal is not None:
+                pending = journal.pending(incident_id, actions, service_name)
+                if len(pending) < len(actions) and not any(map(journal.journaled, pending)):
+                    logger.info("All UI steps already applied for %s", incident_id)
+                    return True
+                actions = pending
+            to_prompts = compile_prompts if self._coalesce_prompts else actions_to_prompts
+            prompts = to_prompts(
+                topological_order(actions),
+                service_name=service_name,
+                # Pooled and worker browsers are logged in once, when they start
+                include_login=self.session_pool is None and self.worker_pool is None,
             )
-        for action in actions:
+            timings: list[tuple[str, float]] = []
+            start = time.monotonic()
+            if self.worker_pool is not None:
+                ok = self.worker_pool.run(prompts, timings=timings)
+            elif self.session_pool is not None:
+                ok = self.session_pool.run(prompts, timings=timings)
+            else:
+                ok = _run_nova_act(
+                    self.dashboard_url,
+                    prompts,
+                    self._api_key or None,
+                    timings=timings,
+                )
             logger.info(
-                "UIAction (stub) %s on %s params=%s",
-                action.action_type,
-                action.target,
-                action.parameters,
+                "Nova Act ran %s of %s act() call(s) for %s step(s) in %.2fs",
+                len(timings),
+                len(prompts),
+                len(actions),
+                time.monotonic() - start,
+                extra={"act_seconds": [round(seconds, 3) for _, seconds in timings]},
+            )
+            if ok and journal is not None and incident_id:
+                for action in filter(journal.journaled, actions):
+                    journal.record(incident_id, action, service_name, ok=True)
+            return ok
+        if journal is None:
+            result = self._dag.run(actions, self._stub_step)
+        else:
+            result = self._dag.run(
+                actions,
+                lambda action: journal.run(
+                    incident_id, action, service_name, lambda: self._stub_step(action)
+                ),
             )
+        if not result.ok:
+            logger.warning("UI plan partially failed: %s", result.summary())
+        return result.ok
+
+    @staticmethod
+    def _stub_step(action: PlannedAction) -> bool:
+        logger.info(
+            "UIAction (stub) %s on %s params=%s",
+            action.action_type,
+            action.target,
+            action.parameters,
+        )
         return True
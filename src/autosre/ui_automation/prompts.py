@@ -1,7 +1,13 @@
 """Convert PlannedAction list into natural-language prompts for Nova Act."""
 
+from collections.abc import Mapping
+from functools import lru_cache
+from typing import Any
+
 from autosre.models import PlannedAction
 
+LOGIN_PROMPT = "Click the Demo login button."
+
 
 def actions_to_prompts(
     actions: list[PlannedAction],
@@ -16,29 +22,93 @@ def actions_to_prompts(
     """
     prompts: list[str] = []
     if include_login:
-        prompts.append("Click the Demo login button.")
+        prompts.append(LOGIN_PROMPT)
     if service_name:
-        display = service_name.capitalize()
-        prompts.append(f"Click the {display} service link.")
+        prompts.append(_service_prompt(service_name))
     for action in actions:
-        if action.action_type == "navigate" and action.target == "deployment_panel":
-            prompts.append("Click the Deployments tab.")
-        elif action.action_type == "click_rollback":
-            to_version = action.parameters.get("to_version", "previous")
-            prompts.append(f"Click the Rollback button for version {to_version}.")
-        elif action.action_type == "navigate" and action.target == "service_instances":
-            prompts.append("Open the service instances section.")
-        elif action.action_type == "restart_instance":
-            prompts.append("Click the Restart button for the first instance.")
-        elif action.action_type == "navigate" and action.target == "service_scaling":
-            prompts.append("Open the scaling section.")
-        elif action.action_type == "scale_replicas":
-            replicas = action.parameters.get("replicas", 4)
-            prompts.append(f"Set replicas to {replicas} and apply.")
-        elif action.action_type == "navigate" and action.target == "db_pool":
-            prompts.append("Open the database pool section.")
-        elif action.action_type == "restart_pool":
-            prompts.append("Click the Restart pool button.")
-        else:
-            prompts.append(f"Perform {action.action_type} on {action.target}.")
+        prompts.append(_action_prompt(action.action_type, action.target, action.parameters))
     return prompts
+
+
+def _service_prompt(service_name: str) -> str:
+    return f"Click the {service_name.capitalize()} service link."
+
+
+def _action_prompt(action_type: str, target: str, parameters: Mapping[str, Any]) -> str:
+    if action_type == "navigate" and target == "deployment_panel":
+        return "Click the Deployments tab."
+    if action_type == "click_rollback":
+        to_version = parameters.get("to_version", "previous")
+        return f"Click the Rollback button for version {to_version}."
+    if action_type == "navigate" and target == "service_instances":
+        return "Open the service instances section."
+    if action_type == "restart_instance":
+        return "Click the Restart button for the first instance."
+    if action_type == "navigate" and target == "service_scaling":
+        return "Open the scaling section."
+    if action_type == "scale_replicas":
+        replicas = parameters.get("replicas", 4)
+        return f"Set replicas to {replicas} and apply."
+    if action_type == "navigate" and target == "db_pool":
+        return "Open the database pool section."
+    if action_type == "restart_pool":
+        return "Click the Restart pool button."
+    return f"Perform {action_type} on {target}."
+
+
+def _merge(prompts: list[str]) -> str:
+    """'Click A.' + 'Open B.' -> 'Click A, then open B.'"""
+    parts = [p.rstrip(".") for p in prompts]
+    rest = [p[:1].lower() + p[1:] for p in parts[1:]]
+    return ", then ".join([parts[0], *rest]) + "."
+
+
+@lru_cache(maxsize=256)
+def _compile(
+    service_name: str | None,
+    include_login: bool,
+    steps: tuple[tuple[str, str, tuple[tuple[str, Any], ...]], ...],
+    max_steps_per_act: int,
+) -> tuple[str, ...]:
+    # (prompt, safe): navigation only moves around the dashboard and is safe to batch
+    sequence: list[tuple[str, bool]] = []
+    if include_login:
+        sequence.append((LOGIN_PROMPT, True))
+    if service_name:
+        sequence.append((_service_prompt(service_name), True))
+    for action_type, target, parameters in steps:
+        prompt = _action_prompt(action_type, target, dict(parameters))
+        sequence.append((prompt, action_type == "navigate"))
+    compiled: list[str] = []
+    group: list[str] = []
+    for prompt, safe in sequence:
+        group.append(prompt)
+        # A state-changing step closes its group, so each act() changes at most one thing
+        if not safe or len(group) >= max_steps_per_act:
+            compiled.append(_merge(group))
+            group = []
+    if group:
+        compiled.append(_merge(group))
+    return tuple(compiled)
+
+
+def compile_prompts(
+    actions: list[PlannedAction],
+    service_name: str | None = None,
+    include_login: bool = True,
+    max_steps_per_act: int = 4,
+) -> list[str]:
+    """
+    Like actions_to_prompts, but merges steps into as few act() calls as is safe.
+
+    Consecutive navigation steps are merged with the state-changing step that follows
+    them (at most max_steps_per_act per call), so a rollback is a single act().
+    Compiled sequences are cached per service and plan.
+    """
+    steps = tuple((a.action_type, a.target, tuple(sorted(a.parameters.items()))) for a in actions)
+    try:
+        return list(_compile(service_name, include_login, steps, max(1, max_steps_per_act)))
+    except TypeError:  # unhashable parameter value: compile without the cache
+        return list(
+            _compile.__wrapped__(service_name, include_login, steps, max(1, max_steps_per_act))
+        )
@@ -0,0 +1,358 @@
+"""
+Pool of warm, logged-in Nova Act browser sessions.
+
+Starting a browser and logging in to the dashboard takes several seconds, and
+that delay used to come before every UI remediation. The pool keeps up to `size`
+sessions open and logged in. Each execute borrows one session exclusively (a
+per-session lock), resets it to the dashboard home page and runs its prompts.
+A session is recycled when it is older than max_age_seconds, when its page was
+closed, or when a prompt failed in it (its page state is then unknown).
+
+Nova Act drives Playwright's sync API, which only works on the thread that
+started the browser. Each session therefore lives on its own daemon thread:
+every NovaAct call (start, login, act, go_to_url, stop) is handed to that thread,
+so a session warmed on one thread can be borrowed from any other.
+"""
+
+from __future__ import annotations
+
+import functools
+import itertools
+import logging
+import queue
+import threading
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future
+from contextlib import contextmanager
+from typing import Any
+
+from autosre.config import Settings, get_settings
+from autosre.ui_automation.prompts import LOGIN_PROMPT
+
+logger = logging.getLogger(__name__)
+
+
+_thread_ids = itertools.count(1)
+
+
+class _SessionThread:
+    """The one thread a session's browser is started, driven and stopped on."""
+
+    def __init__(self) -> None:
+        self._calls: queue.SimpleQueue = queue.SimpleQueue()
+        self._thread = threading.Thread(
+            target=self._serve, name=f"autosre-nova-act-{next(_thread_ids)}", daemon=True
+        )
+        self._thread.start()
+
+    def _serve(self) -> None:
+        while True:
+            item = self._calls.get()
+            if item is None:
+                return
+            future, fn = item
+            try:
+                future.set_result(fn())
+            except BaseException as e:  # noqa: BLE001
+                future.set_exception(e)
+
+    def call(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Run fn on this thread and return its result (or raise its exception)."""
+        if threading.current_thread() is self._thread:
+            return fn(*args, **kwargs)
+        future: Future = Future()
+        self._calls.put((future, functools.partial(fn, *args, **kwargs)))
+        return future.result()
+
+    def stop(self) -> None:
+        self._calls.put(None)
+
+
+class _ThreadBound:
+    """NovaAct proxy whose method calls run on the session's thread."""
+
+    def __init__(self, target: Any, thread: _SessionThread) -> None:
+        self._target = target
+        self._thread = thread
+
+    def __getattr__(self, name: str) -> Any:
+        value = self._thread.call(getattr, self._target, name)
+        if not callable(value):
+            return value
+        return functools.partial(self._thread.call, value)
+
+
+class _Session:
+    def __init__(self, nova: Any, thread: _SessionThread, created_at: float) -> None:
+        self.nova = nova
+        self.thread = thread
+        self.proxy = _ThreadBound(nova, thread)
+        self.created_at = created_at
+        self.lock = threading.Lock()
+        self.uses = 0
+
+    def stop(self) -> None:
+        try:
+            self.thread.call(_stop, self.nova)
+        finally:
+            self.thread.stop()
+
+
+class NovaActSessionPool:
+    """Thread-safe pool of started, authenticated NovaAct instances."""
+
+    def __init__(
+        self,
+        dashboard_url: str,
+        api_key: str | None = None,
+        size: int = 2,
+        max_age_seconds: float = 1800.0,
+        acquire_timeout_seconds: float = 60.0,
+        factory: Callable[[], Any] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._dashboard_url = dashboard_url.rstrip("/")
+        self._api_key = api_key or ""
+        self._size = max(1, size)
+        self._max_age_seconds = max_age_seconds
+        self._acquire_timeout_seconds = acquire_timeout_seconds
+        self._factory = factory or self._new_nova_act
+        self._clock = clock
+        self._cond = threading.Condition()
+        self._sessions: list[_Session] = []
+        self._opening = 0
+        self._closed = False
+        self.created = 0
+        self.reused = 0
+        self.recycled = 0
+
+    def _new_nova_act(self) -> Any:
+        from nova_act import NovaAct
+
+        kwargs: dict[str, Any] = {"starting_page": self._dashboard_url}
+        if self._api_key:
+            kwargs["nova_act_api_key"] = self._api_key
+        return NovaAct(**kwargs)
+
+    def _start(self) -> Any:
+        nova = self._factory()
+        nova.start()
+        try:
+            nova.act(LOGIN_PROMPT)
+        except Exception:
+            _stop(nova)
+            raise
+        return nova
+
+    def _open(self) -> _Session:
+        """Start a browser and log in (the slow part the pool exists to amortize)."""
+        thread = _SessionThread()
+        try:
+            nova = thread.call(self._start)
+        except BaseException:
+            thread.stop()
+            raise
+        return _Session(nova, thread, self._clock())
+
+    def _healthy(self, session: _Session) -> bool:
+        if self._clock() - session.created_at >= self._max_age_seconds:
+            return False
+        try:
+            return session.thread.call(_page_open, session.nova)
+        except Exception:  # noqa: BLE001
+            return False
+
+    def _checkout(self) -> _Session:
+        deadline = self._clock() + self._acquire_timeout_seconds
+        stale: list[_Session] = []
+        try:
+            with self._cond:
+                while True:
+                    if self._closed:
+                        raise RuntimeError("Nova Act session pool is closed")
+                    for session in list(self._sessions):
+                        if not session.lock.acquire(blocking=False):
+                            continue
+                        if self._healthy(session):
+                            session.uses += 1
+                            self.reused += 1
+                            return session
+                        self._sessions.remove(session)
+                        session.lock.release()
+                        self.recycled += 1
+                        stale.append(session)
+                    if len(self._sessions) + self._opening < self._size:
+                        self._opening += 1
+                        break
+                    remaining = deadline - self._clock()
+                    if remaining <= 0:
+                        raise TimeoutError(
+                            f"No Nova Act session free after {self._acquire_timeout_seconds}s"
+                        )
+                    self._cond.wait(remaining)
+        finally:
+            for session in stale:
+                session.stop()
+        try:
+            session = self._open()
+        except BaseException:
+            with self._cond:
+                self._opening -= 1
+                self._cond.notify()
+            raise
+        session.lock.acquire()
+        session.uses = 1
+        with self._cond:
+            self._opening -= 1
+            self._sessions.append(session)
+            self.created += 1
+        return session
+
+    def _checkin(self, session: _Session, discard: bool) -> None:
+        with self._cond:
+            discard = discard or self._closed
+            if discard and session in self._sessions:
+                self._sessions.remove(session)
+                self.recycled += 1
+            session.lock.release()
+            self._cond.notify()
+        if discard:
+            session.stop()
+
+    @contextmanager
+    def session(self) -> Iterator[Any]:
+        """
+        Borrow a logged-in NovaAct positioned on the dashboard home page.
+
+        The yielded object proxies the session's NovaAct: its method calls run on the
+        thread that owns the browser, whichever thread borrowed it.
+        """
+        session = self._checkout()
+        ok = False
+        try:
+            if session.uses > 1:
+                session.proxy.go_to_url(self._dashboard_url)
+            yield session.proxy
+            ok = True
+        finally:
+            self._checkin(session, discard=not ok)
+
+    def run(self, prompts: list[str], timings: list[tuple[str, float]] | None = None) -> bool:
+        """Run prompts (without the login step) in a pooled session; True if all succeeded."""
+        try:
+            with self.session() as nova:
+                run_prompts(nova, prompts, timings)
+            return True
+        except ImportError as e:
+            logger.warning("Nova Act SDK not available; cannot run UI automation: %s", e)
+            return False
+        except Exception as e:
+            logger.warning("Nova Act execution failed: %s", e, exc_info=True)
+            return False
+
+    def warm(self) -> int:
+        """Open sessions up to the pool size ahead of the first incident; returns the count opened."""
+        opened = 0
+        while True:
+            with self._cond:
+                if self._closed or len(self._sessions) + self._opening >= self._size:
+                    return opened
+                self._opening += 1
+            try:
+                session = self._open()
+            except Exception as e:  # noqa: BLE001
+                logger.warning("Could not warm a Nova Act session: %s", e)
+                with self._cond:
+                    self._opening -= 1
+                return opened
+            with self._cond:
+                self._opening -= 1
+                self._sessions.append(session)
+                self.created += 1
+                self._cond.notify()
+            opened += 1
+
+    def close(self) -> None:
+        """Stop idle sessions now; sessions in use are stopped when they are returned."""
+        with self._cond:
+            self._closed = True
+            idle = [s for s in self._sessions if s.lock.acquire(blocking=False)]
+            for session in idle:
+                self._sessions.remove(session)
+            self._cond.notify_all()
+        for session in idle:
+            session.stop()
+
+    def stats(self) -> dict[str, int]:
+        with self._cond:
+            return {
+                "size": len(self._sessions),
+                "busy": sum(1 for s in self._sessions if s.lock.locked()),
+                "created": self.created,
+                "reused": self.reused,
+                "recycled": self.recycled,
+            }
+
+
+def run_prompts(
+    nova: Any, prompts: list[str], timings: list[tuple[str, float]] | None = None
+) -> None:
+    """nova.act() each prompt in order, appending (prompt, seconds) to timings."""
+    for i, prompt in enumerate(prompts):
+        start = time.monotonic()
+        try:
+            nova.act(prompt)
+        finally:
+            seconds = time.monotonic() - start
+            if timings is not None:
+                timings.append((prompt, seconds))
+            logger.info(
+                "Nova Act step %s/%s took %.2fs: %s",
+                i + 1,
+                len(prompts),
+                seconds,
+                prompt,
+                extra={"act_step": i + 1, "act_seconds": seconds},
+            )
+
+
+def _page_open(nova: Any) -> bool:
+    page = nova.page
+    return page is None or not page.is_closed()
+
+
+def _stop(nova: Any) -> None:
+    try:
+        nova.stop()
+    except Exception as e:  # noqa: BLE001
+        logger.debug("Error stopping Nova Act session: %s", e)
+
+
+_shared_pool: NovaActSessionPool | None = None
+_shared_lock = threading.Lock()
+
+
+def get_session_pool(settings: Settings | None = None) -> NovaActSessionPool:
+    """Process-wide pool (browser sessions are shared by the daemon's workers)."""
+    global _shared_pool
+    with _shared_lock:
+        if _shared_pool is None:
+            settings = settings or get_settings()
+            _shared_pool = NovaActSessionPool(
+                settings.operations_dashboard_url,
+                api_key=settings.nova_act_api_key or None,
+                size=settings.ui_session_pool_size,
+                max_age_seconds=settings.ui_session_max_age_seconds,
+                acquire_timeout_seconds=settings.ui_session_acquire_timeout_seconds,
+            )
+        return _shared_pool
+
+
+def close_session_pool() -> None:
+    """Close the process-wide pool, if one was built (the one-shot run path's exit)."""
+    global _shared_pool
+    with _shared_lock:
+        pool, _shared_pool = _shared_pool, None
+    if pool is not None:
+        pool.close()
@@ -0,0 +1,322 @@
+"""
+Process-isolated Nova Act workers.
+
+Each worker is a spawned subprocess that owns one browser, kept warm and logged in
+(a one-session NovaActSessionPool). The parent hands each action batch to an idle
+worker over that worker's task queue, so up to `processes` UI remediations run in
+parallel. Each worker
+streams a result per act() back to the parent as the step finishes, over a pipe of
+its own. The API key is passed to each worker's NovaAct, so no process-wide
+environment is mutated. A worker that dies fails only its own task and is replaced
+as soon as its process exits; so is a worker whose task ran past
+task_timeout_seconds (its browser is in an unknown state). A replaced worker's
+queue and pipe are discarded with it, so terminating it cannot wedge the others.
+"""
+
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import queue
+import threading
+import time
+import uuid
+from collections.abc import Callable
+from multiprocessing.connection import wait
+from typing import Any
+
+from autosre.config import Settings, get_settings
+from autosre.ui_automation.session_pool import NovaActSessionPool
+
+logger = logging.getLogger(__name__)
+
+# Result events (worker -> parent) on the worker's results pipe:
+#   ("step", task_id, index, prompt, seconds)
+#   ("done", task_id, ok, error)
+
+
+def _worker_main(
+    dashboard_url: str,
+    api_key: str | None,
+    max_age_seconds: float,
+    factory: Callable[[], Any] | None,
+    tasks: Any,
+    results: Any,
+) -> None:
+    """Subprocess entry point: serve action batches from tasks until a None sentinel."""
+    pool = NovaActSessionPool(
+        dashboard_url,
+        api_key=api_key,
+        size=1,
+        max_age_seconds=max_age_seconds,
+        factory=factory,
+    )
+    pool.warm()  # start the browser and log in before the first task arrives
+    while True:
+        task = tasks.get()
+        if task is None:
+            break
+        task_id, prompts = task
+        ok, error = True, ""
+        try:
+            with pool.session() as nova:
+                for i, prompt in enumerate(prompts):
+                    start = time.monotonic()
+                    try:
+                        nova.act(prompt)
+                    finally:
+                        results.send(("step", task_id, i, prompt, time.monotonic() - start))
+        except Exception as e:  # noqa: BLE001
+            ok, error = False, f"{type(e).__name__}: {e}"
+        results.send(("done", task_id, ok, error))
+    pool.close()
+
+
+class _Worker:
+    def __init__(self, process: Any, tasks: Any, results: Any) -> None:
+        self.process = process
+        self.tasks = tasks
+        self.results = results  # parent end of the worker's results pipe
+        self.task_id: str | None = None  # set while it runs a batch
+
+    def discard(self) -> None:
+        """Release the parent's ends of the worker's queue and pipe."""
+        self.tasks.cancel_join_thread()
+        self.tasks.close()
+        self.results.close()
+
+
+class UIWorkerPool:
+    """Parent-side handle: spawns the workers, routes their streamed results to callers."""
+
+    def __init__(
+        self,
+        dashboard_url: str,
+        api_key: str | None = None,
+        processes: int = 2,
+        max_age_seconds: float = 1800.0,
+        task_timeout_seconds: float = 600.0,
+        factory: Callable[[], Any] | None = None,
+    ) -> None:
+        """factory (picklable, e.g. a module-level class) replaces NovaAct in the workers."""
+        self._dashboard_url = dashboard_url.rstrip("/")
+        self._api_key = api_key or None
+        self._processes = max(1, processes)
+        self._max_age_seconds = max_age_seconds
+        self._task_timeout_seconds = task_timeout_seconds
+        self._factory = factory
+        self._ctx = multiprocessing.get_context("spawn")
+        self._workers: list[_Worker] = []
+        self._inboxes: dict[str, queue.Queue] = {}
+        self._cond = threading.Condition()
+        self._started = False
+        self._closed = threading.Event()
+        self.restarts = 0
+
+    def _spawn(self) -> _Worker:
+        tasks = self._ctx.Queue()
+        results, child_results = self._ctx.Pipe(duplex=False)
+        process = self._ctx.Process(
+            target=_worker_main,
+            args=(
+                self._dashboard_url,
+                self._api_key,
+                self._max_age_seconds,
+                self._factory,
+                tasks,
+                child_results,
+            ),
+            name="autosre-ui-worker",
+            daemon=True,
+        )
+        process.start()
+        child_results.close()  # the worker holds its own end
+        return _Worker(process, tasks, results)
+
+    def start(self) -> None:
+        """Spawn the workers (idempotent); each starts its browser right away."""
+        with self._cond:
+            if self._started:
+                return
+            if self._closed.is_set():
+                raise RuntimeError("UI worker pool is closed")
+            self._workers = [self._spawn() for _ in range(self._processes)]
+            self._started = True
+        threading.Thread(target=self._dispatch, name="autosre-ui-results", daemon=True).start()
+
+    def _dispatch(self) -> None:
+        """Route events from every worker's pipe; replace a worker as soon as it exits."""
+        while not self._closed.is_set():
+            with self._cond:
+                handles: dict[Any, _Worker] = {}
+                for worker in self._workers:
+                    handles[worker.results] = worker
+                    handles[worker.process.sentinel] = worker
+            try:
+                ready = wait(list(handles), timeout=0.5)
+            except (OSError, ValueError):
+                continue  # a pipe was closed by a concurrent replacement
+            for handle in ready:
+                worker = handles[handle]
+                if handle is worker.results:
+                    self._drain(worker)
+            self._replace_dead_workers()
+
+    def _drain(self, worker: _Worker) -> None:
+        try:
+            while worker.results.poll():
+                event = worker.results.recv()
+                task_id = event[1]
+                with self._cond:
+                    if event[0] == "done" and worker.task_id == task_id:
+                        worker.task_id = None
+                        self._cond.notify()
+                    inbox = self._inboxes.get(task_id)
+                if inbox is not None:  # None: the caller already timed out
+                    inbox.put(event)
+        except (EOFError, OSError):
+            pass  # the worker exited (or was replaced); its sentinel reports it
+
+    def _replace(self, i: int, reason: str) -> _Worker:
+        """Swap in a fresh worker at index i (under the lock); returns the old one."""
+        worker = self._workers[i]
+        inbox = self._inboxes.get(worker.task_id or "")
+        if inbox is not None:
+            inbox.put(("done", worker.task_id, False, reason))
+        self._workers[i] = self._spawn()
+        self.restarts += 1
+        self._cond.notify()
+        return worker
+
+    def _replace_dead_workers(self) -> None:
+        dead: list[_Worker] = []
+        with self._cond:
+            if self._closed.is_set():
+                return
+            for i, worker in enumerate(self._workers):
+                if worker.process.is_alive():
+                    continue
+                logger.warning(
+                    "UI worker %s exited (%s); restarting",
+                    worker.process.pid,
+                    worker.process.exitcode,
+                )
+                self._drain(worker)  # results it sent before exiting
+                dead.append(self._replace(i, "worker exited"))
+        for worker in dead:
+            worker.discard()
+
+    def _replace_worker_running(self, task_id: str) -> None:
+        """Terminate the worker stuck on task_id and spawn a fresh one in its place."""
+        stuck = None
+        with self._cond:
+            if self._closed.is_set():
+                return
+            for i, worker in enumerate(self._workers):
+                if worker.task_id == task_id:
+                    worker.process.terminate()
+                    stuck = self._replace(i, "task timed out")
+                    break
+        if stuck is not None:
+            stuck.process.join(5.0)
+            stuck.discard()
+
+    def _assign(self, task_id: str, prompts: list[str], deadline: float) -> bool:
+        """Hand the batch to an idle worker; False if none freed up before the deadline."""
+        with self._cond:
+            while True:
+                if self._closed.is_set():
+                    return False
+                worker = next((w for w in self._workers if w.task_id is None), None)
+                if worker is not None:
+                    worker.task_id = task_id
+                    worker.tasks.put((task_id, prompts))
+                    return True
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+
+    def run(self, prompts: list[str], timings: list[tuple[str, float]] | None = None) -> bool:
+        """Run prompts in the next free worker; True if all succeeded (blocks until done)."""
+        self.start()
+        task_id = uuid.uuid4().hex
+        inbox: queue.Queue = queue.Queue()
+        deadline = time.monotonic() + self._task_timeout_seconds
+        with self._cond:
+            self._inboxes[task_id] = inbox
+        try:
+            if not self._assign(task_id, list(prompts), deadline):
+                logger.warning("No UI worker free within %ss", self._task_timeout_seconds)
+                return False
+            while True:
+                try:
+                    event = inbox.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    logger.warning("UI task timed out after %ss", self._task_timeout_seconds)
+                    self._replace_worker_running(task_id)
+                    return False
+                if event[0] == "step":
+                    _, _, index, prompt, seconds = event
+                    if timings is not None:
+                        timings.append((prompt, seconds))
+                    logger.info(
+                        "Nova Act step %s/%s took %.2fs: %s",
+                        index + 1,
+                        len(prompts),
+                        seconds,
+                        prompt,
+                        extra={"act_step": index + 1, "act_seconds": seconds},
+                    )
+                elif event[0] == "done":
+                    _, _, ok, error = event
+                    if not ok:
+                        logger.warning("Nova Act execution failed in worker: %s", error)
+                    return ok
+        finally:
+            with self._cond:
+                self._inboxes.pop(task_id, None)
+
+    def close(self, timeout: float = 10.0) -> None:
+        """Ask the workers to stop their browsers and exit; terminate stragglers."""
+        with self._cond:
+            self._closed.set()
+            workers, self._workers = self._workers, []
+            self._cond.notify_all()
+        for worker in workers:
+            worker.tasks.put(None)
+        deadline = time.monotonic() + timeout
+        for worker in workers:
+            worker.process.join(max(0.0, deadline - time.monotonic()))
+            if worker.process.is_alive():
+                worker.process.terminate()
+            worker.discard()
+
+
+_shared_pool: UIWorkerPool | None = None
+_shared_lock = threading.Lock()
+
+
+def get_ui_worker_pool(settings: Settings | None = None) -> UIWorkerPool:
+    """Process-wide worker pool (browsers are per worker process, not per agent)."""
+    global _shared_pool
+    with _shared_lock:
+        if _shared_pool is None:
+            settings = settings or get_settings()
+            _shared_pool = UIWorkerPool(
+                settings.operations_dashboard_url,
+                api_key=settings.nova_act_api_key or None,
+                processes=settings.ui_worker_processes,
+                max_age_seconds=settings.ui_session_max_age_seconds,
+                task_timeout_seconds=settings.ui_worker_task_timeout_seconds,
+            )
+        return _shared_pool
+
+
+def close_ui_worker_pool() -> None:
+    """Close the process-wide worker pool, if one was built (the one-shot run path's exit)."""
+    global _shared_pool
+    with _shared_lock:
+        pool, _shared_pool = _shared_pool, None
+    if pool is not None:
+        pool.close()
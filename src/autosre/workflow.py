@@ -8,19 +8,39 @@ Closed-loop autonomous operations workflow.
 import logging
 import os
 import time
+from contextlib import contextmanager
+from dataclasses import dataclass
 
-from autosre.config import get_settings
+from autosre.config import Settings, get_settings
 from autosre.incident_detection import DEMO_INCIDENT_ID, get_incident_stream
 from autosre.log_storage import LogStore
 from autosre.log_storage.cloudwatch_logs import get_logs_for_incident_cloudwatch
-from autosre.models import Diagnosis, IncidentType, PostMortemReport, RecoveryStatus
+from autosre.models import (
+    Diagnosis,
+    IncidentEvent,
+    IncidentType,
+    PostMortemReport,
+    RecommendedAction,
+    RecoveryStatus,
+)
 from autosre.planner import PlannerAgent
+from autosre.planner.catalog import get_plan_catalog
 from autosre.reasoning_agent import ReasoningAgent
 from autosre.reasoning_agent.agent import FALLBACK_DIAGNOSIS
+from autosre.reasoning_agent.breaker import get_circuit_breaker
+from autosre.reasoning_agent.cache import get_diagnosis_cache
+from autosre.reasoning_agent.ratelimit import get_rate_limiter
+from autosre.reasoning_agent.rules import get_rule_engine
+from autosre.reasoning_agent.similarity import SimilarityIndex
+from autosre.reasoning_agent.templates import log_templates
 from autosre.recovery_verification import RecoveryMonitor
-from autosre.remediation import AWSExecutor
+from autosre.remediation import AWSExecutor, DagExecutor, DashboardAPIExecutor
+from autosre.remediation.journal import get_action_journal
+from autosre.retry import RetryPolicy
 from autosre.slack_reporter import SlackReporter
 from autosre.ui_automation import UIActionAgent
+from autosre.ui_automation.session_pool import close_session_pool, get_session_pool
+from autosre.ui_automation.workers import close_ui_worker_pool, get_ui_worker_pool
 
 logger = logging.getLogger(__name__)
 
@@ -91,141 +111,326 @@ def _build_report(
     )
 
 
-def run_once(
-    incident_type: IncidentType | None = None,
-    demo: bool = False,
-) -> bool:
-    """
-    Run one full cycle: detect one incident, diagnose, act, verify, report.
+@dataclass
+class WorkflowComponents:
+    """Stage implementations used by one pipeline run (built from settings or injected)."""
 
-    For demo pass incident_type=IncidentType.LATENCY_SPIKE and demo=True for
-    deterministic incident id (inc-demo0001).
-    Returns True if the cycle completed successfully (recovered). On escalation,
-    UI failure, or verification failure still publishes a post-mortem when possible.
-    """
-    settings = get_settings()
-    log_store = LogStore(data_dir=settings.log_storage_data_dir or None)
-    reasoning = ReasoningAgent(use_bedrock=settings.reasoning_use_bedrock)
-    planner = PlannerAgent()
-    use_aws = settings.use_aws_integration
-    if use_aws:
-        metrics_url = ""
-        monitor = RecoveryMonitor(
-            metrics_url=metrics_url,
+    log_store: LogStore
+    reasoning: ReasoningAgent
+    planner: PlannerAgent
+    monitor: RecoveryMonitor
+    slack: SlackReporter
+    aws_executor: AWSExecutor | None = None
+    # UIActionAgent, or DashboardAPIExecutor wrapping it as the fallback
+    ui_agent: UIActionAgent | DashboardAPIExecutor | None = None
+    similarity_index: SimilarityIndex | None = None
+
+
+def build_monitor(settings: Settings) -> RecoveryMonitor:
+    """Recovery monitor for the configured run mode (CloudWatch alarms or health URL)."""
+    if settings.use_aws_integration:
+        return RecoveryMonitor(
+            metrics_url="",
             use_aws_integration=True,
             cloudwatch_alarm_names=settings.cloudwatch_alarm_names,
             aws_region=settings.aws_region,
         )
-        aws_executor = AWSExecutor()
+    metrics_url = settings.metrics_url or (
+        settings.operations_dashboard_url.rstrip("/") + "/api/health"
+    )
+    return RecoveryMonitor(metrics_url=metrics_url)
+
+
+def build_components(settings: Settings | None = None) -> WorkflowComponents:
+    """Construct the stage components for the configured run mode (AWS or dashboard)."""
+    settings = settings or get_settings()
+    log_store = LogStore(data_dir=settings.log_storage_data_dir or None)
+    similarity_index = (
+        SimilarityIndex.from_log_store(log_store) if settings.similarity_enabled else None
+    )
+    reasoning = ReasoningAgent(
+        use_bedrock=settings.reasoning_use_bedrock,
+        cache=get_diagnosis_cache(settings) if settings.diagnosis_cache_enabled else None,
+        rules=get_rule_engine(settings) if settings.reasoning_rules_enabled else None,
+        similarity_index=similarity_index,
+        breaker=get_circuit_breaker(settings) if settings.reasoning_breaker_enabled else None,
+        rate_limiter=get_rate_limiter(settings),
+    )
+    planner = PlannerAgent(catalog=get_plan_catalog(settings))
+    monitor = build_monitor(settings)
+    journal = get_action_journal(settings) if settings.remediation_journal_enabled else None
+    if settings.use_aws_integration:
+        aws_executor = AWSExecutor(journal=journal)
         ui_agent = None
     else:
-        metrics_url = settings.metrics_url or (
-            settings.operations_dashboard_url.rstrip("/") + "/api/health"
-        )
-        monitor = RecoveryMonitor(metrics_url=metrics_url)
         aws_executor = None
+        dag = DagExecutor(
+            max_parallel=settings.remediation_max_parallel,
+            step_timeout_seconds=settings.remediation_step_timeout_seconds,
+        )
         ui_agent = UIActionAgent(
             dashboard_url=settings.operations_dashboard_url,
             use_nova_act=not settings.ui_stub,
             api_key=settings.nova_act_api_key or None,
+            dag=dag,
+            session_pool=(
+                get_session_pool(settings)
+                if not settings.ui_stub
+                and settings.ui_worker_processes <= 0
+                and settings.ui_session_pool_size > 0
+                else None
+            ),
+            worker_pool=(
+                get_ui_worker_pool(settings)
+                if not settings.ui_stub and settings.ui_worker_processes > 0
+                else None
+            ),
+            coalesce_prompts=settings.ui_coalesce_prompts,
+            journal=journal,
         )
-    slack = SlackReporter(bot_token=settings.slack_bot_token, channel_id=settings.slack_channel_id)
-
-    # 1. Incident detection
-    stream = get_incident_stream(
-        incident_type=incident_type,
-        incident_id=DEMO_INCIDENT_ID if demo else None,
+        if not settings.ui_stub and settings.dashboard_api_enabled:
+            ui_agent = DashboardAPIExecutor(
+                settings.operations_dashboard_url,
+                fallback=ui_agent,
+                timeout_seconds=settings.dashboard_api_timeout_seconds,
+                retry_policy=RetryPolicy.from_settings(settings),
+                dag=dag,
+                journal=journal,
+            )
+    slack = SlackReporter(
+        bot_token=settings.slack_bot_token,
+        channel_id=settings.slack_channel_id,
+        retry_policy=RetryPolicy.from_settings(settings),
     )
-    incident = next(stream, None)
-    if not incident:
-        logger.warning("No incident received")
-        return False
+    return WorkflowComponents(
+        log_store=log_store,
+        reasoning=reasoning,
+        planner=planner,
+        monitor=monitor,
+        slack=slack,
+        aws_executor=aws_executor,
+        ui_agent=ui_agent,
+        similarity_index=similarity_index,
+    )
+
+
+@contextmanager
+def _timed_stage(stage_timings: dict[str, float] | None, stage: str):
+    """Record wall time of a pipeline stage into stage_timings (when provided)."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        if stage_timings is not None:
+            stage_timings[stage] = time.perf_counter() - start
+
 
+def _record_outcome(
+    components: WorkflowComponents,
+    incident: IncidentEvent,
+    diagnosis: Diagnosis,
+    logs: str,
+    recovered: bool,
+    recovery_seconds: float,
+) -> None:
+    """Store the remediation outcome and make it retrievable for later incidents."""
     try:
-        log_store.record_incident(incident)
+        outcome = components.log_store.record_outcome(
+            incident,
+            diagnosis,
+            recovered=recovered,
+            recovery_seconds=recovery_seconds,
+            log_templates=log_templates(logs),
+        )
+        if components.similarity_index is not None:
+            components.similarity_index.add(outcome)
     except Exception as e:
-        logger.warning("Failed to record incident: %s", e, exc_info=True)
+        logger.warning("Failed to record incident outcome: %s", e, exc_info=True)
+
+
+def run_once(
+    incident_type: IncidentType | None = None,
+    demo: bool = False,
+) -> bool:
+    """
+    Run one full cycle: detect one incident, diagnose, act, verify, report.
+
+    For demo pass incident_type=IncidentType.LATENCY_SPIKE and demo=True for
+    deterministic incident id (inc-demo0001).
+    Returns True if the cycle completed successfully (recovered). On escalation,
+    UI failure, or verification failure still publishes a post-mortem when possible.
+    """
+    settings = get_settings()
+    components = build_components(settings)
+    try:
+        # 1. Incident detection
+        stream = get_incident_stream(
+            incident_type=incident_type,
+            incident_id=DEMO_INCIDENT_ID if demo else None,
+        )
+        incident = next(stream, None)
+        if not incident:
+            logger.warning("No incident received")
+            return False
+        return run_incident(incident, components, settings=settings)
+    finally:
+        # The process exits after one cycle; stop the browsers it opened
+        close_session_pool()
+        close_ui_worker_pool()
+
+
+def run_incident(
+    incident: IncidentEvent,
+    components: WorkflowComponents,
+    settings: Settings | None = None,
+    stage_timings: dict[str, float] | None = None,
+) -> bool:
+    """
+    Run the pipeline (store → analyze → plan → act → verify → report) for one incident.
+
+    When stage_timings is given, wall time per stage (seconds) is written into it
+    under the keys store, analyze, plan, execute, verify and report, plus
+    first_action: time from the start of analysis until the recommended action
+    was known (earlier than analyze when the reasoning agent streams).
+    Returns True if the service recovered.
+    """
+    settings = settings or get_settings()
+    log_store = components.log_store
+    reasoning = components.reasoning
+    planner = components.planner
+    monitor = components.monitor
+    slack = components.slack
+    use_aws = components.aws_executor is not None
+
+    with _timed_stage(stage_timings, "store"):
+        try:
+            log_store.record_incident(incident)
+        except Exception as e:
+            logger.warning("Failed to record incident: %s", e, exc_info=True)
 
-    # 2. Root cause analysis (Nova), with retries
-    if use_aws:
-        logs = get_logs_for_incident_cloudwatch(incident)
-        if not logs:
+        if use_aws:
+            # Rollback targets are resolved from this index; warm it during analysis
+            components.aws_executor.prefetch(incident.service_name)
+            logs = get_logs_for_incident_cloudwatch(incident)
+            if not logs:
+                logs = log_store.get_logs_for_incident(incident)
+        else:
             logs = log_store.get_logs_for_incident(incident)
-    else:
-        logs = log_store.get_logs_for_incident(incident)
-    deployment_history = log_store.get_deployment_history(incident.service_name)
-    diagnosis: Diagnosis = FALLBACK_DIAGNOSIS
-    max_attempts = 1 + max(0, settings.reasoning_max_retries)
-    for attempt in range(max_attempts):
+        deployment_history = log_store.get_deployment_history(incident.service_name)
+
+    # 2. Root cause analysis (Nova). Throttled/timed-out model calls are retried with
+    # backoff inside the agent, which falls back to escalation when they keep failing.
+    # With a streaming reasoning agent the recommended action arrives before the full
+    # diagnosis, and is planned right away.
+    analyze_start = time.perf_counter()
+    early: dict = {}
+
+    def on_partial(field: str, value) -> None:
+        if field != "recommended_action" or "action" in early:
+            return
+        if stage_timings is not None:
+            stage_timings["first_action"] = time.perf_counter() - analyze_start
         try:
-            result = reasoning.analyze(incident, logs, deployment_history)
-            if result is not None:
-                diagnosis = result
-                break
+            action = RecommendedAction(str(value).strip().lower())
+        except ValueError:
+            return
+        early["action"] = action
+        logger.info("Early recommended action for %s: %s", incident.incident_id, action.value)
+        provisional = Diagnosis(summary="(streaming)", confidence=0.0, recommended_action=action)
+        early["actions"] = planner.plan(provisional, incident, deployment_history)
+
+    with _timed_stage(stage_timings, "analyze"):
+        try:
+            diagnosis = (
+                reasoning.analyze(incident, logs, deployment_history, on_partial=on_partial)
+                or FALLBACK_DIAGNOSIS
+            )
         except Exception as e:
-            logger.warning("Reasoning attempt %s failed: %s", attempt + 1, e, exc_info=True)
-            if attempt == max_attempts - 1:
-                diagnosis = FALLBACK_DIAGNOSIS
+            logger.warning("Reasoning failed: %s", e, exc_info=True)
+            diagnosis = FALLBACK_DIAGNOSIS
+    if stage_timings is not None:
+        stage_timings.setdefault("first_action", time.perf_counter() - analyze_start)
 
-    # 3. Plan actions
-    actions = planner.plan(diagnosis)
+    # 3. Plan actions (reuse the plan made from the streamed action when it still holds)
+    with _timed_stage(stage_timings, "plan"):
+        if early.get("action") == diagnosis.recommended_action and "actions" in early:
+            actions = early["actions"]
+        else:
+            actions = planner.plan(diagnosis, incident, deployment_history)
     if not actions:
         logger.info("No actions (e.g. escalate); publishing escalation report")
-        report = _build_report(
-            incident.incident_id,
-            incident.detected_at.isoformat(),
-            diagnosis,
-            0.0,
-            RecoveryStatus.UNKNOWN,
-            extra_timeline=["Escalated; no automated action taken."],
-        )
-        _publish_report(slack, report)
+        with _timed_stage(stage_timings, "report"):
+            report = _build_report(
+                incident.incident_id,
+                incident.detected_at.isoformat(),
+                diagnosis,
+                0.0,
+                RecoveryStatus.UNKNOWN,
+                extra_timeline=["Escalated; no automated action taken."],
+            )
+            _publish_report(slack, report)
         return False
 
     # 4. Execute actions (AWS executor or UI automation)
     action_start_time = time.monotonic()
-    if use_aws:
-        success = aws_executor.execute(actions, service_name=incident.service_name)
-    else:
-        success = ui_agent.execute(actions, service_name=incident.service_name)
+    with _timed_stage(stage_timings, "execute"):
+        if use_aws:
+            executor = components.aws_executor
+        else:
+            executor = components.ui_agent
+        success = executor.execute(
+            actions, service_name=incident.service_name, incident_id=incident.incident_id
+        )
     if not success:
         logger.warning("Action execution failed; publishing report")
-        report = _build_report(
-            incident.incident_id,
-            incident.detected_at.isoformat(),
-            diagnosis,
-            0.0,
-            RecoveryStatus.NOT_RECOVERED,
-            extra_timeline=["Action execution failed (UI or AWS)."],
-        )
-        _publish_report(slack, report)
+        with _timed_stage(stage_timings, "report"):
+            report = _build_report(
+                incident.incident_id,
+                incident.detected_at.isoformat(),
+                diagnosis,
+                0.0,
+                RecoveryStatus.NOT_RECOVERED,
+                extra_timeline=["Action execution failed (UI or AWS)."],
+            )
+            _publish_report(slack, report)
+        _record_outcome(components, incident, diagnosis, logs, False, 0.0)
         return False
 
     # 5. Recovery verification
     timeout = settings.recovery_verify_timeout_seconds
     recovery_seconds: float = 0.0
-    try:
-        status = monitor.verify(
-            incident.incident_id,
-            incident.service_name,
-            timeout_seconds=timeout,
-            action_start_time=action_start_time,
-        )
-        recovery_seconds = monitor.get_recovery_time_seconds()
-    except Exception as e:
-        logger.warning("Recovery verification failed: %s", e, exc_info=True)
-        status = RecoveryStatus.NOT_RECOVERED
-        recovery_seconds = timeout
-
-    # 6. Post-mortem to Slack
-    report = _build_report(
-        incident.incident_id,
-        incident.detected_at.isoformat(),
+    with _timed_stage(stage_timings, "verify"):
+        try:
+            status = monitor.verify(
+                incident.incident_id,
+                incident.service_name,
+                timeout_seconds=timeout,
+                action_start_time=action_start_time,
+            )
+            recovery_seconds = monitor.get_recovery_time_seconds()
+        except Exception as e:
+            logger.warning("Recovery verification failed: %s", e, exc_info=True)
+            status = RecoveryStatus.NOT_RECOVERED
+            recovery_seconds = timeout
+    _record_outcome(
+        components,
+        incident,
         diagnosis,
+        logs,
+        status == RecoveryStatus.RECOVERED,
         recovery_seconds,
-        status,
     )
-    _publish_report(slack, report)
+
+    # 6. Post-mortem to Slack
+    with _timed_stage(stage_timings, "report"):
+        report = _build_report(
+            incident.incident_id,
+            incident.detected_at.isoformat(),
+            diagnosis,
+            recovery_seconds,
+            status,
+        )
+        _publish_report(slack, report)
 
     return status == RecoveryStatus.RECOVERED
 
@@ -252,6 +457,7 @@ def run_demo() -> bool:
 
     try:
         import httpx
+
         settings = get_settings()
         url = settings.operations_dashboard_url.rstrip("/") + "/api/health"
         httpx.get(url, timeout=2.0)
@@ -0,0 +1,89 @@
+"""Tests for the pre-warmed, gradual Lambda alias shift."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from autosre.remediation.alias_shift import GradualAliasShift
+
+
+def _routing(client: MagicMock) -> list[tuple[str, dict]]:
+    return [
+        (c.kwargs["FunctionVersion"], c.kwargs["RoutingConfig"]["AdditionalVersionWeights"])
+        for c in client.update_alias.call_args_list
+    ]
+
+
+def _metrics(errors: list[float], throttles: list[float]) -> dict:
+    return {
+        "MetricDataResults": [
+            {"Id": "errors", "Values": errors},
+            {"Id": "throttles", "Values": throttles},
+        ]
+    }
+
+
+def test_prewarms_then_shifts_in_weighted_steps_and_finalizes():
+    client = MagicMock()
+    client.invoke.return_value = {"StatusCode": 200}
+    cloudwatch = MagicMock()
+    cloudwatch.get_metric_data.return_value = _metrics([0.0], [])
+    sleeps: list[float] = []
+    shift = GradualAliasShift(
+        client,
+        cloudwatch=cloudwatch,
+        weights=(0.5, 0.1),
+        step_seconds=7,
+        warm_invocations=3,
+        sleep=sleeps.append,
+    )
+    assert shift.run("fn", "live", current="12", target="11") is True
+    # Only the 3 warm-up invocations hit the function; health comes from metrics
+    assert client.invoke.call_count == 3
+    assert {c.kwargs["Qualifier"] for c in client.invoke.call_args_list} == {"11"}
+    assert _routing(client) == [("12", {"11": 0.1}), ("12", {"11": 0.5}), ("11", {})]
+    assert sleeps == [7, 7]
+    assert cloudwatch.get_metric_data.call_count == 2
+    queries = cloudwatch.get_metric_data.call_args.kwargs["MetricDataQueries"]
+    assert [q["MetricStat"]["Metric"]["MetricName"] for q in queries] == ["Errors", "Throttles"]
+    assert queries[0]["MetricStat"]["Metric"]["Dimensions"] == [
+        {"Name": "FunctionName", "Value": "fn"},
+        {"Name": "Resource", "Value": "fn:live"},
+        {"Name": "ExecutedVersion", "Value": "11"},
+    ]
+
+
+def test_target_errors_or_throttles_in_the_step_restore_the_original_version():
+    for errors, throttles in (([0.0, 2.0], []), ([], [1.0])):
+        client = MagicMock()
+        cloudwatch = MagicMock()
+        cloudwatch.get_metric_data.return_value = _metrics(errors, throttles)
+        shift = GradualAliasShift(
+            client, cloudwatch=cloudwatch, warm_invocations=0, sleep=lambda s: None
+        )
+        assert shift.run("fn", "live", current="12", target="11") is False
+        assert _routing(client) == [("12", {"11": 0.1}), ("12", {})]
+
+
+def test_needs_a_metrics_client_or_a_health_check():
+    with pytest.raises(ValueError):
+        GradualAliasShift(MagicMock())
+
+
+def test_unhealthy_target_restores_the_original_version():
+    client = MagicMock()
+    health = MagicMock(side_effect=[True, False])
+    shift = GradualAliasShift(client, warm_invocations=0, health_check=health, sleep=lambda s: None)
+    assert shift.run("fn", "live", current="12", target="11") is False
+    assert _routing(client) == [("12", {"11": 0.1}), ("12", {"11": 0.5}), ("12", {})]
+    client.invoke.assert_not_called()
+
+
+def test_latest_alias_is_switched_directly_after_prewarm():
+    client = MagicMock()
+    client.invoke.return_value = {"FunctionError": "Unhandled"}  # warm-up errors are tolerated
+    shift = GradualAliasShift(
+        client, cloudwatch=MagicMock(), warm_invocations=2, sleep=lambda s: None
+    )
+    assert shift.run("fn", "live", current="$LATEST", target="7") is True
+    assert _routing(client) == [("7", {})]
@@ -0,0 +1,219 @@
+"""Tests for restart, scale and pool-reset actions on AWS resources."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from autosre.aws_clients import ClientCache
+from autosre.models import PlannedAction
+from autosre.remediation.aws_actions import AwsResource, AwsResourceActions
+
+ECS_EAST = "arn:aws:ecs:us-east-1:123456789012:service/prod/checkout"
+ECS_WEST = "arn:aws:ecs:us-west-2:123456789012:service/prod/checkout"
+LAMBDA = "arn:aws:lambda:us-east-1:123456789012:function:checkout-fn"
+RDS = "arn:aws:rds:us-east-1:123456789012:db:checkout-db"
+
+
+def _steady(desired: int = 2) -> dict:
+    return {
+        "services": [
+            {
+                "deployments": [{"rolloutState": "COMPLETED"}],
+                "runningCount": desired,
+                "desiredCount": desired,
+            }
+        ]
+    }
+
+
+def _rolling() -> dict:
+    return {
+        "services": [
+            {
+                "deployments": [{"rolloutState": "IN_PROGRESS"}, {"rolloutState": "COMPLETED"}],
+                "runningCount": 1,
+                "desiredCount": 2,
+            }
+        ]
+    }
+
+
+def _actions(clients: ClientCache, sleeps: list[float] | None = None) -> AwsResourceActions:
+    return AwsResourceActions(
+        clients,
+        lambda_alias_name="live",
+        poll_seconds=5,
+        sleep=(sleeps.append if sleeps is not None else lambda s: None),
+    )
+
+
+def test_from_arn_parses_supported_resources():
+    assert AwsResource.from_arn(ECS_EAST) == AwsResource("ecs", "us-east-1", "checkout", "prod")
+    assert AwsResource.from_arn(
+        "arn:aws:ecs:us-east-1:123456789012:service/checkout"
+    ) == AwsResource("ecs", "us-east-1", "checkout", "default")
+    assert AwsResource.from_arn(LAMBDA) == AwsResource("lambda", "us-east-1", "checkout-fn")
+    assert AwsResource.from_arn(LAMBDA + ":live").name == "checkout-fn"
+    assert AwsResource.from_arn(RDS) == AwsResource("rds", "us-east-1", "checkout-db")
+    with pytest.raises(ValueError):
+        AwsResource.from_arn("arn:aws:s3:::bucket")
+    with pytest.raises(ValueError):
+        AwsResource.from_arn("checkout")
+
+
+@patch("autosre.aws_clients.get_client")
+def test_restart_fans_out_with_one_client_per_region(mock_get_client):
+    east, west = MagicMock(), MagicMock()
+    mock_get_client.side_effect = lambda service, region, sdk_retries: {
+        "us-east-1": east,
+        "us-west-2": west,
+    }[region]
+    east.describe_services.side_effect = [_rolling(), _steady()]
+    west.describe_services.return_value = _steady()
+    sleeps: list[float] = []
+    resources = [AwsResource.from_arn(ECS_EAST), AwsResource.from_arn(ECS_WEST)]
+
+    assert _actions(ClientCache(), sleeps).run("restart_instance", resources, {}) is True
+    # Each region's client is built once, then shared by the update and the polls
+    assert mock_get_client.call_count == 2
+    east.update_service.assert_called_once_with(
+        cluster="prod", service="checkout", forceNewDeployment=True
+    )
+    west.update_service.assert_called_once()
+    assert east.describe_services.call_count == 2
+    assert sleeps == [5]
+
+
+@patch("autosre.aws_clients.get_client")
+def test_failed_rollout_and_wait_timeout_fail_the_action(mock_get_client):
+    client = mock_get_client.return_value
+    client.describe_services.return_value = {
+        "services": [{"deployments": [{"rolloutState": "FAILED"}]}]
+    }
+    resources = [AwsResource.from_arn(ECS_EAST)]
+    assert _actions(ClientCache()).run("scale_replicas", resources, {"replicas": 4}) is False
+    client.update_service.assert_called_once_with(
+        cluster="prod", service="checkout", desiredCount=4
+    )
+
+    client.describe_services.return_value = _rolling()
+    clock = iter(range(0, 1000, 100))
+    actions = AwsResourceActions(
+        ClientCache(), wait_timeout_seconds=240, sleep=lambda s: None, clock=lambda: next(clock)
+    )
+    assert actions.run("restart_instance", resources, {}) is False
+
+
+@patch("autosre.aws_clients.get_client")
+def test_lambda_scale_sets_provisioned_concurrency_on_the_alias(mock_get_client):
+    client = mock_get_client.return_value
+    client.get_provisioned_concurrency_config.side_effect = [
+        {"Status": "IN_PROGRESS"},
+        {"Status": "READY"},
+    ]
+    resources = [AwsResource.from_arn(LAMBDA)]
+    assert _actions(ClientCache()).run("scale_replicas", resources, {"replicas": 3}) is True
+    client.put_provisioned_concurrency_config.assert_called_once_with(
+        FunctionName="checkout-fn", Qualifier="live", ProvisionedConcurrentExecutions=3
+    )
+
+
+def _lambda_config(**extra) -> dict:
+    return {
+        "Environment": {"Variables": {"DB_HOST": "db"}},
+        "LastUpdateStatus": "Successful",
+        "State": "Active",
+        "CodeSha256": "abc",
+        **extra,
+    }
+
+
+@patch("autosre.aws_clients.get_client")
+def test_lambda_restart_publishes_a_version_and_moves_the_alias(mock_get_client):
+    client = mock_get_client.return_value
+    client.get_alias.return_value = {"FunctionVersion": "7"}
+    client.get_function_configuration.return_value = _lambda_config()
+    client.publish_version.return_value = {"Version": "8"}
+    resources = [AwsResource.from_arn(LAMBDA)]
+    assert _actions(ClientCache()).run("restart_instance", resources, {}) is True
+    variables = client.update_function_configuration.call_args.kwargs["Environment"]["Variables"]
+    assert variables["DB_HOST"] == "db"
+    assert "AUTOSRE_RESTARTED_AT" in variables
+    client.publish_version.assert_called_once_with(
+        FunctionName="checkout-fn", CodeSha256="abc", Description="autosre restart of version 7"
+    )
+    client.update_alias.assert_called_once_with(
+        FunctionName="checkout-fn", Name="live", FunctionVersion="8"
+    )
+
+
+@patch("autosre.aws_clients.get_client")
+def test_lambda_restart_never_deploys_other_code_to_the_alias(mock_get_client):
+    client = mock_get_client.return_value
+    client.get_alias.return_value = {"FunctionVersion": "6"}  # e.g. after a rollback
+    client.get_function_configuration.side_effect = lambda **kw: _lambda_config(
+        CodeSha256="old" if kw.get("Qualifier") == "6" else "abc"
+    )
+    resources = [AwsResource.from_arn(LAMBDA)]
+    assert _actions(ClientCache()).run("restart_instance", resources, {}) is False
+    client.update_function_configuration.assert_not_called()
+    client.publish_version.assert_not_called()
+
+    # An alias on $LATEST gets the new environments from the configuration bump alone
+    client.get_alias.return_value = {"FunctionVersion": "$LATEST"}
+    assert _actions(ClientCache()).run("restart_instance", resources, {}) is True
+    client.publish_version.assert_not_called()
+    client.update_alias.assert_not_called()
+
+
+@patch("autosre.aws_clients.get_client")
+def test_pool_reset_reboots_rds_only_when_allowed(mock_get_client):
+    client = mock_get_client.return_value
+    client.get_alias.return_value = {"FunctionVersion": "$LATEST"}
+    client.get_function_configuration.return_value = _lambda_config()
+    client.describe_db_instances.return_value = {"DBInstances": [{"DBInstanceStatus": "available"}]}
+    resources = [AwsResource.from_arn(LAMBDA), AwsResource.from_arn(RDS)]
+    assert _actions(ClientCache()).run("restart_pool", resources, {}) is True
+    client.update_function_configuration.assert_called_once()
+    client.reboot_db_instance.assert_not_called()
+    assert _actions(ClientCache()).run("restart_pool", [AwsResource.from_arn(RDS)], {}) is False
+
+    allowed = AwsResourceActions(ClientCache(), allow_db_reboot=True, sleep=lambda s: None)
+    assert allowed.run("restart_pool", [AwsResource.from_arn(RDS)], {}) is True
+    client.reboot_db_instance.assert_called_once_with(DBInstanceIdentifier="checkout-db")
+
+
+@patch("autosre.aws_clients.get_client")
+def test_unsupported_resources_are_skipped(mock_get_client):
+    client = mock_get_client.return_value
+    client.describe_services.return_value = _steady()
+    actions = _actions(ClientCache())
+    rds = AwsResource.from_arn(RDS)
+    assert actions.run("scale_replicas", [rds], {"replicas": 2}) is False
+    assert actions.run("scale_replicas", [rds, AwsResource.from_arn(ECS_EAST)], {"replicas": 2})
+    client.reboot_db_instance.assert_not_called()
+
+
+@patch("autosre.remediation.aws_executor.get_settings")
+def test_executor_resolves_resources_per_service(mock_settings):
+    from autosre.remediation.aws_executor import AWSExecutor
+
+    settings = mock_settings.return_value
+    settings.lambda_alias_name = "live"
+    settings.lambda_function_name = "fallback-fn"
+    settings.aws_region = "us-east-1"
+    settings.aws_remediation_resources = {"checkout": [ECS_EAST, RDS]}
+    settings.aws_allow_db_reboot = False
+    settings.remediation_max_parallel = 2
+    settings.remediation_step_timeout_seconds = 0
+    executor = AWSExecutor(versions=MagicMock())
+
+    restart = PlannedAction(action_type="restart_instance", target="service", parameters={})
+    assert [r.service for r in executor.resources(restart, "checkout")] == ["ecs", "rds"]
+    assert executor.resources(restart, "other") == [
+        AwsResource("lambda", "us-east-1", "fallback-fn")
+    ]
+    explicit = PlannedAction(
+        action_type="restart_instance", target="service", parameters={"resources": [LAMBDA]}
+    )
+    assert executor.resources(explicit, "checkout") == [AwsResource.from_arn(LAMBDA)]
@@ -0,0 +1,54 @@
+"""Tests for the benchmark runner (tiny sizes, no timing assertions)."""
+
+import benchmarks.pipeline  # noqa: F401
+from benchmarks.run import main
+from benchmarks.runner import BenchmarkResult, BenchmarkRun, compare, parse_size, run_benchmarks
+
+
+def _result(name: str, median: float, size: int | None = None) -> BenchmarkResult:
+    return BenchmarkResult(
+        name=name,
+        size=size,
+        rounds=1,
+        min_seconds=median,
+        median_seconds=median,
+        mean_seconds=median,
+        max_seconds=median,
+    )
+
+
+def test_parse_size():
+    assert parse_size("10k") == 10_000
+    assert parse_size("1M") == 1_000_000
+    assert parse_size("10m") == 10_000_000
+    assert parse_size("250") == 250
+
+
+def test_run_benchmarks_sized_cases_run_per_size():
+    run = run_benchmarks([50, 100], rounds=1, name_filter="log_store")
+    keys = [run.key(r) for r in run.results]
+    assert keys == [
+        "log_store.ingest[50]",
+        "log_store.ingest[100]",
+        "log_store.query[50]",
+        "log_store.query[100]",
+    ]
+    assert all(r.items_per_second for r in run.results)
+
+
+def test_compare_flags_only_slowdowns_beyond_tolerance():
+    baseline = BenchmarkRun(results=[_result("a", 1.0), _result("b", 1.0), _result("c", 1.0, 10)])
+    current = BenchmarkRun(
+        results=[_result("a", 1.2), _result("b", 2.0), _result("c", 0.5, 10), _result("d", 9.0)]
+    )
+    regressions = compare(current, baseline, tolerance=0.25)
+    assert [r.case for r in regressions] == ["b"]
+    assert regressions[0].ratio == 2.0
+
+
+def test_main_writes_json_and_passes_against_itself(tmp_path):
+    out = tmp_path / "results.json"
+    assert main(["--sizes", "20", "--rounds", "1", "--filter", "planner", "--json", str(out)]) == 0
+    run = BenchmarkRun.model_validate_json(out.read_text(encoding="utf-8"))
+    assert [r.name for r in run.results] == ["planner.plan"]
+    assert main(["--rounds", "1", "--filter", "slack", "--baseline", str(out)]) == 0
@@ -0,0 +1,148 @@
+"""Tests for the AWS record/playback cassette layer."""
+
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from botocore.exceptions import ClientError
+
+from autosre.aws_clients import get_client
+from autosre.cassette import PLAYBACK, RECORD, Cassette, CassetteMissError, use_cassette
+
+
+class _FakeHTTPResponse:
+    def __init__(self, status_code: int = 200) -> None:
+        self.status_code = status_code
+        self.headers = {}
+        self.content = b""
+
+
+def _fake_aws(client, responses):
+    """Answer calls from a list of (status, parsed) tuples, like the real endpoint would."""
+    queue = list(responses)
+
+    def respond(**kwargs):
+        status, parsed = queue.pop(0)
+        return _FakeHTTPResponse(status), parsed
+
+    client.meta.events.register("before-call", respond)
+    return client
+
+
+def _record(path: Path, service: str, responses, calls):
+    with use_cassette(path, mode=RECORD):
+        client = _fake_aws(get_client(service, region_name="us-east-1"), responses)
+        results = []
+        for name, kwargs in calls:
+            try:
+                results.append(getattr(client, name)(**kwargs))
+            except ClientError as e:
+                results.append(e)
+    return results
+
+
+def test_record_and_playback_paginated_filter_log_events():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "logs.jsonl.gz"
+        _record(
+            path,
+            "logs",
+            [
+                (200, {"events": [{"timestamp": 1, "message": "a"}], "nextToken": "t1"}),
+                (200, {"events": [{"timestamp": 2, "message": "b"}]}),
+            ],
+            [
+                ("filter_log_events", {"logGroupName": "/aws/lambda/fn"}),
+                ("filter_log_events", {"logGroupName": "/aws/lambda/fn", "nextToken": "t1"}),
+            ],
+        )
+        assert path.is_file()
+
+        with use_cassette(path, mode=PLAYBACK, latency_scale=0.0):
+            client = get_client("logs", region_name="us-east-1")
+            second = client.filter_log_events(logGroupName="/aws/lambda/fn", nextToken="t1")
+            first = client.filter_log_events(logGroupName="/aws/lambda/fn")
+    assert first["events"][0]["message"] == "a"
+    assert first["nextToken"] == "t1"
+    assert second["events"][0]["message"] == "b"
+
+
+def test_playback_restores_datetimes_and_repeats_last_response():
+    updated = datetime(2025, 2, 11, 12, 0, 0)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "cw.jsonl.gz"
+        _record(
+            path,
+            "cloudwatch",
+            [(200, {"MetricAlarms": [{"AlarmName": "a", "StateUpdatedTimestamp": updated}]})],
+            [("describe_alarms", {"StateValue": "ALARM"})],
+        )
+        with use_cassette(path, mode=PLAYBACK, latency_scale=0.0):
+            client = get_client("cloudwatch", region_name="us-east-1")
+            for _ in range(3):
+                response = client.describe_alarms(StateValue="ALARM")
+                assert response["MetricAlarms"][0]["StateUpdatedTimestamp"] == updated
+
+
+def test_playback_raises_recorded_modeled_error():
+    error = {"Error": {"Code": "ResourceNotFoundException", "Message": "no alias"}}
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "lambda.jsonl.gz"
+        _record(
+            path, "lambda", [(404, error)], [("get_alias", {"FunctionName": "f", "Name": "live"})]
+        )
+        with use_cassette(path, mode=PLAYBACK, latency_scale=0.0):
+            client = get_client("lambda", region_name="us-east-1")
+            with pytest.raises(client.exceptions.ResourceNotFoundException):
+                client.get_alias(FunctionName="f", Name="live")
+
+
+def test_playback_applies_scaled_recorded_latency():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "cw.jsonl.gz"
+        _record(path, "cloudwatch", [(200, {"MetricAlarms": []})], [("describe_alarms", {})])
+        cassette = Cassette(path, mode=PLAYBACK)
+        cassette._interactions[0]["duration"] = 0.5
+        cassette.latency_scale = 2.0
+        client = cassette.attach(get_client("cloudwatch", region_name="us-east-1"))
+        with patch("autosre.cassette.time.sleep") as mock_sleep:
+            client.describe_alarms()
+    mock_sleep.assert_called_once_with(1.0)
+
+
+def test_playback_miss_raises():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "cw.jsonl.gz"
+        _record(path, "cloudwatch", [(200, {"MetricAlarms": []})], [("describe_alarms", {})])
+        with use_cassette(path, mode=PLAYBACK, latency_scale=0.0):
+            client = get_client("logs", region_name="us-east-1")
+            with pytest.raises(CassetteMissError):
+                client.filter_log_events(logGroupName="g")
+
+
+def test_record_and_playback_converse_stream_events():
+    events = [
+        {"messageStart": {"role": "assistant"}},
+        {"contentBlockDelta": {"delta": {"text": '{"summary": "x"'}, "contentBlockIndex": 0}},
+        {"messageStop": {"stopReason": "end_turn"}},
+    ]
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "bedrock.jsonl.gz"
+        with use_cassette(path, mode=RECORD):
+            client = _fake_aws(
+                get_client("bedrock-runtime", region_name="us-east-1"),
+                [(200, {"stream": iter(events)})],
+            )
+            response = client.converse_stream(
+                modelId="m", messages=[{"role": "user", "content": [{"text": "hi"}]}]
+            )
+            assert list(response["stream"]) == events
+
+        with use_cassette(path, mode=PLAYBACK, latency_scale=0.0):
+            client = get_client("bedrock-runtime", region_name="us-east-1")
+            response = client.converse_stream(
+                modelId="m", messages=[{"role": "user", "content": [{"text": "hi"}]}]
+            )
+            assert list(response["stream"]) == events
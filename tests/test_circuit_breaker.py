@@ -0,0 +1,139 @@
+"""Tests for the Bedrock circuit breaker and degraded-mode diagnoses."""
+
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+from autosre.models import Diagnosis, IncidentEvent, IncidentType, RecommendedAction
+from autosre.reasoning_agent import CircuitBreaker, DiagnosisCache, ReasoningAgent
+from autosre.reasoning_agent.breaker import BreakerState
+from autosre.reasoning_agent.cache import incident_fingerprint
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _ClientError(Exception):
+    """Shaped like botocore.exceptions.ClientError."""
+
+    def __init__(self, code: str, status: int = 400):
+        super().__init__(f"An error occurred ({code})")
+        self.response = {"Error": {"Code": code}, "ResponseMetadata": {"HTTPStatusCode": status}}
+
+
+def _incident() -> IncidentEvent:
+    return IncidentEvent(
+        incident_id="inc-breaker",
+        incident_type=IncidentType.LATENCY_SPIKE,
+        service_name="checkout",
+        detected_at=datetime(2025, 2, 11, 12, 0, 0),
+    )
+
+
+def test_opens_on_failures_and_half_opens_with_a_single_probe():
+    clock = _Clock()
+    breaker = CircuitBreaker(failure_threshold=3, window=10, open_seconds=30, clock=clock)
+    for _ in range(3):
+        permit = breaker.allow()
+        assert permit
+        breaker.record(permit, False, 1.0)
+    assert breaker.state == BreakerState.OPEN
+    assert not breaker.allow()
+
+    clock.now = 31.0
+    probe = breaker.allow()
+    assert probe
+    assert not breaker.allow()  # only one probe at a time
+    breaker.record(probe, False, 1.0)
+    assert breaker.state == BreakerState.OPEN
+
+    clock.now = 62.0
+    probe = breaker.allow()
+    assert probe
+    breaker.record(probe, True, 1.0)
+    assert breaker.state == BreakerState.CLOSED
+    assert breaker.stats()["times_opened"] == 2
+
+
+def test_a_late_pre_open_call_does_not_decide_the_probe():
+    clock = _Clock()
+    breaker = CircuitBreaker(failure_threshold=2, window=10, open_seconds=30, clock=clock)
+    slow = breaker.allow()  # admitted while closed, finishes long after
+    for _ in range(2):
+        breaker.record(breaker.allow(), False, 1.0)
+    assert breaker.state == BreakerState.OPEN
+
+    clock.now = 31.0
+    probe = breaker.allow()
+    breaker.record(slow, True, 1.0)  # lands during half-open: ignored
+    assert breaker.state == BreakerState.HALF_OPEN
+    assert not breaker.allow()  # the probe is still in flight
+    breaker.record(probe, False, 1.0)
+    assert breaker.state == BreakerState.OPEN
+
+    clock.now = 62.0
+    probe = breaker.allow()
+    breaker.record(probe, True, 1.0)
+    assert breaker.state == BreakerState.CLOSED
+    breaker.record(slow, False, 120.0)  # from before the circuit opened: not counted
+    assert breaker.stats()["calls"] == 0
+
+
+def test_opens_when_p95_latency_is_too_high():
+    breaker = CircuitBreaker(failure_threshold=5, slow_call_seconds=10.0, min_calls=5)
+    for latency in (1.0, 1.0, 1.0, 1.0):
+        breaker.record(breaker.allow(), True, latency)
+    assert breaker.state == BreakerState.CLOSED
+    breaker.record(breaker.allow(), True, 45.0)
+    assert breaker.state == BreakerState.OPEN
+    assert breaker.stats()["p95_seconds"] == 45.0
+
+
+@patch("autosre.reasoning_agent.agent._get_bedrock_client")
+def test_open_circuit_skips_bedrock_and_uses_stale_cache(mock_get_client):
+    mock_get_client.return_value = MagicMock(
+        converse=MagicMock(side_effect=_ClientError("ModelTimeoutException", 408))
+    )
+    breaker = CircuitBreaker(failure_threshold=1, open_seconds=60)
+    cache = DiagnosisCache(ttl_seconds=0.0)
+    agent = ReasoningAgent(use_bedrock=True, escalation_model_id="", cache=cache, breaker=breaker)
+
+    # Provider failure opens the circuit; the agent falls back to escalation
+    first = agent.analyze(_incident(), "ERROR upstream timeout", [])
+    assert first.recommended_action == RecommendedAction.ESCALATE
+    assert breaker.state == BreakerState.OPEN
+
+    # An (already expired) cached diagnosis for the same incident is used in degraded mode
+    fingerprint = incident_fingerprint(_incident(), "ERROR upstream timeout", [])
+    cache.put(
+        fingerprint,
+        Diagnosis(summary="Pool", confidence=0.8, recommended_action=RecommendedAction.SCALE_UP),
+    )
+    mock_get_client.reset_mock()
+    degraded = agent.analyze(_incident(), "ERROR upstream timeout", [])
+    assert degraded.recommended_action == RecommendedAction.SCALE_UP
+    assert degraded.metadata["degraded"] == "stale_cache"
+    mock_get_client.assert_not_called()
+
+    other = agent.analyze(_incident(), "ERROR something else", [])
+    assert other.metadata["degraded"] == "fallback"
+
+
+@patch("autosre.reasoning_agent.agent._get_bedrock_client")
+def test_local_errors_do_not_count_against_the_provider(mock_get_client):
+    breaker = CircuitBreaker(failure_threshold=1, open_seconds=60)
+    agent = ReasoningAgent(use_bedrock=True, escalation_model_id="", breaker=breaker)
+
+    # Client configuration error before any request is sent
+    mock_get_client.side_effect = ValueError("no region configured")
+    assert agent.analyze(_incident(), "logs", []).recommended_action == RecommendedAction.ESCALATE
+    # Unclassified error from the call (e.g. a bug, or the rate limiter giving up)
+    mock_get_client.side_effect = None
+    mock_get_client.return_value = MagicMock(converse=MagicMock(side_effect=KeyError("text")))
+    agent.analyze(_incident(), "logs", [])
+    assert breaker.state == BreakerState.CLOSED
+    assert breaker.stats()["calls"] == 0
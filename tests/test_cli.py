@@ -0,0 +1,43 @@
+"""Tests for the CLI entry point and its startup cost."""
+
+import json
+from datetime import datetime
+from unittest.mock import patch
+
+from autosre.cli import INCIDENT_TYPES, main
+from autosre.log_storage import LogStore
+from autosre.models import IncidentEvent, IncidentType
+from benchmarks.startup import heavy_imports, import_profile, module_import_ms
+
+
+def test_incident_type_choices_match_model():
+    assert INCIDENT_TYPES == tuple(t.value for t in IncidentType)
+
+
+def test_cli_import_does_not_load_heavy_dependencies():
+    rows = import_profile("autosre.cli")
+    assert module_import_ms(rows) > 0
+    assert heavy_imports(rows) == []
+
+
+@patch("autosre.workflow.run_once")
+def test_main_runs_one_cycle_with_incident_type(mock_run_once):
+    mock_run_once.return_value = True
+    assert main(["--incident-type", "crash_loop"]) == 0
+    mock_run_once.assert_called_once_with(incident_type=IncidentType.CRASH_LOOP)
+
+
+def test_main_replay_prints_json_report(tmp_path, capsys):
+    store = LogStore(data_dir=str(tmp_path))
+    store.record_incident(
+        IncidentEvent(
+            incident_id="inc-1",
+            incident_type=IncidentType.LATENCY_SPIKE,
+            service_name="checkout",
+            detected_at=datetime(2025, 2, 11, 12, 0, 0),
+        )
+    )
+    assert main(["replay", str(tmp_path), "--json"]) == 0
+    report = json.loads(capsys.readouterr().out)
+    assert report["incidents"] == 1
+    assert report["recovered"] == 1
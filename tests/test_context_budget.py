@@ -0,0 +1,79 @@
+"""Tests for the token-budgeted log context."""
+
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+from autosre.models import IncidentEvent, IncidentType
+from autosre.reasoning_agent import ReasoningAgent
+from autosre.reasoning_agent.agent import FALLBACK_DIAGNOSIS
+from autosre.reasoning_agent.budget import estimate_tokens, fit_logs_to_budget
+
+_DETECTED_AT = datetime(2025, 2, 11, 12, 0, 0)
+_DEPLOYS = [{"version": "v1.4.2", "timestamp": "2025-02-11T10:00:00Z", "status": "deployed"}]
+
+
+def _line(minutes_before: float, message: str) -> str:
+    return f"[{(_DETECTED_AT - timedelta(minutes=minutes_before)).isoformat()}] {message}"
+
+
+def test_logs_within_budget_are_unchanged():
+    logs = _line(1, "INFO ok")
+    text, stats = fit_logs_to_budget(logs, 100)
+    assert text == logs
+    assert stats.truncated is False
+    assert stats.kept_lines == stats.input_lines == 1
+
+
+def test_over_budget_keeps_errors_stack_and_recent_lines_in_order():
+    lines = [
+        _line(50 - n * 0.1, f"INFO request handled path=/p{n} latency_ms={n}") for n in range(300)
+    ]
+    lines[10] = _line(49, "ERROR connection refused to db-primary")
+    lines[11] = '  File "app.py", line 12, in handler'
+    lines += [_line(0.5, f"WARN pool nearly exhausted in={n}") for n in range(50)]
+    logs = "\n".join(lines)
+
+    text, stats = fit_logs_to_budget(
+        logs, 60, detected_at=_DETECTED_AT, deployment_history=_DEPLOYS
+    )
+
+    kept = text.splitlines()
+    assert estimate_tokens(text) <= 60
+    assert stats.truncated and stats.dropped_lines > 0
+    assert stats.duplicate_lines == 297 + 49
+    assert "ERROR connection refused" in kept[0]
+    assert kept[1].startswith('  File "app.py"')
+    assert any("WARN pool nearly exhausted" in k and "[repeated 49x]" in k for k in kept)
+
+
+@patch("autosre.reasoning_agent.agent._get_bedrock_client")
+def test_agent_sends_budgeted_logs_and_records_stats(mock_get_client):
+    mock_client = MagicMock()
+    mock_client.converse.return_value = {
+        "output": {
+            "message": {
+                "content": [
+                    {
+                        "text": '{"summary": "DB down", "confidence": 0.8, '
+                        '"recommended_action": "restart_db_pool", "reasoning": ""}'
+                    }
+                ]
+            }
+        }
+    }
+    mock_get_client.return_value = mock_client
+    incident = IncidentEvent(
+        incident_id="inc-1",
+        incident_type=IncidentType.LATENCY_SPIKE,
+        service_name="checkout",
+        detected_at=_DETECTED_AT,
+    )
+    logs = "\n".join(_line(n / 10, f"INFO tick id={n} value={n}") for n in range(2000))
+
+    diagnosis = ReasoningAgent(use_bedrock=True, log_token_budget=200).analyze(incident, logs, [])
+
+    prompt = mock_client.converse.call_args.kwargs["messages"][0]["content"][0]["text"]
+    assert estimate_tokens(prompt) < 400
+    assert diagnosis.metadata["context"]["truncated"] is True
+    assert diagnosis.metadata["context"]["input_lines"] == 2000
+    assert FALLBACK_DIAGNOSIS.metadata == {}
@@ -0,0 +1,211 @@
+"""Tests for the `autosre serve` daemon."""
+
+import json
+import threading
+import urllib.error
+import urllib.request
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+from autosre.config import Settings
+from autosre.daemon import AutoSREDaemon
+from autosre.models import IncidentEvent, IncidentType, RecoveryStatus
+
+
+def _settings(**overrides) -> Settings:
+    values = {
+        "serve_host": "127.0.0.1",
+        "serve_port": 0,
+        "serve_workers": 2,
+        "serve_poll_interval_seconds": 0.01,
+        "serve_drain_timeout_seconds": 5.0,
+    }
+    values.update(overrides)
+    return Settings(**values)
+
+
+def _incident(incident_id: str, alarm: str | None = None) -> IncidentEvent:
+    return IncidentEvent(
+        incident_id=incident_id,
+        incident_type=IncidentType.LATENCY_SPIKE,
+        service_name="checkout",
+        detected_at=datetime(2025, 2, 11, 12, 0, 0),
+        raw_payload={"AlarmName": alarm} if alarm else {},
+    )
+
+
+def _recovering_monitor():
+    monitor = MagicMock()
+    monitor.verify.return_value = RecoveryStatus.RECOVERED
+    monitor.get_recovery_time_seconds.return_value = 1.0
+    return monitor
+
+
+@patch("autosre.workflow.RecoveryMonitor")
+def test_poll_once_dedupes_same_alarm_and_drains(mock_monitor_class):
+    mock_monitor_class.side_effect = lambda **_: _recovering_monitor()
+    incidents = [_incident("inc-1", "HighLatency"), _incident("inc-2", "HighLatency")]
+    daemon = AutoSREDaemon(settings=_settings(), incident_source=lambda: incidents)
+
+    assert daemon.poll_once() == 1
+    assert daemon.drain() is True
+    # handled within the cooldown: not picked up again
+    assert daemon.poll_once() == 0
+    assert daemon.metrics.outcomes["recovered"] == 1
+    assert daemon.metrics.skipped_duplicate == 3
+    assert daemon.metrics.in_flight == 0
+    assert daemon.metrics.stage_count["verify"] == 1
+
+
+def test_poll_once_defers_when_workers_busy():
+    release = threading.Event()
+    daemon = AutoSREDaemon(
+        settings=_settings(serve_workers=1),
+        incident_source=lambda: [_incident("inc-1"), _incident("inc-2")],
+    )
+    with patch("autosre.daemon.run_incident", side_effect=lambda *a, **k: release.wait(5)):
+        assert daemon.poll_once() == 1
+        assert daemon.metrics.deferred == 1
+        release.set()
+        assert daemon.drain() is True
+    assert daemon.metrics.outcomes["recovered"] == 1
+
+
+def test_poll_errors_are_counted_not_raised():
+    def failing_source():
+        raise RuntimeError("CloudWatch unavailable")
+
+    daemon = AutoSREDaemon(settings=_settings(), incident_source=failing_source)
+    assert daemon.poll_once() == 0
+    assert daemon.metrics.poll_errors == 1
+
+
+def test_run_serves_health_and_metrics_then_stops():
+    daemon = AutoSREDaemon(settings=_settings(), incident_source=list)
+    daemon.start_http()
+    base = f"http://127.0.0.1:{daemon.http_port}"
+    health = json.loads(urllib.request.urlopen(f"{base}/healthz").read())
+    metrics = urllib.request.urlopen(f"{base}/metrics").read().decode()
+    assert health == {"status": "ok", "in_flight": 0}
+    assert 'autosre_incidents_total{outcome="recovered"} 0' in metrics
+
+    daemon.stop()
+    try:
+        urllib.request.urlopen(f"{base}/healthz")
+        raise AssertionError("expected 503 while draining")
+    except urllib.error.HTTPError as e:
+        assert e.code == 503
+    assert daemon.run(install_signal_handlers=False) == 0
+
+
+def test_drain_timeout_abandons_hung_incidents_on_daemon_threads():
+    release = threading.Event()
+    daemon = AutoSREDaemon(
+        settings=_settings(serve_drain_timeout_seconds=0.05),
+        incident_source=lambda: [_incident("inc-1")],
+    )
+    with patch("autosre.daemon.run_incident", side_effect=lambda *a, **k: release.wait(5)):
+        assert daemon.poll_once() == 1
+        assert daemon.drain() is False
+        workers = [t for t in threading.enumerate() if t.name.startswith("autosre-worker")]
+        assert workers and all(t.daemon for t in workers)
+        release.set()
+
+
+@patch("autosre.daemon.AutoSREDaemon._handle")
+def test_simulator_source_dedupes_a_still_firing_incident(mock_handle):
+    daemon = AutoSREDaemon(settings=_settings(use_aws_integration=False), components=MagicMock())
+    assert daemon.poll_once() == 1
+    # The next poll simulates the same alarm again while it is being handled
+    assert daemon.poll_once() == 0
+    assert daemon.metrics.skipped_duplicate == 1
+    key = mock_handle.call_args.args[0]
+    assert key == "alarm:simulated-checkout-latency_spike"
+
+
+@patch("autosre.workflow.RecoveryMonitor")
+def test_serve_reuses_a_warm_ui_session_across_incidents(mock_monitor_class, monkeypatch):
+    from autosre.ui_automation import NovaActSessionPool
+
+    mock_monitor_class.side_effect = lambda **_: _recovering_monitor()
+    created: list = []
+
+    def make():
+        nova = MagicMock()
+        nova.page.is_closed.return_value = False
+        created.append(nova)
+        return nova
+
+    pool = NovaActSessionPool("http://dash", size=1, factory=make)
+    monkeypatch.setattr("autosre.ui_automation.session_pool._shared_pool", pool)
+    settings = _settings(
+        serve_workers=1,
+        use_aws_integration=False,
+        ui_stub=False,
+        ui_worker_processes=0,
+        ui_session_pool_size=1,
+        dashboard_api_enabled=False,
+        remediation_journal_enabled=False,
+    )
+    polls = iter([[_incident("inc-1", "HighLatency")]])
+    daemon = AutoSREDaemon(
+        settings=settings, incident_source=lambda: next(polls, [_incident("inc-2", "Errors")])
+    )
+    server = threading.Thread(target=daemon.run, kwargs={"install_signal_handlers": False})
+    server.start()
+    try:
+        for _ in range(500):
+            if sum(daemon.metrics.outcomes.values()) >= 2:
+                break
+            threading.Event().wait(0.01)
+    finally:
+        daemon.stop()
+        server.join(10)
+    assert daemon.metrics.outcomes["recovered"] == 2
+    # One browser started and logged in; the second incident borrowed it warm
+    assert len(created) == 1
+    assert pool.stats()["reused"] >= 1
+    created[0].stop.assert_called_once()  # closed when serve exits
+
+
+@patch("autosre.workflow.RecoveryMonitor")
+def test_serve_remediates_concurrent_incidents_in_ui_worker_processes(
+    mock_monitor_class, monkeypatch
+):
+    from autosre.ui_automation.workers import UIWorkerPool
+    from tests.test_ui_workers import FakeNova
+
+    mock_monitor_class.side_effect = lambda **_: _recovering_monitor()
+    pool = UIWorkerPool("http://dash", processes=2, task_timeout_seconds=30, factory=FakeNova)
+    monkeypatch.setattr("autosre.ui_automation.workers._shared_pool", pool)
+    results: list[bool] = []
+    run = pool.run
+
+    def recording_run(*args, **kwargs) -> bool:
+        results.append(run(*args, **kwargs))
+        return results[-1]
+
+    monkeypatch.setattr(pool, "run", recording_run)
+    settings = _settings(
+        serve_workers=2,
+        use_aws_integration=False,
+        ui_stub=False,
+        ui_worker_processes=2,
+        dashboard_api_enabled=False,
+        remediation_journal_enabled=False,
+    )
+    incidents = [_incident("inc-1", "HighLatency"), _incident("inc-2", "Errors")]
+    daemon = AutoSREDaemon(settings=settings, incident_source=lambda: incidents)
+    server = threading.Thread(target=daemon.run, kwargs={"install_signal_handlers": False})
+    server.start()
+    try:
+        for _ in range(3000):
+            if sum(daemon.metrics.outcomes.values()) >= 2:
+                break
+            threading.Event().wait(0.01)
+    finally:
+        daemon.stop()
+        server.join(30)
+    assert daemon.metrics.outcomes["recovered"] == 2
+    assert results == [True, True]
+    assert pool.restarts == 0
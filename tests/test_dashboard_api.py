@@ -0,0 +1,85 @@
+"""Tests for the dashboard API remediation fast path."""
+
+import json
+from unittest.mock import MagicMock
+
+import httpx
+
+from autosre.models import PlannedAction
+from autosre.remediation import DashboardAPIExecutor
+from autosre.retry import RetryPolicy
+
+_ROLLBACK_PLAN = [
+    PlannedAction(action_type="navigate", target="deployment_panel"),
+    PlannedAction(
+        action_type="click_rollback", target="deployment_panel", parameters={"to_version": "v1.4.1"}
+    ),
+]
+
+
+def _executor(handler, fallback=None) -> tuple[DashboardAPIExecutor, list[httpx.Request]]:
+    seen: list[httpx.Request] = []
+
+    def record(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return handler(request)
+
+    client = httpx.Client(base_url="http://dash", transport=httpx.MockTransport(record))
+    executor = DashboardAPIExecutor(
+        "http://dash",
+        fallback=fallback,
+        retry_policy=RetryPolicy(max_attempts=2, base_delay=0),
+        client=client,
+    )
+    return executor, seen
+
+
+def test_rollback_plan_runs_over_http_without_the_browser():
+    fallback = MagicMock()
+    executor, seen = _executor(lambda r: httpx.Response(200, json={"ok": True}), fallback)
+    assert executor.execute(_ROLLBACK_PLAN, service_name="Checkout") is True
+    assert [(r.method, r.url.path) for r in seen] == [("POST", "/api/services/checkout/rollback")]
+    assert json.loads(seen[0].content) == {"to_version": "v1.4.1"}
+    fallback.execute.assert_not_called()
+
+
+def test_previous_version_is_resolved_from_the_dashboard():
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.method == "GET":
+            return httpx.Response(
+                200,
+                json={
+                    "deployments": [
+                        {"version": "v1.4.2", "timestamp": "2025-02-11T10:00:00Z"},
+                        {"version": "v1.4.1", "timestamp": "2025-02-11T09:30:00Z"},
+                    ]
+                },
+            )
+        return httpx.Response(200, json={"ok": True})
+
+    executor, seen = _executor(handler)
+    plan = [PlannedAction(action_type="click_rollback", target="deployment_panel")]
+    assert executor.execute(plan, service_name="checkout") is True
+    assert json.loads(seen[-1].content) == {"to_version": "v1.4.1"}
+
+
+def test_unmapped_steps_fall_back_to_ui_automation():
+    fallback = MagicMock()
+    fallback.execute.return_value = True
+    executor, seen = _executor(lambda r: httpx.Response(200), fallback)
+    plan = [PlannedAction(action_type="restart_instance", target="service_instances")]
+    assert executor.execute(plan, service_name="checkout") is True
+    fallback.execute.assert_called_once_with(plan, service_name="checkout", incident_id=None)
+    # Without a service the API cannot be addressed either
+    assert executor.execute(_ROLLBACK_PLAN, service_name=None) is True
+    assert seen == []
+    assert (executor.api_plans, executor.fallback_plans) == (0, 2)
+
+
+def test_server_errors_are_retried_and_client_errors_fail():
+    responses = iter([httpx.Response(503), httpx.Response(200, json={"ok": True})])
+    executor, seen = _executor(lambda r: next(responses))
+    assert executor.execute(_ROLLBACK_PLAN, service_name="checkout") is True
+    assert len(seen) == 2
+    executor, _ = _executor(lambda r: httpx.Response(404, json={"detail": "Service not found"}))
+    assert executor.execute(_ROLLBACK_PLAN, service_name="unknown") is False
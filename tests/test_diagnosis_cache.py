@@ -0,0 +1,99 @@
+"""Tests for the diagnosis cache and log template fingerprinting."""
+
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+from autosre.models import Diagnosis, IncidentEvent, IncidentType, RecommendedAction
+from autosre.reasoning_agent import DiagnosisCache, ReasoningAgent
+from autosre.reasoning_agent.agent import FALLBACK_DIAGNOSIS
+from autosre.reasoning_agent.cache import incident_fingerprint
+from autosre.reasoning_agent.templates import log_templates, normalize_line
+
+_DEPLOYS = [
+    {"version": "v1.4.1", "timestamp": "2025-02-11T09:30:00Z", "status": "deployed"},
+    {"version": "v1.4.2", "timestamp": "2025-02-11T10:00:00Z", "status": "deployed"},
+]
+
+
+def _incident(incident_id: str = "inc-1") -> IncidentEvent:
+    return IncidentEvent(
+        incident_id=incident_id,
+        incident_type=IncidentType.LATENCY_SPIKE,
+        service_name="checkout",
+        detected_at=datetime(2025, 2, 11, 12, 0, 0),
+    )
+
+
+def _diagnosis(summary: str = "Bad deploy") -> Diagnosis:
+    return Diagnosis(summary=summary, confidence=0.9, recommended_action=RecommendedAction.ROLLBACK)
+
+
+def test_normalize_line_replaces_variable_parts():
+    line = "[2025-02-11T12:00:01Z] ERROR timeout after 5012ms request_id=req-8812 from 10.0.0.12"
+    assert normalize_line(line) == "ERROR timeout after <num>ms request_id=<id> from <ip>"
+    logs = "[t1] ERROR timeout after 12ms\n[t2] ERROR timeout after 950ms\n\n"
+    assert log_templates(logs) == ["ERROR timeout after <num>ms"]
+
+
+def test_fingerprint_ignores_ids_but_not_deployment_head():
+    logs_a = "[2025-02-11T12:00:01Z] ERROR OOM request_id=req-1"
+    logs_b = "[2025-02-11T12:07:44Z] ERROR OOM request_id=req-2"
+    a = incident_fingerprint(_incident("inc-1"), logs_a, _DEPLOYS)
+    assert a == incident_fingerprint(_incident("inc-2"), logs_b, list(reversed(_DEPLOYS)))
+    assert a != incident_fingerprint(_incident("inc-1"), logs_a, _DEPLOYS[:1])
+    assert a != incident_fingerprint(_incident("inc-1"), "ERROR disk full", _DEPLOYS)
+
+
+@patch("autosre.reasoning_agent.cache.time.time")
+def test_cache_ttl_lru_and_stats(mock_time):
+    mock_time.return_value = 1000.0
+    cache = DiagnosisCache(max_entries=2, ttl_seconds=60)
+    cache.put("a", _diagnosis("a"))
+    cache.put("b", _diagnosis("b"))
+    assert cache.get("a").summary == "a"  # a is now most recently used
+    cache.put("c", _diagnosis("c"))  # evicts b
+    assert cache.get("b") is None
+    mock_time.return_value = 1061.0
+    assert cache.get("a") is None  # expired
+    assert cache.stats() == {
+        "hits": 1,
+        "misses": 2,
+        "evictions": 1,
+        "size": 1,
+        "hit_rate": 1 / 3,
+    }
+
+
+def test_cache_persists_to_disk(tmp_path):
+    path = tmp_path / "cache" / "diagnoses.json"
+    DiagnosisCache(path=str(path)).put("fp", _diagnosis("persisted"))
+    assert DiagnosisCache(path=str(path)).get("fp").summary == "persisted"
+    path.write_text("not json", encoding="utf-8")
+    assert len(DiagnosisCache(path=str(path))) == 0
+
+
+@patch("autosre.reasoning_agent.agent._get_bedrock_client")
+def test_agent_reuses_cached_diagnosis_and_never_caches_fallback(mock_get_client):
+    mock_client = MagicMock()
+    mock_client.converse.return_value = {"output": {"message": {"content": [{"text": "not json"}]}}}
+    mock_get_client.return_value = mock_client
+    agent = ReasoningAgent(use_bedrock=True, cache=DiagnosisCache())
+    logs = "[2025-02-11T12:00:01Z] ERROR OOM request_id=req-1"
+
+    assert agent.analyze(_incident(), logs, _DEPLOYS) == FALLBACK_DIAGNOSIS
+    mock_client.converse.return_value = {
+        "output": {
+            "message": {
+                "content": [
+                    {
+                        "text": '{"summary": "Leak in v1.4.2", "confidence": 0.9, '
+                        '"recommended_action": "rollback", "reasoning": ""}'
+                    }
+                ]
+            }
+        }
+    }
+    first = agent.analyze(_incident("inc-2"), logs, _DEPLOYS)
+    second = agent.analyze(_incident("inc-3"), logs.replace("req-1", "req-9"), _DEPLOYS)
+    assert first.summary == second.summary == "Leak in v1.4.2"
+    assert mock_client.converse.call_count == 2
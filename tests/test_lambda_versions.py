@@ -0,0 +1,87 @@
+"""Tests for the paginated, incrementally refreshed Lambda version index."""
+
+from unittest.mock import MagicMock, patch
+
+from autosre.remediation import AWSExecutor
+from autosre.remediation.lambda_versions import LambdaVersionIndex
+
+
+class FakeLambda:
+    """list_versions_by_function over `published` versions, 50 per page, ascending."""
+
+    def __init__(self, published: int, descriptions: dict[str, str] | None = None) -> None:
+        self.published = published
+        self.descriptions = descriptions or {}
+        self.calls: list[str | None] = []
+
+    def list_versions_by_function(self, FunctionName: str, MaxItems: int, Marker=None):
+        self.calls.append(Marker)
+        names = ["$LATEST"] + [str(v) for v in range(1, self.published + 1)]
+        start = int(Marker or 0)
+        page = {
+            "Versions": [
+                {"Version": n, "Description": self.descriptions.get(n, "")}
+                for n in names[start : start + MaxItems]
+            ]
+        }
+        if start + MaxItems < len(names):
+            page["NextMarker"] = str(start + MaxItems)
+        return page
+
+
+class _Clock:
+    now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_index_pages_through_long_histories_and_refreshes_incrementally():
+    client = FakeLambda(published=120)
+    clock = _Clock()
+    index = LambdaVersionIndex(client_factory=lambda: client, ttl_seconds=60, clock=clock)
+    assert index.previous_version("fn", "120") == "119"
+    assert index.previous_version("fn", "51") == "50"
+    assert index.previous_version("fn", "$LATEST") == "119"
+    assert index.previous_version("fn", "1") is None
+    assert client.calls == [None, "50", "100"]  # one full listing, then cached
+    # A version published after the last refresh triggers an incremental read
+    client.published = 121
+    assert index.previous_version("fn", "121") == "120"
+    assert client.calls[3:] == ["100"]
+    # After the TTL the index re-reads only from the last page's marker
+    clock.now = 61
+    assert index.versions("fn")[-1] == 121
+    assert client.calls[4:] == ["100"]
+
+
+def test_restart_versions_resolve_to_the_version_they_restarted():
+    client = FakeLambda(published=7, descriptions={"6": "autosre restart of version 5"})
+    index = LambdaVersionIndex(client_factory=lambda: client)
+    # 6 is 5's code with fresh environments: rolling back from either goes to 4
+    assert index.previous_version("fn", "6") == "4"
+    assert index.previous_version("fn", "5") == "4"
+    assert index.previous_version("fn", "7") == "6"
+    # A restart published after the last refresh is picked up on lookup
+    client.published = 8
+    client.descriptions["8"] = "autosre restart of version 7"
+    assert index.previous_version("fn", "8") == "6"
+    assert index.previous_version("fn", "$LATEST") == "6"
+
+
+@patch("autosre.aws_clients.get_client")
+@patch("autosre.remediation.aws_executor.get_settings")
+def test_rollback_targets_the_previous_indexed_version(mock_settings, mock_get_client):
+    mock_settings.return_value.remediation_max_parallel = 1
+    mock_settings.return_value.remediation_step_timeout_seconds = 0
+    mock_settings.return_value.retry_max_attempts = 1
+    client = MagicMock()
+    client.get_alias.return_value = {"FunctionVersion": "75"}
+    mock_get_client.return_value = client
+    index = LambdaVersionIndex(client_factory=lambda: FakeLambda(published=80))
+    executor = AWSExecutor(versions=index)
+    executor.prefetch("payments-fn").join()  # warm before the incident is acted on
+    assert executor._lambda_rollback("payments-fn", "live") is True
+    client.update_alias.assert_called_once_with(
+        FunctionName="payments-fn", Name="live", FunctionVersion="74"
+    )
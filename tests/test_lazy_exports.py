@@ -0,0 +1,33 @@
+"""Tests for lazy package exports."""
+
+import importlib
+
+import pytest
+
+
+def test_exports_resolve_on_first_access_and_are_cached():
+    remediation = importlib.import_module("autosre.remediation")
+    from autosre.remediation.dag import DagExecutor
+
+    assert remediation.DagExecutor is DagExecutor
+    assert vars(remediation)["DagExecutor"] is DagExecutor
+    assert "LambdaVersionIndex" in dir(remediation)
+    with pytest.raises(AttributeError, match="no attribute 'Missing'"):
+        _ = remediation.Missing
+
+
+def test_every_package_export_resolves():
+    for package in (
+        "autosre.incident_detection",
+        "autosre.log_storage",
+        "autosre.planner",
+        "autosre.reasoning_agent",
+        "autosre.recovery_verification",
+        "autosre.remediation",
+        "autosre.replay",
+        "autosre.slack_reporter",
+        "autosre.ui_automation",
+    ):
+        module = importlib.import_module(package)
+        for name in module.__all__:
+            assert getattr(module, name) is not None, f"{package}.{name}"
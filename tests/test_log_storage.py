@@ -4,7 +4,7 @@ import tempfile
 from datetime import datetime
 from pathlib import Path
 
-from autosre.models import IncidentEvent, IncidentType
+from autosre.models import Diagnosis, IncidentEvent, IncidentType, RecommendedAction
 from autosre.log_storage.store import (
     LogStore,
     STUB_DEPLOYMENTS,
@@ -141,3 +141,28 @@ def test_persistence_roundtrip():
         history = store2.get_deployment_history("checkout")
         assert len(history) == 1
         assert history[0]["version"] == "v1.4.2"
+
+
+def test_record_outcome_persists():
+    with tempfile.TemporaryDirectory() as tmp:
+        store1 = LogStore(data_dir=tmp)
+        outcome = store1.record_outcome(
+            IncidentEvent(
+                incident_id="inc-outcome",
+                incident_type=IncidentType.LATENCY_SPIKE,
+                service_name="checkout",
+                detected_at=datetime(2025, 2, 11, 12, 0, 0),
+            ),
+            Diagnosis(
+                summary="Bad deploy",
+                confidence=0.9,
+                recommended_action=RecommendedAction.ROLLBACK,
+            ),
+            recovered=True,
+            recovery_seconds=42.0,
+            log_templates=["ERROR timeout after <num>ms"],
+        )
+        assert outcome["recommended_action"] == "rollback"
+
+        store2 = LogStore(data_dir=tmp)
+        assert store2.list_outcomes() == [outcome]
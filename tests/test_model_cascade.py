@@ -0,0 +1,160 @@
+"""Tests for the fast → escalation model cascade."""
+
+import json
+import time
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+from autosre.models import IncidentEvent, IncidentType, RecommendedAction
+from autosre.reasoning_agent import ReasoningAgent
+from autosre.reasoning_agent.cascade import estimate_cost
+from autosre.reasoning_agent.prompts import SYSTEM_PROMPT
+
+FAST = "us.amazon.nova-lite-v1:0"
+SLOW = "us.amazon.nova-pro-v1:0"
+
+
+def _incident() -> IncidentEvent:
+    return IncidentEvent(
+        incident_id="inc-cascade",
+        incident_type=IncidentType.LATENCY_SPIKE,
+        service_name="checkout",
+        detected_at=datetime(2025, 2, 11, 12, 0, 0),
+    )
+
+
+def _response(action: str, confidence: float) -> dict:
+    text = json.dumps(
+        {"summary": f"{action} it", "confidence": confidence, "recommended_action": action}
+    )
+    return {
+        "output": {"message": {"content": [{"text": text}]}},
+        "usage": {"inputTokens": 1000, "outputTokens": 100, "totalTokens": 1100},
+    }
+
+
+def _client(answers: dict, delays: dict | None = None) -> MagicMock:
+    def converse(**kwargs):
+        model_id = kwargs["modelId"]
+        time.sleep((delays or {}).get(model_id, 0))
+        answer = answers[model_id]
+        if isinstance(answer, Exception):
+            raise answer
+        return answer
+
+    client = MagicMock()
+    client.converse.side_effect = converse
+    return client
+
+
+def _agent(**kwargs) -> ReasoningAgent:
+    return ReasoningAgent(
+        model_id=FAST,
+        use_bedrock=True,
+        escalation_model_id=SLOW,
+        confidence_threshold=0.7,
+        **kwargs,
+    )
+
+
+def test_estimate_cost_uses_longest_matching_price():
+    assert estimate_cost(FAST, 1000, 1000) == 0.00006 + 0.00024
+    assert estimate_cost("us.amazon.nova-2-lite-v1:0", 1000, 0) == 0.0003
+    assert estimate_cost("custom-model", 1000, 0) is None
+    assert estimate_cost("custom-model", 1000, 0, {"custom": (0.5, 1.0)}) == 0.5
+    assert estimate_cost("custom", 0, 0, {"custom": (1.0, 1.0)}, cache_read_tokens=1000) == 0.25
+
+
+@patch("autosre.reasoning_agent.agent._get_bedrock_client")
+def test_confident_fast_model_is_accepted_without_escalation(mock_get_client):
+    mock_get_client.return_value = _client({FAST: _response("rollback", 0.9)})
+
+    diagnosis = _agent().analyze(_incident(), "logs", [])
+
+    assert diagnosis.recommended_action == RecommendedAction.ROLLBACK
+    (tier,) = diagnosis.metadata["tiers"]
+    assert tier["model_id"] == FAST and tier["accepted"] is True
+    assert tier["input_tokens"] == 1000
+    assert tier["cost_usd"] == estimate_cost(FAST, 1000, 100)
+
+
+@patch("autosre.reasoning_agent.agent._get_bedrock_client")
+def test_low_confidence_or_failed_fast_model_escalates(mock_get_client):
+    mock_get_client.return_value = _client(
+        {FAST: _response("restart", 0.4), SLOW: _response("restart_db_pool", 0.85)}
+    )
+    diagnosis = _agent().analyze(_incident(), "logs", [])
+    assert diagnosis.recommended_action == RecommendedAction.RESTART_DB_POOL
+    assert [(t["model_id"], t["accepted"]) for t in diagnosis.metadata["tiers"]] == [
+        (FAST, False),
+        (SLOW, True),
+    ]
+
+    mock_get_client.return_value = _client(
+        {FAST: RuntimeError("ThrottlingException"), SLOW: _response("scale_up", 0.8)}
+    )
+    diagnosis = _agent().analyze(_incident(), "logs", [])
+    assert diagnosis.recommended_action == RecommendedAction.SCALE_UP
+    assert diagnosis.metadata["tiers"][0]["error"] == "ThrottlingException"
+
+
+@patch("autosre.reasoning_agent.agent._get_bedrock_client")
+def test_escalation_failure_keeps_low_confidence_fast_answer(mock_get_client):
+    mock_get_client.return_value = _client(
+        {FAST: _response("restart", 0.4), SLOW: RuntimeError("boom")}
+    )
+    diagnosis = _agent().analyze(_incident(), "logs", [])
+    assert diagnosis.recommended_action == RecommendedAction.RESTART
+    assert diagnosis.metadata["tiers"][0]["accepted"] is True
+
+
+@patch("autosre.reasoning_agent.agent._get_bedrock_client")
+def test_hedged_escalation_wins_when_fast_model_is_slow(mock_get_client):
+    mock_get_client.return_value = _client(
+        {FAST: _response("rollback", 0.95), SLOW: _response("restart", 0.8)},
+        delays={FAST: 1.0},
+    )
+    start = time.perf_counter()
+    diagnosis = _agent(hedge_seconds=0.05).analyze(_incident(), "logs", [])
+    assert time.perf_counter() - start < 0.8
+    assert diagnosis.recommended_action == RecommendedAction.RESTART
+    assert [t["model_id"] for t in diagnosis.metadata["tiers"]] == [SLOW]
+
+
+@patch("autosre.reasoning_agent.agent._get_bedrock_client")
+def test_static_system_prompt_is_cached_and_cache_usage_recorded(mock_get_client):
+    response = _response("rollback", 0.9)
+    response["usage"].update({"cacheReadInputTokens": 1500, "cacheWriteInputTokens": 0})
+    client = _client({FAST: response})
+    mock_get_client.return_value = client
+
+    diagnosis = ReasoningAgent(model_id=FAST, escalation_model_id="").analyze(
+        _incident(), "logs", []
+    )
+
+    system = client.converse.call_args.kwargs["system"]
+    assert system[0] == {"text": SYSTEM_PROMPT}
+    assert system[-1] == {"cachePoint": {"type": "default"}}
+    (tier,) = diagnosis.metadata["tiers"]
+    assert tier["cache_read_tokens"] == 1500
+    assert tier["cost_usd"] == estimate_cost(FAST, 1000, 100, cache_read_tokens=1500)
+
+
+@patch("autosre.reasoning_agent.agent._get_bedrock_client")
+def test_model_rejecting_cache_point_is_retried_without_it(mock_get_client):
+    calls = []
+
+    def converse(**kwargs):
+        calls.append(kwargs["system"])
+        if any("cachePoint" in block for block in kwargs["system"]):
+            raise RuntimeError("ValidationException: This model doesn't support caching")
+        return _response("restart", 0.9)
+
+    client = MagicMock()
+    client.converse.side_effect = converse
+    mock_get_client.return_value = client
+    agent = ReasoningAgent(model_id=FAST, escalation_model_id="")
+
+    assert agent.analyze(_incident(), "logs", []).recommended_action == RecommendedAction.RESTART
+    agent.analyze(_incident(), "other logs", [])
+    assert len(calls) == 3  # rejected, retried, then straight without a cachePoint
@@ -0,0 +1,84 @@
+"""Tests for the remediation plan catalog and PlannerAgent."""
+
+import json
+from datetime import datetime
+
+import pytest
+
+from autosre.models import Diagnosis, IncidentEvent, IncidentType, RecommendedAction
+from autosre.planner import PlanCatalog, PlannerAgent
+from autosre.planner.catalog import CatalogSpec
+
+_HISTORY = [
+    {"version": "v2.1.0", "timestamp": "2025-02-11T10:00:00Z", "status": "deployed"},
+    {"version": "v2.0.9", "timestamp": "2025-02-11T09:00:00Z", "status": "failed"},
+    {"version": "v2.0.8", "timestamp": "2025-02-10T09:00:00Z", "status": "deployed"},
+]
+
+
+def _diagnosis(action: RecommendedAction) -> Diagnosis:
+    return Diagnosis(summary="s", confidence=0.9, recommended_action=action)
+
+
+def _incident(service: str = "payments") -> IncidentEvent:
+    return IncidentEvent(
+        incident_id="inc-plan",
+        incident_type=IncidentType.DEPLOYMENT_FAILURE,
+        service_name=service,
+        detected_at=datetime(2025, 2, 11, 12, 0, 0),
+    )
+
+
+def test_rollback_targets_last_good_version_from_history():
+    planner = PlannerAgent(PlanCatalog())
+    actions = planner.plan(_diagnosis(RecommendedAction.ROLLBACK), _incident(), _HISTORY)
+    assert [a.action_type for a in actions] == ["navigate", "click_rollback"]
+    assert actions[1].parameters == {"to_version": "v2.0.8"}
+    # Without history the UI agent is told to roll back to the previous version
+    actions = planner.plan(_diagnosis(RecommendedAction.ROLLBACK))
+    assert actions[1].parameters == {"to_version": "previous"}
+    assert planner.plan(_diagnosis(RecommendedAction.ESCALATE)) == []
+
+
+def test_plans_are_fresh_objects():
+    planner = PlannerAgent(PlanCatalog(default_replicas=6))
+    first = planner.plan(_diagnosis(RecommendedAction.SCALE_UP))
+    first[1].parameters["replicas"] = 100
+    assert planner.plan(_diagnosis(RecommendedAction.SCALE_UP))[1].parameters == {"replicas": 6}
+
+
+def test_catalog_file_with_service_overrides(tmp_path):
+    path = tmp_path / "catalog.json"
+    path.write_text(
+        json.dumps(
+            {
+                "default_replicas": 3,
+                "services": {
+                    "payments": {
+                        "scale_up": [
+                            {
+                                "action_type": "scale_replicas",
+                                "target": "service_scaling",
+                                "parameters": {"replicas": "{replicas}", "note": "{service_name}"},
+                            }
+                        ]
+                    }
+                },
+            }
+        ),
+        encoding="utf-8",
+    )
+    planner = PlannerAgent(PlanCatalog.from_file(str(path)))
+
+    (step,) = planner.plan(_diagnosis(RecommendedAction.SCALE_UP), _incident("payments"))
+    assert step.parameters == {"replicas": 3, "note": "payments"}
+    # Other services keep the built-in plan
+    assert len(planner.plan(_diagnosis(RecommendedAction.SCALE_UP), _incident("checkout"))) == 2
+
+
+def test_invalid_catalog_is_rejected_at_load():
+    step = {"action_type": "x", "target": "y", "parameters": {"v": "{unknown}"}}
+    with pytest.raises(ValueError, match="unknown placeholder"):
+        PlanCatalog(CatalogSpec.model_validate({"plans": {"restart": [step]}}))
+    with pytest.raises(ValueError):
+        CatalogSpec.model_validate({"plans": {"reboot_everything": []}})
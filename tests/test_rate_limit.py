@@ -0,0 +1,159 @@
+"""Tests for the Bedrock rate limiter and concurrent multi-incident reasoning."""
+
+import json
+import time
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from autosre.models import IncidentEvent, IncidentType, RecommendedAction
+from autosre.reasoning_agent import ReasoningAgent
+from autosre.reasoning_agent.ratelimit import ModelRateLimiter, RateLimitWaitExceeded, TokenBucket
+from autosre.retry import RetryPolicy
+
+
+class _Clock:
+    """Fake monotonic clock; sleep advances it."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+def _incident(i: int) -> IncidentEvent:
+    return IncidentEvent(
+        incident_id=f"inc-{i}",
+        incident_type=IncidentType.LATENCY_SPIKE,
+        service_name=f"svc-{i}",
+        detected_at=datetime(2025, 2, 11, 12, 0, 0),
+    )
+
+
+def test_token_bucket_waits_for_refill():
+    clock = _Clock()
+    bucket = TokenBucket(60, clock=clock, sleep=clock.sleep)  # 1 token per second
+    assert bucket.acquire(60)
+    assert clock.now == 0.0
+    assert bucket.acquire(3)
+    assert clock.now == pytest.approx(3.0)
+    assert not bucket.acquire(10, timeout=2.0)
+    bucket.refund(5)
+    assert bucket.available == pytest.approx(7.0)  # 2s of refill while waiting + 5
+
+
+def test_model_rate_limiter_per_model_limits_and_settle():
+    clock = _Clock()
+    limiter = ModelRateLimiter(
+        default_rpm=0,
+        default_tpm=0,
+        limits={"nova-pro": (2, 1000)},
+        max_wait_seconds=10.0,
+        clock=clock,
+        sleep=clock.sleep,
+    )
+    assert limiter.acquire("us.amazon.nova-lite-v1:0", 10**6) == 0.0  # unlimited
+    assert limiter.acquire("us.amazon.nova-pro-v1:0", 900) == 0.0
+    limiter.settle("us.amazon.nova-pro-v1:0", 900, 100)  # 800 tokens returned
+    assert limiter.acquire("us.amazon.nova-pro-v1:0", 800) == 0.0
+    with pytest.raises(RateLimitWaitExceeded):
+        limiter.acquire("us.amazon.nova-pro-v1:0", 10)  # RPM: 2/min used up
+
+
+@patch("autosre.reasoning_agent.agent._get_bedrock_client")
+def test_analyze_many_runs_concurrently_and_yields_as_completed(mock_get_client):
+    def converse(**kwargs):
+        user = kwargs["messages"][0]["content"][0]["text"]
+        # svc-0 is slowest so it finishes last
+        time.sleep(0.6 if "svc-0" in user else 0.2)
+        text = json.dumps({"summary": "s", "confidence": 0.9, "recommended_action": "restart"})
+        return {
+            "output": {"message": {"content": [{"text": text}]}},
+            "usage": {"inputTokens": 100, "outputTokens": 10},
+        }
+
+    client = MagicMock()
+    client.converse.side_effect = converse
+    mock_get_client.return_value = client
+    limiter = ModelRateLimiter(default_rpm=600, default_tpm=10**6)
+    agent = ReasoningAgent(escalation_model_id="", rate_limiter=limiter, max_concurrency=10)
+
+    start = time.perf_counter()
+    results = list(agent.analyze_many([(_incident(i), "logs", []) for i in range(10)]))
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < 1.5  # ten sequential RCAs would take ~2.4s
+    assert len(results) == 10
+    assert results[-1][0].incident_id == "inc-0"
+    assert all(d.recommended_action == RecommendedAction.RESTART for _, d in results)
+    assert "queued_seconds" in results[0][1].metadata["tiers"][0]
+
+
+class _Throttled(Exception):
+    """Shaped like a botocore ThrottlingException ClientError."""
+
+    def __init__(self) -> None:
+        super().__init__("ThrottlingException")
+        self.response = {"Error": {"Code": "ThrottlingException"}}
+
+
+@patch("autosre.reasoning_agent.agent._get_bedrock_client")
+def test_every_retry_attempt_reserves_quota(mock_get_client):
+    text = json.dumps({"summary": "s", "confidence": 0.9, "recommended_action": "restart"})
+    client = MagicMock()
+    client.converse.side_effect = [
+        _Throttled(),
+        {
+            "output": {"message": {"content": [{"text": text}]}},
+            "usage": {"inputTokens": 100, "outputTokens": 10},
+        },
+    ]
+    mock_get_client.return_value = client
+    limiter = MagicMock()
+    limiter.acquire.return_value = 0.0
+    agent = ReasoningAgent(
+        escalation_model_id="",
+        rate_limiter=limiter,
+        retry_policy=RetryPolicy(base_delay=0.0, max_delay=0.0),
+    )
+    diagnosis = agent.analyze(_incident(1), "logs", [])
+    assert diagnosis.recommended_action == RecommendedAction.RESTART
+    assert limiter.acquire.call_count == 2
+    limiter.settle.assert_called_once()
+
+
+def _answer(input_tokens: int, output_tokens: int) -> dict:
+    text = json.dumps({"summary": "s", "confidence": 0.9, "recommended_action": "restart"})
+    return {
+        "output": {"message": {"content": [{"text": text}]}},
+        "usage": {"inputTokens": input_tokens, "outputTokens": output_tokens},
+    }
+
+
+@patch("autosre.reasoning_agent.agent._get_bedrock_client")
+def test_retried_reservations_are_settled_to_actual_usage(mock_get_client):
+    clock = _Clock()  # frozen: no refill, so the bucket level shows what stays charged
+    limiter = ModelRateLimiter(default_tpm=100_000, clock=clock, sleep=clock.sleep)
+    client = MagicMock()
+    mock_get_client.return_value = client
+    agent = ReasoningAgent(
+        escalation_model_id="",
+        rate_limiter=limiter,
+        retry_policy=RetryPolicy(max_attempts=3, base_delay=0.0, max_delay=0.0),
+    )
+
+    client.converse.side_effect = [_Throttled(), _Throttled(), _answer(100, 10)]
+    assert agent.analyze(_incident(1), "logs", []).recommended_action == RecommendedAction.RESTART
+    model_id = client.converse.call_args.kwargs["modelId"]
+    tokens = limiter._model_buckets(model_id)[1]
+    assert tokens.available == pytest.approx(100_000 - 110)
+
+    # Every attempt throttled: nothing stays charged
+    client.converse.side_effect = [_Throttled(), _Throttled(), _Throttled()]
+    agent.analyze(_incident(2), "logs", [])
+    assert tokens.available == pytest.approx(100_000 - 110)
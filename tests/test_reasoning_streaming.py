@@ -0,0 +1,101 @@
+"""Tests for streaming Converse and incremental diagnosis parsing."""
+
+import json
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+from autosre.models import IncidentEvent, IncidentType, RecommendedAction, RecoveryStatus
+from autosre.reasoning_agent import ReasoningAgent
+from autosre.reasoning_agent.agent import FALLBACK_DIAGNOSIS
+from autosre.reasoning_agent.streaming import IncrementalDiagnosisParser
+from autosre.workflow import build_components, run_incident
+
+_RESPONSE = json.dumps(
+    {
+        "recommended_action": "rollback",
+        "confidence": 0.87,
+        "summary": 'Leak in "v1.4.2"',
+        "reasoning": "Errors start right after the rollout.",
+    }
+)
+
+
+def _incident() -> IncidentEvent:
+    return IncidentEvent(
+        incident_id="inc-stream",
+        incident_type=IncidentType.LATENCY_SPIKE,
+        service_name="checkout",
+        detected_at=datetime(2025, 2, 11, 12, 0, 0),
+    )
+
+
+def _stream(text: str, size: int = 7) -> dict:
+    events = [{"messageStart": {"role": "assistant"}}]
+    events += [
+        {"contentBlockDelta": {"delta": {"text": text[i : i + size]}, "contentBlockIndex": 0}}
+        for i in range(0, len(text), size)
+    ]
+    events.append({"messageStop": {"stopReason": "end_turn"}})
+    return {"stream": iter(events)}
+
+
+def test_parser_reports_fields_as_soon_as_complete():
+    seen = []
+    parser = IncrementalDiagnosisParser(on_field=lambda k, v: seen.append((k, v, len(parser.text))))
+    for char in "```json\n" + _RESPONSE:
+        parser.feed(char)
+    assert [k for k, _, _ in seen] == ["recommended_action", "confidence", "summary", "reasoning"]
+    assert parser.fields["confidence"] == 0.87
+    assert parser.fields["summary"] == 'Leak in "v1.4.2"'
+    # action was known well before the reasoning text finished
+    assert seen[0][2] < len(parser.text) // 3
+    # a number is only complete once a delimiter follows it
+    partial = IncrementalDiagnosisParser()
+    assert partial.feed('{"confidence": 0.8') == {}
+    assert partial.feed("5, ") == {"confidence": 0.85}
+    assert partial.feed('"x": null}') == {"x": None}
+
+
+@patch("autosre.reasoning_agent.agent._get_bedrock_client")
+def test_streaming_agent_surfaces_partial_action(mock_get_client):
+    mock_client = MagicMock()
+    mock_client.converse_stream.return_value = _stream(_RESPONSE)
+    mock_get_client.return_value = mock_client
+    partials = {}
+
+    agent = ReasoningAgent(use_bedrock=True, streaming=True)
+    diagnosis = agent.analyze(_incident(), "logs", [], on_partial=partials.__setitem__)
+
+    assert partials["recommended_action"] == "rollback"
+    assert diagnosis.recommended_action == RecommendedAction.ROLLBACK
+    assert diagnosis.confidence == 0.87
+    mock_client.converse.assert_not_called()
+    assert mock_client.converse_stream.call_args.kwargs["modelId"] == "us.amazon.nova-2-lite-v1:0"
+
+
+@patch("autosre.reasoning_agent.agent._get_bedrock_client")
+def test_streaming_agent_truncated_response_returns_fallback(mock_get_client):
+    mock_client = MagicMock()
+    mock_client.converse_stream.return_value = _stream(_RESPONSE[:40])
+    mock_get_client.return_value = mock_client
+
+    agent = ReasoningAgent(use_bedrock=True, streaming=True)
+    assert agent.analyze(_incident(), "logs", [], on_partial=lambda k, v: 1 / 0) == (
+        FALLBACK_DIAGNOSIS
+    )
+
+
+@patch("autosre.reasoning_agent.agent._get_bedrock_client")
+@patch("autosre.workflow.RecoveryMonitor")
+def test_workflow_plans_from_streamed_action(mock_monitor_class, mock_get_client):
+    mock_monitor_class.return_value.verify.return_value = RecoveryStatus.RECOVERED
+    mock_monitor_class.return_value.get_recovery_time_seconds.return_value = 1.0
+    mock_get_client.return_value.converse_stream.return_value = _stream(_RESPONSE)
+    components = build_components()
+    components.reasoning = ReasoningAgent(use_bedrock=True, streaming=True)
+    components.planner = MagicMock(wraps=components.planner)
+    timings: dict[str, float] = {}
+
+    assert run_incident(_incident(), components, stage_timings=timings) is True
+    assert components.planner.plan.call_count == 1  # streamed plan reused
+    assert 0 < timings["first_action"] <= timings["analyze"]
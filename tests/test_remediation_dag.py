@@ -0,0 +1,148 @@
+"""Tests for the parallel DAG executor of planned actions."""
+
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from autosre.models import PlannedAction, RecommendedAction
+from autosre.planner import PlanCatalog
+from autosre.planner.catalog import CatalogSpec
+from autosre.remediation import AWSExecutor, DagExecutor
+from autosre.remediation.dag import build_dag, topological_order
+
+
+def _step(step_id: str, *depends_on: str, action_type: str = "noop") -> PlannedAction:
+    return PlannedAction(
+        action_type=action_type, target=step_id, step_id=step_id, depends_on=list(depends_on)
+    )
+
+
+def test_legacy_plan_without_dependencies_runs_in_order():
+    actions = [
+        PlannedAction(action_type="navigate", target="a"),
+        PlannedAction(action_type="click", target="b"),
+        PlannedAction(action_type="click", target="c"),
+    ]
+    assert build_dag(actions) == {"step0": [], "step1": ["step0"], "step2": ["step1"]}
+    seen = []
+    result = DagExecutor(max_parallel=4).run(actions, lambda a: seen.append(a.target) or True)
+    assert result.ok
+    assert seen == ["a", "b", "c"]
+
+
+def test_invalid_dags_are_rejected():
+    with pytest.raises(ValueError, match="Duplicate"):
+        build_dag([_step("a"), _step("a", "a")])
+    with pytest.raises(ValueError, match="unknown"):
+        build_dag([_step("a", "missing")])
+    with pytest.raises(ValueError, match="cycle"):
+        build_dag([_step("a", "b"), _step("b", "a"), _step("c")])
+    ordered = topological_order([_step("c", "a", "b"), _step("a"), _step("b", "a")])
+    assert [a.step_id for a in ordered] == ["a", "b", "c"]
+
+
+def test_independent_steps_run_in_parallel_up_to_the_bound():
+    running = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def run(action: PlannedAction) -> bool:
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.05)
+        with lock:
+            running -= 1
+        return True
+
+    actions = [_step(f"s{i}", "root") for i in range(5)] + [_step("root")]
+    result = DagExecutor(max_parallel=3).run(actions, run)
+    assert result.ok
+    assert peak == 3
+    assert [s.step_id for s in result.steps] == [a.step_id for a in actions]
+
+
+def test_failure_skips_dependents_but_not_independent_branches():
+    def run(action: PlannedAction) -> bool:
+        if action.step_id == "bad":
+            raise RuntimeError("boom")
+        return True
+
+    actions = [_step("bad"), _step("after_bad", "bad"), _step("good"), _step("after_good", "good")]
+    result = DagExecutor().run(actions, run)
+    statuses = {s.step_id: s.status for s in result.steps}
+    assert statuses == {
+        "bad": "failed",
+        "after_bad": "skipped",
+        "good": "succeeded",
+        "after_good": "succeeded",
+    }
+    assert not result.ok
+    assert "bad (noop on bad) failed: boom" in result.summary()
+
+
+def test_step_timeout_is_reported_and_dependents_skipped():
+    release = threading.Event()
+
+    def run(action: PlannedAction) -> bool:
+        if action.step_id == "slow":
+            release.wait(5)
+        return True
+
+    try:
+        result = DagExecutor(step_timeout_seconds=0.05).run(
+            [_step("slow"), _step("next", "slow"), _step("fast")], run
+        )
+    finally:
+        release.set()
+    statuses = {s.step_id: s.status for s in result.steps}
+    assert statuses == {"slow": "timed_out", "next": "skipped", "fast": "succeeded"}
+
+
+def test_catalog_passes_dependencies_through_and_validates_them():
+    spec = CatalogSpec.model_validate(
+        {
+            "plans": {
+                "restart": [
+                    {"action_type": "navigate", "target": "svc", "step_id": "nav"},
+                    {"action_type": "restart_instance", "target": "a", "depends_on": ["nav"]},
+                    {
+                        "action_type": "restart_instance",
+                        "target": "b",
+                        "step_id": "b",
+                        "depends_on": ["nav"],
+                    },
+                ]
+            }
+        }
+    )
+    actions = PlanCatalog(spec).render(RecommendedAction.RESTART)
+    assert [a.depends_on for a in actions] == [[], ["nav"], ["nav"]]
+    bad = CatalogSpec.model_validate(
+        {"plans": {"restart": [{"action_type": "x", "target": "y", "depends_on": ["nope"]}]}}
+    )
+    with pytest.raises(ValueError, match=r"plans\.restart"):
+        PlanCatalog(bad)
+
+
+@patch("autosre.remediation.aws_executor.get_settings")
+def test_aws_executor_reports_partial_failure(mock_settings):
+    mock_settings.return_value.lambda_function_name = ""
+    mock_settings.return_value.lambda_alias_name = "live"
+    mock_settings.return_value.remediation_max_parallel = 2
+    mock_settings.return_value.remediation_step_timeout_seconds = 0
+    executor = AWSExecutor()
+    actions = [
+        _step("nav", action_type="navigate"),
+        _step("rollback", "nav", action_type="click_rollback"),
+    ]
+    # No function name configured and none given: the rollback step fails
+    result = executor.execute_dag(actions, service_name=None)
+    assert [s.status for s in result.steps] == ["succeeded", "failed"]
+    assert executor.execute(actions, service_name=None) is False
+    with patch.object(AWSExecutor, "_lambda_rollback", return_value=True) as rollback:
+        assert executor.execute(actions, service_name="checkout") is True
+    rollback.assert_called_once_with("checkout", "live")
@@ -0,0 +1,137 @@
+"""Tests for the remediation action journal (deduplication of applied steps)."""
+
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from autosre.models import PlannedAction
+from autosre.remediation.journal import ActionJournal, action_fingerprint
+from autosre.ui_automation.agent import UIActionAgent
+
+NAVIGATE = PlannedAction(action_type="navigate", target="deployment_panel", parameters={})
+ROLLBACK = PlannedAction(
+    action_type="click_rollback", target="deployment_panel", parameters={"to_version": "v1.4.1"}
+)
+
+
+def test_applied_step_is_not_run_again_for_the_same_incident():
+    journal = ActionJournal()
+    execute = MagicMock(return_value=True)
+    assert journal.run("inc-1", ROLLBACK, "checkout", execute) is True
+    assert journal.run("inc-1", ROLLBACK, "Checkout", execute) is True
+    assert execute.call_count == 1
+    # Another incident, or no incident at all, runs the step
+    assert journal.run("inc-2", ROLLBACK, "checkout", execute) is True
+    assert journal.run(None, ROLLBACK, "checkout", execute) is True
+    assert execute.call_count == 3
+    assert journal.stats() == {"hits": 1, "entries": 2}
+
+
+def test_failed_step_is_retried_and_navigation_is_not_journaled():
+    journal = ActionJournal()
+    execute = MagicMock(side_effect=[False, RuntimeError("boom"), True, True])
+    assert journal.run("inc-1", ROLLBACK, "checkout", execute) is False
+    with pytest.raises(RuntimeError):
+        journal.run("inc-1", ROLLBACK, "checkout", execute)
+    assert journal.run("inc-1", ROLLBACK, "checkout", execute) is True
+    assert journal.run("inc-1", ROLLBACK, "checkout", execute) is True
+    assert execute.call_count == 3
+
+    navigate = MagicMock(return_value=True)
+    journal.run("inc-1", NAVIGATE, "checkout", navigate)
+    journal.run("inc-1", NAVIGATE, "checkout", navigate)
+    assert navigate.call_count == 2
+
+
+def test_concurrent_triggers_apply_the_step_once():
+    journal = ActionJournal()
+    calls = []
+
+    def slow_rollback() -> bool:
+        calls.append(1)
+        time.sleep(0.05)
+        return True
+
+    threads = [
+        threading.Thread(target=journal.run, args=("inc-1", ROLLBACK, "checkout", slow_rollback))
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(calls) == 1
+    assert journal._key_locks == {}  # dropped once the step settled
+
+
+def test_expired_entries_are_pruned_from_memory():
+    journal = ActionJournal(retention_seconds=100)
+    with patch("autosre.remediation.journal.time.time", return_value=journal._pruned_at):
+        journal.run("inc-1", ROLLBACK, "checkout", lambda: True)
+    assert len(journal) == 1
+    later = journal._pruned_at + 150
+    with patch("autosre.remediation.journal.time.time", return_value=later):
+        journal.run("inc-2", ROLLBACK, "checkout", lambda: True)
+        assert len(journal) == 1
+        assert not journal.applied("inc-1", ROLLBACK, "checkout")
+        assert journal.applied("inc-2", ROLLBACK, "checkout")
+
+
+def test_journal_is_replayed_from_disk(tmp_path):
+    path = tmp_path / "journal.jsonl"
+    journal = ActionJournal(path=str(path))
+    journal.run("inc-1", ROLLBACK, "checkout", lambda: False)
+    journal.run("inc-1", ROLLBACK, "checkout", lambda: True)
+    with path.open("a", encoding="utf-8") as f:
+        f.write('{"incident_id": "inc-1", "finger')  # torn by a crash
+    assert len(path.read_text(encoding="utf-8").splitlines()) == 3
+
+    reloaded = ActionJournal(path=str(path))
+    assert reloaded.applied("inc-1", ROLLBACK, "checkout")
+    entry = reloaded.get("inc-1", action_fingerprint(ROLLBACK, "checkout"))
+    assert entry is not None and entry.action_type == "click_rollback"
+
+    expired = ActionJournal(path=str(path), retention_seconds=0)
+    assert len(expired) == 0
+
+
+def test_pending_drops_applied_steps_and_their_dependency_edges():
+    journal = ActionJournal()
+    restart = PlannedAction(
+        action_type="restart_instance", target="service_instances", parameters={}, step_id="a"
+    )
+    scale = PlannedAction(
+        action_type="scale_replicas",
+        target="service_scaling",
+        parameters={"replicas": 4},
+        step_id="b",
+        depends_on=["a"],
+    )
+    journal.record("inc-1", restart, "checkout", ok=True)
+    assert journal.pending("inc-1", [restart, scale], "checkout") == [
+        scale.model_copy(update={"depends_on": []})
+    ]
+    assert journal.pending("inc-2", [restart, scale], "checkout") == [restart, scale]
+
+
+@patch("autosre.ui_automation.agent._run_nova_act")
+def test_ui_agent_skips_an_already_applied_plan(mock_run):
+    mock_run.return_value = True
+    journal = ActionJournal()
+    agent = UIActionAgent(use_nova_act=True, journal=journal)
+    assert agent.execute([NAVIGATE, ROLLBACK], service_name="checkout", incident_id="inc-1")
+    assert agent.execute([NAVIGATE, ROLLBACK], service_name="checkout", incident_id="inc-1")
+    mock_run.assert_called_once()
+    assert journal.applied("inc-1", ROLLBACK, "checkout")
+
+
+def test_ui_agent_stub_mode_consults_the_journal():
+    journal = ActionJournal()
+    agent = UIActionAgent(journal=journal)
+    with patch.object(UIActionAgent, "_stub_step", return_value=True) as step:
+        assert agent.execute([NAVIGATE, ROLLBACK], service_name="checkout", incident_id="inc-1")
+        assert agent.execute([NAVIGATE, ROLLBACK], service_name="checkout", incident_id="inc-1")
+    # The navigation step runs both times, the rollback once
+    assert step.call_count == 3
@@ -0,0 +1,116 @@
+"""Tests for offline incident replay."""
+
+import gzip
+import json
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import patch
+
+from autosre.log_storage import LogStore
+from autosre.models import IncidentEvent, IncidentType
+from autosre.replay import load_incidents, replay_incidents
+from autosre.replay.harness import STAGES
+
+
+def _incident(incident_id: str, minute: int) -> IncidentEvent:
+    return IncidentEvent(
+        incident_id=incident_id,
+        incident_type=IncidentType.LATENCY_SPIKE,
+        service_name="checkout",
+        detected_at=datetime(2025, 2, 11, 12, minute, 0),
+    )
+
+
+def test_load_incidents_from_jsonl_sorted_and_skips_invalid():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "incidents.jsonl"
+        lines = [
+            _incident("inc-2", 5).model_dump_json(),
+            "not json",
+            json.dumps({"incident_id": "inc-bad"}),
+            _incident("inc-1", 1).model_dump_json(),
+        ]
+        path.write_text("\n".join(lines), encoding="utf-8")
+        incidents = load_incidents(path)
+    assert [i.incident_id for i in incidents] == ["inc-1", "inc-2"]
+
+
+def test_replay_from_log_store_dir_does_not_modify_recording():
+    with tempfile.TemporaryDirectory() as tmp:
+        store = LogStore(data_dir=tmp)
+        store.record_incident(_incident("inc-1", 1))
+        store.record_incident(_incident("inc-2", 2))
+        before = (Path(tmp) / "incidents.json").read_text(encoding="utf-8")
+
+        report = replay_incidents(tmp)
+
+        assert (Path(tmp) / "incidents.json").read_text(encoding="utf-8") == before
+    assert report.incidents == 2
+    assert report.recovered == 2
+    assert report.throughput_per_second > 0
+    assert set(report.stages) == set(STAGES)
+    assert all(report.stages[s].count == 2 for s in STAGES)
+    assert [r.incident_id for r in report.results] == ["inc-1", "inc-2"]
+
+
+@patch("autosre.replay.harness.time.sleep")
+def test_replay_speedup_compresses_gaps_and_recovery(mock_sleep):
+    with tempfile.TemporaryDirectory() as tmp:
+        store = LogStore(data_dir=tmp)
+        store.record_incident(_incident("inc-1", 0))
+        store.record_incident(_incident("inc-2", 10))
+        report = replay_incidents(tmp, speedup=600.0)
+    assert report.incidents == 2
+    waits = [c.args[0] for c in mock_sleep.call_args_list]
+    # two recovery waits (92s / 600) plus one inter-arrival gap (~600s / 600)
+    assert len(waits) == 3
+    assert any(0.9 < w <= 1.0 for w in waits)
+
+
+def test_replay_limit_and_text_report():
+    with tempfile.TemporaryDirectory() as tmp:
+        store = LogStore(data_dir=tmp)
+        for n in range(3):
+            store.record_incident(_incident(f"inc-{n}", n))
+        report = replay_incidents(Path(tmp) / "incidents.json", limit=1)
+    assert report.incidents == 1
+    text = report.format_text()
+    assert "Replayed 1 incident(s)" in text
+    assert "analyze" in text
+
+
+def test_replay_with_cassette_uses_recorded_bedrock_diagnosis():
+    converse = {
+        "service": "bedrock-runtime",
+        "operation": "Converse",
+        "params": {},
+        "params_key": "{}",
+        "status": 200,
+        "duration": 0.0,
+        "response": {
+            "output": {
+                "message": {
+                    "role": "assistant",
+                    "content": [
+                        {
+                            "text": '{"summary": "Unknown failure", "confidence": 0.3, '
+                            '"recommended_action": "escalate", "reasoning": "unclear"}'
+                        }
+                    ],
+                }
+            }
+        },
+    }
+    with tempfile.TemporaryDirectory() as tmp:
+        cassette = Path(tmp) / "bedrock.jsonl.gz"
+        with gzip.open(cassette, "wt", encoding="utf-8") as f:
+            f.write(json.dumps({"version": 1}) + "\n")
+            f.write(json.dumps(converse) + "\n")
+        incidents = Path(tmp) / "incidents.jsonl"
+        incidents.write_text(_incident("inc-1", 1).model_dump_json(), encoding="utf-8")
+
+        report = replay_incidents(incidents, cassette=cassette, latency_scale=0.0)
+    assert report.incidents == 1
+    # stub reasoning would roll back and recover; the recorded diagnosis escalates
+    assert report.recovered == 0
@@ -0,0 +1,107 @@
+"""Tests for the shared retry policy."""
+
+import random
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from autosre.models import PostMortemReport
+from autosre.retry import ErrorKind, RetryPolicy, classify_error
+from autosre.slack_reporter import SlackReporter
+
+
+class _ClientError(Exception):
+    """Shaped like botocore.exceptions.ClientError."""
+
+    def __init__(self, code: str, status: int = 400):
+        super().__init__(f"An error occurred ({code})")
+        self.response = {"Error": {"Code": code}, "ResponseMetadata": {"HTTPStatusCode": status}}
+
+
+class _SlackError(Exception):
+    """Shaped like slack_sdk.errors.SlackApiError (response with headers / status_code)."""
+
+    def __init__(self, error: str, status: int, headers: dict | None = None):
+        super().__init__(error)
+        self.response = MagicMock(status_code=status, headers=headers or {})
+        self.response.get.side_effect = lambda key: error if key == "error" else None
+
+
+class ReadTimeoutError(Exception):
+    pass
+
+
+def _flaky(*errors):
+    fn = MagicMock(side_effect=[*errors, "ok"])
+    fn.__name__ = "flaky"
+    return fn
+
+
+def test_classify_error():
+    assert classify_error(_ClientError("ThrottlingException")) == ErrorKind.THROTTLING
+    assert classify_error(_ClientError("ModelTimeoutException", 408)) == ErrorKind.TIMEOUT
+    assert classify_error(_ClientError("ServiceUnavailableException", 503)) == ErrorKind.TRANSIENT
+    assert classify_error(_ClientError("ValidationException")) == ErrorKind.VALIDATION
+    assert classify_error(_ClientError("SomethingNew", 502)) == ErrorKind.TRANSIENT
+    assert classify_error(_SlackError("ratelimited", 429)) == ErrorKind.THROTTLING
+    assert classify_error(ReadTimeoutError()) == ErrorKind.TIMEOUT
+    assert classify_error(ConnectionResetError()) == ErrorKind.TRANSIENT
+    assert classify_error(ValueError("bad json")) == ErrorKind.UNKNOWN
+
+
+def test_retries_retryable_errors_with_bounded_jittered_backoff():
+    sleeps: list[float] = []
+    policy = RetryPolicy(max_attempts=4, base_delay=1.0, max_delay=3.0)
+    fn = _flaky(_ClientError("ThrottlingException"), ReadTimeoutError(), TimeoutError())
+
+    assert policy.call(fn, 1, key="v", sleep=sleeps.append) == "ok"
+    fn.assert_called_with(1, key="v")
+    assert fn.call_count == 4
+    # Throttling doubles the first cap (1.0 → 2.0); later caps are clamped to max_delay
+    assert 0 <= sleeps[0] <= 2.0 and all(0 <= s <= 3.0 for s in sleeps)
+
+
+def test_non_retryable_and_exhausted_errors_are_raised():
+    sleeps: list[float] = []
+    fn = _flaky(_ClientError("ValidationException"))
+    with pytest.raises(_ClientError):
+        RetryPolicy().call(fn, sleep=sleeps.append)
+    assert fn.call_count == 1 and sleeps == []
+
+    fn = _flaky(TimeoutError(), TimeoutError(), TimeoutError())
+    with pytest.raises(TimeoutError):
+        RetryPolicy(max_attempts=3, base_delay=0.0).call(fn, sleep=sleeps.append)
+    assert fn.call_count == 3
+
+
+def test_total_time_cap_and_retry_after():
+    sleeps: list[float] = []
+    fn = _flaky(_SlackError("ratelimited", 429, {"Retry-After": "60"}))
+    with pytest.raises(_SlackError):
+        RetryPolicy(max_total_seconds=30.0).call(fn, sleep=sleeps.append)
+    assert sleeps == []
+
+    fn = _flaky(_SlackError("ratelimited", 429, {"Retry-After": "2"}))
+    assert RetryPolicy().call(fn, sleep=sleeps.append) == "ok"
+    assert sleeps[0] >= 2.0
+
+
+def test_backoff_grows_exponentially_up_to_max_delay():
+    policy = RetryPolicy(base_delay=0.5, max_delay=4.0, throttling_multiplier=1.0)
+    rng = random.Random(7)
+    caps = [max(policy.backoff(n, ErrorKind.TIMEOUT, rng) for _ in range(200)) for n in range(5)]
+    assert caps[0] <= 0.5 < caps[2] <= 2.0 < caps[4] <= 4.0
+
+
+@patch("slack_sdk.WebClient")
+def test_slack_publish_retries_rate_limits(mock_web_client):
+    client = mock_web_client.return_value
+    client.chat_postMessage.side_effect = [_SlackError("ratelimited", 429), {"ok": True}]
+    reporter = SlackReporter(
+        bot_token="xoxb-xxx", channel_id="C123", retry_policy=RetryPolicy(base_delay=0.0)
+    )
+    report = PostMortemReport(
+        incident_id="inc-1", root_cause="x", action_taken="rollback", recovery_time_seconds=1.0
+    )
+    assert reporter.publish(report) is True
+    assert client.chat_postMessage.call_count == 2
@@ -0,0 +1,75 @@
+"""Tests for the rule-based fast-path diagnoser."""
+
+import json
+from datetime import datetime
+from unittest.mock import patch
+
+from autosre.models import IncidentEvent, IncidentType, RecommendedAction
+from autosre.reasoning_agent import ReasoningAgent, Rule, RuleEngine
+
+_DETECTED_AT = datetime(2025, 2, 11, 10, 10, 0)
+_RECENT_DEPLOY = [
+    {"version": "v1.4.1", "timestamp": "2025-02-11T09:30:00Z", "status": "deployed"},
+    {"version": "v1.4.2", "timestamp": "2025-02-11T10:00:00Z", "status": "deployed"},
+]
+
+
+def _incident(payload: dict | None = None, detected_at: datetime = _DETECTED_AT) -> IncidentEvent:
+    return IncidentEvent(
+        incident_id="inc-rule",
+        incident_type=IncidentType.DEPLOYMENT_FAILURE,
+        service_name="checkout",
+        detected_at=detected_at,
+        raw_payload=payload or {},
+    )
+
+
+def test_too_many_connections_restarts_db_pool():
+    logs = "[2025-02-11T10:09:00] ERROR FATAL: Too many connections for role app"
+    diagnosis = RuleEngine().match(_incident(), logs, [])
+    assert diagnosis.recommended_action == RecommendedAction.RESTART_DB_POOL
+    assert diagnosis.metadata == {"rule": "db_connection_exhaustion"}
+
+
+def test_error_alarm_after_recent_deploy_rolls_back():
+    payload = {"source": "cloudwatch", "MetricName": "Errors", "AlarmName": "checkout-errors"}
+    diagnosis = RuleEngine().match(_incident(payload), "INFO ok", _RECENT_DEPLOY)
+    assert diagnosis.recommended_action == RecommendedAction.ROLLBACK
+    assert diagnosis.summary == "checkout started failing right after deployment v1.4.2."
+
+    # deploy more than 15 minutes before detection, or a latency alarm: no rule fires
+    late = _incident(payload, detected_at=datetime(2025, 2, 11, 10, 30, 0))
+    assert RuleEngine().match(late, "INFO ok", _RECENT_DEPLOY) is None
+    latency = _incident({"metric": "latency_p99"})
+    assert RuleEngine().match(latency, "INFO ok", _RECENT_DEPLOY) is None
+
+
+def test_rules_from_file_are_checked_before_defaults(tmp_path):
+    path = tmp_path / "rules.json"
+    rules = [
+        {
+            "name": "oom_restart",
+            "action": "restart",
+            "confidence": 0.8,
+            "summary": "{service} ran out of memory.",
+            "incident_types": ["deployment_failure"],
+            "log_patterns": ["out of memory", "too many connections"],
+        }
+    ]
+    path.write_text(json.dumps(rules), encoding="utf-8")
+    engine = RuleEngine.from_file(str(path))
+    assert engine.rules[0].name == "oom_restart"
+    diagnosis = engine.match(_incident(), "Too many connections", [])
+    assert diagnosis.recommended_action == RecommendedAction.RESTART
+    assert RuleEngine([Rule(**rules[0])]).match(_incident(), "all good", []) is None
+
+
+@patch("autosre.reasoning_agent.agent._get_bedrock_client")
+def test_agent_uses_rule_before_bedrock_and_falls_back_otherwise(mock_get_client):
+    agent = ReasoningAgent(use_bedrock=True, rules=RuleEngine())
+    diagnosis = agent.analyze(_incident(), "too many connections", [])
+    assert diagnosis.recommended_action == RecommendedAction.RESTART_DB_POOL
+    mock_get_client.assert_not_called()
+
+    stub = ReasoningAgent(use_bedrock=False, rules=RuleEngine())
+    assert stub.analyze(_incident(), "INFO ok", []).recommended_action == RecommendedAction.ROLLBACK
@@ -0,0 +1,153 @@
+"""Tests for retrieval over past incident outcomes."""
+
+import json
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from autosre.log_storage import LogStore
+from autosre.models import Diagnosis, IncidentEvent, IncidentType, RecommendedAction
+from autosre.reasoning_agent import ReasoningAgent
+from autosre.reasoning_agent.prompts import build_user_prompt
+from autosre.reasoning_agent.similarity import (
+    SimilarityIndex,
+    _features,
+    diagnosis_from_similar,
+)
+from autosre.reasoning_agent.templates import log_templates
+
+DB_LOGS = (
+    "[2025-02-11T11:59:00] ERROR too many connections for role app (pool size 20)\n"
+    "[2025-02-11T11:59:01] ERROR connection refused by db-primary:5432\n"
+)
+OOM_LOGS = "[2025-02-11T11:59:00] FATAL java.lang.OutOfMemoryError: Java heap space\n"
+
+
+def _incident(
+    incident_id: str,
+    incident_type: IncidentType = IncidentType.LATENCY_SPIKE,
+    service: str = "checkout",
+) -> IncidentEvent:
+    return IncidentEvent(
+        incident_id=incident_id,
+        incident_type=incident_type,
+        service_name=service,
+        detected_at=datetime(2025, 2, 11, 12, 0, 0),
+    )
+
+
+def _outcome(store, incident, logs, action, recovered=True):
+    diagnosis = Diagnosis(summary=f"{action} fixed it", confidence=0.9, recommended_action=action)
+    return store.record_outcome(
+        incident, diagnosis, recovered=recovered, log_templates=log_templates(logs)
+    )
+
+
+def _index() -> SimilarityIndex:
+    store = LogStore()
+    _outcome(store, _incident("inc-db"), DB_LOGS, RecommendedAction.RESTART_DB_POOL)
+    _outcome(
+        store,
+        _incident("inc-oom", IncidentType.MEMORY_LEAK, "payments"),
+        OOM_LOGS,
+        RecommendedAction.RESTART,
+    )
+    _outcome(store, _incident("inc-failed"), DB_LOGS, RecommendedAction.SCALE_UP, recovered=False)
+    return SimilarityIndex.from_log_store(store)
+
+
+def test_query_ranks_matching_incident_first_and_skips_failed_remediations():
+    index = _index()
+    assert len(index) == 3
+
+    similar = index.query(_incident("inc-new"), log_templates(DB_LOGS), k=3)
+
+    assert similar[0].incident_id == "inc-db"
+    assert similar[0].similarity > 0.99
+    assert "inc-failed" not in [s.incident_id for s in similar]
+    assert [s.similarity for s in similar] == sorted((s.similarity for s in similar), reverse=True)
+    (other,) = index.query(_incident("inc-db"), log_templates(DB_LOGS), k=1)
+    assert other.incident_id != "inc-db"
+
+
+def test_min_similarity_filters_unrelated_incidents():
+    similar = _index().query(_incident("inc-new"), log_templates(DB_LOGS), min_similarity=0.5)
+    assert [s.incident_id for s in similar] == ["inc-db"]
+
+
+def test_incremental_adds_score_like_a_full_tfidf_rebuild():
+    import numpy as np
+
+    store = LogStore()
+    index = SimilarityIndex(dimensions=256)
+    for i in range(40):  # past the initial row capacity
+        logs = DB_LOGS if i % 3 else OOM_LOGS
+        service = "checkout" if i % 2 else f"svc-{i}"
+        outcome = _outcome(store, _incident(f"inc-{i}", service=service), logs, "restart")
+        index.add(outcome)
+        query_templates = log_templates(DB_LOGS)
+        similar = index.query(_incident("inc-new"), query_templates, k=5, recovered_only=False)
+
+        docs = [
+            index._hashed(_features(o["incident_type"], o["service_name"], o["log_templates"]))
+            for o in store.list_outcomes()
+        ]
+        df = np.zeros(256)
+        for doc in docs:
+            df[list(doc)] += 1
+        idf = np.log((1.0 + len(docs)) / (1.0 + df)) + 1.0
+
+        def vector(doc, idf=idf):
+            v = np.zeros(256)
+            for bucket, count in doc.items():
+                v[bucket] = 1.0 + np.log(count)
+            v *= idf
+            return v / np.linalg.norm(v)
+
+        query = vector(index._hashed(_features("latency_spike", "checkout", query_templates)))
+        expected = sorted((float(vector(doc) @ query) for doc in docs), reverse=True)[:5]
+        assert [s.similarity for s in similar] == pytest.approx(expected, abs=1e-3)
+
+
+def test_diagnosis_from_similar_requires_recovered_automated_action():
+    (similar,) = _index().query(_incident("inc-new"), log_templates(DB_LOGS), k=1)
+    diagnosis = diagnosis_from_similar(similar)
+    assert diagnosis.recommended_action == RecommendedAction.RESTART_DB_POOL
+    assert diagnosis.metadata["similar_incident"] == "inc-db"
+
+    escalated = similar.model_copy(update={"recommended_action": "escalate"})
+    assert diagnosis_from_similar(escalated) is None
+
+
+def test_prompt_includes_similar_incidents():
+    (similar,) = _index().query(_incident("inc-new"), log_templates(DB_LOGS), k=1)
+    prompt = build_user_prompt("latency_spike", "checkout", DB_LOGS, [], [similar.model_dump()])
+    assert "Similar past incidents" in prompt
+    assert "restart_db_pool -> recovered" in prompt
+
+
+@patch("autosre.reasoning_agent.agent._get_bedrock_client")
+def test_near_duplicate_skips_model(mock_get_client):
+    agent = ReasoningAgent(use_bedrock=True, similarity_index=_index(), escalation_model_id="")
+    diagnosis = agent.analyze(_incident("inc-new"), DB_LOGS, [])
+    assert diagnosis.recommended_action == RecommendedAction.RESTART_DB_POOL
+    mock_get_client.assert_not_called()
+
+
+@patch("autosre.reasoning_agent.agent._get_bedrock_client")
+def test_similar_incidents_are_sent_to_model(mock_get_client):
+    text = json.dumps({"summary": "s", "confidence": 0.9, "recommended_action": "restart"})
+    client = MagicMock()
+    client.converse.return_value = {"output": {"message": {"content": [{"text": text}]}}}
+    mock_get_client.return_value = client
+    agent = ReasoningAgent(
+        use_bedrock=True, similarity_index=_index(), escalation_model_id="", streaming=False
+    )
+
+    logs = DB_LOGS + "[2025-02-11T11:59:02] WARN retrying checkout request\n"
+    diagnosis = agent.analyze(_incident("inc-new"), logs, [])
+
+    user_text = client.converse.call_args.kwargs["messages"][0]["content"][0]["text"]
+    assert "Similar past incidents" in user_text
+    assert diagnosis.metadata["similar_incidents"][0] == "inc-db"
@@ -5,8 +5,8 @@ from unittest.mock import MagicMock, patch
 from autosre.models import PostMortemReport
 from autosre.slack_reporter.reporter import (
     SlackReporter,
-    _build_post_mortem_blocks,
-    _build_post_mortem_text,
+    build_post_mortem_blocks,
+    build_post_mortem_text,
 )
 
 
@@ -19,7 +19,7 @@ def test_build_post_mortem_text():
         prevention_suggestion="Add memory profiling",
         timeline=["Alert received", "Rollback executed"],
     )
-    text = _build_post_mortem_text(report)
+    text = build_post_mortem_text(report)
     assert "inc-1" in text
     assert "Memory leak" in text
     assert "rollback" in text
@@ -35,7 +35,7 @@ def test_build_post_mortem_blocks():
         action_taken="rollback",
         recovery_time_seconds=45.0,
     )
-    blocks = _build_post_mortem_blocks(report)
+    blocks = build_post_mortem_blocks(report)
     assert len(blocks) >= 4
     assert blocks[0]["type"] == "header"
     assert any(b.get("type") == "section" for b in blocks)
@@ -96,3 +96,61 @@ def test_ui_agent_nova_act_mode_failure_returns_false(mock_run):
     ]
     result = agent.execute(actions, service_name="checkout")
     assert result is False
+
+
+def test_compile_prompts_merges_navigation_into_one_act_per_change():
+    from autosre.ui_automation.prompts import _compile, compile_prompts
+
+    actions = [
+        PlannedAction(action_type="navigate", target="deployment_panel", parameters={}),
+        PlannedAction(
+            action_type="click_rollback",
+            target="deployment_panel",
+            parameters={"to_version": "v1.4.1"},
+        ),
+    ]
+    prompts = compile_prompts(actions, service_name="checkout", include_login=True)
+    assert prompts == [
+        (
+            "Click the Demo login button, then click the Checkout service link, then click the "
+            "Deployments tab, then click the Rollback button for version v1.4.1."
+        )
+    ]
+    hits = _compile.cache_info().hits
+    assert compile_prompts(actions, service_name="checkout") == prompts
+    assert _compile.cache_info().hits == hits + 1
+    # Each state-changing step gets its own act(); long navigation runs are capped
+    restart_then_scale = [
+        PlannedAction(action_type="restart_instance", target="service_instances"),
+        PlannedAction(action_type="scale_replicas", target="s", parameters={"replicas": 6}),
+    ]
+    assert compile_prompts(restart_then_scale, include_login=False) == [
+        "Click the Restart button for the first instance.",
+        "Set replicas to 6 and apply.",
+    ]
+    assert len(compile_prompts(actions, "checkout", max_steps_per_act=2)) == 2
+
+
+@patch("autosre.ui_automation.agent._run_nova_act")
+def test_ui_agent_coalesced_prompts(mock_run):
+    mock_run.return_value = True
+    agent = UIActionAgent(use_nova_act=True, coalesce_prompts=True)
+    actions = [
+        PlannedAction(action_type="navigate", target="deployment_panel", parameters={}),
+        PlannedAction(action_type="click_rollback", target="deployment_panel"),
+    ]
+    assert agent.execute(actions, service_name="checkout") is True
+    assert len(mock_run.call_args[0][1]) == 1
+
+
+@patch("autosre.ui_automation.agent._run_nova_act")
+def test_ui_agent_worker_pool_runs_out_of_process(mock_run):
+    from unittest.mock import MagicMock
+
+    workers = MagicMock()
+    workers.run.return_value = True
+    agent = UIActionAgent(use_nova_act=True, api_key="k", worker_pool=workers)
+    actions = [PlannedAction(action_type="navigate", target="deployment_panel", parameters={})]
+    assert agent.execute(actions, service_name="checkout") is True
+    mock_run.assert_not_called()
+    assert "Click the Demo login button." not in workers.run.call_args[0][0]
@@ -0,0 +1,157 @@
+"""Tests for the warm Nova Act session pool."""
+
+import threading
+from unittest.mock import MagicMock
+
+from autosre.models import PlannedAction
+from autosre.ui_automation import NovaActSessionPool, UIActionAgent
+from autosre.ui_automation.session_pool import (
+    LOGIN_PROMPT,
+    close_session_pool,
+    get_session_pool,
+)
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _factory(created: list):
+    def make():
+        nova = MagicMock()
+        nova.page.is_closed.return_value = False
+        created.append(nova)
+        return nova
+
+    return make
+
+
+def test_session_is_logged_in_once_and_reused():
+    created: list = []
+    pool = NovaActSessionPool("http://dash/", size=2, factory=_factory(created))
+    assert pool.run(["Click the Deployments tab."])
+    assert pool.run(["Click the Rollback button for version v1."])
+    assert len(created) == 1
+    nova = created[0]
+    nova.start.assert_called_once()
+    prompts = [c.args[0] for c in nova.act.call_args_list]
+    assert prompts.count(LOGIN_PROMPT) == 1
+    # The reused session is reset to the dashboard home before the next incident
+    nova.go_to_url.assert_called_once_with("http://dash")
+    assert pool.stats()["reused"] == 1
+
+
+def test_failed_and_expired_sessions_are_recycled():
+    created: list = []
+    clock = _Clock()
+    pool = NovaActSessionPool(
+        "http://dash", size=1, max_age_seconds=100, factory=_factory(created), clock=clock
+    )
+    assert pool.run(["ok"])
+    created[0].act.side_effect = [RuntimeError("element not found")]
+    assert pool.run(["fails"]) is False
+    created[0].stop.assert_called_once()
+    assert pool.run(["ok"])
+    assert len(created) == 2
+    clock.now = 150
+    assert pool.run(["ok"])
+    assert len(created) == 3
+    created[1].stop.assert_called_once()
+    # A closed page fails the health check
+    created[2].page.is_closed.return_value = True
+    assert pool.run(["ok"])
+    assert len(created) == 4
+    assert pool.stats()["recycled"] == 3
+
+
+def test_concurrent_runs_never_share_a_session():
+    created: list = []
+    pool = NovaActSessionPool("http://dash", size=2, factory=_factory(created))
+    in_use: set = set()
+    overlap = []
+    lock = threading.Lock()
+    barrier = threading.Barrier(2)
+
+    def work():
+        with pool.session() as nova:
+            with lock:
+                overlap.append(id(nova) in in_use)
+                in_use.add(id(nova))
+            barrier.wait(timeout=5)
+            with lock:
+                in_use.discard(id(nova))
+
+    threads = [threading.Thread(target=work) for _ in range(2)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert overlap == [False, False]
+    assert len(created) == 2
+
+
+def test_browser_calls_stay_on_the_session_thread():
+    created: list = []
+    threads: list = []
+
+    def make():
+        nova = MagicMock()
+        nova.page.is_closed.return_value = False
+        for method in (nova.start, nova.act, nova.go_to_url, nova.stop):
+            method.side_effect = lambda *a, **k: threads.append(threading.get_ident())
+        created.append(nova)
+        return nova
+
+    pool = NovaActSessionPool("http://dash", size=1, factory=make)
+    warm = threading.Thread(target=pool.warm)
+    warm.start()
+    warm.join()
+    for _ in range(2):
+        borrower = threading.Thread(target=pool.run, args=(["Click the Deployments tab."],))
+        borrower.start()
+        borrower.join()
+    pool.close()
+    assert len(created) == 1
+    created[0].stop.assert_called_once()
+    # start, login, act, go_to_url, act, stop: all on the one thread owning the browser
+    assert len(threads) == 6
+    assert len(set(threads)) == 1
+    assert threads[0] not in {warm.ident, threading.get_ident()}
+
+
+def test_close_session_pool_stops_the_shared_browsers(monkeypatch):
+    created: list = []
+    pool = NovaActSessionPool("http://dash", size=1, factory=_factory(created))
+    monkeypatch.setattr("autosre.ui_automation.session_pool._shared_pool", pool)
+    assert get_session_pool() is pool
+    assert pool.run(["x"])
+    close_session_pool()
+    created[0].stop.assert_called_once()
+    assert get_session_pool() is not pool
+    close_session_pool()
+
+
+def test_warm_and_close():
+    created: list = []
+    pool = NovaActSessionPool("http://dash", size=2, factory=_factory(created))
+    assert pool.warm() == 2
+    assert pool.warm() == 0
+    pool.close()
+    for nova in created:
+        nova.stop.assert_called_once()
+    assert pool.run(["x"]) is False
+
+
+def test_ui_agent_uses_pool_without_login_prompt():
+    pool = MagicMock()
+    pool.run.return_value = True
+    agent = UIActionAgent(use_nova_act=True, session_pool=pool)
+    actions = [PlannedAction(action_type="navigate", target="deployment_panel")]
+    assert agent.execute(actions, service_name="checkout") is True
+    prompts = pool.run.call_args.args[0]
+    assert LOGIN_PROMPT not in prompts
+    assert prompts == ["Click the Checkout service link.", "Click the Deployments tab."]
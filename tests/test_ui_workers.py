@@ -0,0 +1,100 @@
+"""Tests for process-isolated Nova Act workers (real spawned subprocesses)."""
+
+import os
+import threading
+import time
+
+import pytest
+
+from autosre.ui_automation.workers import UIWorkerPool
+
+
+class FakeNova:
+    """Picklable NovaAct stand-in; behaviour is chosen by the prompt text."""
+
+    page = None
+
+    def start(self) -> None:
+        pass
+
+    def stop(self) -> None:
+        pass
+
+    def go_to_url(self, url: str) -> None:
+        pass
+
+    def act(self, prompt: str) -> None:
+        if prompt == "fail":
+            raise RuntimeError("element not found")
+        if prompt == "crash":
+            os._exit(3)
+        if prompt.startswith("sleep"):
+            time.sleep(float(prompt.split()[1]))
+
+
+@pytest.fixture
+def pool():
+    workers = UIWorkerPool("http://dash", processes=2, task_timeout_seconds=30, factory=FakeNova)
+    workers.start()
+    yield workers
+    workers.close()
+
+
+def test_results_stream_back_per_step(pool):
+    timings: list = []
+    assert pool.run(["Click A.", "Click B."], timings=timings) is True
+    assert [prompt for prompt, _ in timings] == ["Click A.", "Click B."]
+    timings = []
+    assert pool.run(["Click A.", "fail", "Click C."], timings=timings) is False
+    assert [prompt for prompt, _ in timings] == ["Click A.", "fail"]
+
+
+def _run_concurrently(pool, prompts: list[str], n: int = 2) -> list[bool]:
+    results: list[bool] = []
+    threads = [threading.Thread(target=lambda: results.append(pool.run(prompts))) for _ in range(n)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return results
+
+
+def test_batches_run_in_parallel_workers(pool):
+    assert _run_concurrently(pool, ["warm"]) == [True, True]  # both workers are up
+    start = time.monotonic()
+    assert _run_concurrently(pool, ["sleep 0.5"]) == [True, True]
+    assert time.monotonic() - start < 0.95
+
+
+def test_crashed_worker_fails_its_task_and_is_replaced(pool):
+    assert pool.run(["crash"]) is False
+    assert pool.restarts == 1
+    assert pool.run(["Click A."]) is True
+
+
+def test_timed_out_worker_is_terminated_and_replaced():
+    workers = UIWorkerPool("http://dash", processes=1, task_timeout_seconds=3, factory=FakeNova)
+    workers.start()
+    try:
+        assert workers.run(["warm"]) is True
+        assert workers.run(["sleep 30"]) is False
+        assert workers.restarts == 1
+        # The replacement is free right away instead of after the hung batch finishes
+        start = time.monotonic()
+        assert workers.run(["Click A."]) is True
+        assert time.monotonic() - start < 3
+    finally:
+        workers.close()
+
+
+def test_crash_is_noticed_while_other_workers_stream_results(pool):
+    assert _run_concurrently(pool, ["warm"]) == [True, True]
+    streaming = threading.Thread(target=pool.run, args=(["sleep 0.05"] * 40,))
+    streaming.start()
+    time.sleep(0.2)
+    start = time.monotonic()
+    assert pool.run(["crash"]) is False
+    # Not after the streaming batch (2s) or the task timeout (30s)
+    assert time.monotonic() - start < 1.5
+    streaming.join()
+    assert pool.restarts == 1
@@ -2,6 +2,8 @@
 
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from autosre.models import IncidentType, RecoveryStatus
 from autosre.workflow import run_once
 
@@ -19,6 +21,19 @@ def test_run_once_latency_spike(mock_monitor_class):
     mock_monitor.verify.assert_called_once()
 
 
+@patch("autosre.workflow.close_ui_worker_pool")
+@patch("autosre.workflow.close_session_pool")
+@patch("autosre.workflow.run_incident", side_effect=RuntimeError("boom"))
+def test_run_once_closes_ui_pools_on_exit(
+    _mock_run_incident, mock_close_sessions, mock_close_workers
+):
+    """A one-shot run stops the browsers it opened, even when the cycle raises."""
+    with pytest.raises(RuntimeError):
+        run_once(incident_type=IncidentType.LATENCY_SPIKE)
+    mock_close_sessions.assert_called_once()
+    mock_close_workers.assert_called_once()
+
+
 @patch("autosre.workflow.SlackReporter")
 @patch("autosre.workflow.RecoveryMonitor")
 @patch("autosre.workflow.PlannerAgent")